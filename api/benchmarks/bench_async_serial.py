@@ -0,0 +1,79 @@
+"""Benchmark executor-based and event-loop-based AsyncSerial round trips.
+
+Opens a pseudo-terminal whose other end echoes every line back from a
+thread, like a module answering commands, then times write + read_until
+round trips through the executor-based AsyncSerial and through
+NativeAsyncSerial. Prints round trips per second for each.
+
+Usage:
+    python benchmarks/bench_async_serial.py [--count 5000]
+"""
+import argparse
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from serial import serial_for_url  # type: ignore[import]
+
+from opentrons.drivers.asyncio.communication.async_serial import (
+    AsyncSerial,
+    NativeAsyncSerial,
+)
+
+_COMMAND = b"M105\r\n"
+_RESPONSE = b"T:25.000 C:25.000 ok\r\n"
+
+
+def _echo(controller: int) -> None:
+    buffer = b""
+    while True:
+        try:
+            data = os.read(controller, 1024)
+        except OSError:
+            return
+        if not data:
+            return
+        buffer += data
+        while b"\n" in buffer:
+            _, buffer = buffer.split(b"\n", 1)
+            os.write(controller, _RESPONSE)
+
+
+async def _bench(subject: AsyncSerial, count: int) -> float:
+    start = perf_counter()
+    for _ in range(count):
+        await subject.write(_COMMAND)
+        await subject.read_until(b"ok\r\n")
+    seconds = perf_counter() - start
+    await subject.close()
+    return count / seconds
+
+
+async def main(count: int) -> None:
+    """Run the benchmark and print round trips per second."""
+    loop = asyncio.get_event_loop()
+    controller, port_fd = os.openpty()
+    threading.Thread(target=_echo, args=(controller,), daemon=True).start()
+
+    for cls in (AsyncSerial, NativeAsyncSerial):
+        serial = serial_for_url(os.ttyname(port_fd), baudrate=115200, timeout=1)
+        subject = cls(
+            serial=serial,
+            executor=ThreadPoolExecutor(max_workers=1),
+            loop=loop,
+            reset_buffer_before_write=False,
+        )
+        rate = await _bench(subject, count)
+        print(f"  {cls.__name__:<20} {rate:9.1f} round trips/s")
+
+    os.close(port_fd)
+    os.close(controller)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(main(count=args.count))
@@ -0,0 +1,64 @@
+"""Benchmark simulating a 96-well transfer by who is listening for commands.
+
+Times a protocol context simulating a transfer from every well of one plate
+to another: with a subscriber that reads every command's text, as protocol
+contexts used to; with only the context's own command history, whose text is
+now built lazily; and with no subscribers at all, where publishing is
+skipped. Prints the time per protocol run for each.
+
+Usage:
+    python benchmarks/bench_command_publishing.py [--count 5]
+"""
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from opentrons.commands import types as command_types
+from opentrons.protocol_api import ProtocolContext
+from opentrons.simulate import get_protocol_api
+
+
+def _read_text(message: command_types.CommandMessage) -> None:
+    message["payload"].get("text")
+
+
+def _transfer(ctx: ProtocolContext) -> None:
+    tiprack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    dest = ctx.load_labware("corning_96_wellplate_360ul_flat", 3)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tiprack])
+    pipette.transfer(50, source.wells(), dest.wells(), new_tip="once")
+
+
+def _per_run(count: int, setup: Callable[[ProtocolContext], None]) -> float:
+    total = 0.0
+    for _ in range(count):
+        ctx = get_protocol_api("2.11")
+        setup(ctx)
+        start = perf_counter()
+        _transfer(ctx)
+        total += perf_counter() - start
+        ctx.cleanup()
+    return total / count
+
+
+def main(count: int) -> None:
+    """Run the benchmark and print the run times."""
+    cases = [
+        (
+            "text read by a subscriber",
+            lambda ctx: ctx.broker.subscribe(command_types.COMMAND, _read_text),
+        ),
+        ("context history only", lambda ctx: None),
+        ("no subscribers", lambda ctx: ctx.cleanup()),
+    ]
+    print(f"96-well transfer, {count} runs, time per run")
+    for name, setup in cases:
+        print(f"  {name:<28} {_per_run(count, setup) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=5)
+    args = parser.parse_args()
+    main(count=args.count)
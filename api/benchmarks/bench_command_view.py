@@ -0,0 +1,85 @@
+"""Benchmark ProtocolEngine command state selectors as runs grow.
+
+Builds a CommandStore with up to 100k commands, half of them completed and
+half still queued, then times the selectors the app and the queue worker poll
+constantly. Per-call times should stay flat as the command count grows.
+
+Usage:
+    python benchmarks/bench_command_view.py [--sizes 1000 10000 100000]
+"""
+import argparse
+from datetime import datetime
+from timeit import timeit
+from typing import Callable, Dict, List
+
+# protocol_api must be imported before protocol_engine to avoid a circular import
+from opentrons import protocol_api  # noqa: F401
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import QueueCommandAction, UpdateCommandAction
+from opentrons.protocol_engine.state.commands import CommandStore, CommandView
+
+_CREATED_AT = datetime(year=2022, month=1, day=1)
+
+
+def _build_store(size: int) -> CommandStore:
+    store = CommandStore()
+
+    for index in range(size):
+        store.handle_action(
+            QueueCommandAction(
+                request=commands.PauseCreate(params=commands.PauseParams()),
+                created_at=_CREATED_AT,
+                command_id=f"command-{index}",
+                command_key=f"command-{index}",
+            )
+        )
+
+    for index in range(size // 2):
+        for status in [
+            commands.CommandStatus.RUNNING,
+            commands.CommandStatus.SUCCEEDED,
+        ]:
+            store.handle_action(
+                UpdateCommandAction(
+                    command=commands.Pause.construct(
+                        id=f"command-{index}",
+                        key=f"command-{index}",
+                        createdAt=_CREATED_AT,
+                        params=commands.PauseParams(),
+                        status=status,
+                    )
+                )
+            )
+
+    return store
+
+
+def _selectors(view: CommandView, size: int) -> Dict[str, Callable[[], object]]:
+    return {
+        "get_current": view.get_current,
+        "get_next_queued": view.get_next_queued,
+        "get_all_complete": view.get_all_complete,
+        "get_slice (head)": lambda: view.get_slice(cursor=0, length=20),
+        "get_slice (middle)": lambda: view.get_slice(cursor=size // 2, length=20),
+        "get_slice (tail)": lambda: view.get_slice(cursor=None, length=20),
+    }
+
+
+def main(sizes: List[int], number: int) -> None:
+    """Run the benchmark and print per-call timings in microseconds."""
+    for size in sizes:
+        store = _build_store(size)
+        view = CommandView(store.state)
+
+        print(f"{size} commands")
+        for name, selector in _selectors(view, size).items():
+            seconds = timeit(selector, number=number)
+            print(f"  {name:<20} {seconds / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    main(sizes=args.sizes, number=args.number)
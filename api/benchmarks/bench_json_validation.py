@@ -0,0 +1,79 @@
+"""Benchmark JSON protocol validation.
+
+Builds a large JSON protocol by repeating the commands of a shared-data
+fixture, then times validating it the way validate_json used to, loading
+the schemas and validating the protocol as labware and then against its
+protocol schema on every call, and with the cached validators. Prints the
+time per validation for each.
+
+Usage:
+    python benchmarks/bench_json_validation.py [--commands 10000] [--count 10]
+"""
+import argparse
+import copy
+import json
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+import jsonschema  # type: ignore
+
+from opentrons.protocols.parse import validate_json
+from opentrons_shared_data import load_shared_data
+
+
+def _load(path: str) -> Dict[str, Any]:
+    return json.loads(load_shared_data(path).decode("utf-8"))  # type: ignore
+
+
+def _build_protocol(commands: int) -> Dict[str, Any]:
+    protocol = _load("protocol/fixtures/5/multipleTipracksWithTC.json")
+    fixture_commands = protocol["commands"]
+    protocol["commands"] = [
+        copy.deepcopy(fixture_commands[i % len(fixture_commands)])
+        for i in range(commands)
+    ]
+    return protocol
+
+
+def _uncached(protocol: Dict[str, Any]) -> None:
+    labware_schema = _load("labware/schemas/2.json")
+    try:
+        jsonschema.validate(protocol, labware_schema)
+    except jsonschema.ValidationError:
+        pass
+    protocol_schema = _load("protocol/schemas/5.json")
+    resolver = jsonschema.RefResolver(
+        protocol_schema.get("$id", ""),
+        protocol_schema,
+        store={"opentronsLabwareSchemaV2": labware_schema},
+    )
+    jsonschema.validate(protocol, protocol_schema, resolver=resolver)
+
+
+def _per_call(count: int, run: Callable[[], Any]) -> float:
+    start = perf_counter()
+    for _ in range(count):
+        run()
+    return (perf_counter() - start) / count
+
+
+def main(commands: int, count: int) -> None:
+    """Run the benchmark and print the validation times."""
+    protocol = _build_protocol(commands)
+    print(f"{commands} commands, {len(json.dumps(protocol)) // 1024} KiB")
+    first = perf_counter()
+    validate_json(protocol)
+    print(f"  cached, first call {(perf_counter() - first) * 1000:8.1f} ms")
+    for name, run in [
+        ("uncached", lambda: _uncached(protocol)),
+        ("cached", lambda: validate_json(protocol)),
+    ]:
+        print(f"  {name:<18} {_per_call(count, run) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--commands", type=int, default=10000)
+    parser.add_argument("--count", type=int, default=10)
+    args = parser.parse_args()
+    main(commands=args.commands, count=args.count)
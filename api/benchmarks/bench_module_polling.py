@@ -0,0 +1,152 @@
+"""Benchmark module polling with and without adaptive poll policies.
+
+Polls four modules at once, a ramping temperature module, a holding
+temperature module, a shaking heater-shaker and a holding thermocycler,
+with readings that carry a little sensor noise. Runs once with the fixed
+interval pollers used before and once with each module's poll policy and
+idle interval. Prints the polls (each one an event loop wakeup), the
+serial commands they send and the results published to listeners.
+
+Intervals are scaled down (--interval) so that a run takes a few seconds.
+
+Usage:
+    python benchmarks/bench_module_polling.py [--seconds 5] [--interval 0.01]
+"""
+import argparse
+import asyncio
+import random
+from time import perf_counter
+from typing import Any, List, Tuple
+
+from opentrons.drivers.types import (
+    HeaterShakerLabwareLatchStatus,
+    PlateTemperature,
+    RPM,
+    Temperature,
+    ThermocyclerLidStatus,
+)
+from opentrons.hardware_control.modules import heater_shaker, tempdeck, thermocycler
+from opentrons.hardware_control.poller import (
+    Poller,
+    PollPolicy,
+    Reader,
+    WaitableListener,
+)
+
+
+def _noise() -> float:
+    return random.uniform(-0.02, 0.02)
+
+
+class _Reader(Reader[Any]):
+    def __init__(self, commands: int, sample: Any) -> None:
+        self.polls = 0
+        self.commands = 0
+        self._commands_per_read = commands
+        self._sample = sample
+        self._start = perf_counter()
+
+    async def read(self) -> Any:
+        self.polls += 1
+        self.commands += self._commands_per_read
+        return self._sample(perf_counter() - self._start)
+
+
+class _Listener(WaitableListener[Any]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.published = 0
+
+    def on_poll(self, result: Any) -> None:
+        self.published += 1
+        super().on_poll(result)
+
+
+def _ramping_tempdeck(elapsed: float) -> Temperature:
+    return Temperature(current=max(4.0, 25 - elapsed * 10) + _noise(), target=4)
+
+
+def _holding_tempdeck(elapsed: float) -> Temperature:
+    return Temperature(current=37 + _noise(), target=37)
+
+
+def _shaking_heater_shaker(elapsed: float) -> heater_shaker.PollResult:
+    return heater_shaker.PollResult(
+        temperature=Temperature(current=37 + _noise(), target=37),
+        rpm=RPM(current=500 + random.randint(-3, 3), target=500),
+        labware_latch=HeaterShakerLabwareLatchStatus.IDLE_CLOSED,
+    )
+
+
+def _holding_thermocycler(elapsed: float) -> thermocycler.PolledData:
+    return thermocycler.PolledData(
+        lid_status=ThermocyclerLidStatus.CLOSED,
+        lid_temperature=Temperature(current=105 + _noise(), target=105),
+        plate_temperature=PlateTemperature(current=4 + _noise(), target=4, hold=None),
+    )
+
+
+async def _run(seconds: float, interval: float, adaptive: bool) -> Tuple[int, int, int]:
+    modules: List[Tuple[int, Any, PollPolicy[Any]]] = [
+        (1, _ramping_tempdeck, tempdeck.PollerPolicy(tempdeck.TEMP_POLL_EPSILON)),
+        (1, _holding_tempdeck, tempdeck.PollerPolicy(tempdeck.TEMP_POLL_EPSILON)),
+        (3, _shaking_heater_shaker, heater_shaker.PollerPolicy()),
+        (
+            3,
+            _holding_thermocycler,
+            thermocycler.PollerPolicy(thermocycler.POLLING_EPSILON),
+        ),
+    ]
+    readers = []
+    listeners: List[_Listener] = []
+    pollers: List[Poller[Any]] = []
+    for commands, sample, policy in modules:
+        reader = _Reader(commands, sample)
+        listener = _Listener()
+        readers.append(reader)
+        listeners.append(listener)
+        pollers.append(
+            Poller(
+                interval_seconds=interval,
+                reader=reader,
+                listener=listener,
+                policy=policy if adaptive else None,
+                idle_interval_seconds=interval * 5 if adaptive else None,
+            )
+        )
+
+    await asyncio.sleep(seconds)
+    for poller in pollers:
+        await poller.stop_and_wait()
+    polls = sum(r.polls for r in readers)
+    commands = sum(r.commands for r in readers)
+    published = sum(listener.published for listener in listeners)
+    return polls, commands, published
+
+
+def _print(name: str, result: Tuple[int, int, int], seconds: float) -> None:
+    polls, commands, published = result
+    print(
+        f"  {name:<10} {polls / seconds:6.0f} polls/s "
+        f"{commands / seconds:6.0f} commands/s "
+        f"{published / seconds:6.0f} publishes/s"
+    )
+
+
+async def main(seconds: float, interval: float) -> None:
+    """Run the benchmark and print the polling traffic."""
+    print(f"4 modules, {seconds} s, {interval * 1000:.0f} ms poll interval")
+    fixed = await _run(seconds, interval, adaptive=False)
+    _print("fixed", fixed, seconds)
+    adaptive = await _run(seconds, interval, adaptive=True)
+    _print("adaptive", adaptive, seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(seconds=args.seconds, interval=args.interval)
+    )
@@ -0,0 +1,122 @@
+"""Benchmark per-protocol simulator setup with and without a simulator pool.
+
+Times analyzing a short protocol with a simulating protocol runner, on a
+new simulator each time and on one from a SimulatorPool; setting up and
+tearing down a thread-managed simulator, as opentrons.simulate does, new and
+from a ThreadManagedSimulatorPool; and simulate() of the protocol with a new
+simulator (from an empty simulator file) and from its pool. Prints the time
+per protocol for each.
+
+Usage:
+    python benchmarks/bench_simulator_pool.py [--count 50]
+"""
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+from time import perf_counter
+from pathlib import Path
+from typing import Callable, Optional
+
+from opentrons import simulate
+from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.simulator_pool import (
+    SimulatorPool,
+    ThreadManagedSimulatorPool,
+)
+from opentrons.protocol_reader import InputFile, ProtocolReader, ProtocolSource
+from opentrons.protocol_runner import create_simulating_runner
+
+PROTOCOL = """
+metadata = {"apiLevel": "2.11"}
+
+def run(ctx):
+    tiprack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tiprack])
+    pipette.transfer(50, plate["A1"], plate["B1"])
+"""
+
+
+def _per_protocol(count: int, run: Callable[[], None]) -> float:
+    run()
+    start = perf_counter()
+    for _ in range(count):
+        run()
+    return (perf_counter() - start) / count
+
+
+async def _read(directory: str) -> ProtocolSource:
+    protocol_file = InputFile(
+        filename="protocol.py", file=io.BytesIO(PROTOCOL.encode("utf-8"))
+    )
+    return await ProtocolReader(directory=Path(directory)).read(
+        name="protocol", files=[protocol_file]
+    )
+
+
+async def _analyze_fresh(source: ProtocolSource) -> None:
+    runner = await create_simulating_runner()
+    await runner.run(source)
+
+
+async def _analyze_pooled(source: ProtocolSource, pool: SimulatorPool) -> None:
+    async with pool.simulator() as hardware_api:
+        runner = await create_simulating_runner(hardware_api=hardware_api)
+        await runner.run(source)
+
+
+def _thread_managed_fresh() -> None:
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    thread_manager.sync.home()
+    thread_manager.clean_up()
+
+
+def _thread_managed_pooled(pool: ThreadManagedSimulatorPool) -> None:
+    with pool.simulator():
+        pass
+
+
+def _simulate(simulator_file: Optional[str] = None) -> None:
+    simulate.simulate(
+        io.StringIO(PROTOCOL),
+        "protocol.py",
+        hardware_simulator_file_path=simulator_file,
+    )
+
+
+def main(count: int) -> None:
+    """Run the benchmark and print the setup times."""
+    print(f"{count} protocols, time per protocol")
+    loop = asyncio.get_event_loop()
+    simulator_pool = SimulatorPool()
+    pool = ThreadManagedSimulatorPool()
+    with tempfile.TemporaryDirectory() as directory:
+        simulator_file = os.path.join(directory, "simulator.json")
+        with open(simulator_file, "w") as f:
+            f.write("{}")
+        source = loop.run_until_complete(_read(directory))
+        cases = [
+            ("analysis, new", lambda: loop.run_until_complete(_analyze_fresh(source))),
+            (
+                "analysis, pooled",
+                lambda: loop.run_until_complete(
+                    _analyze_pooled(source, simulator_pool)
+                ),
+            ),
+            ("thread manager, new", _thread_managed_fresh),
+            ("thread manager, pooled", lambda: _thread_managed_pooled(pool)),
+            ("simulate(), new", lambda: _simulate(simulator_file)),
+            ("simulate(), pooled", _simulate),
+        ]
+        for name, run in cases:
+            print(f"  {name:<28} {_per_protocol(count, run) * 1000:8.2f} ms")
+    pool.clean_up()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+    main(count=args.count)
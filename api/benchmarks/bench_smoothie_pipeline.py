@@ -0,0 +1,118 @@
+"""Benchmark synchronous and pipelined Smoothie G-code transmission.
+
+Runs the Smoothie emulator behind a local socket that delays each response
+by a fixed link latency, then times a mix of driver calls (speed and
+acceleration settings, and runs of consecutive moves) with pipelining off
+and with a range of pipeline windows. Prints driver commands per second.
+
+Usage:
+    python benchmarks/bench_smoothie_pipeline.py [--latency-ms 2] [--count 200]
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from typing import List
+
+from opentrons.config import robot_configs
+from opentrons.config.types import RobotConfig
+from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
+from opentrons.drivers.smoothie_drivers.connection import SmoothieConnection
+from opentrons.drivers.smoothie_drivers.constants import (
+    DEFAULT_EXECUTE_TIMEOUT,
+    SMOOTHIE_ACK,
+)
+from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+    SmoothieDriver,
+    _command_builder,
+)
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import SmoothieSettings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+# Driver calls per iteration of the workload
+_CALLS_PER_ITERATION = 5
+
+
+async def _start_emulator(latency: float) -> asyncio.AbstractServer:
+    emulator = SmoothieEmulator(parser=Parser(), settings=SmoothieSettings())
+    loop = asyncio.get_event_loop()
+
+    async def _handle_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            try:
+                line = await reader.readuntil(emulator.get_terminator())
+            except asyncio.IncompleteReadError:
+                return
+            response = emulator.handle(line.decode().strip())
+            data = (f"{response}\r\n" if response else "").encode()
+            # Responses are scheduled rather than awaited, so lines that
+            # arrive back to back are answered back to back, like a real link
+            loop.call_later(latency, writer.write, data + emulator.get_ack())
+
+    return await asyncio.start_server(_handle_connection, host="127.0.0.1", port=0)
+
+
+async def _run_workload(driver: SmoothieDriver, count: int) -> None:
+    for i in range(count):
+        x = 10 + i % 2
+        await driver.set_speed(100)
+        await driver.set_acceleration({"X": 1000})
+        for dx in (0.0, 0.5, 1.0):
+            await driver._send_command(
+                _command_builder().add_gcode("G0").add_float("X", x + dx, precision=3)
+            )
+    await driver.update_position()
+
+
+async def _bench(config: RobotConfig, port: int, window: int, count: int) -> float:
+    connection = await SmoothieConnection.create(
+        port=f"socket://127.0.0.1:{port}",
+        baud_rate=115200,
+        name="smoothie",
+        timeout=DEFAULT_EXECUTE_TIMEOUT,
+        ack=SMOOTHIE_ACK,
+        reset_buffer_before_write=True,
+    )
+    driver = SmoothieDriver(
+        config=config,
+        gpio_chardev=SimulatingGPIOCharDev("simulated"),
+        connection=connection,
+    )
+    driver.pipeline_window = window
+
+    start = perf_counter()
+    await _run_workload(driver, count)
+    seconds = perf_counter() - start
+
+    await connection.close()
+    return count * _CALLS_PER_ITERATION / seconds
+
+
+async def main(latency_ms: float, count: int, windows: List[int]) -> None:
+    """Run the benchmark and print commands per second for each window."""
+    server = await _start_emulator(latency_ms / 1000)
+    assert server.sockets, "Emulator server is not listening."
+    port = server.sockets[0].getsockname()[1]
+    config = robot_configs.load_ot2()
+
+    print(f"link latency {latency_ms} ms, {count * _CALLS_PER_ITERATION} commands")
+    for window in windows:
+        name = "synchronous" if window == 0 else f"pipelined, window {window}"
+        rate = await _bench(config, port, window, count)
+        print(f"  {name:<24} {rate:9.1f} commands/s")
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 2, 4, 8])
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(latency_ms=args.latency_ms, count=args.count, windows=args.windows)
+    )
@@ -0,0 +1,73 @@
+"""Benchmark hardware calls through the ThreadManager bridge.
+
+Builds a simulating hardware API in a ThreadManager and times, from the
+calling thread, position queries made one at a time through the synchronous
+adapter and in batches, and attached instrument reads made from the
+snapshot and, as the bridge used to, directly from the managed object.
+Prints calls per second for each.
+
+Usage:
+    python benchmarks/bench_thread_manager.py [--count 5000] [--batch 100]
+"""
+import argparse
+from time import perf_counter
+from typing import Any, Callable
+
+from opentrons.hardware_control import API, SyncHardwareAPI, ThreadManager
+from opentrons.types import Mount
+
+
+def _rate(count: int, run: Callable[[], None]) -> float:
+    start = perf_counter()
+    run()
+    return count / (perf_counter() - start)
+
+
+def _one_at_a_time(sync: SyncHardwareAPI, count: int) -> None:
+    for _ in range(count):
+        sync.current_position(Mount.LEFT)
+
+
+def _batched(sync: SyncHardwareAPI, count: int, batch_size: int) -> None:
+    for _ in range(count // batch_size):
+        with sync.batch() as batch:
+            for _ in range(batch_size):
+                batch.current_position(Mount.LEFT)
+
+
+def _reads(obj: Any, count: int) -> None:
+    for _ in range(count):
+        obj.attached_instruments
+
+
+def main(count: int, batch_size: int) -> None:
+    """Run the benchmark and print the call rates."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    sync = thread_manager.sync
+    sync.cache_instruments({Mount.LEFT: "p300_single"})
+    sync.home()
+
+    rates = [
+        ("current_position, one at a time", lambda: _one_at_a_time(sync, count)),
+        (
+            f"current_position, batches of {batch_size}",
+            lambda: _batched(sync, count, batch_size),
+        ),
+        (
+            "attached_instruments, direct",
+            lambda: _reads(thread_manager.managed_obj, count),
+        ),
+        ("attached_instruments, snapshot", lambda: _reads(sync, count)),
+    ]
+    print(f"{count} calls")
+    for name, run in rates:
+        print(f"  {name:<36} {_rate(count, run):9.0f}/s")
+    thread_manager.clean_up()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+    main(count=args.count, batch_size=args.batch)
@@ -63,6 +63,7 @@ INSTALL_REQUIRES = [
     "jsonschema==3.0.2",
     "numpy>=1.15.1,<2",
     "pydantic==1.8.2",
+    "pyrsistent==0.18.1",
     "pyserial==3.5",
     "typing-extensions==3.10.0.0",
 ]
@@ -100,6 +101,7 @@ if __name__ == "__main__":
         entry_points={
             "console_scripts": [
                 "opentrons_simulate = opentrons.simulate:main",
+                "opentrons_simulate_batch = opentrons.simulate_batch:main",
                 "opentrons_execute = opentrons.execute:main",
             ]
         },
@@ -1,8 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union, overload
+from typing import TYPE_CHECKING, List, Union, cast, overload
 
 
-from .helpers import stringify_location, listify
+from .helpers import LazyTextPayload, stringify_location, listify
 from . import types as command_types
 
 from opentrons.types import Location
@@ -24,20 +24,25 @@ def aspirate(
     location: Union[Well, Location],
     rate: float,
 ) -> command_types.AspirateCommand:
-    location_text = stringify_location(location)
     template = "Aspirating {volume} uL from {location} at {flow} uL/sec"
+    # the flow rate may change later, so it is read now rather than with the text
     flow_rate = rate * FlowRates(instrument._implementation).aspirate
-    text = template.format(volume=float(volume), location=location_text, flow=flow_rate)
 
+    def _make_text() -> str:
+        return template.format(
+            volume=float(volume), location=stringify_location(location), flow=flow_rate
+        )
+
+    payload = LazyTextPayload(
+        _make_text,
+        instrument=instrument,
+        volume=volume,
+        location=location,
+        rate=rate,
+    )
     return {
         "name": command_types.ASPIRATE,
-        "payload": {
-            "instrument": instrument,
-            "volume": volume,
-            "location": location,
-            "rate": rate,
-            "text": text,
-        },
+        "payload": cast(command_types.SimpleLHCommandPayload, payload),
     }
 
 
@@ -47,20 +52,25 @@ def dispense(
     location: Union[Well, Location],
     rate: float,
 ) -> command_types.DispenseCommand:
-    location_text = stringify_location(location)
     template = "Dispensing {volume} uL into {location} at {flow} uL/sec"
+    # the flow rate may change later, so it is read now rather than with the text
     flow_rate = rate * FlowRates(instrument._implementation).dispense
-    text = template.format(volume=float(volume), location=location_text, flow=flow_rate)
 
+    def _make_text() -> str:
+        return template.format(
+            volume=float(volume), location=stringify_location(location), flow=flow_rate
+        )
+
+    payload = LazyTextPayload(
+        _make_text,
+        instrument=instrument,
+        volume=volume,
+        location=location,
+        rate=rate,
+    )
     return {
         "name": command_types.DISPENSE,
-        "payload": {
-            "instrument": instrument,
-            "volume": volume,
-            "location": location,
-            "rate": rate,
-            "text": text,
-        },
+        "payload": cast(command_types.SimpleLHCommandPayload, payload),
     }
 
 
@@ -70,22 +80,25 @@ def consolidate(
     source: List[Union[Location, Well]],
     dest: Union[Location, Well],
 ) -> command_types.ConsolidateCommand:
-    text = "Consolidating {volume} from {source} to {dest}".format(
-        volume=transform_volumes(volume),
-        source=stringify_location(source),
-        dest=stringify_location(dest),
-    )
+    def _make_text() -> str:
+        return "Consolidating {volume} from {source} to {dest}".format(
+            volume=transform_volumes(volume),
+            source=stringify_location(source),
+            dest=stringify_location(dest),
+        )
+
     locations: List[Union[Location, Well]] = listify(source) + listify(dest)
+    payload = LazyTextPayload(
+        _make_text,
+        instrument=instrument,
+        locations=locations,
+        volume=volume,
+        source=source,
+        dest=dest,
+    )
     return {
         "name": command_types.CONSOLIDATE,
-        "payload": {
-            "instrument": instrument,
-            "locations": locations,
-            "volume": volume,
-            "source": source,
-            "dest": dest,
-            "text": text,
-        },
+        "payload": cast(command_types.ConsolidateCommandPayload, payload),
     }
 
 
@@ -95,22 +108,25 @@ def distribute(
     source: Union[Location, Well],
     dest: List[Union[Location, Well]],
 ) -> command_types.DistributeCommand:
-    text = "Distributing {volume} from {source} to {dest}".format(
-        volume=transform_volumes(volume),
-        source=stringify_location(source),
-        dest=stringify_location(dest),
-    )
+    def _make_text() -> str:
+        return "Distributing {volume} from {source} to {dest}".format(
+            volume=transform_volumes(volume),
+            source=stringify_location(source),
+            dest=stringify_location(dest),
+        )
+
     locations: List[Union[Location, Well]] = listify(source) + listify(dest)
+    payload = LazyTextPayload(
+        _make_text,
+        instrument=instrument,
+        locations=locations,
+        volume=volume,
+        source=source,
+        dest=dest,
+    )
     return {
         "name": command_types.DISTRIBUTE,
-        "payload": {
-            "instrument": instrument,
-            "locations": locations,
-            "volume": volume,
-            "source": source,
-            "dest": dest,
-            "text": text,
-        },
+        "payload": cast(command_types.DistributeCommandPayload, payload),
     }
 
 
@@ -120,22 +136,25 @@ def transfer(
     source: List[Union[Location, Well]],
     dest: List[Union[Location, Well]],
 ) -> command_types.TransferCommand:
-    text = "Transferring {volume} from {source} to {dest}".format(
-        volume=transform_volumes(volume),
-        source=stringify_location(source),
-        dest=stringify_location(dest),
-    )
+    def _make_text() -> str:
+        return "Transferring {volume} from {source} to {dest}".format(
+            volume=transform_volumes(volume),
+            source=stringify_location(source),
+            dest=stringify_location(dest),
+        )
+
     locations: List[Union[Location, Well]] = listify(source) + listify(dest)
+    payload = LazyTextPayload(
+        _make_text,
+        instrument=instrument,
+        locations=locations,
+        volume=volume,
+        source=source,
+        dest=dest,
+    )
     return {
         "name": command_types.TRANSFER,
-        "payload": {
-            "instrument": instrument,
-            "locations": locations,
-            "volume": volume,
-            "source": source,
-            "dest": dest,
-            "text": text,
-        },
+        "payload": cast(command_types.TransferCommandPayload, payload),
     }
 
 
@@ -182,15 +201,18 @@ def mix(
 def blow_out(
     instrument: InstrumentContext, location: Union[Well, Location]
 ) -> command_types.BlowOutCommand:
-    location_text = stringify_location(location)
-    text = "Blowing out"
+    def _make_text() -> str:
+        text = "Blowing out"
+
+        if location is not None:
+            text += " at {location}".format(location=stringify_location(location))
 
-    if location is not None:
-        text += " at {location}".format(location=location_text)
+        return text
 
+    payload = LazyTextPayload(_make_text, instrument=instrument, location=location)
     return {
         "name": command_types.BLOW_OUT,
-        "payload": {"instrument": instrument, "location": location, "text": text},
+        "payload": cast(command_types.BlowOutCommandPayload, payload),
     }
 
 
@@ -216,31 +238,39 @@ def return_tip() -> command_types.ReturnTipCommand:
 def pick_up_tip(
     instrument: InstrumentContext, location: Well
 ) -> command_types.PickUpTipCommand:
-    location_text = stringify_location(location)
-    text = f"Picking up tip from {location_text}"
+    def _make_text() -> str:
+        return f"Picking up tip from {stringify_location(location)}"
+
+    payload = LazyTextPayload(_make_text, instrument=instrument, location=location)
     return {
         "name": command_types.PICK_UP_TIP,
-        "payload": {"instrument": instrument, "location": location, "text": text},
+        "payload": cast(command_types.PickUpTipCommandPayload, payload),
     }
 
 
 def drop_tip(
     instrument: InstrumentContext, location: Location
 ) -> command_types.DropTipCommand:
-    location_text = stringify_location(location)
-    text = "Dropping tip into {location}".format(location=location_text)
+    def _make_text() -> str:
+        return "Dropping tip into {location}".format(
+            location=stringify_location(location)
+        )
+
+    payload = LazyTextPayload(_make_text, instrument=instrument, location=location)
     return {
         "name": command_types.DROP_TIP,
-        "payload": {"instrument": instrument, "location": location, "text": text},
+        "payload": cast(command_types.DropTipCommandPayload, payload),
     }
 
 
 def move_to(
     instrument: InstrumentContext, location: Union[Location, Well]
 ) -> command_types.MoveToCommand:
-    location_text = stringify_location(location)
-    text = "Moving to {location}".format(location=location_text)
+    def _make_text() -> str:
+        return "Moving to {location}".format(location=stringify_location(location))
+
+    payload = LazyTextPayload(_make_text, instrument=instrument, location=location)
     return {
         "name": command_types.MOVE_TO,
-        "payload": {"instrument": instrument, "location": location, "text": text},
+        "payload": cast(command_types.MoveToCommandPayload, payload),
     }
@@ -1,4 +1,16 @@
-from typing import List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ItemsView,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+)
 
 from opentrons.protocol_api.labware import Well
 from opentrons.types import Location
@@ -36,3 +48,73 @@ def _stringify_new_loc(loc: CommandLocation) -> str:
 def stringify_location(location: Union[CommandLocation, List[CommandLocation]]) -> str:
     loc_str_list = [_stringify_new_loc(loc) for loc in listify(location)]
     return ", ".join(loc_str_list)
+
+
+class LazyTextPayload(Dict[str, Any]):
+    """A command payload whose ``text`` is only built when it is first read.
+
+    Formatting a command's locations into its text is wasted work when no
+    one reads the text, which is the common case while simulating. Anything
+    that reads the payload's keys or values builds the text first, so the
+    payload otherwise behaves like the plain dict it replaces. The text
+    must only depend on values that do not change after the command runs.
+    """
+
+    def __init__(self, make_text: Callable[[], str], **fields: Any) -> None:
+        super().__init__(**fields)
+        self._make_text: Optional[Callable[[], str]] = make_text
+
+    def _build_text(self) -> None:
+        if self._make_text is not None:
+            make_text, self._make_text = self._make_text, None
+            super().__setitem__("text", make_text())
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "text":
+            self._build_text()
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "text":
+            self._build_text()
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        self._build_text()
+        return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self._build_text()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._build_text()
+        return super().__len__()
+
+    def __eq__(self, other: object) -> bool:
+        self._build_text()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        self._build_text()
+        return super().__repr__()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        self._build_text()
+        return dict, (dict(super().items()),)
+
+    def keys(self) -> KeysView[str]:
+        self._build_text()
+        return super().keys()
+
+    def values(self) -> ValuesView[Any]:
+        self._build_text()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Any]:
+        self._build_text()
+        return super().items()
+
+    def copy(self) -> Dict[str, Any]:
+        self._build_text()
+        return dict(super().items())
@@ -1,5 +1,6 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
 from typing import Any, Callable, Iterator, Optional, TypeVar, cast
 from uuid import uuid4
@@ -55,6 +56,8 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                where applicable.
             4. Construct the command payload and publish it using `publish_context`
             5. Return the value of calling `func` with `*args` and `**kwargs`
+
+            If nothing would see the messages, skip straight to step 5.
             """
 
             broker = getattr(args[0], "broker", None)
@@ -63,6 +66,9 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
+            if not _is_observed(broker):
+                return func(*args, **kwargs)
+
             func_sig = _inspect_signature(func)
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
@@ -105,7 +111,13 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
 
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
+
+    If nothing would see the messages, nothing is published.
     """
+    if not _is_observed(broker):
+        yield
+        return
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
@@ -124,6 +136,13 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
+def _is_observed(broker: Broker) -> bool:
+    """Whether anything would see a command published to the broker."""
+    return broker.has_subscribers(COMMAND_TOPIC) or broker.logger.isEnabledFor(
+        logging.INFO
+    )
+
+
 @functools.lru_cache(maxsize=None)
 def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
     """Inspect function signatures, memoized because it is called very often."""
@@ -148,8 +167,8 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
-        broker.logger.info(f"{name}: {payload_str}")
+        broker.logger.info("%s: %s", name, payload_str)
 
     broker.publish(topic=COMMAND_TOPIC, message=message)
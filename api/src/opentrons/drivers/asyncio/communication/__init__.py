@@ -4,6 +4,7 @@ from opentrons.drivers.asyncio.communication.errors import (
     NoResponse,
     AlarmResponse,
     ErrorResponse,
+    FailedCommand,
 )
 from .async_serial import AsyncSerial
 
@@ -14,4 +15,5 @@ __all__ = [
     "NoResponse",
     "AlarmResponse",
     "ErrorResponse",
+    "FailedCommand",
 ]
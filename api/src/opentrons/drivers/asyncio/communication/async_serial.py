@@ -2,15 +2,36 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import os
 from concurrent.futures.thread import ThreadPoolExecutor
 from functools import partial
-from typing import Optional, AsyncGenerator, Union
+from typing import Dict, Optional, AsyncGenerator, Union
 from typing_extensions import Literal
 
-from serial import Serial, serial_for_url  # type: ignore[import]
+from serial import (  # type: ignore[import]
+    Serial,
+    SerialException,
+    SerialTimeoutException,
+    serial_for_url,
+)
+
+try:
+    from serial.serialposix import Serial as PosixSerial  # type: ignore[import]
+except ImportError:
+    PosixSerial = None
 
 TimeoutProperties = Union[Literal["write_timeout"], Literal["timeout"]]
 
+# Maximum number of bytes to read from a port each time it is readable
+_READ_SIZE = 4096
+
+# Set to "true" to read and write local serial ports on the event loop
+NATIVE_ASYNC_SERIAL_ENV = "OT_NATIVE_ASYNC_SERIAL"
+
+
+def _native_async_serial_enabled() -> bool:
+    return os.environ.get(NATIVE_ASYNC_SERIAL_ENV, "").lower() == "true"
+
 
 class AsyncSerial:
     """Async wrapper around Serial."""
@@ -49,6 +70,12 @@ class AsyncSerial:
                 write_timeout=write_timeout,
             ),
         )
+        if (
+            cls is AsyncSerial
+            and _native_async_serial_enabled()
+            and NativeAsyncSerial.supports(serial)
+        ):
+            cls = NativeAsyncSerial
         return cls(
             serial=serial,
             executor=executor,
@@ -93,32 +120,38 @@ class AsyncSerial:
             func=partial(self._serial.read_until, expected=match),
         )
 
-    async def write(self, data: bytes) -> None:
+    async def write(self, data: bytes, keep_input_buffer: bool = False) -> None:
         """
         Write data
 
         Args:
             data: data to write.
+            keep_input_buffer: do not reset the input buffer before writing,
+             even if the connection was created to do so. Used when
+             responses to earlier writes are still expected.
 
         Returns:
             None
         """
         await self._loop.run_in_executor(
             executor=self._executor,
-            func=lambda: self._sync_write(data=data),
+            func=lambda: self._sync_write(
+                data=data, keep_input_buffer=keep_input_buffer
+            ),
         )
 
-    def _sync_write(self, data: bytes) -> None:
+    def _sync_write(self, data: bytes, keep_input_buffer: bool = False) -> None:
         """
         The synchronous write function
 
         Args:
             data: data to write.
+            keep_input_buffer: do not reset the input buffer before writing.
 
         Returns:
             None
         """
-        if self._reset_buffer_before_write:
+        if self._reset_buffer_before_write and not keep_input_buffer:
             self._serial.reset_input_buffer()
         self._serial.write(data=data)
         self._serial.flush()
@@ -173,3 +206,231 @@ class AsyncSerial:
                         self._serial, timeout_property, default_timeout
                     ),
                 )
+
+
+class NativeAsyncSerial(AsyncSerial):
+    """AsyncSerial that does its reads and writes on the event loop.
+
+    The port's file descriptor is made non-blocking and watched with
+    `loop.add_reader`, so data is buffered as soon as it arrives and a
+    `read_until` returns as soon as its match is in the buffer, without
+    a round trip through the executor thread. Writes go straight to the
+    file descriptor, waiting with `loop.add_writer` only if the kernel's
+    buffer is full. Opening and closing the port still use the executor.
+
+    `AsyncSerial.create` returns one of these for local serial ports if
+    the ``OT_NATIVE_ASYNC_SERIAL`` environment variable is ``true``.
+    Otherwise, and for URL handlers like ``socket://`` that have no file
+    descriptor to watch, it returns the executor-based implementation.
+    """
+
+    @staticmethod
+    def supports(serial: Serial) -> bool:
+        """Check whether a Serial object is a local port with a file descriptor."""
+        return PosixSerial is not None and isinstance(serial, PosixSerial)
+
+    def __init__(
+        self,
+        serial: Serial,
+        executor: ThreadPoolExecutor,
+        loop: asyncio.AbstractEventLoop,
+        reset_buffer_before_write: bool,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            serial: connected Serial object
+            executor: a thread pool executor
+            loop: event loop
+        """
+        super().__init__(
+            serial=serial,
+            executor=executor,
+            loop=loop,
+            reset_buffer_before_write=reset_buffer_before_write,
+        )
+        # Timeouts are applied here rather than by Serial, so overriding
+        # them does not reconfigure the port
+        self._timeouts: Dict[str, Optional[float]] = {
+            "timeout": serial.timeout,
+            "write_timeout": serial.write_timeout,
+        }
+        self._buffer = bytearray()
+        self._read_waiter: Optional["asyncio.Future[None]"] = None
+        self._read_error: Optional[Exception] = None
+        self._fd: Optional[int] = None
+        if serial.is_open:
+            self._start_reading()
+
+    async def read_until(self, match: bytes) -> bytes:
+        """
+        Read data until match.
+
+        Args:
+            match: a sequence of bytes to match
+
+        Returns:
+            read data, including the match. If the timeout passes first,
+            whatever data has been read.
+
+        Raises: SerialException if the port has failed or been closed.
+        """
+        timeout = self._timeouts["timeout"]
+        deadline = None if timeout is None else self._loop.time() + timeout
+
+        while True:
+            index = self._buffer.find(match)
+            if index >= 0:
+                end = index + len(match)
+                data = bytes(self._buffer[:end])
+                del self._buffer[:end]
+                return data
+
+            if self._read_error is not None:
+                raise self._read_error
+
+            remaining = None if deadline is None else deadline - self._loop.time()
+            if remaining is not None and remaining <= 0:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                return data
+
+            await self._wait_for_data(remaining)
+
+    async def write(self, data: bytes, keep_input_buffer: bool = False) -> None:
+        """
+        Write data
+
+        Args:
+            data: data to write.
+            keep_input_buffer: do not reset the input buffer before writing,
+             even if the connection was created to do so.
+
+        Returns:
+            None
+
+        Raises: SerialTimeoutException if the write timeout passes before
+         all data is written.
+        """
+        if self._fd is None:
+            raise SerialException("Attempting to use a port that is not open")
+
+        if self._reset_buffer_before_write and not keep_input_buffer:
+            self._serial.reset_input_buffer()
+            self._buffer.clear()
+
+        remaining = memoryview(data)
+        while remaining:
+            try:
+                written = os.write(self._fd, remaining)
+            except (BlockingIOError, InterruptedError):
+                written = 0
+            remaining = remaining[written:]
+            if remaining:
+                await self._wait_for_writable(self._timeouts["write_timeout"])
+
+    async def open(self) -> None:
+        """
+        Open the connection.
+
+        Returns: None
+        """
+        await super().open()
+        self._start_reading()
+
+    async def close(self) -> None:
+        """
+        Close the connection
+
+        Returns: None
+        """
+        self._stop_reading(SerialException("Port closed"))
+        await super().close()
+
+    @contextlib.asynccontextmanager
+    async def timeout_override(
+        self, timeout_property: TimeoutProperties, timeout: Optional[float]
+    ) -> AsyncGenerator[None, None]:
+        """Context manager that will temporarily override the default timeout."""
+        default_timeout = self._timeouts[timeout_property]
+        if timeout is not None:
+            self._timeouts[timeout_property] = timeout
+        try:
+            yield
+        finally:
+            self._timeouts[timeout_property] = default_timeout
+
+    def _start_reading(self) -> None:
+        fd: int = self._serial.fileno()
+        self._buffer.clear()
+        self._read_error = None
+        os.set_blocking(fd, False)
+        self._loop.add_reader(fd, self._on_readable)
+        self._fd = fd
+
+    def _stop_reading(self, error: Exception) -> None:
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        self._read_error = error
+        self._wake_reader()
+
+    def _on_readable(self) -> None:
+        assert self._fd is not None
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self._stop_reading(SerialException(f"read failed: {e}"))
+            return
+
+        if not data:
+            # Same condition, and message, as a blocking Serial read
+            self._stop_reading(
+                SerialException(
+                    "device reports readiness to read but returned no data "
+                    "(device disconnected or multiple access on port?)"
+                )
+            )
+            return
+
+        self._buffer += data
+        self._wake_reader()
+
+    def _wake_reader(self) -> None:
+        if self._read_waiter is not None and not self._read_waiter.done():
+            self._read_waiter.set_result(None)
+
+    async def _wait_for_data(self, timeout: Optional[float]) -> None:
+        waiter = self._loop.create_future()
+        timer = (
+            self._loop.call_later(timeout, _set_future_done, waiter)
+            if timeout is not None
+            else None
+        )
+        self._read_waiter = waiter
+        try:
+            await waiter
+        finally:
+            self._read_waiter = None
+            if timer is not None:
+                timer.cancel()
+
+    async def _wait_for_writable(self, timeout: Optional[float]) -> None:
+        assert self._fd is not None
+        fd = self._fd
+        waiter = self._loop.create_future()
+        self._loop.add_writer(fd, _set_future_done, waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError as e:
+            raise SerialTimeoutException("Write timeout") from e
+        finally:
+            self._loop.remove_writer(fd)
+
+
+def _set_future_done(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -1,4 +1,5 @@
 """Errors raised by serial connection."""
+from typing import Optional
 
 
 class SerialException(Exception):
@@ -17,11 +18,16 @@ class NoResponse(SerialException):
 
 
 class FailedCommand(SerialException):
-    def __init__(self, port: str, response: str):
+    def __init__(
+        self, port: str, response: str, pipelined_command: Optional[str] = None
+    ):
         super().__init__(
             port=port, description=f"'Received error response '{response}'"
         )
         self.response = response
+        #: The pipelined command that failed, if it was not the command just
+        #: sent, as when a pipelined command's response is read later
+        self.pipelined_command = pipelined_command
 
 
 class AlarmResponse(FailedCommand):
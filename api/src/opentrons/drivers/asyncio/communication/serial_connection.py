@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 from opentrons.drivers.command_builder import CommandBuilder
 
-from .errors import NoResponse, AlarmResponse, ErrorResponse
+from .errors import (
+    NoResponse,
+    AlarmResponse,
+    ErrorResponse,
+    FailedCommand,
+    SerialException,
+)
 from .async_serial import AsyncSerial
 
 log = logging.getLogger(__name__)
@@ -99,6 +106,8 @@ class SerialConnection:
         self._send_data_lock = asyncio.Lock()
         self._error_keyword = error_keyword.lower()
         self._alarm_keyword = alarm_keyword.lower()
+        # Pipelined commands that have been sent but not yet acked, oldest first
+        self._pending: Deque[str] = deque()
 
     async def send_command(
         self, command: CommandBuilder, retries: int = 0, timeout: Optional[float] = None
@@ -137,8 +146,113 @@ class SerialConnection:
         async with self._send_data_lock, self._serial.timeout_override(
             "timeout", timeout
         ):
+            await self._flush_pipeline()
             return await self._send_data(data=data, retries=retries)
 
+    async def send_data_pipelined(
+        self, data: str, window: int, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Send data without waiting for its response.
+
+        Up to `window` pipelined commands may be awaiting their responses at
+        once; if the window is full, this waits for the oldest response
+        first. Responses are matched to commands in the order they were sent
+        and are checked for errors, but are otherwise discarded. Any command
+        sent with `send_data` waits for all outstanding responses first.
+
+        An error in a pipelined command's response is raised from whichever
+        later call reads it, with the failed command as its
+        `pipelined_command`.
+        Pipelined commands are never retried.
+
+        Args:
+            data: The data to send.
+            window: maximum number of commands awaiting a response.
+            timeout: optional override of default timeout in seconds
+
+        Returns: None
+
+        Raises: SerialException
+        """
+        async with self._send_data_lock, self._serial.timeout_override(
+            "timeout", timeout
+        ):
+            while self._pending and len(self._pending) >= window:
+                await self._read_pipelined_response()
+
+            data_encode = data.encode()
+            log.debug(f"{self.name}: Write (pipelined) -> {data_encode!r}")
+            # Responses to earlier commands may already be in the input
+            # buffer, so it must not be reset before this write
+            await self._serial.write(
+                data=data_encode, keep_input_buffer=len(self._pending) > 0
+            )
+            self._pending.append(data)
+
+    async def flush_pipeline(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the responses to all pipelined commands.
+
+        Args:
+            timeout: optional override of default timeout in seconds
+
+        Returns: None
+
+        Raises: SerialException
+        """
+        async with self._send_data_lock, self._serial.timeout_override(
+            "timeout", timeout
+        ):
+            await self._flush_pipeline()
+
+    @property
+    def pipeline_depth(self) -> int:
+        """The number of pipelined commands awaiting a response."""
+        return len(self._pending)
+
+    async def _flush_pipeline(self) -> None:
+        while self._pending:
+            await self._read_pipelined_response()
+
+    async def _read_pipelined_response(self) -> None:
+        """
+        Read and check the response to the oldest pipelined command.
+
+        On an error, the responses of any later pipelined commands are
+        discarded so that the next command's response is read correctly.
+
+        Raises: SerialException
+        """
+        data = self._pending.popleft()
+        response = await self._serial.read_until(match=self._ack)
+        log.debug(f"{self.name}: Read (pipelined) <- {response!r}")
+
+        if self._ack not in response:
+            # Without an ack, there is no telling which response is next
+            self._pending.clear()
+            raise NoResponse(port=self._port, command=data)
+
+        str_response = self.process_raw_response(
+            command=data, response=response.replace(self._ack, b"").decode()
+        )
+
+        try:
+            self.raise_on_error(response=str_response)
+        except SerialException as e:
+            if isinstance(e, FailedCommand):
+                e.pipelined_command = data
+            await self._discard_pipelined_responses()
+            raise
+
+    async def _discard_pipelined_responses(self) -> None:
+        while self._pending:
+            self._pending.popleft()
+            response = await self._serial.read_until(match=self._ack)
+            log.debug(f"{self.name}: Discard (pipelined) <- {response!r}")
+            if self._ack not in response:
+                self._pending.clear()
+
     async def _send_data(self, data: str, retries: int = 0) -> str:
         """
         Send data and return the response.
@@ -13,7 +13,17 @@ import contextlib
 import logging
 from os import environ
 from time import time
-from typing import Any, Dict, Optional, Union, List, Tuple, cast, AsyncIterator
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    cast,
+    AsyncIterator,
+    FrozenSet,
+)
 
 from math import isclose
 
@@ -68,6 +78,7 @@ from opentrons.drivers.asyncio.communication import (
     NoResponse,
     AlarmResponse,
     ErrorResponse,
+    FailedCommand,
 )
 from opentrons.drivers.types import MoveSplits
 from opentrons.drivers.utils import AxisMoveTimestamp, ParseError, string_to_hex
@@ -85,6 +96,48 @@ def _command_builder() -> CommandBuilder:
     return CommandBuilder(terminator=SMOOTHIE_COMMAND_TERMINATOR)
 
 
+# Set to a positive number of commands to enable pipelined G-code
+PIPELINE_WINDOW_ENV = "OT_SMOOTHIE_PIPELINE_WINDOW"
+
+# G-codes that are queued in smoothieware's motion planner, or only change
+# how later G-codes are parsed. These can be sent while motion is running.
+_PLANNER_GCODES: FrozenSet[str] = frozenset(
+    {GCODE.MOVE.value, GCODE.ABSOLUTE_COORDS.value, GCODE.RELATIVE_COORDS.value}
+)
+
+# G-codes that take effect as soon as they are received, and that have no
+# response other than an ack. These can be pipelined once motion is done.
+_SETTING_GCODES: FrozenSet[str] = frozenset(
+    {
+        GCODE.DWELL.value,
+        GCODE.SET_CURRENT.value,
+        GCODE.ACCELERATION.value,
+        GCODE.SET_MAX_SPEED.value,
+        GCODE.MICROSTEPPING_B_ENABLE.value,
+        GCODE.MICROSTEPPING_B_DISABLE.value,
+        GCODE.MICROSTEPPING_C_ENABLE.value,
+        GCODE.MICROSTEPPING_C_DISABLE.value,
+    }
+)
+
+
+def _get_gcodes(command: CommandBuilder) -> FrozenSet[str]:
+    """Get the G-codes in a command, including any in raw command strings."""
+    return frozenset(
+        element.split(" ")[0]
+        for element in command
+        if element[:1] in "GM" and element[1:2].isdigit()
+    )
+
+
+def _get_pipeline_window_from_env() -> int:
+    try:
+        return max(0, int(environ.get(PIPELINE_WINDOW_ENV, "0")))
+    except ValueError:
+        log.warning(f"Ignoring invalid {PIPELINE_WINDOW_ENV} value")
+        return 0
+
+
 class SmoothieDriver:
     @classmethod
     async def build(
@@ -202,6 +255,16 @@ class SmoothieDriver:
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
 
+        # Pipelined G-code: up to this many commands may be sent before their
+        # acks are read. Zero means every command waits for its ack and M400.
+        self._pipeline_window = _get_pipeline_window_from_env()
+        # Whether any pipelined commands have been sent since the last
+        # synchronous command, the last pipelined move if moves may still be
+        # running, and how long to wait for them to finish
+        self._pipeline_in_use = False
+        self._pending_move: Optional[str] = None
+        self._motion_timeout = 0.0
+
     @property
     def gpio_chardev(self) -> GPIODriverLike:
         return self._gpio_chardev
@@ -210,6 +273,55 @@ class SmoothieDriver:
     def gpio_chardev(self, gpio_chardev: GPIODriverLike) -> None:
         self._gpio_chardev = gpio_chardev
 
+    @property
+    def pipeline_window(self) -> int:
+        """
+        The number of G-code commands that may be sent before their acks
+        are read. Zero, the default, disables pipelining.
+
+        When pipelining is enabled, moves and settings commands are sent
+        without waiting for them to complete. A move returns once smoothie
+        has queued it, and only the next command that has to observe its
+        result (a position read, a home, a current change, a delay...)
+        waits for motion to finish. Pipelining is disabled again if any
+        command fails.
+        """
+        return self._pipeline_window
+
+    @pipeline_window.setter
+    def pipeline_window(self, window: int) -> None:
+        self._pipeline_window = max(0, window)
+
+    @contextlib.asynccontextmanager
+    async def pipelined_moves(self) -> AsyncIterator[None]:
+        """
+        Wait for the commands sent in the context to complete when it exits.
+
+        If pipelining is enabled (see :py:attr:`pipeline_window`), a path of
+        moves sent in the context is streamed to smoothie without a full stop
+        after each one, while the caller still sees the whole path done when
+        the context exits. If it is not, as by default, each move already
+        waits for itself and this does nothing.
+
+        If the context raises, the pipeline is not waited for here: the next
+        command reads what is left of it.
+        """
+        yield
+        try:
+            await self._finish_pipeline(DEFAULT_ACK_TIMEOUT)
+        except AlarmResponse as e:
+            self._handle_return(
+                ret_code=e.response,
+                is_alarm=True,
+                pipelined_command=e.pipelined_command,
+            )
+        except ErrorResponse as e:
+            self._handle_return(
+                ret_code=e.response,
+                is_error=True,
+                pipelined_command=e.pipelined_command,
+            )
+
     @property
     def homed_position(self) -> Dict[str, float]:
         return self._homed_position.copy()
@@ -419,6 +531,8 @@ class SmoothieDriver:
 
             log.info(f"Connecting to smoothie at port {port}")
 
+            self._pipeline_in_use = False
+            self._pending_move = None
             self._connection = await SmoothieConnection.create(
                 port=port,
                 baud_rate=self._config.serial_speed,
@@ -816,7 +930,6 @@ class SmoothieDriver:
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     async def _send_command(
         self,
         command: CommandBuilder,
@@ -873,16 +986,22 @@ class SmoothieDriver:
             # is locking at a higher level like in APIv2.
             await self._reset_from_error()
             error_axis = se.ret_code.strip()[-1]
+            # A pipelined command's failure may be read while sending a
+            # later command, so handle the error as the failed command's
+            failed_command = se.pipelined_command or str(command)
+            failed_elements = failed_command.split()
             if not suppress_error_msg:
-                log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
+                log.warning(
+                    f"alarm/error: command={failed_command}, resp={se.ret_code}"
+                )
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in failed_elements or GCODE.PROBE in failed_elements
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
                 log.info("Homing after alarm/error")
                 await self.home(error_axis)
-            raise SmoothieError(se.ret_code, str(command))
+            raise SmoothieError(se.ret_code, failed_command)
 
     async def _send_command_unsynchronized(
         self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
@@ -890,6 +1009,9 @@ class SmoothieDriver:
         assert self._connection, "There is no connection."
         command_result = ""
         try:
+            if await self._send_pipelined(command, ack_timeout, execute_timeout):
+                return command_result
+
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
@@ -900,13 +1022,115 @@ class SmoothieDriver:
                 command=wait_command, retries=0, timeout=execute_timeout
             )
         except AlarmResponse as e:
-            self._handle_return(ret_code=e.response, is_alarm=True)
+            self._handle_return(
+                ret_code=e.response,
+                is_alarm=True,
+                pipelined_command=e.pipelined_command,
+            )
         except ErrorResponse as e:
-            self._handle_return(ret_code=e.response, is_error=True)
+            self._handle_return(
+                ret_code=e.response,
+                is_error=True,
+                pipelined_command=e.pipelined_command,
+            )
         return command_result
 
+    async def _send_pipelined(
+        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+    ) -> bool:
+        """
+        Send a command without waiting for it, if pipelining allows.
+
+        If the command cannot be pipelined, wait for all previously
+        pipelined commands to complete instead, so the caller can send
+        it synchronously.
+
+        Returns: whether the command was sent.
+        """
+        assert self._connection, "There is no connection."
+        gcodes = _get_gcodes(command)
+        try:
+            if not self._can_pipeline(gcodes):
+                await self._finish_pipeline(ack_timeout)
+                return False
+
+            if not gcodes <= _PLANNER_GCODES:
+                # Settings take effect immediately, so must not change
+                # under a move that is still running
+                await self._wait_for_motion()
+            await self._connection.send_data_pipelined(
+                data=command.build(),
+                window=self._pipeline_window,
+                timeout=ack_timeout,
+            )
+        except (AlarmResponse, ErrorResponse, NoResponse) as e:
+            self._stop_pipelining(e)
+            raise
+
+        self._pipeline_in_use = True
+        if GCODE.MOVE.value in gcodes:
+            self._pending_move = command.build()
+            self._motion_timeout = max(self._motion_timeout, execute_timeout)
+        return True
+
+    async def _finish_pipeline(self, ack_timeout: float) -> None:
+        """Wait for all pipelined commands to be acked and to complete."""
+        if not self._pipeline_in_use:
+            return
+        assert self._connection, "There is no connection."
+        try:
+            await self._connection.flush_pipeline(timeout=ack_timeout)
+            await self._wait_for_motion()
+        except (AlarmResponse, ErrorResponse, NoResponse) as e:
+            self._stop_pipelining(e)
+            raise
+        self._pipeline_in_use = False
+
+    def _can_pipeline(self, gcodes: FrozenSet[str]) -> bool:
+        """Check whether a command can be sent without waiting for it."""
+        if self._pipeline_window == 0 or not gcodes:
+            return False
+        if gcodes == {GCODE.DWELL.value}:
+            # A bare dwell is a delay, which callers expect to block
+            return False
+        return gcodes <= _PLANNER_GCODES | _SETTING_GCODES
+
+    async def _wait_for_motion(self) -> None:
+        """
+        Wait for any pipelined moves to finish executing.
+
+        An alarm or error while waiting is raised as a failure of the last
+        pipelined move, since that is what was running.
+        """
+        if self._pending_move is None:
+            return
+        assert self._connection, "There is no connection."
+        wait_command = _command_builder().add_gcode(gcode=GCODE.WAIT)
+        try:
+            await self._connection.send_command(
+                command=wait_command, retries=0, timeout=self._motion_timeout
+            )
+        except FailedCommand as e:
+            e.pipelined_command = self._pending_move
+            raise
+        self._pending_move = None
+        self._motion_timeout = 0.0
+
+    def _stop_pipelining(self, error: Exception) -> None:
+        """Fall back to sending commands synchronously after an error."""
+        self._pipeline_in_use = False
+        self._pending_move = None
+        self._motion_timeout = 0.0
+        if self._pipeline_window > 0:
+            log.warning(f"Disabling pipelined G-code after error: {error}")
+            self._pipeline_window = 0
+
     def _handle_return(
-        self, ret_code: str, is_alarm: bool = False, is_error: bool = False
+        self,
+        ret_code: str,
+        is_alarm: bool = False,
+        is_error: bool = False,
+        pipelined_command: Optional[str] = None,
     ) -> None:
         """Check the return string from smoothie for an error condition.
 
@@ -916,6 +1140,9 @@ class SmoothieDriver:
         is used for things like cancelling protocols and needs to be
         handled elsewhere. In that case, we raise SmoothieAlarm, which isn't
         (and shouldn't be) handled by the normal error handling.
+
+        If `pipelined_command` is given, it is the pipelined command that
+        failed, when that was not the command being sent.
         """
         if self._is_hard_halting.is_set():
             # This is the alarm from setting the hard halt
@@ -924,13 +1151,13 @@ class SmoothieDriver:
                 raise SmoothieAlarm(ret_code)
             elif is_error:
                 # this would be a race condition
-                raise SmoothieError(ret_code)
+                raise SmoothieError(ret_code, pipelined_command=pipelined_command)
         else:
             if is_alarm or is_error:
                 # info-level logging for errors of form "no L instrument found"
                 if "instrument found" in ret_code.lower():
                     log.info(f"smoothie: {ret_code}")
-                    raise SmoothieError(ret_code)
+                    raise SmoothieError(ret_code, pipelined_command=pipelined_command)
 
                 # the two errors below happen when we're recovering from a hard
                 # halt. in that case, some try/finallys above us may send
@@ -943,7 +1170,7 @@ class SmoothieDriver:
                     and "after halt you should home" not in ret_code.lower()
                 ):
                     log.error(f"alarm/error outside hard halt: {ret_code}")
-                    raise SmoothieError(ret_code)
+                    raise SmoothieError(ret_code, pipelined_command=pipelined_command)
 
     async def _home_x(self) -> None:
         log.debug("_home_x")
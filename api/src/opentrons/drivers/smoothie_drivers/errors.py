@@ -3,10 +3,16 @@ from typing import Optional
 
 class SmoothieError(Exception):
     def __init__(
-        self, ret_code: Optional[str] = None, command: Optional[str] = None
+        self,
+        ret_code: Optional[str] = None,
+        command: Optional[str] = None,
+        pipelined_command: Optional[str] = None,
     ) -> None:
         self.ret_code = ret_code or ""
         self.command = command
+        #: The pipelined command that failed, if the error was read while
+        #: sending a later command
+        self.pipelined_command = pipelined_command
         super().__init__()
 
     def __repr__(self) -> str:
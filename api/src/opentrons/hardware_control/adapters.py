@@ -2,7 +2,25 @@
 """
 import asyncio
 import functools
-from typing import Generic, TypeVar, Callable, Any, cast
+import threading
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    cast,
+)
 from .protocols import AsyncioConfigurable
 
 
@@ -11,6 +29,290 @@ WrappedReturn = TypeVar("WrappedReturn")
 WrappedFunc = TypeVar("WrappedFunc", bound=Callable[..., WrappedReturn])
 
 
+class PropertySnapshot:
+    """Copies of read-only properties of an object living in another thread.
+
+    Reading a property of the hardware API from outside its thread races with
+    the API changing it. A snapshot instead serves values read in the API's
+    own thread. Each property is given with the methods whose calls may change
+    it. A bridged coroutine call to one of those refreshes the property in the
+    API's thread at the end of the call, and a bridged synchronous call to one
+    (which runs in the caller's thread) marks it stale, so the next read
+    refreshes it with a single call into the API's thread. Other calls leave
+    the snapshot alone.
+
+    Only properties that change solely through calls to the object belong
+    here: a property changed by the object itself, like the door state, would
+    be served stale. Only properties that have been read are refreshed.
+    Values must be built of dicts, lists and immutable values. The object may
+    change its own dicts and lists in place, so the snapshot copies them when
+    it is taken, and every read gets its own copy.
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        loop: asyncio.AbstractEventLoop,
+        properties: Mapping[str, Optional[Iterable[str]]],
+        thread: Optional[threading.Thread] = None,
+    ) -> None:
+        """Build the snapshot.
+
+        :param obj: The object whose properties to copy
+        :param loop: The event loop of the thread ``obj`` lives in
+        :param properties: The names of the properties to serve, each with the
+                           names of the methods whose calls may change it, or
+                           ``None`` if any call may
+        :param thread: The thread ``obj`` lives in. Reads from that thread are
+                       served from ``obj`` directly.
+        """
+        self._obj = obj
+        self._loop = loop
+        self._changed_by: Dict[str, Optional[FrozenSet[str]]] = {
+            name: None if methods is None else frozenset(methods)
+            for name, methods in properties.items()
+        }
+        self._thread = thread
+        self._lock = threading.Lock()
+        self._wanted: Set[str] = set()
+        self._values: Dict[str, Any] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._changed_by
+
+    def changes(self, method: str) -> bool:
+        """Whether a call to a method may change a property in the snapshot."""
+        return any(
+            methods is None or method in methods
+            for methods in self._changed_by.values()
+        )
+
+    def get(self, name: str) -> Any:
+        """Read a property, from the snapshot if it is fresh."""
+        if threading.current_thread() is self._thread:
+            return getattr(self._obj, name)
+        # The values dict is replaced, never changed, so this is consistent
+        values = self._values
+        try:
+            return _copy_value(values[name])
+        except KeyError:
+            pass
+        with self._lock:
+            self._wanted.add(name)
+        value = asyncio.run_coroutine_threadsafe(self._read(name), self._loop)
+        return _copy_value(value.result())
+
+    def refresh(self, methods: Optional[Iterable[str]] = None) -> None:
+        """Read the wanted properties. Call in the object's thread.
+
+        :param methods: Only read the properties that calls to these methods
+                        may have changed. If not specified, read them all.
+        """
+        checked = None if methods is None else list(methods)
+        with self._lock:
+            names = [
+                name
+                for name in self._wanted
+                if checked is None
+                or any(self._may_change(method, name) for method in checked)
+            ]
+        if names:
+            self._update(names)
+
+    def invalidate(self, method: str) -> None:
+        """Mark what a call to a method may change as stale."""
+        with self._lock:
+            self._values = {
+                name: value
+                for name, value in self._values.items()
+                if not self._may_change(method, name)
+            }
+
+    def refreshing(
+        self, method: str, func: Callable[..., Awaitable[WrappedReturn]]
+    ) -> Callable[..., Awaitable[WrappedReturn]]:
+        """Wrap a coroutine method to refresh the snapshot after calls.
+
+        The wrapped function must be awaited in the object's thread. Methods
+        that change nothing in the snapshot are returned unwrapped.
+        """
+        if not self.changes(method):
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> WrappedReturn:
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.refresh([method])
+
+        return wrapper
+
+    def wrap_sync(self, method: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a synchronous method to mark the snapshot stale after calls.
+
+        Methods that change nothing in the snapshot are returned unwrapped.
+        """
+        if not self.changes(method):
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.invalidate(method)
+
+        return wrapper
+
+    def _may_change(self, method: str, name: str) -> bool:
+        methods = self._changed_by[name]
+        return methods is None or method in methods
+
+    def _update(self, names: Iterable[str]) -> Dict[str, Any]:
+        fresh = {name: _copy_value(getattr(self._obj, name)) for name in names}
+        with self._lock:
+            self._values = {**self._values, **fresh}
+        return fresh
+
+    async def _read(self, name: str) -> Any:
+        return self._update([name])[name]
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy the dicts and lists in a value."""
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+class _BatchedCall(NamedTuple):
+    name: str
+    is_call: bool
+    args: Sequence[Any]
+    kwargs: Mapping[str, Any]
+    future: "Future[Any]"
+
+
+class CallBatch:
+    """Calls to an object in another thread, run there in one transaction.
+
+    Record calls and property reads by using the batch like the object. Each
+    returns a :py:class:`concurrent.futures.Future` for its result. Running the
+    batch makes a single trip into the object's thread, where the calls run
+    in order. If one raises, its future gets the exception, the rest are
+    cancelled, and the run raises it.
+
+    Example
+    -------
+    .. code-block::
+    >>> with sync_api.batch() as batch:
+    ...     left = batch.current_position(Mount.LEFT)
+    ...     right = batch.current_position(Mount.RIGHT)
+    ...     pipettes = batch.attached_instruments
+    >>> left.result()
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        loop: asyncio.AbstractEventLoop,
+        snapshot: Optional[PropertySnapshot] = None,
+    ) -> None:
+        """Build the batch.
+
+        :param obj: The object to call
+        :param loop: The event loop of the thread ``obj`` lives in
+        :param snapshot: A snapshot to refresh after the calls
+        """
+        self._obj = obj
+        self._loop = loop
+        self._snapshot = snapshot
+        self._calls: List[_BatchedCall] = []
+
+    def __getattr__(self, name: str) -> Any:
+        obj = object.__getattribute__(self, "_obj")
+        if isinstance(getattr(type(obj), name, None), property):
+            return self._record(name, False, (), {})
+        if not callable(getattr(obj, name)):
+            raise AttributeError(f"{name} is neither a method nor a property")
+
+        def record(*args: Any, **kwargs: Any) -> "Future[Any]":
+            return self._record(name, True, args, kwargs)
+
+        return record
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __enter__(self) -> "CallBatch":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.run()
+        else:
+            self._cancel(self._calls)
+
+    def run(self) -> List[Any]:
+        """Run the recorded calls, blocking until they are done.
+
+        :returns: The results of the calls in the order they were recorded
+        """
+        calls, self._calls = self._calls, []
+        asyncio.run_coroutine_threadsafe(self._run(calls), self._loop).result()
+        return [call.future.result() for call in calls]
+
+    async def run_async(self) -> List[Any]:
+        """Run the recorded calls from another event loop.
+
+        :returns: The results of the calls in the order they were recorded
+        """
+        calls, self._calls = self._calls, []
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._run(calls), self._loop)
+        )
+        return [call.future.result() for call in calls]
+
+    def _record(
+        self,
+        name: str,
+        is_call: bool,
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any],
+    ) -> "Future[Any]":
+        call = _BatchedCall(name, is_call, args, kwargs, Future())
+        self._calls.append(call)
+        return call.future
+
+    async def _run(self, calls: List[_BatchedCall]) -> None:
+        try:
+            for index, call in enumerate(calls):
+                if not call.future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = getattr(self._obj, call.name)
+                    if call.is_call:
+                        result = result(*call.args, **call.kwargs)
+                        if asyncio.iscoroutine(result):
+                            result = await result
+                except Exception as e:
+                    call.future.set_exception(e)
+                    self._cancel(calls[index + 1 :])
+                    return
+                call.future.set_result(result)
+        finally:
+            if self._snapshot is not None:
+                self._snapshot.refresh(call.name for call in calls if call.is_call)
+
+    @staticmethod
+    def _cancel(calls: Iterable[_BatchedCall]) -> None:
+        for call in calls:
+            call.future.cancel()
+
+
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
 # instance and setattr on the outer instance with the proper async resolution
@@ -41,16 +343,33 @@ class SynchronousAdapter(Generic[WrappedObj]):
     >>> sync_api.home()
     """
 
-    def __init__(self, asynchronous_instance: WrappedObj) -> None:
+    def __init__(
+        self,
+        asynchronous_instance: WrappedObj,
+        snapshot: Optional[PropertySnapshot] = None,
+    ) -> None:
         """Build the SynchronousAdapter.
 
         :param asynchronous_instance: The asynchronous class instance to wrap
+        :param snapshot: Serve the properties in this snapshot from it
         """
         self._obj_to_adapt = asynchronous_instance
+        self._snapshot = snapshot
 
     def __repr__(self) -> str:
         return "<SynchronousAdapter>"
 
+    def batch(self) -> CallBatch:
+        """Start a batch of calls to run in the adapted object's thread at once.
+
+        :returns: A :py:class:`CallBatch`, best used as a context manager
+        """
+        return CallBatch(
+            object.__getattribute__(self, "_obj_to_adapt"),
+            object.__getattribute__(self, "_obj_to_adapt")._loop,
+            object.__getattribute__(self, "_snapshot"),
+        )
+
     @staticmethod
     def call_coroutine_sync(
         loop: asyncio.AbstractEventLoop,
@@ -69,23 +388,20 @@ class SynchronousAdapter(Generic[WrappedObj]):
         # Almost every attribute retrieved from us will be for people actually
         # looking for an attribute of the hardware API, so check there first.
         obj_to_adapt = object.__getattribute__(self, "_obj_to_adapt")
+        snapshot = object.__getattribute__(self, "_snapshot")
+        if snapshot is not None and attr_name in snapshot:
+            return snapshot.get(attr_name)
         try:
             inner_attr = getattr(obj_to_adapt, attr_name)
         except AttributeError:
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
-        check = inner_attr
-        if isinstance(inner_attr, functools.partial):
-            # if partial func check passed in func
-            check = inner_attr.func
-        try:
-            # if decorated func check wrapped func
-            check = check.__wrapped__
-        except AttributeError:
-            pass
+        check = _unwrap(inner_attr)
         if asyncio.iscoroutinefunction(check):
             # Return a synchronized version of the coroutine
+            if snapshot is not None:
+                inner_attr = snapshot.refreshing(attr_name, inner_attr)
             return functools.partial(
                 object.__getattribute__(self, "call_coroutine_sync"),
                 obj_to_adapt._loop,
@@ -95,5 +411,21 @@ class SynchronousAdapter(Generic[WrappedObj]):
             # Catch awaitable properties and reify the future before returning
             fut = asyncio.run_coroutine_threadsafe(check, obj_to_adapt._loop)
             return fut.result()
+        elif snapshot is not None and callable(inner_attr):
+            return snapshot.wrap_sync(attr_name, inner_attr)
 
         return inner_attr
+
+
+def _unwrap(attr: Any) -> Any:
+    """Find the function behind a partial or decorated function."""
+    check = attr
+    if isinstance(attr, functools.partial):
+        # if partial func check passed in func
+        check = attr.func
+    try:
+        # if decorated func check wrapped func
+        check = check.__wrapped__
+    except AttributeError:
+        pass
+    return check
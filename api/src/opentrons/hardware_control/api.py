@@ -293,6 +293,10 @@ class API(
 
         return unregister
 
+    def clear_callbacks(self) -> None:
+        """Unregister every callback registered with :py:meth:`register_callback`."""
+        self._callbacks.clear()
+
     def get_fw_version(self) -> str:
         """
         Return the firmware version of the connected motor control board.
@@ -660,6 +664,54 @@ class API(
         await self._cache_and_maybe_retract_mount(mount)
         await self._move(target_position, speed=speed, max_speeds=max_speeds)
 
+    async def move_path(
+        self,
+        mount: top_types.Mount,
+        waypoints: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """
+        Move the critical point of the specified mount through each waypoint
+        in turn.
+
+        If the backend streams paths, which is opted into with
+        ``OT_SMOOTHIE_PIPELINE_WINDOW``, the whole path is transformed to
+        machine coordinates up front and handed to the backend at once, to
+        move through without stopping at each waypoint. Otherwise this moves
+        to each waypoint in turn with :py:meth:`move_to`.
+        """
+        if not waypoints:
+            return
+
+        if not self._backend.streams_move_paths:
+            for abs_position, critical_point in waypoints:
+                await self.move_to(
+                    mount,
+                    abs_position,
+                    speed=speed,
+                    critical_point=critical_point,
+                    max_speeds=max_speeds,
+                )
+            return
+
+        if not self._current_position:
+            await self.home()
+
+        target_positions = [
+            target_position_from_absolute(
+                mount,
+                abs_position,
+                partial(self.critical_point_for, cp_override=critical_point),
+                top_types.Point(*self._config.left_mount_offset),
+                top_types.Point(0, 0, 0),
+            )
+            for abs_position, critical_point in waypoints
+        ]
+
+        await self._cache_and_maybe_retract_mount(mount)
+        await self._move_path(target_positions, speed=speed, max_speeds=max_speeds)
+
     async def move_rel(
         self,
         mount: top_types.Mount,
@@ -734,20 +786,7 @@ class API(
         at most one of a ZA or BC components. The frame in which to move
         is identified by the presence of (ZA) or (BC).
         """
-        machine_pos = machine_from_deck(
-            target_position,
-            self._robot_calibration.deck_calibration.attitude,
-            top_types.Point(0, 0, 0),
-        )
-
-        bounds = self._backend.axis_bounds
-        to_check = {
-            ax: machine_pos[ax.name]
-            for idx, ax in enumerate(target_position.keys())
-            if ax in Axis.gantry_axes()
-        }
-
-        check_motion_bounds(to_check, target_position, bounds, check_bounds)
+        machine_pos = self._machine_position(target_position, check_bounds)
         checked_maxes = max_speeds or {}
         str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
         async with contextlib.AsyncExitStack() as stack:
@@ -767,6 +806,64 @@ class API(
             else:
                 self._current_position.update(target_position)
 
+    @ExecutionManagerProvider.wait_for_running
+    async def _move_path(
+        self,
+        target_positions: Sequence["OrderedDict[Axis, float]"],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """Worker function to move through a path of target positions.
+
+        Each of ``target_positions`` is as for :py:meth:`_move`. All of them
+        are transformed to machine coordinates before any motion starts. As
+        for :py:meth:`move_to`, they are not bounds-checked.
+        """
+        machine_positions = [
+            self._machine_position(target_position, MotionChecks.NONE)
+            for target_position in target_positions
+        ]
+        checked_maxes = max_speeds or {}
+        str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
+        async with self._motion_lock:
+            try:
+                await self._backend.move_path(
+                    machine_positions,
+                    speed=speed,
+                    home_flagged_axes=True,
+                    axis_max_speeds=str_maxes,
+                )
+            except Exception:
+                self._log.exception("Move failed")
+                self._current_position.clear()
+                raise
+            else:
+                for target_position in target_positions:
+                    self._current_position.update(target_position)
+
+    def _machine_position(
+        self,
+        target_position: "OrderedDict[Axis, float]",
+        check_bounds: MotionChecks,
+    ) -> Dict[str, float]:
+        """Transform a deck calibrated target position to machine coordinates,
+        checking it against the axis bounds."""
+        machine_pos = machine_from_deck(
+            target_position,
+            self._robot_calibration.deck_calibration.attitude,
+            top_types.Point(0, 0, 0),
+        )
+
+        bounds = self._backend.axis_bounds
+        to_check = {
+            ax: machine_pos[ax.name]
+            for idx, ax in enumerate(target_position.keys())
+            if ax in Axis.gantry_axes()
+        }
+
+        check_motion_bounds(to_check, target_position, bounds, check_bounds)
+        return machine_pos
+
     def get_engaged_axes(self) -> Dict[Axis, bool]:
         """Which axes are engaged and holding."""
         return {Axis[ax]: eng for ax, eng in self._backend.engaged_axes().items()}
@@ -160,6 +160,42 @@ class Controller:
                 target_position, home_flagged_axes=home_flagged_axes, speed=speed
             )
 
+    @property
+    def streams_move_paths(self) -> bool:
+        """Whether :py:meth:`move_path` streams moves rather than stopping
+        after each one.
+
+        This is opted into by enabling pipelined G-code with
+        ``OT_SMOOTHIE_PIPELINE_WINDOW``.
+        """
+        return self._smoothie_driver.pipeline_window > 0
+
+    async def move_path(
+        self,
+        target_positions: Sequence[Dict[str, float]],
+        home_flagged_axes: bool = True,
+        speed: Optional[float] = None,
+        axis_max_speeds: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Move through each target in turn, streaming the moves to smoothie
+        if pipelining is enabled.
+
+        Pipelined moves do not stop between them unless smoothie's settings
+        have to change. All of the moves are complete when this returns.
+        """
+        async with AsyncExitStack() as cmstack:
+            if axis_max_speeds:
+                await cmstack.enter_async_context(
+                    self._smoothie_driver.restore_axis_max_speed(axis_max_speeds)
+                )
+            async with self._smoothie_driver.pipelined_moves():
+                for target_position in target_positions:
+                    await self._smoothie_driver.move(
+                        target_position,
+                        home_flagged_axes=home_flagged_axes,
+                        speed=speed,
+                    )
+
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         if axes:
             args: Tuple[Any, ...] = ("".join(axes),)
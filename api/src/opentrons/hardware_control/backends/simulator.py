@@ -191,6 +191,20 @@ class Simulator:
         self._position.update(target_position)
         self._engaged_axes.update({ax: True for ax in target_position})
 
+    @property
+    def streams_move_paths(self) -> bool:
+        return False
+
+    async def move_path(
+        self,
+        target_positions: Sequence[Dict[str, float]],
+        home_flagged_axes: bool = True,
+        speed: Optional[float] = None,
+        axis_max_speeds: Optional[Dict[str, float]] = None,
+    ) -> None:
+        for target_position in target_positions:
+            await self.move(target_position, home_flagged_axes, speed, axis_max_speeds)
+
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         # driver_3_0-> HOMED_POSITION
         checked_axes = "".join(axes) if axes else "XYZABC"
@@ -9,7 +9,12 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollPolicy,
+)
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     TemperatureStatus,
@@ -22,6 +27,12 @@ from opentrons.hardware_control.modules.types import (
 log = logging.getLogger(__name__)
 
 POLL_PERIOD = 1
+IDLE_POLL_PERIOD_FACTOR = 5.0
+"""How many times longer to wait between polls while idle or holding."""
+TEMPERATURE_POLL_EPSILON = 0.05
+"""Temperature changes, in degrees Celsius, below which polls are not published."""
+SPEED_POLL_EPSILON = 10
+"""Speed changes, in RPM, below which polls are not published."""
 
 
 class HeaterShakerError(RuntimeError):
@@ -52,7 +63,9 @@ class HeaterShaker(mod_abc.AbstractModule):
             sim_model: The model name used by simulator
             polling_period: the polling period in seconds
             kwargs: further kwargs are in starargs because of inheritance rules.
-            possible values include polling_period: float, a time in seconds to poll
+            possible values include polling_period: float, a time in seconds to poll,
+            idle_polling_period: float, the time while idle or holding, and
+            polling_epsilon: float, the temperature change worth publishing
 
         Returns:
             HeaterShaker instance
@@ -70,6 +83,8 @@ class HeaterShaker(mod_abc.AbstractModule):
             device_info=await driver.get_device_info(),
             loop=loop,
             polling_period=kwargs.get("polling_period"),
+            idle_polling_period=kwargs.get("idle_polling_period"),
+            polling_epsilon=kwargs.get("polling_epsilon", TEMPERATURE_POLL_EPSILON),
         )
         return mod
 
@@ -82,6 +97,8 @@ class HeaterShaker(mod_abc.AbstractModule):
         device_info: Mapping[str, str],
         loop: Optional[asyncio.AbstractEventLoop] = None,
         polling_period: Optional[float] = None,
+        idle_polling_period: Optional[float] = None,
+        polling_epsilon: float = TEMPERATURE_POLL_EPSILON,
     ):
         super().__init__(
             port=port, usb_port=usb_port, loop=loop, execution_manager=execution_manager
@@ -94,6 +111,9 @@ class HeaterShaker(mod_abc.AbstractModule):
             reader=PollerReader(driver=self._driver),
             interval_seconds=poll_time_s,
             listener=self._listener,
+            policy=PollerPolicy(temperature_epsilon=polling_epsilon),
+            idle_interval_seconds=idle_polling_period
+            or poll_time_s * IDLE_POLL_PERIOD_FACTOR,
         )
         # TODO (spp, 2022-02-23): refine this to include user-facing error message.
         self._error_status: Optional[str] = None
@@ -167,6 +187,7 @@ class HeaterShaker(mod_abc.AbstractModule):
 
     async def wait_next_poll(self) -> None:
         """Wait for the next poll to complete."""
+        self._poller.wake()
         await self._listener.wait_next_poll()
 
     @property
@@ -286,6 +307,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
+        self._poller.wake()
 
     async def await_temperature(self, awaiting_temperature: float) -> None:
         """
@@ -350,6 +372,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         """
         await self.wait_for_is_running()
         await self._driver.set_rpm(rpm)
+        self._poller.wake()
 
     async def await_speed(self, awaiting_speed: int) -> None:
         """
@@ -393,12 +416,14 @@ class HeaterShaker(mod_abc.AbstractModule):
         current_status = await self._driver.get_labware_latch_status()
         while status != current_status:
             current_status = await self._driver.get_labware_latch_status()
+        self._poller.wake()
 
     async def deactivate(self) -> None:
         """Stop heating/cooling; stop shaking and home the plate"""
         await self.wait_for_is_running()
         await self._driver.set_temperature(0)
         await self._driver.home()
+        self._poller.wake()
 
     async def open_labware_latch(self) -> None:
         await self.wait_for_is_running()
@@ -438,6 +463,45 @@ class PollerReader(Reader[PollResult]):
         )
 
 
+class PollerPolicy(PollPolicy[PollResult]):
+    """Polls slowly while idle or holding, and publishes changes."""
+
+    def __init__(
+        self,
+        temperature_epsilon: float = TEMPERATURE_POLL_EPSILON,
+        speed_epsilon: int = SPEED_POLL_EPSILON,
+    ) -> None:
+        """Constructor."""
+        self._temperature_epsilon = temperature_epsilon
+        self._speed_epsilon = speed_epsilon
+
+    def is_idle(self, result: PollResult) -> bool:
+        """Idle if not heating, cooling, changing speed or moving the latch."""
+        return (
+            HeaterShaker._get_temperature_status(result.temperature)
+            in (TemperatureStatus.IDLE, TemperatureStatus.HOLDING)
+            and HeaterShaker._get_speed_status(result.rpm)
+            in (SpeedStatus.IDLE, SpeedStatus.HOLDING)
+            and result.labware_latch
+            not in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
+    def changed(self, previous: PollResult, result: PollResult) -> bool:
+        """Changed if a target or the latch changed, or a reading moved past
+        epsilon."""
+        return (
+            previous.labware_latch != result.labware_latch
+            or previous.temperature.target != result.temperature.target
+            or previous.rpm.target != result.rpm.target
+            or abs(previous.temperature.current - result.temperature.current)
+            > self._temperature_epsilon
+            or abs(previous.rpm.current - result.rpm.current) > self._speed_epsilon
+        )
+
+
 class HeaterShakerListener(WaitableListener[PollResult]):
     """Tempdeck state listener."""
 
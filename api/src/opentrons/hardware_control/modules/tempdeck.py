@@ -3,7 +3,12 @@ import logging
 from typing import Mapping, Optional
 
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollPolicy,
+)
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -19,6 +24,10 @@ log = logging.getLogger(__name__)
 
 TEMP_POLL_INTERVAL_SECS = 1.0
 SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+IDLE_POLL_INTERVAL_FACTOR = 5.0
+"""How many times longer to wait between polls while idle or holding."""
+TEMP_POLL_EPSILON = 0.05
+"""Temperature changes, in degrees Celsius, below which polls are not published."""
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -51,7 +60,9 @@ class TempDeck(mod_abc.AbstractModule):
             sim_model: The model name used by simulator
             **kwargs: Module specific values.
                 can be 'polling_frequency' to specify the polling frequency in
-                seconds
+                seconds, 'idle_polling_frequency' to specify it while idle or
+                holding, and 'polling_epsilon' to specify the temperature
+                change in degrees Celsius worth publishing
 
         Returns:
             Tempdeck instance
@@ -73,6 +84,8 @@ class TempDeck(mod_abc.AbstractModule):
             device_info=await driver.get_device_info(),
             loop=loop,
             polling_frequency=polling_frequency,
+            idle_polling_frequency=kwargs.get("idle_polling_frequency"),
+            polling_epsilon=kwargs.get("polling_epsilon", TEMP_POLL_EPSILON),
         )
         return mod
 
@@ -85,6 +98,8 @@ class TempDeck(mod_abc.AbstractModule):
         device_info: Mapping[str, str],
         loop: Optional[asyncio.AbstractEventLoop] = None,
         polling_frequency: float = TEMP_POLL_INTERVAL_SECS,
+        idle_polling_frequency: Optional[float] = None,
+        polling_epsilon: float = TEMP_POLL_EPSILON,
     ) -> None:
         """Constructor"""
         super().__init__(
@@ -97,6 +112,9 @@ class TempDeck(mod_abc.AbstractModule):
             reader=PollerReader(driver=self._driver),
             interval_seconds=polling_frequency,
             listener=self._listener,
+            policy=PollerPolicy(epsilon=polling_epsilon),
+            idle_interval_seconds=idle_polling_frequency
+            or polling_frequency * IDLE_POLL_INTERVAL_FACTOR,
         )
 
     async def cleanup(self) -> None:
@@ -117,6 +135,7 @@ class TempDeck(mod_abc.AbstractModule):
 
     async def wait_next_poll(self) -> None:
         """Wait for the next poll to complete."""
+        self._poller.wake()
         await self._listener.wait_next_poll()
 
     async def set_temperature(self, celsius: float) -> None:
@@ -179,6 +198,7 @@ class TempDeck(mod_abc.AbstractModule):
         """Stop heating/cooling and turn off the fan"""
         await self.wait_for_is_running()
         await self._driver.deactivate()
+        self._poller.wake()
 
     @property
     def device_info(self) -> Mapping[str, str]:
@@ -284,6 +304,28 @@ class PollerReader(Reader[Temperature]):
         return await self._driver.get_temperature()
 
 
+class PollerPolicy(PollPolicy[Temperature]):
+    """Polls slowly while idle or holding, and publishes temperature changes."""
+
+    def __init__(self, epsilon: float) -> None:
+        """Constructor."""
+        self._epsilon = epsilon
+
+    def is_idle(self, result: Temperature) -> bool:
+        """Idle if not heating or cooling."""
+        return TempDeck._get_status(result) in (
+            TemperatureStatus.IDLE,
+            TemperatureStatus.HOLDING,
+        )
+
+    def changed(self, previous: Temperature, result: Temperature) -> bool:
+        """Changed if the target changed or the temperature moved past epsilon."""
+        return (
+            previous.target != result.target
+            or abs(previous.current - result.current) > self._epsilon
+        )
+
+
 class TempdeckListener(WaitableListener[Temperature]):
     """Tempdeck state listener."""
 
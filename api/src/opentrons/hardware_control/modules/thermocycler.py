@@ -7,7 +7,12 @@ from opentrons.drivers.types import ThermocyclerLidStatus, Temperature, PlateTem
 from opentrons.hardware_control.modules.lid_temp_status import LidTemperatureStatus
 from opentrons.hardware_control.modules.plate_temp_status import PlateTemperatureStatus
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, WaitableListener, Poller
+from opentrons.hardware_control.poller import (
+    Reader,
+    WaitableListener,
+    Poller,
+    PollPolicy,
+)
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -22,6 +27,10 @@ MODULE_LOG = logging.getLogger(__name__)
 
 POLLING_FREQUENCY_SEC = 1.0
 SIM_POLLING_FREQUENCY_SEC = POLLING_FREQUENCY_SEC / 20.0
+IDLE_POLLING_FREQUENCY_FACTOR = 5.0
+"""How many times longer to wait between polls while idle or holding."""
+POLLING_EPSILON = 0.05
+"""Temperature changes, in degrees Celsius, below which polls are not published."""
 
 TEMP_UPDATE_RETRIES = 50
 
@@ -58,7 +67,9 @@ class Thermocycler(mod_abc.AbstractModule):
             sim_model: The model name used by simulator
             **kwargs: Module specific values.
                 can be 'polling_frequency' to specify the polling frequency in
-                seconds
+                seconds, 'idle_polling_frequency' to specify it while idle or
+                holding, and 'polling_epsilon' to specify the temperature
+                change in degrees Celsius worth publishing
 
         Returns:
             Thermocycler instance.
@@ -80,6 +91,8 @@ class Thermocycler(mod_abc.AbstractModule):
             loop=loop,
             execution_manager=execution_manager,
             polling_interval_sec=polling_frequency,
+            idle_polling_interval_sec=kwargs.get("idle_polling_frequency"),
+            polling_epsilon=kwargs.get("polling_epsilon", POLLING_EPSILON),
         )
         return mod
 
@@ -92,6 +105,8 @@ class Thermocycler(mod_abc.AbstractModule):
         device_info: Dict[str, str],
         loop: Optional[asyncio.AbstractEventLoop] = None,
         polling_interval_sec: float = POLLING_FREQUENCY_SEC,
+        idle_polling_interval_sec: Optional[float] = None,
+        polling_epsilon: float = POLLING_EPSILON,
     ) -> None:
         """
         Constructor
@@ -104,6 +119,8 @@ class Thermocycler(mod_abc.AbstractModule):
             device_info: The thermocycler device info.
             loop: Optional loop.
             polling_interval_sec: How often to poll thermocycler for status
+            idle_polling_interval_sec: How often to poll while idle or holding
+            polling_epsilon: The temperature change worth publishing
         """
         super().__init__(
             port=port, usb_port=usb_port, loop=loop, execution_manager=execution_manager
@@ -117,6 +134,9 @@ class Thermocycler(mod_abc.AbstractModule):
             interval_seconds=polling_interval_sec,
             listener=self._listener,
             reader=PollerReader(driver=self._driver),
+            policy=PollerPolicy(epsilon=polling_epsilon),
+            idle_interval_seconds=idle_polling_interval_sec
+            or polling_interval_sec * IDLE_POLLING_FREQUENCY_FACTOR,
         )
         self._hold_time_fuzzy_seconds = polling_interval_sec * 5
 
@@ -153,18 +173,21 @@ class Thermocycler(mod_abc.AbstractModule):
         """Deactivate the lid heating pad"""
         await self.wait_for_is_running()
         await self._driver.deactivate_lid()
+        self._poller.wake()
 
     async def deactivate_block(self) -> None:
         """Deactivate the block peltiers"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_block()
+        self._poller.wake()
 
     async def deactivate(self) -> None:
         """Deactivate the block peltiers and lid heating pad"""
         await self.wait_for_is_running()
         self._clear_cycle_counters()
         await self._driver.deactivate_all()
+        self._poller.wake()
 
     async def open(self) -> str:
         """Open the lid if it is closed"""
@@ -345,6 +368,7 @@ class Thermocycler(mod_abc.AbstractModule):
 
     async def wait_next_poll(self) -> None:
         """Wait for the next poll to complete."""
+        self._poller.wake()
         await self._listener.wait_next_poll()
 
     @property
@@ -557,6 +581,49 @@ class PollerReader(Reader[PolledData]):
         )
 
 
+class PollerPolicy(PollPolicy[PolledData]):
+    """Polls slowly while idle or holding, and publishes changes."""
+
+    def __init__(self, epsilon: float) -> None:
+        """Constructor."""
+        self._epsilon = epsilon
+
+    def is_idle(self, result: PolledData) -> bool:
+        """Idle if the lid is not moving and neither heater is ramping or
+        counting down a hold."""
+        plate = result.plate_temperature
+        lid = result.lid_temperature
+        return (
+            result.lid_status != ThermocyclerLidStatus.IN_BETWEEN
+            and not plate.hold
+            and (
+                plate.target is None
+                or abs(plate.target - plate.current)
+                < PlateTemperatureStatus.TEMP_THRESHOLD
+            )
+            and (
+                lid.target is None
+                or lid.target - lid.current < LidTemperatureStatus.TEMP_THRESHOLD
+            )
+        )
+
+    def changed(self, previous: PolledData, result: PolledData) -> bool:
+        """Changed if the lid, a target or the hold time changed, or a
+        temperature moved past epsilon."""
+        return (
+            previous.lid_status != result.lid_status
+            or previous.plate_temperature.target != result.plate_temperature.target
+            or previous.plate_temperature.hold != result.plate_temperature.hold
+            or previous.lid_temperature.target != result.lid_temperature.target
+            or abs(
+                previous.plate_temperature.current - result.plate_temperature.current
+            )
+            > self._epsilon
+            or abs(previous.lid_temperature.current - result.lid_temperature.current)
+            > self._epsilon
+        )
+
+
 class ThermocyclerListener(WaitableListener[PolledData]):
     """Thermocycler state listener."""
 
@@ -591,6 +658,13 @@ class ThermocyclerListener(WaitableListener[PolledData]):
         self._lid_temperature_status.update(result.lid_temperature)
         return super().on_poll(result)
 
+    def on_unchanged(self, result: PolledData) -> None:
+        """On a poll that changed nothing worth publishing."""
+        # Holding is judged from a run of samples, so keep counting them.
+        self._plate_temperature_status.update(result.plate_temperature)
+        self._lid_temperature_status.update(result.lid_temperature)
+        return super().on_unchanged(result)
+
     def on_error(self, exc: Exception) -> None:
         """On error."""
         if self._callback:
@@ -287,6 +287,10 @@ class OT3API(
 
         return unregister
 
+    def clear_callbacks(self) -> None:
+        """Unregister every callback registered with :py:meth:`register_callback`."""
+        self._callbacks.clear()
+
     def get_fw_version(self) -> str:
         """
         Return the firmware version of the connected hardware.
@@ -652,6 +656,24 @@ class OT3API(
         await self._cache_and_maybe_retract_mount(realmount)
         await self._move(target_position, speed=speed, max_speeds=checked_max)
 
+    async def move_path(
+        self,
+        mount: Union[top_types.Mount, OT3Mount],
+        waypoints: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Union[None, Dict[Axis, float], OT3AxisMap[float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through each
+        waypoint in turn."""
+        for abs_position, critical_point in waypoints:
+            await self.move_to(
+                mount,
+                abs_position,
+                speed=speed,
+                critical_point=critical_point,
+                max_speeds=max_speeds,
+            )
+
     async def move_rel(
         self,
         mount: Union[top_types.Mount, OT3Mount],
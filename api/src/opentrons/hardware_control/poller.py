@@ -55,6 +55,47 @@ class Listener(ABC, Generic[DataT]):
         """
         ...
 
+    def on_unchanged(self, result: DataT) -> None:
+        """
+        Called by poller instead of on_poll when the poll policy finds the
+        result has not changed since the last result passed to on_poll.
+
+        Args:
+            result: The latest poll result.
+
+        Returns: None
+        """
+        ...
+
+
+class PollPolicy(ABC, Generic[DataT]):
+    """Interface of an adaptive poll policy."""
+
+    @abstractmethod
+    def is_idle(self, result: DataT) -> bool:
+        """
+        Check whether the polled device is idle, so it can be polled slowly.
+
+        Args:
+            result: The latest poll result.
+
+        Returns: True if nothing is expected to change until commanded.
+        """
+        ...
+
+    @abstractmethod
+    def changed(self, previous: DataT, result: DataT) -> bool:
+        """
+        Check whether a poll result is worth passing on to the listener.
+
+        Args:
+            previous: The last result passed to the listener.
+            result: The latest poll result.
+
+        Returns: True if result differs from previous by more than epsilon.
+        """
+        ...
+
 
 class WaitableListener(Listener[DataT]):
     """A listener that can be waited on."""
@@ -78,6 +119,10 @@ class WaitableListener(Listener[DataT]):
         """Handle a new poll"""
         self._notify(result)
 
+    def on_unchanged(self, result: DataT) -> None:
+        """Handle a poll that changed nothing."""
+        self._notify(result)
+
     def on_error(self, exc: Exception) -> None:
         """Handle a poller error."""
         self._cancel(exc)
@@ -107,6 +152,8 @@ class Poller(Generic[DataT]):
         interval_seconds: float,
         reader: Reader[DataT],
         listener: Listener[DataT],
+        policy: Optional[PollPolicy[DataT]] = None,
+        idle_interval_seconds: Optional[float] = None,
     ) -> None:
         """
         Constructor.
@@ -115,16 +162,34 @@ class Poller(Generic[DataT]):
             interval_seconds: time in between polls.
             reader: The data reader.
             listener: event listener.
+            policy: Optional poll policy. If set, results it finds unchanged
+                are passed to the listener's on_unchanged rather than on_poll.
+            idle_interval_seconds: time in between polls while the policy
+                finds the device idle. Defaults to interval_seconds.
         """
-        self._shutdown_event = asyncio.Event()
+        self._stopping = False
+        self._wake_event = asyncio.Event()
         self._interval = interval_seconds
+        self._idle_interval = idle_interval_seconds or interval_seconds
         self._listener = listener
         self._reader = reader
+        self._policy = policy
+        self._published: Optional[DataT] = None
         self._task = asyncio.create_task(self._poller())
 
     def stop(self) -> None:
         """Signal poller to stop."""
-        self._shutdown_event.set()
+        self._stopping = True
+        self._wake_event.set()
+
+    def wake(self) -> None:
+        """
+        Poll at the active interval again.
+
+        Call when the device is commanded, so that a change is seen promptly
+        even while the poller is waiting out an idle interval.
+        """
+        self._wake_event.set()
 
     async def stop_and_wait(self) -> None:
         """Stop poller and wait for it to terminate."""
@@ -134,17 +199,46 @@ class Poller(Generic[DataT]):
     async def _poller(self) -> None:
         """Poll task entrypoint."""
         while True:
+            interval = self._interval
             try:
                 poll = await self._reader.read()
-                self._listener.on_poll(poll)
+                if self._publish(poll):
+                    interval = self._idle_interval
             except Exception as e:
                 self._listener.on_error(e)
 
-            try:
-                await asyncio.wait_for(self._shutdown_event.wait(), self._interval)
-            except asyncio.TimeoutError:
-                pass
-            else:
+            if await self._sleep(interval):
                 break
 
         self._listener.on_terminated()
+
+    def _publish(self, poll: DataT) -> bool:
+        """Pass a poll result to the listener. Returns whether it is idle."""
+        if self._policy is None:
+            self._listener.on_poll(poll)
+            return False
+        if self._published is None or self._policy.changed(self._published, poll):
+            self._published = poll
+            self._listener.on_poll(poll)
+        else:
+            self._listener.on_unchanged(poll)
+        return self._policy.is_idle(poll)
+
+    async def _sleep(self, interval: float) -> bool:
+        """Wait until the next poll is due. Returns whether to stop."""
+        deadline = asyncio.get_running_loop().time() + interval
+        while not self._stopping:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                return False
+            if not self._wake_event.is_set():
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return False
+            if not self._stopping:
+                # Woken: the next poll is due an active interval after the
+                # last, or now if that has passed.
+                self._wake_event.clear()
+                deadline = min(deadline, deadline - interval + self._interval)
+        return True
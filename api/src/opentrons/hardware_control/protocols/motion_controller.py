@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from typing_extensions import Protocol
 
 from opentrons.types import Mount, Point
@@ -154,6 +154,32 @@ class MotionController(Protocol):
         """
         ...
 
+    async def move_path(
+        self,
+        mount: Mount,
+        waypoints: Sequence[Tuple[Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a path of
+        waypoints as one motion.
+
+        Each waypoint is a position relative to the deck and the critical point
+        to move there, as the ``abs_position`` and ``critical_point`` of
+        :py:meth:`move_to`. Moving through a whole path at once, rather than
+        with a :py:meth:`move_to` for each waypoint, lets hardware that has
+        opted into it stream the path without stopping at each waypoint.
+        Otherwise the waypoints are moved to one by one. When this returns,
+        the mount has reached the last waypoint.
+
+        :param mount: The mount to move
+        :param waypoints: The positions and critical points to move through
+        :param speed: An overall head speed to use for the whole path
+        :param max_speeds: An optional override for per-axis maximum speeds,
+                           as for :py:meth:`move_to`
+        """
+        ...
+
     async def move_rel(
         self,
         mount: Mount,
@@ -0,0 +1,265 @@
+"""
+hardware_control.simulator_pool: Reusable, homed hardware simulators
+
+Simulating a protocol needs a hardware simulator, and building one means
+loading the robot config and calibration from disk, configuring a simulated
+backend and homing it; a simulator in a thread manager also has to start and
+later stop its thread. When many protocols are simulated, as in analysis,
+that setup can take longer than the simulations themselves.
+
+The pools here keep simulators that are already built and homed. A
+simulator is put back in the state it was in when it was built (no
+instruments, default config and calibration, no callbacks) and homed again
+before it is reused. A simulator that cannot be put back, for instance
+because modules were attached to it, is cleaned up instead.
+"""
+
+import contextlib
+import threading
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from opentrons.config import robot_configs
+from opentrons.config.types import RobotConfig
+
+from .api import API
+from .modules import AbstractModule
+from .robot_calibration import RobotCalibration
+from .thread_manager import ThreadManager
+
+#: The default number of idle simulators a pool keeps
+DEFAULT_MAX_IDLE = 2
+
+
+@dataclass(frozen=True)
+class _CleanState:
+    """The state of a simulator just after it was built and homed"""
+
+    config: RobotConfig
+    robot_calibration: RobotCalibration
+    lights: Dict[str, bool]
+    modules: List[AbstractModule]
+
+    @classmethod
+    def capture(cls, hardware: API) -> "_CleanState":
+        return cls(
+            config=hardware.config,
+            robot_calibration=hardware.robot_calibration,
+            lights=dict(hardware.get_lights()),
+            modules=list(hardware.attached_modules),
+        )
+
+
+async def _build(config: RobotConfig) -> Tuple[API, _CleanState]:
+    hardware = await API.build_hardware_simulator(config=config)
+    await hardware.home()
+    return hardware, _CleanState.capture(hardware)
+
+
+async def _restore(hardware: API, state: _CleanState) -> bool:
+    """Put a simulator back in its clean state, except for its position.
+
+    :returns: Whether the simulator could be put back
+    """
+    if hardware.attached_modules != state.modules:
+        return False
+    await hardware.reset()
+    hardware.set_config(state.config)
+    hardware.set_robot_calibration(state.robot_calibration)
+    hardware.clear_callbacks()
+    await hardware.set_lights(**state.lights)
+    await hardware.cache_instruments()
+    return True
+
+
+def _managed(thread_manager: ThreadManager[API]) -> API:
+    # A thread manager that failed to build raises rather than being returned
+    return cast(API, thread_manager.managed_obj)
+
+
+def _restore_managed(thread_manager: ThreadManager[API], state: _CleanState) -> bool:
+    """Put a simulator in a thread manager back in its clean state and home it.
+
+    This makes the calls of :py:func:`_restore` in one batch through the
+    thread manager, so that its property snapshot follows them.
+
+    :returns: Whether the simulator could be put back
+    """
+    if _managed(thread_manager).attached_modules != state.modules:
+        return False
+    with thread_manager.sync.batch() as batch:
+        batch.reset()
+        batch.set_config(state.config)
+        batch.set_robot_calibration(state.robot_calibration)
+        batch.clear_callbacks()
+        batch.set_lights(**state.lights)
+        batch.cache_instruments()
+        batch.home()
+    return True
+
+
+class SimulatorPool:
+    """A pool of built and homed hardware simulators.
+
+    Simulators are built in, and bound to, the event loop the pool is used
+    from, so a pool must only be used from one event loop.
+
+    .. code-block::
+    >>> pool = SimulatorPool()
+    >>> async with pool.simulator() as hardware:
+    ...     runner = await create_simulating_runner(hardware_api=hardware)
+    ...     await runner.run(protocol_source)
+    """
+
+    def __init__(
+        self, max_idle: int = DEFAULT_MAX_IDLE, config: Optional[RobotConfig] = None
+    ) -> None:
+        """Build the pool. No simulators are built until one is needed.
+
+        :param max_idle: The most simulators to keep while they are not used
+        :param config: The config to build simulators with. If not specified,
+                       the robot config is loaded once for the pool.
+        """
+        self._max_idle = max_idle
+        self._config = config
+        self._idle: List[Tuple[API, _CleanState]] = []
+        self._clean_states: Dict[int, _CleanState] = {}
+
+    async def acquire(self) -> API:
+        """Get a homed simulator, building one if none are idle.
+
+        Give it back with :py:meth:`release` when done with it.
+        """
+        if self._idle:
+            hardware, state = self._idle.pop()
+        else:
+            if self._config is None:
+                self._config = robot_configs.load_ot2()
+            hardware, state = await _build(self._config)
+        self._clean_states[id(hardware)] = state
+        return hardware
+
+    async def release(self, hardware: API) -> None:
+        """Give back a simulator from :py:meth:`acquire` to be reused."""
+        state = self._clean_states.pop(id(hardware))
+        if len(self._idle) < self._max_idle and await _restore(hardware, state):
+            await hardware.home()
+            self._idle.append((hardware, state))
+        else:
+            await hardware.clean_up()
+
+    @contextlib.asynccontextmanager
+    async def simulator(self) -> AsyncIterator[API]:
+        """Use a simulator from the pool for the duration of the context."""
+        hardware = await self.acquire()
+        try:
+            yield hardware
+        finally:
+            await self.release(hardware)
+
+    async def warm(self, count: Optional[int] = None) -> None:
+        """Build simulators ahead of time until ``count`` are idle.
+
+        :param count: How many idle simulators to have. If not specified,
+                      as many as the pool keeps.
+        """
+        target = min(self._max_idle if count is None else count, self._max_idle)
+        built = [await self.acquire() for _ in range(target - len(self._idle))]
+        for hardware in built:
+            await self.release(hardware)
+
+    async def clean_up(self) -> None:
+        """Clean up the idle simulators."""
+        idle, self._idle = self._idle, []
+        for hardware, _ in idle:
+            await hardware.clean_up()
+
+
+class ThreadManagedSimulatorPool:
+    """A pool of built and homed hardware simulators in thread managers.
+
+    This is the synchronous counterpart of :py:class:`SimulatorPool`, for
+    simulating from synchronous code as :py:mod:`opentrons.simulate` does.
+    It may be used from any thread.
+    """
+
+    def __init__(
+        self, max_idle: int = DEFAULT_MAX_IDLE, config: Optional[RobotConfig] = None
+    ) -> None:
+        """Build the pool. No simulators are built until one is needed.
+
+        :param max_idle: The most simulators to keep while they are not used
+        :param config: The config to build simulators with. If not specified,
+                       the robot config is loaded once for the pool.
+        """
+        self._max_idle = max_idle
+        self._config = config
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[ThreadManager[API], _CleanState]] = []
+        self._clean_states: Dict[int, _CleanState] = {}
+
+    def acquire(self) -> ThreadManager[API]:
+        """Get a homed simulator, building one if none are idle.
+
+        Give it back with :py:meth:`release` when done with it.
+        """
+        with self._lock:
+            idle = self._idle.pop() if self._idle else None
+            if idle is None and self._config is None:
+                self._config = robot_configs.load_ot2()
+        if idle is None:
+            thread_manager: ThreadManager[API] = ThreadManager(
+                API.build_hardware_simulator, config=self._config
+            )
+            thread_manager.sync.home()
+            idle = thread_manager, _CleanState.capture(_managed(thread_manager))
+        thread_manager, state = idle
+        with self._lock:
+            self._clean_states[id(thread_manager)] = state
+        return thread_manager
+
+    def release(self, thread_manager: ThreadManager[API]) -> None:
+        """Give back a simulator from :py:meth:`acquire` to be reused."""
+        with self._lock:
+            state = self._clean_states.pop(id(thread_manager))
+            keep = len(self._idle) < self._max_idle
+        if keep and _restore_managed(thread_manager, state):
+            with self._lock:
+                self._idle.append((thread_manager, state))
+        else:
+            thread_manager.clean_up()
+
+    @contextlib.contextmanager
+    def simulator(self) -> Iterator[ThreadManager[API]]:
+        """Use a simulator from the pool for the duration of the context."""
+        thread_manager = self.acquire()
+        try:
+            yield thread_manager
+        finally:
+            self.release(thread_manager)
+
+    def warm(self, count: Optional[int] = None) -> None:
+        """Build simulators ahead of time until ``count`` are idle.
+
+        :param count: How many idle simulators to have. If not specified,
+                      as many as the pool keeps.
+        """
+        target = min(self._max_idle if count is None else count, self._max_idle)
+        built = [self.acquire() for _ in range(target - len(self._idle))]
+        for thread_manager in built:
+            self.release(thread_manager)
+
+    def clean_up(self) -> None:
+        """Clean up the idle simulators."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for thread_manager, _ in idle:
+            thread_manager.clean_up()
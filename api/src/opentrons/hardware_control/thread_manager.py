@@ -8,6 +8,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    FrozenSet,
     Generic,
     Optional,
     TypeVar,
@@ -15,7 +16,7 @@ from typing import (
     Sequence,
     Mapping,
 )
-from .adapters import SynchronousAdapter
+from .adapters import CallBatch, PropertySnapshot, SynchronousAdapter
 from .modules.mod_abc import AbstractModule
 from .protocols import (
     AsyncioConfigurable,
@@ -23,6 +24,37 @@ from .protocols import (
 
 MODULE_LOG = logging.getLogger(__name__)
 
+SNAPSHOT_PROPERTIES: Mapping[str, Optional[FrozenSet[str]]] = {
+    "attached_instruments": frozenset(
+        (
+            "add_tip",
+            "aspirate",
+            "blow_out",
+            "cache_instruments",
+            "calibrate_plunger",
+            "dispense",
+            "drop_tip",
+            "pick_up_tip",
+            "prepare_for_aspirate",
+            "remove_tip",
+            "reset",
+            "reset_instrument",
+            "set_current_tiprack_diameter",
+            "set_flow_rate",
+            "set_pipette_speed",
+            "set_working_volume",
+            "stop",
+        )
+    ),
+    # Every motion engages the axes it moves
+    "engaged_axes": None,
+}
+"""Properties of the managed object served from a :py:class:`.PropertySnapshot`.
+
+These change only through calls to the managed object. Each is given with the
+methods whose calls may change it, or ``None`` if any call may.
+"""
+
 
 class ThreadManagerException(Exception):
     pass
@@ -51,16 +83,23 @@ WrappedObj = TypeVar("WrappedObj", bound=AsyncioConfigurable, covariant=True)
 
 class CallBridger(Generic[WrappedObj]):
     def __init__(
-        self, wrapped_obj: WrappedObj, loop: asyncio.AbstractEventLoop
+        self,
+        wrapped_obj: WrappedObj,
+        loop: asyncio.AbstractEventLoop,
+        snapshot: Optional[PropertySnapshot] = None,
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        self._snapshot = snapshot
 
     def __getattribute__(self, attr_name: str) -> Any:
         # Almost every attribute retrieved from us will be for people actually
         # looking for an attribute of the managed object, so check there first.
         managed_obj = object.__getattribute__(self, "wrapped_obj")
         loop = object.__getattribute__(self, "_loop")
+        snapshot = object.__getattribute__(self, "_snapshot")
+        if snapshot is not None and attr_name in snapshot:
+            return snapshot.get(attr_name)
         try:
             attr = getattr(managed_obj, attr_name)
         except AttributeError:
@@ -71,11 +110,13 @@ class CallBridger(Generic[WrappedObj]):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
 
+            target = attr if snapshot is None else snapshot.refreshing(attr_name, attr)
+
             @functools.wraps(attr)
             async def wrapper(
                 *args: Sequence[Any], **kwargs: Mapping[str, Any]
             ) -> WrappedReturn:
-                return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
+                return await call_coroutine_threadsafe(loop, target, *args, **kwargs)
 
             return wrapper
 
@@ -85,6 +126,9 @@ class CallBridger(Generic[WrappedObj]):
             wrapped = asyncio.wrap_future(fut)
             return wrapped
 
+        elif snapshot is not None and callable(attr):
+            return snapshot.wrap_sync(attr_name, attr)
+
         return attr
 
 
@@ -117,6 +161,17 @@ class ThreadManager(Generic[WrappedObj]):
     >>> api_single_thread = ThreadManager(API.build_hardware_simulator)
     >>> await api_single_thread.home() # call as awaitable async
     >>> api_single_thread.sync.home() # call as blocking sync
+
+    Each call crosses into the managed thread and back. To make many calls
+    in one crossing, batch them:
+
+    >>> with api_single_thread.sync.batch() as batch:
+    ...     left = batch.current_position(Mount.LEFT)
+    ...     right = batch.current_position(Mount.RIGHT)
+    >>> left.result()
+
+    The properties named in :py:data:`SNAPSHOT_PROPERTIES` are served from a
+    :py:class:`.PropertySnapshot` taken in the managed thread.
     """
 
     def __init__(
@@ -134,6 +189,7 @@ class ThreadManager(Generic[WrappedObj]):
         self.managed_obj: Optional[WrappedObj] = None
         self.bridged_obj: Optional[CallBridger[WrappedObj]] = None
         self._sync_managed_obj: Optional[SynchronousAdapter[WrappedObj]] = None
+        self._snapshot: Optional[PropertySnapshot] = None
         is_running = threading.Event()
         self._is_running = is_running
         self._cached_modules: weakref.WeakKeyDictionary[
@@ -186,8 +242,19 @@ class ThreadManager(Generic[WrappedObj]):
         try:
             managed_obj = loop.run_until_complete(builder(*args, loop=loop, **kwargs))
             self.managed_obj = managed_obj
-            self.bridged_obj = CallBridger(managed_obj, loop)
-            self._sync_managed_obj = SynchronousAdapter(managed_obj)
+            snapshot = PropertySnapshot(
+                managed_obj,
+                loop,
+                {
+                    name: methods
+                    for name, methods in SNAPSHOT_PROPERTIES.items()
+                    if isinstance(getattr(type(managed_obj), name, None), property)
+                },
+                threading.current_thread(),
+            )
+            self._snapshot = snapshot
+            self.bridged_obj = CallBridger(managed_obj, loop, snapshot)
+            self._sync_managed_obj = SynchronousAdapter(managed_obj, snapshot)
         except Exception:
             MODULE_LOG.exception("Exception in Thread Manager build")
         finally:
@@ -206,6 +273,18 @@ class ThreadManager(Generic[WrappedObj]):
     def __repr__(self) -> str:
         return "<ThreadManager>"
 
+    def batch(self) -> CallBatch:
+        """Start a batch of calls to run in the managed thread at once.
+
+        Run it with ``await batch.run_async()``, or use it as a context
+        manager to run it blocking.
+        """
+        return CallBatch(
+            object.__getattribute__(self, "managed_obj"),
+            object.__getattribute__(self, "_loop"),
+            object.__getattribute__(self, "_snapshot"),
+        )
+
     def clean_up(self) -> None:
         try:
             loop = object.__getattribute__(self, "_loop")
@@ -127,7 +127,7 @@ class ProtocolContext(CommandPublisher):
         }
         self._modules: List[ModuleTypes] = []
 
-        self._commands: List[str] = []
+        self._command_payloads: List[cmd_types.CommandPayload] = []
         self._unsubscribe_commands: Optional[Callable[[], None]] = None
         self.clear_commands()
 
@@ -226,11 +226,17 @@ class ProtocolContext(CommandPublisher):
 
     @requires_version(2, 0)
     def commands(self) -> List[str]:
-        return self._commands
+        # payloads are kept rather than their text, which may be built lazily,
+        # so that the text is only built if it is asked for
+        texts = (
+            cast(Optional[str], payload.get("text"))
+            for payload in self._command_payloads
+        )
+        return [text for text in texts if text is not None]
 
     @requires_version(2, 0)
     def clear_commands(self) -> None:
-        self._commands.clear()
+        self._command_payloads.clear()
         if self._unsubscribe_commands:
             self._unsubscribe_commands()
 
@@ -240,13 +246,8 @@ class ProtocolContext(CommandPublisher):
             if payload is None:
                 return
 
-            text = payload.get("text")
-
-            if text is None:
-                return
-
             if message["$"] == "before":
-                self._commands.append(text)
+                self._command_payloads.append(payload)
 
         self._unsubscribe_commands = self.broker.subscribe(
             cmd_types.COMMAND, on_command
@@ -9,7 +9,14 @@ from .create_protocol_engine import create_protocol_engine
 from .protocol_engine import ProtocolEngine
 from .errors import ProtocolEngineError, ErrorOccurrence
 from .commands import Command, CommandParams, CommandCreate, CommandStatus, CommandType
-from .state import State, StateView, CommandSlice, CurrentCommand, EngineConfigs
+from .state import (
+    State,
+    StateView,
+    CommandSlice,
+    CommandUpdates,
+    CurrentCommand,
+    EngineConfigs,
+)
 from .plugins import AbstractPlugin
 
 from .types import (
@@ -51,6 +58,7 @@ __all__ = [
     "State",
     "StateView",
     "CommandSlice",
+    "CommandUpdates",
     "CurrentCommand",
     # public value interfaces and models
     "LabwareOffset",
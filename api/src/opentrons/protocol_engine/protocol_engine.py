@@ -181,7 +181,16 @@ class ProtocolEngine:
         self._queue_worker.cancel()
         await self._hardware_stopper.do_halt()
 
-    # TODO(mc, 2021-12-27): commands.get_all_complete not yet implemented
+    async def wait_for_command_updates(self, cursor: int) -> None:
+        """Wait for any command to be added or changed after an update cursor.
+
+        Also returns once the engine has stopped, since no more commands
+        will be added or changed after that.
+        """
+        await self._state_store.wait_for(
+            self._state_store.commands.get_has_updates_or_stopped, cursor=cursor
+        )
+
     async def wait_until_complete(self) -> None:
         """Wait until there are no more commands to execute.
 
@@ -1,7 +1,13 @@
 """Protocol engine state module."""
 
 from .state import State, StateStore, StateView
-from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
+from .commands import (
+    CommandState,
+    CommandView,
+    CommandSlice,
+    CommandUpdates,
+    CurrentCommand,
+)
 from .labware import LabwareState, LabwareView
 from .pipettes import PipetteState, PipetteView, HardwarePipette, CurrentWell
 from .modules import ModuleState, ModuleView, MagneticModuleView, HardwareModule
@@ -18,6 +24,7 @@ __all__ = [
     "CommandState",
     "CommandView",
     "CommandSlice",
+    "CommandUpdates",
     "CurrentCommand",
     # labware state and values
     "LabwareState",
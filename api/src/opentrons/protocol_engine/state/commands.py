@@ -1,11 +1,10 @@
 """Protocol engine commands sub-state."""
 from __future__ import annotations
-from collections import OrderedDict
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Dict, List, Mapping, Optional
-from typing_extensions import Literal
+from typing import List, Optional
+from pyrsistent import PMap, PSet, PVector, pmap, pset, pvector
 
 from opentrons.hardware_control.types import DoorStateNotification, DoorState
 
@@ -68,6 +67,23 @@ class CommandSlice:
     total_length: int
 
 
+@dataclass(frozen=True)
+class CommandUpdates:
+    """Commands that were added or changed since a given update cursor.
+
+    Attributes:
+        commands: The latest version of every command added or changed since
+            the requested cursor, in the order they were last changed.
+        cursors: For each of `commands`, the update cursor to use to request
+            only the updates after that command's.
+        cursor: The update cursor to use to request subsequent updates.
+    """
+
+    commands: List[Command]
+    cursors: List[int]
+    cursor: int
+
+
 @dataclass(frozen=True)
 class CurrentCommand:
     """The "current" command's ID and index in the overall commands list."""
@@ -86,10 +102,15 @@ class CommandEntry:
     index: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class CommandState:
     """State of all protocol engine command resources.
 
+    Every action produces a new `CommandState` rather than modifying the
+    previous one. The command collections are persistent data structures,
+    so each new state shares everything but the changed entries with its
+    predecessor, and any previous state may be safely held onto as a snapshot.
+
     Attributes:
         queue_status: Whether the engine is currently pulling new
             commands off the queue to execute. A command may still be
@@ -101,11 +122,26 @@ class CommandState:
         run_result: Whether the run is done and succeeded, failed, or stopped.
             Once set, this status cannot be unset.
         running_command_id: The ID of the currently running command, if any.
-        queued_command_ids: The IDs of queued commands in FIFO order.
-            Implemented as an OrderedDict to behave like an ordered set.
-        commands_by_id: All command resources, in insertion order, mapped
-            by their unique IDs.
+        all_command_ids: The IDs of all commands, in insertion order.
+        queued_command_ids: The IDs of queued commands. Commands are only
+            queued as they are added, so FIFO order matches insertion order.
+        next_queued_index: The index of the earliest queued command,
+            or None if no commands are queued.
+        completed_command_count: The number of commands that have
+            succeeded or failed.
+        last_completed_index: The index of the latest command in the list
+            that has succeeded or failed, if any.
+        update_count: The number of times any command has been added or
+            changed. Update cursors count updates, so this is the latest cursor.
+        update_cursor_by_command_id: The position of each command's latest
+            update, counting from 0.
+        command_ids_by_update_cursor: The inverse of
+            `update_cursor_by_command_id`. Only a command's latest update is
+            kept, so this holds one entry per command rather than growing
+            with every update.
+        commands_by_id: All command resources, mapped by their unique IDs.
         errors_by_id: All error occurrences, mapped by their unique IDs.
+            Unordered; `CommandView.get_all_errors` sorts them by time.
     """
 
     queue_status: QueueStatus
@@ -113,10 +149,23 @@ class CommandState:
     is_door_blocking: bool
     run_result: Optional[RunResult]
     running_command_id: Optional[str]
-    all_command_ids: List[str]
-    queued_command_ids: OrderedDict[str, Literal[True]]
-    commands_by_id: Dict[str, CommandEntry]
-    errors_by_id: Dict[str, ErrorOccurrence]
+    all_command_ids: PVector[str]
+    queued_command_ids: PSet[str]
+    next_queued_index: Optional[int]
+    completed_command_count: int
+    last_completed_index: Optional[int]
+    update_count: int
+    update_cursor_by_command_id: PMap[str, int]
+    command_ids_by_update_cursor: PMap[int, str]
+    commands_by_id: PMap[str, CommandEntry]
+    errors_by_id: PMap[str, ErrorOccurrence]
+
+
+def _is_complete(command: Command) -> bool:
+    return (
+        command.status == CommandStatus.SUCCEEDED
+        or command.status == CommandStatus.FAILED
+    )
 
 
 class CommandStore(HasState[CommandState], HandlesActions):
@@ -132,16 +181,20 @@ class CommandStore(HasState[CommandState], HandlesActions):
             is_door_blocking=is_door_blocking,
             run_result=None,
             running_command_id=None,
-            all_command_ids=[],
-            queued_command_ids=OrderedDict(),
-            commands_by_id=OrderedDict(),
-            errors_by_id={},
+            all_command_ids=pvector(),
+            queued_command_ids=pset(),
+            next_queued_index=None,
+            completed_command_count=0,
+            last_completed_index=None,
+            update_count=0,
+            update_cursor_by_command_id=pmap(),
+            command_ids_by_update_cursor=pmap(),
+            commands_by_id=pmap(),
+            errors_by_id=pmap(),
         )
 
     def handle_action(self, action: Action) -> None:  # noqa: C901
         """Modify state in reaction to an action."""
-        errors_by_id: Mapping[str, ErrorOccurrence]
-
         if isinstance(action, QueueCommandAction):
             assert action.command_id not in self._state.commands_by_id
 
@@ -158,12 +211,23 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             next_index = len(self._state.all_command_ids)
-            self._state.all_command_ids.append(action.command_id)
-            self._state.queued_command_ids[queued_command.id] = True
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
+            next_queued_index = self._state.next_queued_index
+
+            self._state = replace(
+                self._state,
+                all_command_ids=self._state.all_command_ids.append(queued_command.id),
+                queued_command_ids=self._state.queued_command_ids.add(
+                    queued_command.id
+                ),
+                next_queued_index=(
+                    next_queued_index if next_queued_index is not None else next_index
+                ),
+                commands_by_id=self._state.commands_by_id.set(
+                    queued_command.id,
+                    CommandEntry(index=next_index, command=queued_command),
+                ),
             )
+            self._log_updates([queued_command.id])
 
         # TODO(mc, 2021-12-28): replace "UpdateCommandAction" with explicit
         # state change actions (e.g. RunCommandAction, SucceedCommandAction)
@@ -171,26 +235,42 @@ class CommandStore(HasState[CommandState], HandlesActions):
         elif isinstance(action, UpdateCommandAction):
             command = action.command
             prev_entry = self._state.commands_by_id.get(command.id)
+            all_command_ids = self._state.all_command_ids
+            running_command_id = self._state.running_command_id
 
             if prev_entry is None:
-                index = len(self._state.all_command_ids)
-                self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
+                index = len(all_command_ids)
+                all_command_ids = all_command_ids.append(command.id)
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
-                )
-
-            self._state.queued_command_ids.pop(command.id, None)
+                index = prev_entry.index
 
             if command.status == CommandStatus.RUNNING:
-                self._state.running_command_id = command.id
-            elif self._state.running_command_id == command.id:
-                self._state.running_command_id = None
+                running_command_id = command.id
+            elif running_command_id == command.id:
+                running_command_id = None
+
+            completed_command_count = self._state.completed_command_count
+            last_completed_index = self._state.last_completed_index
+
+            if _is_complete(command) and (
+                prev_entry is None or not _is_complete(prev_entry.command)
+            ):
+                completed_command_count += 1
+                last_completed_index = max(index, last_completed_index or 0)
+
+            self._state = replace(
+                self._state,
+                all_command_ids=all_command_ids,
+                running_command_id=running_command_id,
+                completed_command_count=completed_command_count,
+                last_completed_index=last_completed_index,
+                commands_by_id=self._state.commands_by_id.set(
+                    command.id,
+                    CommandEntry(index=index, command=command),
+                ),
+            )
+            self._log_updates([command.id])
+            self._dequeue(command.id)
 
         elif isinstance(action, FailCommandAction):
             error_occurrence = ErrorOccurrence.construct(
@@ -202,13 +282,22 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
             command_ids_to_fail = [
                 action.command_id,
-                *[i for i in self._state.queued_command_ids.keys()],
+                *self._get_queued_command_ids(),
             ]
+            commands_by_id = self._state.commands_by_id.evolver()
+            completed_command_count = self._state.completed_command_count
+            last_completed_index = self._state.last_completed_index
 
             for command_id in command_ids_to_fail:
-                prev_entry = self._state.commands_by_id[command_id]
+                prev_entry = commands_by_id[command_id]
 
-                self._state.commands_by_id[command_id] = CommandEntry(
+                if not _is_complete(prev_entry.command):
+                    completed_command_count += 1
+                    last_completed_index = max(
+                        prev_entry.index, last_completed_index or 0
+                    )
+
+                commands_by_id[command_id] = CommandEntry(
                     index=prev_entry.index,
                     command=prev_entry.command.copy(
                         update={
@@ -219,36 +308,51 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     ),
                 )
 
-            if self._state.running_command_id == action.command_id:
-                self._state.running_command_id = None
-
-            self._state.errors_by_id[action.error_id] = error_occurrence
-            self._state.queued_command_ids.clear()
+            running_command_id = self._state.running_command_id
+
+            if running_command_id == action.command_id:
+                running_command_id = None
+
+            self._state = replace(
+                self._state,
+                running_command_id=running_command_id,
+                queued_command_ids=pset(),
+                next_queued_index=None,
+                completed_command_count=completed_command_count,
+                last_completed_index=last_completed_index,
+                commands_by_id=commands_by_id.persistent(),
+                errors_by_id=self._state.errors_by_id.set(
+                    action.error_id, error_occurrence
+                ),
+            )
+            self._log_updates(command_ids_to_fail)
 
         elif isinstance(action, PlayAction):
             if not self._state.run_result:
-                if self._state.is_door_blocking:
+                self._state = replace(
+                    self._state,
                     # Always inactivate queue when door is blocking
-                    self._state.queue_status = QueueStatus.INACTIVE
-                else:
-                    self._state.queue_status = QueueStatus.ACTIVE
+                    queue_status=(
+                        QueueStatus.INACTIVE
+                        if self._state.is_door_blocking
+                        else QueueStatus.ACTIVE
+                    ),
+                )
 
         elif isinstance(action, PauseAction):
-            self._state.queue_status = QueueStatus.INACTIVE
+            self._state = replace(self._state, queue_status=QueueStatus.INACTIVE)
 
         elif isinstance(action, StopAction):
             if not self._state.run_result:
-                self._state.queue_status = QueueStatus.INACTIVE
-                self._state.run_result = RunResult.STOPPED
+                self._state = replace(
+                    self._state,
+                    queue_status=QueueStatus.INACTIVE,
+                    run_result=RunResult.STOPPED,
+                )
 
         elif isinstance(action, FinishAction):
             if not self._state.run_result:
-                self._state.queue_status = QueueStatus.INACTIVE
-                self._state.run_result = (
-                    RunResult.SUCCEEDED
-                    if not action.error_details
-                    else RunResult.FAILED
-                )
+                errors_by_id = self._state.errors_by_id
 
                 # any `ProtocolEngineError`'s will be captured by `FailCommandAction`,
                 # so only capture unknown errors here
@@ -260,26 +364,128 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     created_at = action.error_details.created_at
                     error = action.error_details.error
 
-                    self._state.errors_by_id[error_id] = ErrorOccurrence.construct(
-                        id=error_id,
-                        createdAt=created_at,
-                        errorType=type(error).__name__,
-                        detail=str(error),
+                    errors_by_id = errors_by_id.set(
+                        error_id,
+                        ErrorOccurrence.construct(
+                            id=error_id,
+                            createdAt=created_at,
+                            errorType=type(error).__name__,
+                            detail=str(error),
+                        ),
                     )
 
+                self._state = replace(
+                    self._state,
+                    queue_status=QueueStatus.INACTIVE,
+                    run_result=(
+                        RunResult.SUCCEEDED
+                        if not action.error_details
+                        else RunResult.FAILED
+                    ),
+                    errors_by_id=errors_by_id,
+                )
+
         elif isinstance(action, HardwareStoppedAction):
-            self._state.queue_status = QueueStatus.INACTIVE
-            self._state.run_result = self._state.run_result or RunResult.STOPPED
-            self._state.is_hardware_stopped = True
+            self._state = replace(
+                self._state,
+                queue_status=QueueStatus.INACTIVE,
+                run_result=self._state.run_result or RunResult.STOPPED,
+                is_hardware_stopped=True,
+            )
 
         elif isinstance(action, HardwareEventAction):
             if isinstance(action.event, DoorStateNotification):
                 if action.event.blocking:
-                    self._state.is_door_blocking = True
-                    if self._state.queue_status != QueueStatus.IMPLICITLY_ACTIVE:
-                        self._state.queue_status = QueueStatus.INACTIVE
+                    queue_status = self._state.queue_status
+
+                    if queue_status != QueueStatus.IMPLICITLY_ACTIVE:
+                        queue_status = QueueStatus.INACTIVE
+
+                    self._state = replace(
+                        self._state,
+                        is_door_blocking=True,
+                        queue_status=queue_status,
+                    )
                 elif action.event.new_state == DoorState.CLOSED:
-                    self._state.is_door_blocking = False
+                    self._state = replace(self._state, is_door_blocking=False)
+
+    def _dequeue(self, command_id: str) -> None:
+        """Remove a command from the queue, if it is queued.
+
+        Since commands are only ever queued as they are added, the index of
+        the earliest queued command only ever moves forward, so advancing it
+        past dequeued commands is O(1) amortized over the life of the run.
+        """
+        queued_command_ids = self._state.queued_command_ids
+
+        if command_id not in queued_command_ids:
+            return
+
+        queued_command_ids = queued_command_ids.remove(command_id)
+        next_queued_index = self._state.next_queued_index
+
+        if len(queued_command_ids) == 0:
+            next_queued_index = None
+        else:
+            assert next_queued_index is not None
+            all_command_ids = self._state.all_command_ids
+
+            while all_command_ids[next_queued_index] not in queued_command_ids:
+                next_queued_index += 1
+
+        self._state = replace(
+            self._state,
+            queued_command_ids=queued_command_ids,
+            next_queued_index=next_queued_index,
+        )
+
+    def _log_updates(self, command_ids: List[str]) -> None:
+        """Record that commands were added or changed, in order.
+
+        Each command's previous update, if any, is dropped from the log,
+        so the log stays as long as the list of commands.
+        """
+        update_count = self._state.update_count
+        update_cursor_by_command_id = self._state.update_cursor_by_command_id
+        command_ids_by_update_cursor = self._state.command_ids_by_update_cursor
+
+        for command_id in command_ids:
+            prev_cursor = update_cursor_by_command_id.get(command_id)
+
+            if prev_cursor is not None:
+                command_ids_by_update_cursor = command_ids_by_update_cursor.remove(
+                    prev_cursor
+                )
+
+            update_cursor_by_command_id = update_cursor_by_command_id.set(
+                command_id, update_count
+            )
+            command_ids_by_update_cursor = command_ids_by_update_cursor.set(
+                update_count, command_id
+            )
+            update_count += 1
+
+        self._state = replace(
+            self._state,
+            update_count=update_count,
+            update_cursor_by_command_id=update_cursor_by_command_id,
+            command_ids_by_update_cursor=command_ids_by_update_cursor,
+        )
+
+    def _get_queued_command_ids(self) -> List[str]:
+        """Get all queued command IDs, in FIFO order."""
+        next_queued_index = self._state.next_queued_index
+
+        if next_queued_index is None:
+            return []
+
+        queued_command_ids = self._state.queued_command_ids
+
+        return [
+            command_id
+            for command_id in self._state.all_command_ids[next_queued_index:]
+            if command_id in queued_command_ids
+        ]
 
 
 class CommandView(HasState[CommandState]):
@@ -298,6 +504,10 @@ class CommandView(HasState[CommandState]):
         except KeyError:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
 
+    def get_count(self) -> int:
+        """Get the total number of commands in state."""
+        return len(self._state.all_command_ids)
+
     def get_all(self) -> List[Command]:
         """Get a list of all commands in state.
 
@@ -319,9 +529,6 @@ class CommandView(HasState[CommandState]):
 
         If the cursor is omitted, return the tail of `length` of the collection.
         """
-        # TODO(mc, 2022-01-31): this is not the most performant way to implement
-        # this; if this becomes a problem, change or the underlying data structure
-        # to something that isn't just an OrderedDict
         all_command_ids = self._state.all_command_ids
         commands_by_id = self._state.commands_by_id
         total_length = len(all_command_ids)
@@ -332,8 +539,10 @@ class CommandView(HasState[CommandState]):
         # start is inclusive, stop is exclusive
         actual_cursor = max(0, min(cursor, total_length - 1))
         stop = min(total_length, actual_cursor + length)
-        command_ids = all_command_ids[actual_cursor:stop]
-        commands = [commands_by_id[cid].command for cid in command_ids]
+        commands = [
+            commands_by_id[all_command_ids[index]].command
+            for index in range(actual_cursor, stop)
+        ]
 
         return CommandSlice(
             commands=commands,
@@ -341,9 +550,43 @@ class CommandView(HasState[CommandState]):
             total_length=total_length,
         )
 
+    def get_updates(self, cursor: int) -> CommandUpdates:
+        """Get all commands that have been added or changed since a cursor.
+
+        Arguments:
+            cursor: An update cursor from a previous `CommandUpdates`,
+                or 0 to get every command.
+        """
+        commands: List[Command] = []
+        cursors: List[int] = []
+        next_cursor = self._state.update_count
+
+        for update_cursor in range(max(0, cursor), next_cursor):
+            command_id = self._state.command_ids_by_update_cursor.get(update_cursor)
+
+            if command_id is not None:
+                commands.append(self._state.commands_by_id[command_id].command)
+                cursors.append(update_cursor + 1)
+
+        return CommandUpdates(commands=commands, cursors=cursors, cursor=next_cursor)
+
+    def get_has_updates(self, cursor: int) -> bool:
+        """Get whether any commands have been added or changed since a cursor."""
+        return self._state.update_count > cursor
+
+    def get_has_updates_or_stopped(self, cursor: int) -> bool:
+        """Get whether there are command updates since a cursor or the engine stopped.
+
+        Once the engine has stopped, no more commands will be added or changed,
+        so anything waiting for updates should stop waiting.
+        """
+        return self.get_has_updates(cursor) or self.get_is_stopped()
+
     def get_all_errors(self) -> List[ErrorOccurrence]:
-        """Get a list of all errors that have occurred."""
-        return list(self._state.errors_by_id.values())
+        """Get a list of all errors that have occurred, oldest first."""
+        return sorted(
+            self._state.errors_by_id.values(), key=lambda error: error.createdAt
+        )
 
     def get_current(self) -> Optional[CurrentCommand]:
         """Return the "current" command, if any.
@@ -360,17 +603,18 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        last_completed_index = self._state.last_completed_index
+
+        if last_completed_index is not None:
+            entry = self._state.commands_by_id[
+                self._state.all_command_ids[last_completed_index]
+            ]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
@@ -387,10 +631,15 @@ class CommandView(HasState[CommandState]):
         if self._state.run_result:
             raise ProtocolEngineStoppedError("Engine was stopped")
 
-        if self._state.queue_status == QueueStatus.INACTIVE:
+        next_queued_index = self._state.next_queued_index
+
+        if (
+            self._state.queue_status == QueueStatus.INACTIVE
+            or next_queued_index is None
+        ):
             return None
 
-        return next(iter(self._state.queued_command_ids.keys()), None)
+        return self._state.all_command_ids[next_queued_index]
 
     def get_is_okay_to_clear(self) -> bool:
         """Get whether the engine is stopped or unplayed so it could be removed."""
@@ -426,21 +675,23 @@ class CommandView(HasState[CommandState]):
         Arguments:
             command_id: Command to check.
         """
-        status = self.get(command_id).status
-
-        return status == CommandStatus.SUCCEEDED or status == CommandStatus.FAILED
+        return _is_complete(self.get(command_id))
 
-    # TODO(mc, 2021-12-28): the method needs to be re-implemented prior to PAPIv3 prod
-    # Implementation should take care to remain O(1)
     def get_all_complete(self) -> bool:
         """Get whether all commands have completed.
 
         All commands have "completed" if one of the following is true:
 
         - The hardware has been stopped
-        - There are no queued nor running commands
+        - Every command has succeeded or failed
         """
-        raise NotImplementedError("CommandView.get_all_complete not yet implemented")
+        return self._state.is_hardware_stopped or (
+            self._state.completed_command_count == len(self._state.all_command_ids)
+        )
+
+    def get_completed_count(self) -> int:
+        """Get the number of commands that have succeeded or failed."""
+        return self._state.completed_command_count
 
     def get_stop_requested(self) -> bool:
         """Get whether an engine stop has been requested.
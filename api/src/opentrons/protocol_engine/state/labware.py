@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+from pyrsistent import PMap, PVector, pmap, pvector
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2, SlotDefV2
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
@@ -25,6 +26,7 @@ from ..types import (
     LabwareOffsetLocation,
     LabwareLocation,
     LoadedLabware,
+    ModuleModel,
 )
 from ..actions import (
     Action,
@@ -37,21 +39,46 @@ from .abstract_store import HasState, HandlesActions
 
 _TRASH_LOCATION = DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH)
 
+# (definitionUri, slotName, moduleModel) of a labware offset
+LabwareOffsetKey = Tuple[str, DeckSlotName, Optional[ModuleModel]]
 
-@dataclass
+
+def _get_labware_offset_key(
+    definition_uri: str,
+    location: LabwareOffsetLocation,
+) -> LabwareOffsetKey:
+    return (definition_uri, location.slotName, location.moduleModel)
+
+
+@dataclass(frozen=True)
 class LabwareState:
-    """State of all loaded labware resources."""
+    """State of all loaded labware resources.
+
+    Loaded labware, offsets, and definitions are kept in persistent maps.
+    Loading a labware or adding an offset makes a new `LabwareState` that
+    shares all other entries with the old one, which remains a valid snapshot.
+    Persistent maps are unordered, so load and add order is kept separately.
+    """
 
     # Indexed by LoadedLabware.id.
     # If a LoadedLabware here has a non-None offsetId,
     # it must point to an existing element of labware_offsets_by_id.
-    labware_by_id: Dict[str, LoadedLabware]
+    labware_by_id: PMap[str, LoadedLabware]
+
+    # The IDs of all labware, in load order.
+    all_labware_ids: PVector[str]
 
     # Indexed by LabwareOffset.id.
-    # We rely on Python 3.7+ preservation of dict insertion order.
-    labware_offsets_by_id: Dict[str, LabwareOffset]
+    labware_offsets_by_id: PMap[str, LabwareOffset]
 
-    definitions_by_uri: Dict[str, LabwareDefinition]
+    # The IDs of all labware offsets, in the order they were added.
+    all_labware_offset_ids: PVector[str]
+
+    # Index of the most recently added offset ID for each
+    # definition URI and location, for constant-time offset lookup.
+    labware_offset_ids_by_key: PMap[LabwareOffsetKey, str]
+
+    definitions_by_uri: PMap[str, LabwareDefinition]
     deck_definition: DeckDefinitionV2
 
 
@@ -90,9 +117,12 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         }
 
         self._state = LabwareState(
-            definitions_by_uri=definitions_by_uri,
-            labware_offsets_by_id={},
-            labware_by_id=labware_by_id,
+            definitions_by_uri=pmap(definitions_by_uri),
+            labware_offsets_by_id=pmap(),
+            all_labware_offset_ids=pvector(),
+            labware_offset_ids_by_key=pmap(),
+            labware_by_id=pmap(labware_by_id),
+            all_labware_ids=pvector(labware_by_id),
             deck_definition=deck_definition,
         )
 
@@ -117,7 +147,12 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 load_name=action.definition.parameters.loadName,
                 version=action.definition.version,
             )
-            self._state.definitions_by_uri[uri] = action.definition
+            self._state = replace(
+                self._state,
+                definitions_by_uri=self._state.definitions_by_uri.set(
+                    uri, action.definition
+                ),
+            )
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -133,16 +168,28 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=command.result.definition.version,
             )
 
-            self._state.labware_by_id[labware_id] = LoadedLabware(
-                id=labware_id,
-                location=command.params.location,
-                loadName=command.result.definition.parameters.loadName,
-                definitionUri=definition_uri,
-                offsetId=command.result.offsetId,
+            self._state = replace(
+                self._state,
+                labware_by_id=self._state.labware_by_id.set(
+                    labware_id,
+                    LoadedLabware(
+                        id=labware_id,
+                        location=command.params.location,
+                        loadName=command.result.definition.parameters.loadName,
+                        definitionUri=definition_uri,
+                        offsetId=command.result.offsetId,
+                    ),
+                ),
+                all_labware_ids=(
+                    self._state.all_labware_ids
+                    if labware_id in self._state.labware_by_id
+                    else self._state.all_labware_ids.append(labware_id)
+                ),
+                definitions_by_uri=self._state.definitions_by_uri.set(
+                    definition_uri, command.result.definition
+                ),
             )
 
-            self._state.definitions_by_uri[definition_uri] = command.result.definition
-
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
 
@@ -152,7 +199,23 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         """
         assert labware_offset.id not in self._state.labware_offsets_by_id
 
-        self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
+        offset_key = _get_labware_offset_key(
+            definition_uri=labware_offset.definitionUri,
+            location=labware_offset.location,
+        )
+
+        self._state = replace(
+            self._state,
+            labware_offsets_by_id=self._state.labware_offsets_by_id.set(
+                labware_offset.id, labware_offset
+            ),
+            all_labware_offset_ids=self._state.all_labware_offset_ids.append(
+                labware_offset.id
+            ),
+            labware_offset_ids_by_key=self._state.labware_offset_ids_by_key.set(
+                offset_key, labware_offset.id
+            ),
+        )
 
 
 class LabwareView(HasState[LabwareState]):
@@ -236,7 +299,10 @@ class LabwareView(HasState[LabwareState]):
 
     def get_all(self) -> List[LoadedLabware]:
         """Get a list of all labware entries in state."""
-        return list(self._state.labware_by_id.values())
+        return [
+            self._state.labware_by_id[labware_id]
+            for labware_id in self._state.all_labware_ids
+        ]
 
     def get_has_quirk(self, labware_id: str, quirk: str) -> bool:
         """Get if a labware has a certain quirk."""
@@ -374,7 +440,10 @@ class LabwareView(HasState[LabwareState]):
 
     def get_labware_offsets(self) -> List[LabwareOffset]:
         """Get all labware offsets, in the order they were added."""
-        return list(self._state.labware_offsets_by_id.values())
+        return [
+            self._state.labware_offsets_by_id[offset_id]
+            for offset_id in self._state.all_labware_offset_ids
+        ]
 
     def find_applicable_labware_offset(
         self,
@@ -392,10 +461,13 @@ class LabwareView(HasState[LabwareState]):
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-        return None
+        offset_key = _get_labware_offset_key(
+            definition_uri=definition_uri,
+            location=location,
+        )
+        offset_id = self._state.labware_offset_ids_by_key.get(offset_key)
+
+        if offset_id is None:
+            return None
+
+        return self._state.labware_offsets_by_id[offset_id]
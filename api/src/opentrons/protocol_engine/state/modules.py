@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, NamedTuple, Optional, Sequence, overload
+from dataclasses import dataclass, replace
+from typing import List, NamedTuple, Optional, Sequence, overload
 from typing_extensions import Final
+from pyrsistent import PMap, PVector, pmap, pvector
 from numpy import array, dot
 
 from opentrons.hardware_control.modules import AbstractModule, MagDeck
@@ -64,12 +65,22 @@ class HardwareModule:
     definition: ModuleDefinition
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModuleState:
-    """Basic module data state and getter methods."""
+    """Basic module data state and getter methods.
+
+    Loading a module appends its ID and sets one entry in each map, leaving
+    the previous `ModuleState` untouched and valid as a snapshot.
 
-    slot_by_module_id: Dict[str, DeckSlotName]
-    hardware_module_by_slot: Dict[DeckSlotName, HardwareModule]
+    Attributes:
+        all_module_ids: The IDs of all loaded modules, in load order.
+        slot_by_module_id: The deck slot of each loaded module.
+        hardware_module_by_slot: The hardware module found in each slot.
+    """
+
+    all_module_ids: PVector[str]
+    slot_by_module_id: PMap[str, DeckSlotName]
+    hardware_module_by_slot: PMap[DeckSlotName, HardwareModule]
 
 
 class ModuleStore(HasState[ModuleState], HandlesActions):
@@ -79,7 +90,11 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
 
     def __init__(self) -> None:
         """Initialize a ModuleStore and its state."""
-        self._state = ModuleState(slot_by_module_id={}, hardware_module_by_slot={})
+        self._state = ModuleState(
+            all_module_ids=pvector(),
+            slot_by_module_id=pmap(),
+            hardware_module_by_slot=pmap(),
+        )
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
@@ -93,10 +108,23 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             definition = command.result.definition
             slot_name = command.params.location.slotName
 
-            self._state.slot_by_module_id[module_id] = slot_name
-            self._state.hardware_module_by_slot[slot_name] = HardwareModule(
-                serial_number=serial_number,
-                definition=definition,
+            self._state = replace(
+                self._state,
+                all_module_ids=(
+                    self._state.all_module_ids
+                    if module_id in self._state.slot_by_module_id
+                    else self._state.all_module_ids.append(module_id)
+                ),
+                slot_by_module_id=self._state.slot_by_module_id.set(
+                    module_id, slot_name
+                ),
+                hardware_module_by_slot=self._state.hardware_module_by_slot.set(
+                    slot_name,
+                    HardwareModule(
+                        serial_number=serial_number,
+                        definition=definition,
+                    ),
+                ),
             )
 
 
@@ -136,7 +164,7 @@ class ModuleView(HasState[ModuleState]):
 
     def get_all(self) -> List[LoadedModule]:
         """Get a list of all module entries in state."""
-        return [self.get(mod_id) for mod_id in self._state.slot_by_module_id.keys()]
+        return [self.get(mod_id) for mod_id in self._state.all_module_ids]
 
     def get_magnetic_module_view(self, module_id: str) -> MagneticModuleView:
         """Return a `MagneticModuleView` for the given Magnetic Module.
@@ -1,7 +1,8 @@
 """Basic pipette data state and store."""
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List, Mapping, Optional
+from dataclasses import dataclass, replace
+from typing import List, Mapping, Optional
+from pyrsistent import PMap, PVector, pmap, pvector
 
 from opentrons.hardware_control.dev_types import PipetteDict
 from opentrons.types import MountType, Mount as HwMount
@@ -40,14 +41,20 @@ class CurrentWell:
     well_name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class PipetteState:
-    """Basic pipette data state and getter methods."""
+    """Basic pipette data state and getter methods.
+
+    Aspirated volumes and attached tips change on almost every liquid handling
+    command, so they are persistent maps: each of those commands sets or
+    removes a single entry, sharing the rest with the previous `PipetteState`.
+    """
 
-    pipettes_by_id: Dict[str, LoadedPipette]
-    aspirated_volume_by_id: Dict[str, float]
+    all_pipette_ids: PVector[str]
+    pipettes_by_id: PMap[str, LoadedPipette]
+    aspirated_volume_by_id: PMap[str, float]
     current_well: Optional[CurrentWell]
-    attached_tip_labware_by_id: Dict[str, str]
+    attached_tip_labware_by_id: PMap[str, str]
 
 
 class PipetteStore(HasState[PipetteState], HandlesActions):
@@ -58,10 +65,11 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
     def __init__(self) -> None:
         """Initialize a PipetteStore and its state."""
         self._state = PipetteState(
-            pipettes_by_id={},
-            aspirated_volume_by_id={},
+            all_pipette_ids=pvector(),
+            pipettes_by_id=pmap(),
+            aspirated_volume_by_id=pmap(),
             current_well=None,
-            attached_tip_labware_by_id={},
+            attached_tip_labware_by_id=pmap(),
         )
 
     def handle_action(self, action: Action) -> None:
@@ -80,49 +88,84 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 DispenseResult,
             ),
         ):
-            self._state.current_well = CurrentWell(
-                pipette_id=command.params.pipetteId,
-                labware_id=command.params.labwareId,
-                well_name=command.params.wellName,
+            self._state = replace(
+                self._state,
+                current_well=CurrentWell(
+                    pipette_id=command.params.pipetteId,
+                    labware_id=command.params.labwareId,
+                    well_name=command.params.wellName,
+                ),
             )
         # TODO(mc, 2021-11-12): wipe out current_well on movement failures, too
         elif isinstance(command.result, HomeResult):
-            self._state.current_well = None
+            self._state = replace(self._state, current_well=None)
 
         if isinstance(command.result, LoadPipetteResult):
             pipette_id = command.result.pipetteId
 
-            self._state.pipettes_by_id[pipette_id] = LoadedPipette(
-                id=pipette_id,
-                pipetteName=command.params.pipetteName,
-                mount=command.params.mount,
+            self._state = replace(
+                self._state,
+                all_pipette_ids=(
+                    self._state.all_pipette_ids
+                    if pipette_id in self._state.pipettes_by_id
+                    else self._state.all_pipette_ids.append(pipette_id)
+                ),
+                pipettes_by_id=self._state.pipettes_by_id.set(
+                    pipette_id,
+                    LoadedPipette(
+                        id=pipette_id,
+                        pipetteName=command.params.pipetteName,
+                        mount=command.params.mount,
+                    ),
+                ),
+                aspirated_volume_by_id=self._state.aspirated_volume_by_id.set(
+                    pipette_id, 0
+                ),
             )
-            self._state.aspirated_volume_by_id[pipette_id] = 0
 
         elif isinstance(command.result, AspirateResult):
             pipette_id = command.params.pipetteId
             previous_volume = self._state.aspirated_volume_by_id[pipette_id]
             next_volume = previous_volume + command.result.volume
 
-            self._state.aspirated_volume_by_id[pipette_id] = next_volume
+            self._set_aspirated_volume(pipette_id, next_volume)
 
         elif isinstance(command.result, DispenseResult):
             pipette_id = command.params.pipetteId
             previous_volume = self._state.aspirated_volume_by_id[pipette_id]
             next_volume = max(0.0, previous_volume - command.result.volume)
-            self._state.aspirated_volume_by_id[pipette_id] = next_volume
+
+            self._set_aspirated_volume(pipette_id, next_volume)
 
         elif isinstance(command.result, PickUpTipResult):
             pipette_id = command.params.pipetteId
             tiprack_id = command.params.labwareId
-            self._state.attached_tip_labware_by_id[pipette_id] = tiprack_id
+
+            self._state = replace(
+                self._state,
+                attached_tip_labware_by_id=self._state.attached_tip_labware_by_id.set(
+                    pipette_id, tiprack_id
+                ),
+            )
 
         elif isinstance(command.result, DropTipResult):
             pipette_id = command.params.pipetteId
             # No-op if pipette_id not found; makes unit testing easier.
             # That should never happen outside of tests. But if it somehow does,
             # it won't harm the state.
-            self._state.attached_tip_labware_by_id.pop(pipette_id, None)
+            attached_tips = self._state.attached_tip_labware_by_id
+            self._state = replace(
+                self._state,
+                attached_tip_labware_by_id=attached_tips.discard(pipette_id),
+            )
+
+    def _set_aspirated_volume(self, pipette_id: str, volume: float) -> None:
+        self._state = replace(
+            self._state,
+            aspirated_volume_by_id=self._state.aspirated_volume_by_id.set(
+                pipette_id, volume
+            ),
+        )
 
 
 class PipetteView(HasState[PipetteState]):
@@ -143,11 +186,14 @@ class PipetteView(HasState[PipetteState]):
 
     def get_all(self) -> List[LoadedPipette]:
         """Get a list of all pipette entries in state."""
-        return list(self._state.pipettes_by_id.values())
+        return [
+            self._state.pipettes_by_id[pipette_id]
+            for pipette_id in self._state.all_pipette_ids
+        ]
 
     def get_by_mount(self, mount: MountType) -> Optional[LoadedPipette]:
         """Get pipette data by the pipette's mount."""
-        for pipette in self._state.pipettes_by_id.values():
+        for pipette in self.get_all():
             if pipette.mount == mount:
                 return pipette
         return None
@@ -205,6 +251,6 @@ class PipetteView(HasState[PipetteState]):
             or pipette_config["ready_to_aspirate"]
         )
 
-    def get_attached_tip_labware_by_id(self) -> Dict[str, str]:
+    def get_attached_tip_labware_by_id(self) -> Mapping[str, str]:
         """Get the tiprack ids of attached tip by pipette ids."""
         return self._state.attached_tip_labware_by_id
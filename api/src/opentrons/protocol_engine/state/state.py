@@ -84,9 +84,11 @@ class StateView(HasState[State]):
 class StateStore(StateView, ActionHandler):
     """ProtocolEngine state store.
 
-    A StateStore manages several substores, which will modify themselves in
-    reaction to commands and other protocol events. State instances inside
-    stores should be treated as immutable.
+    A StateStore manages several substores, which will replace their state
+    in reaction to commands and other protocol events. State instances are
+    immutable snapshots that share unchanged data with their predecessors,
+    so the `state` value may be held onto or read from another thread
+    without copying.
     """
 
     def __init__(
@@ -232,7 +234,22 @@ class StateStore(StateView, ActionHandler):
         )
 
     def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
+        """Update state view interfaces to use latest underlying values.
+
+        Substores only replace their state when an action changes it, so
+        if every substate is the same object as before, the previous `State`
+        is kept as-is and nothing is notified.
+        """
+        prev_state = self._state
+
+        if (
+            self._command_store.state is prev_state.commands
+            and self._labware_store.state is prev_state.labware
+            and self._pipette_store.state is prev_state.pipettes
+            and self._module_store.state is prev_state.modules
+        ):
+            return
+
         next_state = self._get_next_state()
         self._state = next_state
         self._commands._state = next_state.commands
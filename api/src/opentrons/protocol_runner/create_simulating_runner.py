@@ -1,7 +1,13 @@
 """Simulating ProtocolRunner factory."""
 
+from typing import Optional
+
 from opentrons.config import feature_flags
-from opentrons.hardware_control import API as HardwareAPI, SynchronousAdapter
+from opentrons.hardware_control import (
+    API as HardwareAPI,
+    HardwareControlAPI,
+    SynchronousAdapter,
+)
 from opentrons.protocol_engine import EngineConfigs, create_protocol_engine
 
 from .legacy_wrappers import LegacySimulatingContextCreator
@@ -9,9 +15,15 @@ from .legacy_labware_offset_provider import LegacyLabwareOffsetProvider
 from .protocol_runner import ProtocolRunner
 
 
-async def create_simulating_runner() -> ProtocolRunner:
+async def create_simulating_runner(
+    hardware_api: Optional[HardwareControlAPI] = None,
+) -> ProtocolRunner:
     """Create a ProtocolRunner wired to a simulating HardwareControlAPI.
 
+    Arguments:
+        hardware_api: A homed hardware simulator to use, for instance one from
+            a `SimulatorPool`. If not given, a new simulator is built and homed.
+
     Example:
         ```python
         from pathlib import Path
@@ -32,10 +44,13 @@ async def create_simulating_runner() -> ProtocolRunner:
         commands: List[Command] = await runner.run(protocol)
         ```
     """
-    simulating_hardware_api = await HardwareAPI.build_hardware_simulator()
+    if hardware_api is not None:
+        simulating_hardware_api = hardware_api
+    else:
+        simulating_hardware_api = await HardwareAPI.build_hardware_simulator()
 
-    # TODO(mc, 2021-08-25): move initial home to protocol engine
-    await simulating_hardware_api.home()
+        # TODO(mc, 2021-08-25): move initial home to protocol engine
+        await simulating_hardware_api.home()
 
     protocol_engine = await create_protocol_engine(
         hardware_api=simulating_hardware_api,
@@ -172,14 +172,22 @@ class InstrumentContextImplementation(AbstractInstrument):
             minimum_z_height=minimum_z_height,
         )
 
+        max_speeds = self._protocol_interface.get_max_speeds().data
+
         try:
-            for move in moves:
+            if len(moves) == 1:
                 hardware.move_to(
                     self._mount,
-                    move[0],
-                    critical_point=move[1],
+                    moves[0][0],
+                    critical_point=moves[0][1],
                     speed=speed,
-                    max_speeds=self._protocol_interface.get_max_speeds().data,
+                    max_speeds=max_speeds,
+                )
+            else:
+                # an arc is submitted as one path, so that it can be streamed
+                # to the motion controller without a stop at each waypoint
+                hardware.move_path(
+                    self._mount, moves, speed=speed, max_speeds=max_speeds
                 )
         except Exception:
             self._protocol_interface.set_last_location(None)
@@ -1,3 +1,4 @@
+import functools
 import logging
 import json
 import os
@@ -7,13 +8,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, AnyStr, List, Dict, Union
 
-import jsonschema  # type: ignore
-
+from opentrons.protocols import schema_validators
 from opentrons.protocols.api_support.util import ModifiedList
 from opentrons.calibration_storage import helpers, modify
 from opentrons.protocols.context.labware import AbstractLabware
 from opentrons.types import Point
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data import get_shared_data_root
 from opentrons.protocols.geometry.deck_item import DeckItem
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
@@ -144,14 +144,11 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+    schema_validators.labware_validator().validate(to_return)
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -259,8 +256,12 @@ def _get_standard_labware_definition(
     def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        if namespace == OPENTRONS_NAMESPACE:
+            contents = _read_standard_definition(def_path)
+        else:
+            with open(def_path, "rb") as f:
+                contents = f.read()
+        labware_def = json.loads(contents.decode("utf-8"))
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
@@ -270,6 +271,17 @@ def _get_standard_labware_definition(
     return labware_def
 
 
+@functools.lru_cache(maxsize=None)
+def _read_standard_definition(def_path: Path) -> bytes:
+    """Read a standard definition file, which never changes, only once.
+
+    The contents are parsed by each caller, so that each gets its own
+    definition to do with as it likes.
+    """
+    with open(def_path, "rb") as f:
+        return f.read()
+
+
 def _get_parent_identifier(labware: AbstractLabware) -> str:
     """
     Helper function to return whether a labware is on top of a
@@ -14,7 +14,6 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data import load_shared_data, protocol
 from .api_support.types import APIVersion
 from .types import (
     Protocol,
@@ -25,6 +24,7 @@ from .types import (
     ApiDeprecationError,
 )
 from .bundle import extract_bundle
+from . import schema_validators
 
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -373,37 +373,12 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
-    """Retrieve the json schema for a protocol schema version"""
-    # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
-    # deprecating v1/v2 JSON protocols?
-    if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
-        raise RuntimeError(
-            f"JSON Protocol version {version_num} is not yet "
-            + "supported in this version of the API"
-        )
-    try:
-        schema = load_shared_data(f"protocol/schemas/{version_num}.json")
-    except FileNotFoundError:
-        schema = None  # type: ignore
-    if not schema:
-        raise RuntimeError(
-            'JSON Protocol schema "{}" does not exist'.format(version_num)
-        )
-    return json.loads(schema.decode("utf-8"))
-
-
 def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
     """Validates a json protocol and returns its schema version"""
     # Check if this is actually a labware
-    labware_schema_v2 = json.loads(
-        load_shared_data("labware/schemas/2.json").decode("utf-8")
-    )
-    try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
-    except jsonschema.ValidationError:
-        pass
-    else:
+    if schema_validators.could_be_labware(
+        protocol_json
+    ) and schema_validators.labware_validator().is_valid(protocol_json):
         MODULE_LOG.error("labware uploaded instead of protocol")
         raise RuntimeError(
             "The file you are trying to open is a JSON labware definition, "
@@ -428,18 +403,16 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
             "version. Please update your OT-2 App and robot server to the "
             "latest version and try again."
         )
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
+    try:
+        validator = schema_validators.protocol_validator(version_num)
+    except FileNotFoundError:
+        raise RuntimeError(
+            'JSON Protocol schema "{}" does not exist'.format(version_num)
+        )
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        validator.validate(protocol_json)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
@@ -0,0 +1,204 @@
+"""
+opentrons.protocols.schema_validators: Process-wide json schema validators
+
+Building a validator means loading its schema from shared-data, checking
+the schema itself against its metaschema and setting up a resolver for its
+references, which together can take longer than validating a document.
+This module does that once per schema version and keeps the validators for
+the life of the process.
+
+Protocol schemas allow each command to be any one of the command types, so
+validating a command against the whole schema tries it against every type.
+Protocol validators instead check each command against the types that have
+its command name.
+"""
+import functools
+import itertools
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import load_shared_data
+
+LABWARE_SCHEMA_ID = "opentronsLabwareSchemaV2"
+
+
+class CachedValidator:
+    """A compiled json schema validator that is safe to share between threads.
+
+    Validators resolve ``$ref`` through a resolver that keeps a stack of
+    scopes while it validates, so calls are serialized.
+    """
+
+    def __init__(self, validator: Any) -> None:
+        self._validator = validator
+        self._lock = threading.Lock()
+
+    @property
+    def schema(self) -> Dict[str, Any]:
+        return self._validator.schema
+
+    def validate(self, instance: Any) -> None:
+        """Validate an instance against the schema.
+
+        This raises the same error :py:func:`jsonschema.validate` would.
+
+        :raises jsonschema.ValidationError: If the instance is not valid
+        """
+        with self._lock:
+            error = jsonschema.exceptions.best_match(
+                self._validator.iter_errors(instance)
+            )
+        if error is not None:
+            raise error
+
+    def is_valid(self, instance: Any) -> bool:
+        with self._lock:
+            return self._validator.is_valid(instance)
+
+
+class ProtocolValidator(CachedValidator):
+    """A compiled validator for a protocol schema that checks commands by name.
+
+    An invalid protocol is validated again against the whole schema, so it
+    fails with the same error it would have without checking by name.
+    """
+
+    def __init__(
+        self,
+        validator: Any,
+        shell: Any,
+        by_name: Dict[str, Tuple[Any, ...]],
+        unnamed: Tuple[Any, ...],
+    ) -> None:
+        super().__init__(validator)
+        self._shell = shell
+        self._by_name = by_name
+        self._unnamed = unnamed
+        self._all = tuple(itertools.chain(*by_name.values())) + unnamed
+
+    def _command_is_valid(self, command: Any) -> bool:
+        name = command.get("command") if isinstance(command, dict) else None
+        if isinstance(name, str) and name in self._by_name:
+            candidates = self._by_name[name] + self._unnamed
+        else:
+            candidates = self._all
+        return any(candidate.is_valid(command) for candidate in candidates)
+
+    def _is_valid(self, instance: Any) -> bool:
+        return self._shell.is_valid(instance) and all(
+            self._command_is_valid(command) for command in instance["commands"]
+        )
+
+    def validate(self, instance: Any) -> None:
+        with self._lock:
+            valid = self._is_valid(instance)
+        if not valid:
+            super().validate(instance)
+
+    def is_valid(self, instance: Any) -> bool:
+        with self._lock:
+            return self._is_valid(instance)
+
+
+def _load_schema(path: str) -> Dict[str, Any]:
+    return json.loads(load_shared_data(path).decode("utf-8"))
+
+
+def _command_types(schema: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Get the command types of a protocol schema that lists them in an anyOf"""
+    if schema.get("type") != "object" or "commands" not in schema.get("required", []):
+        return None
+    commands = schema.get("properties", {}).get("commands", {})
+    items = commands.get("items", {})
+    if commands.get("type") != "array" or set(items) - {"anyOf", "description"}:
+        return None
+    return items.get("anyOf")
+
+
+def _command_names(command_type: Dict[str, Any]) -> Optional[List[str]]:
+    """Get the only command names a command type allows, if it limits them"""
+    command = command_type.get("properties", {}).get("command", {})
+    names = command.get("enum")
+    if set(command) != {"enum"} or not isinstance(names, list):
+        return None
+    if not all(isinstance(name, str) for name in names):
+        return None
+    return names
+
+
+def _compile(schema: Dict[str, Any], store: Dict[str, Any]) -> CachedValidator:
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    resolver = jsonschema.RefResolver(schema.get("$id", ""), schema, store=store)
+    validator = cls(schema, resolver=resolver)
+    command_types = _command_types(schema)
+    if command_types is None:
+        return CachedValidator(validator)
+
+    # The whole schema but for the command types, which are checked by name
+    commands = dict(schema["properties"]["commands"])
+    del commands["items"]
+    shell = cls(
+        {**schema, "properties": {**schema["properties"], "commands": commands}},
+        resolver=resolver,
+    )
+    by_name: Dict[str, Tuple[Any, ...]] = {}
+    unnamed: Tuple[Any, ...] = ()
+    for command_type in command_types:
+        command_validator = cls(command_type, resolver=resolver)
+        names = _command_names(command_type)
+        if names is None:
+            unnamed += (command_validator,)
+        for name in names or []:
+            by_name[name] = by_name.get(name, ()) + (command_validator,)
+    return ProtocolValidator(validator, shell, by_name, unnamed)
+
+
+@functools.lru_cache(maxsize=None)
+def labware_validator() -> CachedValidator:
+    """Get the validator for labware definitions (schema version 2)."""
+    schema = _load_schema("labware/schemas/2.json")
+    return _compile(schema, {})
+
+
+@functools.lru_cache(maxsize=None)
+def protocol_validator(version: int) -> CachedValidator:
+    """Get the validator for a JSON protocol schema version.
+
+    :raises FileNotFoundError: If there is no schema for the version
+    """
+    schema = _load_schema(f"protocol/schemas/{version}.json")
+    # Protocol schemas refer to the labware schema for their labware
+    store = {LABWARE_SCHEMA_ID: labware_validator().schema}
+    return _compile(schema, store)
+
+
+def could_be_labware(contents: Any) -> bool:
+    """Check whether a document has the top level keys of a labware definition.
+
+    A document without them cannot be a valid labware definition, so this is
+    a cheap way to rule labware out before validating against a protocol
+    schema. A document with them still has to be validated to be sure.
+    """
+    return isinstance(contents, dict) and all(
+        key in contents for key in labware_validator().schema["required"]
+    )
+
+
+def warm() -> List[CachedValidator]:
+    """Build the validators for every labware and protocol schema version.
+
+    Validators are otherwise built when first used.
+
+    :returns: The labware validator, then the protocol validators by version
+    """
+    validators = [labware_validator()]
+    for version in itertools.count(1):
+        try:
+            validators.append(protocol_validator(version))
+        except FileNotFoundError:
+            return validators
+    return validators
@@ -4,6 +4,7 @@ This module has functions that provide a console entrypoint for simulating
 a protocol from the command line.
 """
 import argparse
+import contextlib
 import sys
 import logging
 import os
@@ -12,6 +13,7 @@ import queue
 from typing import (
     Any,
     Dict,
+    Iterator,
     List,
     Mapping,
     TextIO,
@@ -27,6 +29,7 @@ from opentrons.hardware_control import (
     ThreadManager,
     SyncHardwareAPI,
 )
+from opentrons.hardware_control.simulator_pool import ThreadManagedSimulatorPool
 from opentrons.hardware_control.simulator_setup import load_simulator
 from opentrons.protocol_api import MAX_SUPPORTED_VERSION
 from opentrons.protocols.duration import DurationEstimator
@@ -39,12 +42,15 @@ from opentrons.protocols.context.protocol_api.protocol_context import (
     ProtocolContextImplementation,
 )
 from opentrons.protocols import parse, bundle
-from opentrons.protocols.types import PythonProtocol, BundleContents
+from opentrons.protocols.types import Protocol, PythonProtocol, BundleContents
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
 from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
 
+# Simulators for simulate() to reuse, so that each call need not build one
+_simulator_pool = ThreadManagedSimulatorPool()
+
 
 class AccumulatingHandler(logging.Handler):
     def __init__(
@@ -343,35 +349,17 @@ def simulate(
     else:
         extra_data = {}
 
-    hardware_simulator = None
-
-    if hardware_simulator_file_path:
-        hardware_simulator = ThreadManager(
-            load_simulator,
-            pathlib.Path(hardware_simulator_file_path),
-        ).sync
-
     protocol = parse.parse(
         contents, file_name, extra_labware=extra_labware, extra_data=extra_data
     )
     bundle_contents: Optional[BundleContents] = None
 
-    # we want a None literal rather than empty dict so get_protocol_api
-    # will look for custom labware if this is a robot
-    gpa_extras = getattr(protocol, "extra_labware", None) or None
-    context = get_protocol_api(
-        getattr(protocol, "api_level", MAX_SUPPORTED_VERSION),
-        bundled_labware=getattr(protocol, "bundled_labware", None),
-        bundled_data=getattr(protocol, "bundled_data", None),
-        hardware_simulator=hardware_simulator,
-        extra_labware=gpa_extras,
-    )
-    broker = context.broker
-    scraper = CommandScraper(stack_logger, log_level, broker)
-    if duration_estimator:
-        broker.subscribe(command_types.COMMAND, duration_estimator.on_message)
+    with _simulating_context(protocol, hardware_simulator_file_path) as context:
+        broker = context.broker
+        scraper = CommandScraper(stack_logger, log_level, broker)
+        if duration_estimator:
+            broker.subscribe(command_types.COMMAND, duration_estimator.on_message)
 
-    try:
         execute.run_protocol(protocol, context)
         if (
             isinstance(protocol, PythonProtocol)
@@ -380,12 +368,47 @@ def simulate(
             and allow_bundle()
         ):
             bundle_contents = bundle_from_sim(protocol, context)
-    finally:
-        context.cleanup()
 
     return scraper.commands, bundle_contents
 
 
+@contextlib.contextmanager
+def _simulating_context(
+    protocol: Protocol,
+    hardware_simulator_file_path: Optional[str],
+) -> Iterator[opentrons.protocol_api.ProtocolContext]:
+    """Build a protocol context to simulate a parsed protocol with."""
+    with _simulator(hardware_simulator_file_path) as hardware_simulator:
+        # we want a None literal rather than empty dict so get_protocol_api
+        # will look for custom labware if this is a robot
+        gpa_extras = getattr(protocol, "extra_labware", None) or None
+        context = get_protocol_api(
+            getattr(protocol, "api_level", MAX_SUPPORTED_VERSION),
+            bundled_labware=getattr(protocol, "bundled_labware", None),
+            bundled_data=getattr(protocol, "bundled_data", None),
+            hardware_simulator=hardware_simulator,
+            extra_labware=gpa_extras,
+        )
+        try:
+            yield context
+        finally:
+            context.cleanup()
+
+
+@contextlib.contextmanager
+def _simulator(
+    hardware_simulator_file_path: Optional[str],
+) -> Iterator[SyncHardwareAPI]:
+    if hardware_simulator_file_path:
+        yield ThreadManager(
+            load_simulator,
+            pathlib.Path(hardware_simulator_file_path),
+        ).sync
+    else:
+        with _simulator_pool.simulator() as thread_manager:
+            yield thread_manager.sync
+
+
 def format_runlog(runlog: List[Mapping[str, Any]]) -> str:
     """
     Format a run log (return value of :py:obj:`simulate`) into a
@@ -0,0 +1,370 @@
+"""Functions and entrypoints for simulating many protocols at once.
+
+This module has functions that provide a console entrypoint for simulating
+a directory or manifest of protocols across worker processes, writing one
+JSON result per protocol as each finishes.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import opentrons
+from opentrons import simulate
+from opentrons.commands import types as command_types
+from opentrons.protocols import parse
+from opentrons.protocols.duration import DurationEstimator
+from opentrons.protocols.execution import execute
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
+
+#: The file suffixes of protocols found in a directory
+PROTOCOL_SUFFIXES = (".py", ".json")
+
+# Workers are spawned rather than forked so that they start the same way on
+# every platform, without any hardware threads from the parent process
+_mp_context = multiprocessing.get_context("spawn")
+
+
+@dataclass(frozen=True)
+class _WorkerState:
+    """What a worker loads once and uses for every protocol it simulates."""
+
+    extra_labware: Dict[str, LabwareDefinition]
+    extra_data: Dict[str, bytes]
+    hardware_simulator_file_path: Optional[str]
+
+
+_worker_state: Optional[_WorkerState] = None
+
+
+def find_protocols(
+    paths: Sequence[str], manifest: Optional[str] = None
+) -> List[pathlib.Path]:
+    """Find the protocol files to simulate.
+
+    :param paths: Protocol files, or directories whose (non-recursive)
+                  ``.py`` and ``.json`` files are protocols.
+    :param manifest: A file listing a protocol path per line. Relative paths
+                     are relative to the manifest's directory, and blank lines
+                     and lines starting with ``#`` are ignored.
+    :returns: The protocol files, directories' contents sorted by name.
+    """
+    found: List[pathlib.Path] = []
+    for strpath in paths:
+        path = pathlib.Path(strpath)
+        if path.is_dir():
+            found.extend(
+                sorted(
+                    child
+                    for child in path.iterdir()
+                    if child.is_file() and child.suffix in PROTOCOL_SUFFIXES
+                )
+            )
+        else:
+            found.append(path)
+    if manifest:
+        manifest_path = pathlib.Path(manifest)
+        for line in manifest_path.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                found.append(manifest_path.parent / line)
+    return found
+
+
+def simulate_batch(
+    protocol_paths: Sequence[pathlib.Path],
+    custom_labware_paths: Optional[List[str]] = None,
+    custom_data_paths: Optional[List[str]] = None,
+    hardware_simulator_file_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Simulate many protocols, in parallel.
+
+    Custom labware and data are loaded once per worker process rather than
+    once per protocol, and each worker reuses its hardware simulators.
+
+    Results are yielded as protocols finish, so not necessarily in the order
+    of ``protocol_paths``. Each result is a JSON-serializable dict with the
+    keys:
+
+        - ``protocol``: The path of the protocol file.
+        - ``ok``: Whether the protocol simulated without errors.
+        - ``commands``: The commands run until the protocol finished or
+                        failed, as dicts of ``level`` (see
+                        :py:obj:`opentrons.simulate.simulate`) and ``text``.
+        - ``errors``: The errors that stopped the simulation, if any, as dicts
+                      of ``type`` and ``message``.
+        - ``estimatedDuration``: The protocol's estimated duration in seconds.
+                                 This is an experimental feature.
+        - ``labware``: The labware loaded by the protocol, as dicts of
+                       ``slot``, ``uri`` and ``displayName``. The fixed trash
+                       is not included.
+        - ``output``: What the protocol printed. It is captured rather than
+                      written to standard output.
+
+    A protocol whose worker process died has a result with an error of type
+    ``BrokenProcessPool`` and nothing else.
+
+    :param protocol_paths: The protocol files to simulate.
+    :param custom_labware_paths: Directories to search for custom labware,
+                                 as for :py:obj:`opentrons.simulate.simulate`.
+    :param custom_data_paths: Directories or files to load custom data from,
+                              as for :py:obj:`opentrons.simulate.simulate`.
+    :param hardware_simulator_file_path: A path to a JSON file defining a
+                                         hardware simulator.
+    :param workers: How many worker processes to use. If not specified, one
+                    per CPU. If 1, protocols are simulated in this process.
+    """
+    initargs = (
+        custom_labware_paths or [],
+        custom_data_paths or [],
+        hardware_simulator_file_path,
+    )
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _load_worker_state(*initargs)
+        for path in protocol_paths:
+            yield _simulate_one(str(path))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_mp_context,
+        initializer=_init_worker,
+        initargs=initargs,
+    ) as executor:
+        futures = {
+            executor.submit(_simulate_one, str(path)): str(path)
+            for path in protocol_paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                yield _result(futures[future], [_error(e)])
+
+
+def _init_worker(
+    custom_labware_paths: List[str],
+    custom_data_paths: List[str],
+    hardware_simulator_file_path: Optional[str],
+) -> None:
+    # Keep a worker's protocol logs out of its (inherited) standard error;
+    # they are scraped into each result instead
+    logging.getLogger("opentrons").propagate = False
+    _load_worker_state(
+        custom_labware_paths, custom_data_paths, hardware_simulator_file_path
+    )
+
+
+def _load_worker_state(
+    custom_labware_paths: List[str],
+    custom_data_paths: List[str],
+    hardware_simulator_file_path: Optional[str],
+) -> None:
+    global _worker_state
+    _worker_state = _WorkerState(
+        extra_labware=labware_from_paths(custom_labware_paths),
+        extra_data=datafiles_from_paths(custom_data_paths),
+        hardware_simulator_file_path=hardware_simulator_file_path,
+    )
+
+
+def _simulate_one(protocol_path: str) -> Dict[str, Any]:
+    assert _worker_state is not None, "Worker was not initialized"
+    duration_estimator = DurationEstimator()  # type: ignore[no-untyped-call]
+    commands: List[Dict[str, Any]] = []
+    labware: List[Dict[str, Any]] = []
+    errors: List[Dict[str, str]] = []
+    output = io.StringIO()
+
+    try:
+        with open(protocol_path, "rb") as f:
+            contents = f.read()
+        protocol = parse.parse(
+            contents,
+            os.path.basename(protocol_path),
+            extra_labware=_worker_state.extra_labware,
+            extra_data=_worker_state.extra_data,
+        )
+        with simulate._simulating_context(
+            protocol, _worker_state.hardware_simulator_file_path
+        ) as context:
+            scraper = simulate.CommandScraper(
+                logging.getLogger("opentrons"), "none", context.broker
+            )
+            context.broker.subscribe(
+                command_types.COMMAND, duration_estimator.on_message
+            )
+            try:
+                with contextlib.redirect_stdout(output):
+                    execute.run_protocol(protocol, context)
+            finally:
+                commands = [
+                    {
+                        "level": command["level"],
+                        "text": command["payload"]
+                        .get("text", "")
+                        .format(**command["payload"]),
+                    }
+                    for command in scraper.commands
+                ]
+                labware = [
+                    {
+                        "slot": str(slot),
+                        "uri": lw.uri,
+                        "displayName": lw.name,
+                    }
+                    for slot, lw in context.loaded_labwares.items()
+                    if lw != context.fixed_trash
+                ]
+    # A protocol that calls sys.exit() has failed, not the batch
+    except (Exception, SystemExit) as e:
+        errors.append(_error(e))
+
+    return _result(
+        protocol_path,
+        errors,
+        commands=commands,
+        estimated_duration=duration_estimator.get_total_duration(),
+        labware=labware,
+        output=output.getvalue(),
+    )
+
+
+def _error(error: BaseException) -> Dict[str, str]:
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+def _result(
+    protocol_path: str,
+    errors: List[Dict[str, str]],
+    commands: Optional[List[Dict[str, Any]]] = None,
+    estimated_duration: float = 0,
+    labware: Optional[List[Dict[str, Any]]] = None,
+    output: str = "",
+) -> Dict[str, Any]:
+    return {
+        "protocol": protocol_path,
+        "ok": not errors,
+        "commands": commands or [],
+        "errors": errors,
+        "estimatedDuration": estimated_duration,
+        "labware": labware or [],
+        "output": output,
+    }
+
+
+def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Get the argument parser for this module.
+
+    :param parser: A parser to add arguments to.
+    :returns argparse.ArgumentParser: The parser with arguments added.
+    """
+    parser.add_argument(
+        "-L",
+        "--custom-labware-path",
+        action="append",
+        default=[os.getcwd()],
+        help="Specify directories to search for custom labware definitions, "
+        "as for opentrons_simulate. By default, the current directory is "
+        "searched.",
+    )
+    parser.add_argument(
+        "-D",
+        "--custom-data-path",
+        action="append",
+        default=[],
+        help="Specify directories or files to load custom data files from, "
+        "as for opentrons_simulate. Every protocol gets the same data files.",
+    )
+    parser.add_argument(
+        "-s",
+        "--custom-hardware-simulator-file",
+        type=str,
+        default=None,
+        help="Specify a file that describes the features present in the "
+        "hardware simulator. Features can be instruments, modules, and "
+        "configuration.",
+    )
+    parser.add_argument(
+        "-m",
+        "--manifest",
+        type=str,
+        default=None,
+        help="Specify a file that lists a protocol to simulate per line, "
+        "relative to the file's directory. Blank lines and lines starting "
+        "with # are ignored.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="How many protocols to simulate at once, each in its own "
+        "process. By default, one per CPU.",
+    )
+    parser.add_argument(
+        "protocols",
+        metavar="PROTOCOL",
+        nargs="*",
+        help="Protocol files to simulate, or directories whose .py and .json "
+        "files are protocols to simulate.",
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"%(prog)s {opentrons.__version__}",
+        help="Print the opentrons package version and exit",
+    )
+    return parser
+
+
+# Note - this script is also set up as a setuptools entrypoint and thus does
+# an absolute minimum of work since setuptools does something odd generating
+# the scripts
+def main() -> int:
+    """Simulate the protocols, printing a line of JSON for each.
+
+    Exits with 1 if any protocol failed to simulate.
+    """
+    parser = argparse.ArgumentParser(
+        prog="opentrons_simulate_batch",
+        description="Simulate many OT-2 protocols, printing JSON lines results",
+    )
+    parser = get_arguments(parser)
+    args = parser.parse_args()
+
+    protocol_paths = find_protocols(args.protocols, args.manifest)
+    if not protocol_paths:
+        parser.error("no protocols to simulate")
+
+    all_ok = True
+    for result in simulate_batch(
+        protocol_paths,
+        custom_labware_paths=args.custom_labware_path,
+        custom_data_paths=args.custom_data_path,
+        hardware_simulator_file_path=args.custom_hardware_simulator_file,
+        workers=args.workers,
+    ):
+        all_ok = all_ok and result["ok"]
+        print(json.dumps(result), flush=True)
+
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
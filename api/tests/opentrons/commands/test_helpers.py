@@ -0,0 +1,40 @@
+import json
+import pickle
+from typing import List
+
+from opentrons.commands.helpers import LazyTextPayload
+
+
+def test_lazy_text_payload() -> None:
+    """It should build its text once, when the text or whole payload is read."""
+    calls: List[None] = []
+
+    def _make_text() -> str:
+        calls.append(None)
+        return "some text"
+
+    subject = LazyTextPayload(_make_text, volume=10)
+    assert subject["volume"] == 10
+    assert calls == []
+
+    assert subject.get("text") == "some text"
+    assert subject["text"] == "some text"
+    assert calls == [None]
+
+
+def test_lazy_text_payload_acts_as_a_dict() -> None:
+    """It should include its text wherever a dict would."""
+
+    def _payload() -> LazyTextPayload:
+        return LazyTextPayload(lambda: "some text", volume=10)
+
+    expected = {"volume": 10, "text": "some text"}
+
+    assert _payload() == expected
+    assert dict(**_payload()) == expected
+    assert dict(_payload().items()) == expected
+    assert "text" in _payload()
+    assert len(_payload()) == 2
+    assert json.loads(json.dumps(_payload())) == expected
+    assert pickle.loads(pickle.dumps(_payload())) == expected
+    assert "{text}".format(**_payload()) == "some text"
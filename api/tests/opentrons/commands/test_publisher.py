@@ -11,8 +11,10 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: Broker) -> None:
@@ -317,3 +319,34 @@ def test_publish_context_with_error(decoy: Decoy, broker: Broker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_decorator_without_subscribers(decoy: Decoy) -> None:
+    """It should not build or publish a command if nothing would see it."""
+    broker = Broker()
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str) -> int:
+            _act(foo)
+            return 42
+
+    subject = _Subject(broker=broker)
+
+    assert subject.act("hello") == 42
+    decoy.verify(_act("hello"))
+    decoy.verify(_get_command_payload(), ignore_extra_args=True, times=0)
+
+
+def test_publish_context_without_subscribers(decoy: Decoy) -> None:
+    """It should not publish a command if nothing would see it."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(False)
+    command = cast(CommandDict, {"name": "some_command", "payload": {"foo": "hi"}})
+
+    with publish_context(broker=broker, command=command):
+        pass
+
+    decoy.verify(broker.publish(topic="command", message=matchers.Anything()), times=0)
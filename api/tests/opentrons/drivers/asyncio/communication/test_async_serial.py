@@ -1,11 +1,16 @@
 import asyncio
+import os
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional, Tuple
 
 import pytest
 from mock import MagicMock, PropertyMock, call
-from serial import Serial  # type: ignore[import]
+from serial import Serial, SerialException  # type: ignore[import]
 from opentrons.drivers.asyncio.communication import AsyncSerial
+from opentrons.drivers.asyncio.communication.async_serial import (
+    NATIVE_ASYNC_SERIAL_ENV,
+    NativeAsyncSerial,
+)
 
 
 @pytest.fixture
@@ -132,3 +137,140 @@ async def test_read_timeout_dont_override(
         await subject.read_until(b"")
 
     mock_timeout_prop.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    argnames=["keep_input_buffer", "expect_reset"],
+    argvalues=[[False, True], [True, False]],
+)
+async def test_write_reset_input_buffer(
+    loop: asyncio.AbstractEventLoop,
+    mock_serial: MagicMock,
+    keep_input_buffer: bool,
+    expect_reset: bool,
+) -> None:
+    """It should reset the input buffer before writing unless asked not to."""
+    subject = AsyncSerial(
+        serial=mock_serial,
+        executor=ThreadPoolExecutor(),
+        loop=loop,
+        reset_buffer_before_write=True,
+    )
+
+    await subject.write(b"data", keep_input_buffer=keep_input_buffer)
+
+    assert mock_serial.reset_input_buffer.called == expect_reset
+    mock_serial.write.assert_called_once_with(data=b"data")
+
+
+@pytest.fixture
+def pty() -> Iterator[Tuple[int, str]]:
+    """A pseudo-terminal pair: the controlling fd and the port name."""
+    controller, port_fd = os.openpty()
+    port_name = os.ttyname(port_fd)
+    yield controller, port_name
+    for fd in (controller, port_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+async def native_subject(
+    loop: asyncio.AbstractEventLoop,
+    pty: Tuple[int, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[AsyncSerial]:
+    """An AsyncSerial connected to a pty, with native I/O enabled."""
+    monkeypatch.setenv(NATIVE_ASYNC_SERIAL_ENV, "true")
+    _, port_name = pty
+    subject = await AsyncSerial.create(
+        port=port_name,
+        baud_rate=115200,
+        timeout=1,
+        loop=loop,
+        reset_buffer_before_write=True,
+    )
+    yield subject
+    await subject.close()
+
+
+async def test_create_native_for_local_port(native_subject: AsyncSerial) -> None:
+    """It should read and write local ports from the event loop if enabled."""
+    assert isinstance(native_subject, NativeAsyncSerial)
+
+
+async def test_create_uses_executor_by_default(
+    loop: asyncio.AbstractEventLoop,
+    pty: Tuple[int, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should read and write local ports in the executor by default."""
+    monkeypatch.delenv(NATIVE_ASYNC_SERIAL_ENV, raising=False)
+    _, port_name = pty
+    subject = await AsyncSerial.create(port=port_name, baud_rate=115200, loop=loop)
+    try:
+        assert type(subject) is AsyncSerial
+    finally:
+        await subject.close()
+
+
+async def test_native_read_until(
+    native_subject: AsyncSerial, pty: Tuple[int, str]
+) -> None:
+    """It should return data through the match and keep the rest."""
+    controller, _ = pty
+    os.write(controller, b"first ok\r\nsec")
+
+    assert await native_subject.read_until(b"ok\r\n") == b"first ok\r\n"
+
+    os.write(controller, b"ond ok\r\n")
+
+    assert await native_subject.read_until(b"ok\r\n") == b"second ok\r\n"
+
+
+async def test_native_read_until_timeout(
+    native_subject: AsyncSerial, pty: Tuple[int, str]
+) -> None:
+    """It should return what it has read once the timeout passes."""
+    controller, _ = pty
+    os.write(controller, b"partial")
+
+    async with native_subject.timeout_override("timeout", 0.05):
+        assert await native_subject.read_until(b"ok\r\n") == b"partial"
+
+
+async def test_native_write(
+    loop: asyncio.AbstractEventLoop,
+    native_subject: AsyncSerial,
+    pty: Tuple[int, str],
+) -> None:
+    """It should write data, dropping unread input unless asked not to."""
+    controller, _ = pty
+    os.write(controller, b"stale ok\r\n")
+    await asyncio.sleep(0.05)
+
+    await native_subject.write(b"command\n")
+    received = await loop.run_in_executor(None, os.read, controller, 100)
+    assert received.strip() == b"command"
+
+    os.write(controller, b"response ok\r\n")
+    await asyncio.sleep(0.05)
+    await native_subject.write(b"command\n", keep_input_buffer=True)
+
+    async with native_subject.timeout_override("timeout", 0.05):
+        assert await native_subject.read_until(b"ok\r\n") == b"response ok\r\n"
+
+
+async def test_native_read_closed(
+    native_subject: AsyncSerial, pty: Tuple[int, str]
+) -> None:
+    """It should raise if the port goes away during a read."""
+    controller, _ = pty
+    read = asyncio.ensure_future(native_subject.read_until(b"ok\r\n"))
+    await asyncio.sleep(0.05)
+    os.close(controller)
+
+    with pytest.raises(SerialException):
+        await read
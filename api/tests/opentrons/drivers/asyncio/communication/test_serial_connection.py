@@ -123,3 +123,81 @@ async def test_on_retry(mock_serial_port: AsyncMock, subject: SerialConnection)
 
     mock_serial_port.close.assert_called_once()
     mock_serial_port.open.assert_called_once()
+
+
+async def test_send_data_pipelined(
+    mock_serial_port: AsyncMock, subject: SerialConnection, ack: str
+) -> None:
+    """It should only wait for responses once the window is full."""
+    mock_serial_port.read_until.return_value = ack.encode()
+
+    await subject.send_data_pipelined(data="first", window=2)
+    await subject.send_data_pipelined(data="second", window=2)
+
+    mock_serial_port.read_until.assert_not_called()
+    assert subject.pipeline_depth == 2
+
+    await subject.send_data_pipelined(data="third", window=2)
+
+    mock_serial_port.read_until.assert_called_once_with(match=ack.encode())
+    mock_serial_port.write.assert_has_calls(
+        calls=[
+            call(data=b"first", keep_input_buffer=False),
+            call(data=b"second", keep_input_buffer=True),
+            call(data=b"third", keep_input_buffer=True),
+        ]
+    )
+    assert subject.pipeline_depth == 2
+
+
+async def test_send_data_flushes_pipeline(
+    mock_serial_port: AsyncMock, subject: SerialConnection, ack: str
+) -> None:
+    """It should read pipelined responses before sending synchronously."""
+    mock_serial_port.read_until.side_effect = [
+        ack.encode(),
+        f"response data {ack}".encode(),
+    ]
+
+    await subject.send_data_pipelined(data="first", window=2)
+    response = await subject.send_data(data="second")
+
+    assert response == "response data"
+    assert mock_serial_port.read_until.call_count == 2
+    assert subject.pipeline_depth == 0
+
+
+async def test_pipelined_error(
+    mock_serial_port: AsyncMock, subject: SerialConnection, ack: str
+) -> None:
+    """It should raise a pipelined error and discard later responses."""
+    mock_serial_port.read_until.side_effect = [
+        f"error: bad {ack}".encode(),
+        f"error: alarm lock {ack}".encode(),
+    ]
+
+    await subject.send_data_pipelined(data="first", window=2)
+    await subject.send_data_pipelined(data="second", window=2)
+
+    with pytest.raises(ErrorResponse, match="bad") as exc_info:
+        await subject.flush_pipeline()
+
+    assert exc_info.value.pipelined_command == "first"
+    assert mock_serial_port.read_until.call_count == 2
+    assert subject.pipeline_depth == 0
+
+
+async def test_pipelined_no_response(
+    mock_serial_port: AsyncMock, subject: SerialConnection
+) -> None:
+    """It should raise and forget pending commands if an ack is missing."""
+    mock_serial_port.read_until.return_value = b""
+
+    await subject.send_data_pipelined(data="first", window=2)
+    await subject.send_data_pipelined(data="second", window=2)
+
+    with pytest.raises(NoResponse, match="first"):
+        await subject.flush_pipeline()
+
+    mock_serial_port.read_until.assert_called_once()
+    assert subject.pipeline_depth == 0
@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Dict, cast
+from typing import Dict, List, cast
 
 from opentrons.drivers import utils
 from opentrons.drivers.asyncio.communication import AlarmResponse
@@ -464,3 +464,192 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+def _sent_gcodes(mock_connection: AsyncMock) -> List[str]:
+    """Get the commands sent to a mock connection, pipelined or not."""
+    sent = []
+    for name, args, kwargs in mock_connection.mock_calls:
+        if name == "send_command":
+            sent.append(kwargs["command"].build().strip())
+        elif name == "send_data_pipelined":
+            sent.append(f"{kwargs['data'].strip()} (pipelined)")
+        elif name == "flush_pipeline":
+            sent.append("(flush)")
+    return sent
+
+
+async def test_pipelined_settings_and_moves(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should pipeline settings and moves, waiting only when required."""
+    smoothie.pipeline_window = 4
+    mock_connection.send_command.return_value = (
+        "ok MCS: X:20.0000 Y:0.0000 Z:0.0000 A:0.0000 B:0.0000 C:0.0000"
+    )
+
+    await smoothie.set_speed(2)
+    await smoothie._send_command(
+        driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+    )
+    await smoothie._send_command(
+        driver_3_0._command_builder().add_gcode("G0").add_int("X", 20)
+    )
+    await smoothie.set_acceleration({"X": 100})
+    await smoothie.update_position()
+
+    assert _sent_gcodes(mock_connection) == [
+        "G0 F120 (pipelined)",
+        "G0 X10 (pipelined)",
+        "G0 X20 (pipelined)",
+        # settings must not change under a running move
+        "M400",
+        "M204 S10000 X100 (pipelined)",
+        # position reads must see the end of all commands
+        "(flush)",
+        "M114.2",
+        "M400",
+    ]
+
+
+async def test_pipelined_delay_blocks(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """A delay should wait for queued moves and for itself to complete."""
+    smoothie.pipeline_window = 4
+
+    await smoothie._send_command(
+        driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+    )
+    await smoothie.delay(1)
+
+    assert _sent_gcodes(mock_connection) == [
+        "G0 X10 (pipelined)",
+        "(flush)",
+        "M400",
+        "G4 P1",
+        "M400",
+    ]
+
+
+async def test_pipelined_moves(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should stream moves in the context, then wait for them on exit."""
+    smoothie.pipeline_window = 4
+    async with smoothie.pipelined_moves():
+        await smoothie._send_command(
+            driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+        )
+        await smoothie._send_command(
+            driver_3_0._command_builder().add_gcode("G0").add_int("X", 20)
+        )
+
+    assert smoothie.pipeline_window == 4
+    assert _sent_gcodes(mock_connection) == [
+        "G0 X10 (pipelined)",
+        "G0 X20 (pipelined)",
+        "(flush)",
+        "M400",
+    ]
+
+
+async def test_pipelined_moves_not_enabled(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should send moves one by one unless pipelining is enabled."""
+    async with smoothie.pipelined_moves():
+        await smoothie._send_command(
+            driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+        )
+
+    sent = _sent_gcodes(mock_connection)
+    assert sent[0] == "G0 X10"
+    assert not [gcode for gcode in sent if "pipelined" in gcode or "flush" in gcode]
+
+
+async def test_pipelined_moves_raise(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should not wait for the moves if the context raises."""
+    smoothie.pipeline_window = 4
+    with pytest.raises(RuntimeError):
+        async with smoothie.pipelined_moves():
+            await smoothie._send_command(
+                driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+            )
+            raise RuntimeError("cancelled")
+
+    assert _sent_gcodes(mock_connection) == ["G0 X10 (pipelined)"]
+
+
+async def test_pipelined_alarm_homes_after_move(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """A pipelined move's alarm, read by a later command, should home."""
+    smoothie.pipeline_window = 4
+    mock_connection.flush_pipeline.side_effect = AlarmResponse(
+        port="port",
+        response="ALARM: Hard limit -X",
+        pipelined_command="G0 X10 \r\n\r\n",
+    )
+
+    await smoothie._send_command(
+        driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+    )
+
+    with patch.object(smoothie, "_reset_from_error"), patch.object(smoothie, "home"):
+        mocked_home = cast(AsyncMock, smoothie.home)
+        with pytest.raises(SmoothieError) as exc_info:
+            await smoothie.update_position()
+
+        mocked_home.assert_called_once_with("X")
+
+    assert exc_info.value.command == "G0 X10 \r\n\r\n"
+
+
+async def test_pipelined_motion_alarm_homes_after_move(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """An alarm while a setting waits for pipelined motion should home."""
+    smoothie.pipeline_window = 4
+    mock_connection.send_command.side_effect = AlarmResponse(
+        port="port", response="ALARM: Hard limit -X"
+    )
+
+    await smoothie._send_command(
+        driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+    )
+
+    with patch.object(smoothie, "_reset_from_error"), patch.object(smoothie, "home"):
+        mocked_home = cast(AsyncMock, smoothie.home)
+        with pytest.raises(SmoothieError) as exc_info:
+            await smoothie.set_acceleration({"X": 100})
+
+        mocked_home.assert_called_once_with("X")
+
+    assert exc_info.value.command is not None
+    assert exc_info.value.command.startswith("G0 X10")
+
+
+async def test_pipelined_error_falls_back(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """An error in a pipelined command should disable pipelining."""
+    smoothie.pipeline_window = 4
+    mock_connection.send_data_pipelined.side_effect = AlarmResponse(
+        port="port", response="ALARM: Hard limit -X"
+    )
+
+    with patch.object(smoothie, "_reset_from_error"), patch.object(smoothie, "home"):
+        with pytest.raises(SmoothieError):
+            await smoothie._send_command(
+                driver_3_0._command_builder().add_gcode("G0").add_int("X", 10)
+            )
+
+    assert smoothie.pipeline_window == 0
+
+    mock_connection.reset_mock()
+    await smoothie.set_speed(2)
+
+    assert _sent_gcodes(mock_connection) == ["G0 F120", "M400"]
@@ -110,6 +110,61 @@ async def test_move_extras_passed_through(hardware_api, monkeypatch):
     assert mock_be_move.call_args_list[0][1]["axis_max_speeds"] == {"Y": 20}
 
 
+async def test_move_path_one_by_one(hardware_api, monkeypatch):
+    await hardware_api.home()
+    mock_be_move = mock.AsyncMock(wraps=hardware_api._backend.move)
+    mock_be_move_path = mock.AsyncMock()
+    monkeypatch.setattr(hardware_api._backend, "move", mock_be_move)
+    monkeypatch.setattr(hardware_api._backend, "move_path", mock_be_move_path)
+
+    await hardware_api.move_path(
+        types.Mount.RIGHT,
+        [(types.Point(0, 0, 100), None), (types.Point(30, 20, 10), None)],
+        speed=30,
+    )
+
+    mock_be_move_path.assert_not_called()
+    assert mock_be_move.call_count == 2
+    assert hardware_api._current_position[Axis.X] == 30
+
+
+async def test_move_path(hardware_api, monkeypatch):
+    mount = types.Mount.RIGHT
+    await hardware_api.home()
+    monkeypatch.setattr(type(hardware_api._backend), "streams_move_paths", True)
+    mock_be_move_path = mock.AsyncMock(wraps=hardware_api._backend.move_path)
+    monkeypatch.setattr(hardware_api._backend, "move_path", mock_be_move_path)
+
+    await hardware_api.move_path(
+        mount,
+        [
+            (types.Point(0, 0, 100), None),
+            (types.Point(30, 20, 100), None),
+            (types.Point(30, 20, 10), None),
+        ],
+        speed=30,
+        max_speeds={Axis.X: 10},
+    )
+
+    mock_be_move_path.assert_called_once()
+    machine_positions = mock_be_move_path.call_args[0][0]
+    assert [(pos["X"], pos["Y"], pos["A"]) for pos in machine_positions] == [
+        (0, 0, 70),
+        (30, 20, 70),
+        (30, 20, -20),
+    ]
+    assert mock_be_move_path.call_args[1]["speed"] == 30
+    assert mock_be_move_path.call_args[1]["axis_max_speeds"] == {"X": 10}
+    assert hardware_api._current_position == {
+        Axis.X: 30,
+        Axis.Y: 20,
+        Axis.Z: 218,
+        Axis.A: -20,
+        Axis.B: 19,
+        Axis.C: 19,
+    }
+
+
 async def test_mount_offset_applied(hardware_api, is_robot):
     await hardware_api.home()
     abs_position = types.Point(30, 20, 10)
@@ -1,6 +1,22 @@
+import asyncio
+
 import pytest
 from mock import AsyncMock, MagicMock
-from opentrons.hardware_control.poller import Poller, Listener, Reader, WaitableListener
+from opentrons.hardware_control.poller import (
+    Poller,
+    Listener,
+    PollPolicy,
+    Reader,
+    WaitableListener,
+)
+
+
+class _EpsilonPolicy(PollPolicy[float]):
+    def is_idle(self, result: float) -> bool:
+        return result == 0
+
+    def changed(self, previous: float, result: float) -> bool:
+        return abs(previous - result) > 0.5
 
 
 async def test_poll_error() -> None:
@@ -49,3 +65,67 @@ async def test_await_poll_error() -> None:
     with pytest.raises(exc.__class__):
         await listener.wait_next_poll()
     await p.stop_and_wait()
+
+
+async def test_publish_changes_only() -> None:
+    """It should pass results within epsilon of the last to on_unchanged."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.side_effect = [1.0, 1.2, 1.4, 1.6, 3.0]
+    listener = MagicMock(spec=Listener)
+    waitable = WaitableListener[float]()
+    listener.on_unchanged.side_effect = waitable.on_unchanged
+    listener.on_poll.side_effect = waitable.on_poll
+
+    p: Poller[float] = Poller(
+        interval_seconds=0.001,
+        reader=reader,
+        listener=listener,
+        policy=_EpsilonPolicy(),
+    )
+    while reader.read.call_count < 5:
+        await waitable.wait_next_poll()
+    await p.stop_and_wait()
+
+    assert [c[0][0] for c in listener.on_poll.call_args_list] == [1.0, 1.6, 3.0]
+    assert [c[0][0] for c in listener.on_unchanged.call_args_list] == [1.2, 1.4]
+
+
+async def test_idle_interval() -> None:
+    """It should poll at the idle interval while idle, until woken."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 0
+    listener = WaitableListener[float]()
+
+    p: Poller[float] = Poller(
+        interval_seconds=0.001,
+        reader=reader,
+        listener=listener,
+        policy=_EpsilonPolicy(),
+        idle_interval_seconds=60,
+    )
+    await listener.wait_next_poll()
+    await asyncio.sleep(0.05)
+    assert reader.read.call_count == 1
+
+    p.wake()
+    await asyncio.wait_for(listener.wait_next_poll(), 1)
+    assert reader.read.call_count == 2
+    await p.stop_and_wait()
+
+
+async def test_active_interval() -> None:
+    """It should poll at the active interval while not idle."""
+    reader = AsyncMock(spec=Reader)
+    reader.read.return_value = 1
+    listener = WaitableListener[float]()
+
+    p: Poller[float] = Poller(
+        interval_seconds=0.001,
+        reader=reader,
+        listener=listener,
+        policy=_EpsilonPolicy(),
+        idle_interval_seconds=60,
+    )
+    for _ in range(3):
+        await asyncio.wait_for(listener.wait_next_poll(), 1)
+    await p.stop_and_wait()
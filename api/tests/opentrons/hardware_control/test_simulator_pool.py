@@ -0,0 +1,73 @@
+from opentrons.hardware_control.simulator_pool import (
+    SimulatorPool,
+    ThreadManagedSimulatorPool,
+)
+from opentrons.types import Mount
+
+
+async def test_simulators_are_homed() -> None:
+    pool = SimulatorPool()
+    async with pool.simulator() as hardware:
+        assert await hardware.current_position(Mount.LEFT)
+        assert hardware.attached_instruments[Mount.LEFT] == {}
+
+
+async def test_simulators_are_reset_and_reused() -> None:
+    pool = SimulatorPool()
+    async with pool.simulator() as hardware:
+        config = hardware.config
+        await hardware.cache_instruments({Mount.LEFT: "p300_single_gen2"})
+        await hardware.update_config(name="changed")
+        hardware.register_callback(lambda event: None)
+        await hardware.set_lights(rails=True)
+
+    async with pool.simulator() as reused:
+        assert reused is hardware
+        assert reused.attached_instruments[Mount.LEFT] == {}
+        assert reused.config == config
+        assert not reused._callbacks
+        assert reused.get_lights()["rails"] is False
+        assert await reused.current_position(Mount.LEFT)
+
+
+async def test_at_most_max_idle_are_kept() -> None:
+    pool = SimulatorPool(max_idle=1)
+    first = await pool.acquire()
+    second = await pool.acquire()
+    await pool.release(first)
+    await pool.release(second)
+
+    assert await pool.acquire() is first
+    assert await pool.acquire() is not second
+
+
+async def test_simulators_with_new_modules_are_not_reused() -> None:
+    pool = SimulatorPool()
+    async with pool.simulator() as hardware:
+        hardware.attached_modules.append(object())
+
+    async with pool.simulator() as fresh:
+        assert fresh is not hardware
+
+
+async def test_warm() -> None:
+    pool = SimulatorPool(max_idle=3)
+    await pool.warm(2)
+    first = await pool.acquire()
+    second = await pool.acquire()
+    assert first is not second
+    await pool.clean_up()
+
+
+def test_thread_managed_simulators_are_reset_and_reused() -> None:
+    pool = ThreadManagedSimulatorPool()
+    with pool.simulator() as thread_manager:
+        thread_manager.sync.cache_instruments({Mount.LEFT: "p300_single_gen2"})
+        assert thread_manager.sync.attached_instruments[Mount.LEFT]
+
+    with pool.simulator() as reused:
+        assert reused is thread_manager
+        assert reused.sync.attached_instruments[Mount.LEFT] == {}
+        assert reused.sync.current_position(Mount.LEFT)
+
+    pool.clean_up()
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 
 import pytest
 import weakref
@@ -8,6 +9,7 @@ from opentrons.hardware_control.thread_manager import (
     ThreadManager,
 )
 from opentrons.hardware_control.api import API
+from opentrons.types import Mount
 
 
 def test_build_fail_raises_exception():
@@ -69,3 +71,134 @@ async def test_module_cache_remove_entry():
     future.result()
     mods_after = thread_manager.attached_modules
     assert len(mods_after) == 1
+
+
+def test_sync_batch():
+    """It should run batched calls in order and return their results."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    with synch.batch() as batch:
+        batch.cache_instruments({Mount.LEFT: "p10_single"})
+        batch.home()
+        position = batch.current_position(Mount.LEFT)
+        pipettes = batch.attached_instruments
+    assert position.result() == synch.current_position(Mount.LEFT)
+    assert pipettes.result()[Mount.LEFT]["name"].startswith("p10_single")
+    thread_manager.clean_up()
+
+
+def test_sync_batch_error():
+    """It should stop a batch at the first error and raise it."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    batch = thread_manager.sync.batch()
+    first = batch.home_z(Mount.LEFT)
+    failing = batch.cache_instruments({Mount.LEFT: "not_a_pipette"})
+    skipped = batch.current_position(Mount.LEFT)
+    with pytest.raises(Exception):
+        batch.run()
+    assert first.result() is None
+    assert failing.exception() is not None
+    assert skipped.cancelled()
+    thread_manager.clean_up()
+
+
+async def test_async_batch():
+    """It should run a batch from another event loop."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    batch = thread_manager.batch()
+    batch.cache_instruments({Mount.RIGHT: "p300_single"})
+    batch.home()
+    batch.current_position(Mount.RIGHT)
+    results = await batch.run_async()
+    assert results[:2] == [None, None]
+    assert results[2] == await thread_manager.current_position(Mount.RIGHT)
+    thread_manager.clean_up()
+
+
+def test_snapshot_follows_calls():
+    """It should refresh snapshot properties after bridged calls."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    synch.cache_instruments({Mount.LEFT: "p10_single"})
+    pipette = synch.attached_instruments[Mount.LEFT]
+    # Served from the snapshot until a call changes it
+    assert synch.attached_instruments[Mount.LEFT] == pipette
+
+    # A synchronous call, run in this thread
+    synch.set_flow_rate(Mount.LEFT, aspirate=1.0)
+    assert synch.attached_instruments[Mount.LEFT]["aspirate_flow_rate"] == 1.0
+
+    # A coroutine call, run in the managed thread
+    synch.cache_instruments({Mount.LEFT: "p300_single"})
+    assert synch.attached_instruments[Mount.LEFT]["name"].startswith("p300_single")
+    assert thread_manager.attached_instruments == synch.attached_instruments
+    thread_manager.clean_up()
+
+
+def test_snapshot_serves_copies():
+    """It should serve copies that neither readers nor the API change."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    synch.cache_instruments({Mount.LEFT: "p10_single"})
+    pipette = synch.attached_instruments[Mount.LEFT]
+    pipette["back_compat_names"].append("changed")
+    pipette["default_aspirate_speeds"].clear()
+    assert synch.attached_instruments[Mount.LEFT] != pipette
+    assert not pipette["has_tip"]
+    synch.add_tip(Mount.LEFT, 50)
+    assert not pipette["has_tip"]
+    assert synch.attached_instruments[Mount.LEFT]["has_tip"]
+    thread_manager.clean_up()
+
+
+def test_snapshot_refreshes_only_after_changing_calls(monkeypatch):
+    """It should only refresh properties after calls that may change them."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    synch.cache_instruments({Mount.LEFT: "p10_single"})
+    synch.attached_instruments
+    reads = []
+    get_attached_instruments = API.get_attached_instruments
+
+    def counting(self):
+        reads.append(self)
+        return get_attached_instruments(self)
+
+    monkeypatch.setattr(API, "get_attached_instruments", counting)
+    synch.home()
+    synch.current_position(Mount.LEFT)
+    synch.attached_instruments
+    assert reads == []
+    synch.add_tip(Mount.LEFT, 50)
+    assert reads
+    refreshed = len(reads)
+    assert synch.attached_instruments[Mount.LEFT]["has_tip"]
+    assert len(reads) == refreshed
+    thread_manager.clean_up()
+
+
+def test_snapshot_concurrent_reads():
+    """It should serve reads from many threads while calls refresh it."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    synch = thread_manager.sync
+    synch.cache_instruments({Mount.LEFT: "p10_single"})
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            synch.attached_instruments
+            synch.engaged_axes
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for _ in range(50):
+            synch.add_tip(Mount.LEFT, 50)
+            synch.remove_tip(Mount.LEFT)
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    assert not synch.attached_instruments[Mount.LEFT]["has_tip"]
+    thread_manager.clean_up()
@@ -92,27 +92,31 @@ async def test_motion(ctx, hardware):
 
 async def test_max_speeds(ctx, monkeypatch, hardware):
     ctx.home()
-    with mock.patch.object(ctx._implementation.get_hardware(), "move_to") as mock_move:
+    hw = ctx._implementation.get_hardware()._obj_to_adapt
+
+    def _max_speeds(*mocks):
+        return [kw["max_speeds"] for m in mocks for args, kw in m.call_args_list]
+
+    with mock.patch.object(hw, "move_to") as mock_move, mock.patch.object(
+        hw, "move_path"
+    ) as mock_path:
         instr = ctx.load_instrument("p10_single", Mount.RIGHT)
         instr.move_to(Location(Point(0, 0, 0), None))
-        assert all(
-            kwargs["max_speeds"] == {} for args, kwargs in mock_move.call_args_list
-        )
+        assert _max_speeds(mock_move, mock_path) == [{}]
 
-    with mock.patch.object(ctx._implementation.get_hardware(), "move_to") as mock_move:
+    with mock.patch.object(hw, "move_to") as mock_move, mock.patch.object(
+        hw, "move_path"
+    ) as mock_path:
         ctx.max_speeds["x"] = 10
         instr.move_to(Location(Point(0, 0, 1), None))
-        assert all(
-            kwargs["max_speeds"] == {Axis.X: 10}
-            for args, kwargs in mock_move.call_args_list
-        )
+        assert _max_speeds(mock_move, mock_path) == [{Axis.X: 10}]
 
-    with mock.patch.object(ctx._implementation.get_hardware(), "move_to") as mock_move:
+    with mock.patch.object(hw, "move_to") as mock_move, mock.patch.object(
+        hw, "move_path"
+    ) as mock_path:
         ctx.max_speeds["x"] = None
         instr.move_to(Location(Point(1, 0, 1), None))
-        assert all(
-            kwargs["max_speeds"] == {} for args, kwargs in mock_move.call_args_list
-        )
+        assert _max_speeds(mock_move, mock_path) == [{}]
 
 
 async def test_location_cache(ctx, monkeypatch, get_labware_def, hardware):
@@ -208,14 +212,14 @@ async def test_move_uses_arc(ctx, monkeypatch, get_labware_def, hardware):
     ctx.home()
 
     with mock.patch.object(
-        ctx._implementation.get_hardware()._obj_to_adapt, "move_to"
-    ) as fake_move:
+        ctx._implementation.get_hardware()._obj_to_adapt, "move_path"
+    ) as fake_move_path:
         right.move_to(lw.wells()[0].top())
-        assert len(fake_move.call_args_list) == 3
-        assert fake_move.call_args_list[-1][0] == (
-            Mount.RIGHT,
-            lw.wells()[0].top().point,
-        )
+        fake_move_path.assert_called_once()
+        mount, waypoints = fake_move_path.call_args[0]
+        assert mount == Mount.RIGHT
+        assert len(waypoints) == 3
+        assert waypoints[-1][0] == lw.wells()[0].top().point
 
 
 def test_pipette_info(ctx):
@@ -416,6 +420,8 @@ def test_aspirate(ctx, get_labware_def):
     instr = ctx.load_instrument("p10_single", Mount.RIGHT, tip_racks=[tiprack])
 
     with mock.patch.object(
+        ctx._implementation.get_hardware()._obj_to_adapt, "move_path"
+    ) as fake_move_path, mock.patch.object(
         ctx._implementation.get_hardware()._obj_to_adapt, "move_to"
     ) as fake_move, mock.patch.object(
         ctx._implementation.get_hardware()._obj_to_adapt, "aspirate"
@@ -425,6 +431,12 @@ def test_aspirate(ctx, get_labware_def):
         assert "aspirating" in ",".join([cmd.lower() for cmd in ctx.commands()])
 
         fake_hw_aspirate.assert_called_once_with(Mount.RIGHT, 2.0, 1.0)
+        # the arc to the top of the well goes through move_path
+        mount, waypoints = fake_move_path.call_args[0]
+        assert mount == Mount.RIGHT
+        assert waypoints[-1] == (lw.wells()[0].top().point, None)
+        assert fake_move_path.call_args[1] == {"speed": 400, "max_speeds": {}}
+        # and the descent to the well bottom through move_to
         assert fake_move.call_args_list[-1] == mock.call(
             Mount.RIGHT,
             lw.wells()[0].bottom().point,
@@ -486,21 +498,18 @@ def test_dispense(ctx, get_labware_def, monkeypatch):
     instr = ctx.load_instrument("p10_single", Mount.RIGHT)
 
     with mock.patch.object(
-        ctx._implementation.get_hardware()._obj_to_adapt, "move_to"
-    ) as fake_move, mock.patch.object(
+        ctx._implementation.get_hardware()._obj_to_adapt, "move_path"
+    ) as fake_move_path, mock.patch.object(
         ctx._implementation.get_hardware()._obj_to_adapt, "dispense"
     ) as fake_hw_dispense:
 
         instr.dispense(2.0, lw.wells()[0].bottom())
         assert "dispensing" in ",".join([cmd.lower() for cmd in ctx.commands()])
         fake_hw_dispense.assert_called_once_with(Mount.RIGHT, 2.0, 1.0)
-        fake_move.assert_called_with(
-            Mount.RIGHT,
-            lw.wells()[0].bottom().point,
-            critical_point=None,
-            speed=400,
-            max_speeds={},
-        )
+        mount, waypoints = fake_move_path.call_args[0]
+        assert mount == Mount.RIGHT
+        assert waypoints[-1] == (lw.wells()[0].bottom().point, None)
+        assert fake_move_path.call_args[1] == {"speed": 400, "max_speeds": {}}
 
     with mock.patch.object(
         ctx._implementation.get_hardware()._obj_to_adapt, "move_to"
@@ -1,8 +1,8 @@
 """Tests for the command lifecycle state."""
 import pytest
-from collections import OrderedDict
 from datetime import datetime
 from typing import NamedTuple, Type
+from pyrsistent import pmap, pset, pvector
 
 from opentrons.types import MountType, DeckSlotName
 from opentrons.hardware_control.types import DoorStateNotification, DoorState
@@ -50,10 +50,16 @@ def test_initial_state() -> None:
         is_door_blocking=False,
         run_result=None,
         running_command_id=None,
-        queued_command_ids=OrderedDict(),
-        all_command_ids=[],
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        all_command_ids=pvector(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -177,11 +183,14 @@ def test_command_store_queues_commands(
     subject = CommandStore()
     subject.handle_action(action)
 
-    assert subject.state.commands_by_id == {
-        "command-id": CommandEntry(index=0, command=expected_command),
-    }
-    assert subject.state.all_command_ids == ["command-id"]
-    assert subject.state.queued_command_ids == OrderedDict({"command-id": True})
+    assert subject.state.commands_by_id == pmap(
+        {
+            "command-id": CommandEntry(index=0, command=expected_command),
+        }
+    )
+    assert subject.state.all_command_ids == pvector(["command-id"])
+    assert subject.state.queued_command_ids == pset(["command-id"])
+    assert subject.state.next_queued_index == 0
 
 
 def test_command_queue_and_unqueue() -> None:
@@ -208,18 +217,174 @@ def test_command_queue_and_unqueue() -> None:
     subject = CommandStore()
 
     subject.handle_action(queue_1)
-    assert subject.state.queued_command_ids == OrderedDict([("command-id-1", True)])
+    assert subject.state.queued_command_ids == pset(["command-id-1"])
+    assert subject.state.next_queued_index == 0
 
     subject.handle_action(queue_2)
-    assert subject.state.queued_command_ids == OrderedDict(
-        [("command-id-1", True), ("command-id-2", True)]
-    )
+    assert subject.state.queued_command_ids == pset(["command-id-1", "command-id-2"])
+    assert subject.state.next_queued_index == 0
 
     subject.handle_action(update_2)
-    assert subject.state.queued_command_ids == OrderedDict([("command-id-1", True)])
+    assert subject.state.queued_command_ids == pset(["command-id-1"])
+    assert subject.state.next_queued_index == 0
 
     subject.handle_action(update_1)
-    assert subject.state.queued_command_ids == OrderedDict([])
+    assert subject.state.queued_command_ids == pset()
+    assert subject.state.next_queued_index is None
+
+
+def test_command_queue_advances_next_queued() -> None:
+    """It should advance the next queued index past dequeued commands."""
+    subject = CommandStore()
+
+    for command_id in ["command-id-1", "command-id-2", "command-id-3"]:
+        subject.handle_action(
+            QueueCommandAction(
+                request=commands.PauseCreate(params=commands.PauseParams()),
+                created_at=datetime(year=2021, month=1, day=1),
+                command_id=command_id,
+                command_key=command_id,
+            )
+        )
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-2"))
+    )
+    assert subject.state.next_queued_index == 0
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    assert subject.state.next_queued_index == 2
+
+
+def test_command_store_counts_completed_commands() -> None:
+    """It should keep track of completed commands as they succeed or fail."""
+    subject = CommandStore()
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_queued_command(command_id="command-id-2"))
+    )
+    assert subject.state.completed_command_count == 0
+    assert subject.state.last_completed_index is None
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-1"))
+    )
+    assert subject.state.completed_command_count == 1
+    assert subject.state.last_completed_index == 0
+
+    # re-completing a completed command should not count it twice
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-1"))
+    )
+    assert subject.state.completed_command_count == 1
+    assert subject.state.last_completed_index == 0
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-2"))
+    )
+    assert subject.state.completed_command_count == 2
+    assert subject.state.last_completed_index == 1
+
+
+def test_command_store_counts_failed_queued_commands() -> None:
+    """It should count queued commands failed alongside a failed command."""
+    subject = CommandStore()
+
+    for command_id in ["command-id-1", "command-id-2", "command-id-3"]:
+        subject.handle_action(
+            QueueCommandAction(
+                request=commands.PauseCreate(params=commands.PauseParams()),
+                created_at=datetime(year=2021, month=1, day=1),
+                command_id=command_id,
+                command_key=command_id,
+            )
+        )
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        FailCommandAction(
+            command_id="command-id-1",
+            error_id="error-id",
+            failed_at=datetime(year=2022, month=2, day=2),
+            error=errors.ProtocolEngineError("oh no"),
+        )
+    )
+
+    assert subject.state.completed_command_count == 3
+    assert subject.state.last_completed_index == 2
+
+
+def test_command_store_logs_command_updates() -> None:
+    """It should log the latest update of each added or changed command."""
+    subject = CommandStore()
+
+    for command_id in ["command-id-1", "command-id-2"]:
+        subject.handle_action(
+            QueueCommandAction(
+                request=commands.PauseCreate(params=commands.PauseParams()),
+                created_at=datetime(year=2021, month=1, day=1),
+                command_id=command_id,
+                command_key=command_id,
+            )
+        )
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="command-id-1"))
+    )
+    subject.handle_action(
+        FailCommandAction(
+            command_id="command-id-1",
+            error_id="error-id",
+            failed_at=datetime(year=2022, month=2, day=2),
+            error=errors.ProtocolEngineError("oh no"),
+        )
+    )
+
+    assert subject.state.update_count == 5
+    assert subject.state.update_cursor_by_command_id == pmap(
+        {"command-id-1": 3, "command-id-2": 4}
+    )
+    assert subject.state.command_ids_by_update_cursor == pmap(
+        {3: "command-id-1", 4: "command-id-2"}
+    )
+
+
+def test_command_store_keeps_previous_states() -> None:
+    """It should leave previous states untouched as actions are handled."""
+    queue = QueueCommandAction(
+        request=commands.PauseCreate(params=commands.PauseParams()),
+        created_at=datetime(year=2021, month=1, day=1),
+        command_id="command-id-1",
+        command_key="command-key-1",
+    )
+    running_update = UpdateCommandAction(
+        command=create_running_command(command_id="command-id-1"),
+    )
+
+    subject = CommandStore()
+    initial_state = subject.state
+
+    subject.handle_action(queue)
+    queued_state = subject.state
+
+    subject.handle_action(running_update)
+    running_state = subject.state
+
+    assert initial_state.all_command_ids == pvector()
+    assert initial_state.commands_by_id == pmap()
+    assert queued_state.queued_command_ids == pset(["command-id-1"])
+    assert queued_state.running_command_id is None
+    assert queued_state.commands_by_id["command-id-1"].command.status == (
+        commands.CommandStatus.QUEUED
+    )
+    assert running_state.queued_command_ids == pset()
+    assert running_state.running_command_id == "command-id-1"
 
 
 def test_running_command_id() -> None:
@@ -261,11 +426,11 @@ def test_running_command_no_queue() -> None:
     subject = CommandStore()
 
     subject.handle_action(running_update)
-    assert subject.state.all_command_ids == ["command-id-1"]
+    assert subject.state.all_command_ids == pvector(["command-id-1"])
     assert subject.state.running_command_id == "command-id-1"
 
     subject.handle_action(completed_update)
-    assert subject.state.all_command_ids == ["command-id-1"]
+    assert subject.state.all_command_ids == pvector(["command-id-1"])
     assert subject.state.running_command_id is None
 
 
@@ -328,12 +493,14 @@ def test_command_failure_clears_queue() -> None:
     subject.handle_action(fail_1)
 
     assert subject.state.running_command_id is None
-    assert subject.state.queued_command_ids == OrderedDict([])
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
-    assert subject.state.commands_by_id == {
-        "command-id-1": CommandEntry(index=0, command=expected_failed_1),
-        "command-id-2": CommandEntry(index=1, command=expected_failed_2),
-    }
+    assert subject.state.queued_command_ids == pset()
+    assert subject.state.all_command_ids == pvector(["command-id-1", "command-id-2"])
+    assert subject.state.commands_by_id == pmap(
+        {
+            "command-id-1": CommandEntry(index=0, command=expected_failed_1),
+            "command-id-2": CommandEntry(index=1, command=expected_failed_2),
+        }
+    )
 
 
 def test_command_store_preserves_handle_order() -> None:
@@ -346,24 +513,30 @@ def test_command_store_preserves_handle_order() -> None:
     subject = CommandStore()
 
     subject.handle_action(UpdateCommandAction(command=command_a))
-    assert subject.state.all_command_ids == ["command-id-1"]
-    assert subject.state.commands_by_id == {
-        "command-id-1": CommandEntry(index=0, command=command_a),
-    }
+    assert subject.state.all_command_ids == pvector(["command-id-1"])
+    assert subject.state.commands_by_id == pmap(
+        {
+            "command-id-1": CommandEntry(index=0, command=command_a),
+        }
+    )
 
     subject.handle_action(UpdateCommandAction(command=command_b))
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
-    assert subject.state.commands_by_id == {
-        "command-id-1": CommandEntry(index=0, command=command_a),
-        "command-id-2": CommandEntry(index=1, command=command_b),
-    }
+    assert subject.state.all_command_ids == pvector(["command-id-1", "command-id-2"])
+    assert subject.state.commands_by_id == pmap(
+        {
+            "command-id-1": CommandEntry(index=0, command=command_a),
+            "command-id-2": CommandEntry(index=1, command=command_b),
+        }
+    )
 
     subject.handle_action(UpdateCommandAction(command=command_c))
-    assert subject.state.all_command_ids == ["command-id-1", "command-id-2"]
-    assert subject.state.commands_by_id == {
-        "command-id-1": CommandEntry(index=0, command=command_c),
-        "command-id-2": CommandEntry(index=1, command=command_b),
-    }
+    assert subject.state.all_command_ids == pvector(["command-id-1", "command-id-2"])
+    assert subject.state.commands_by_id == pmap(
+        {
+            "command-id-1": CommandEntry(index=0, command=command_c),
+            "command-id-2": CommandEntry(index=1, command=command_b),
+        }
+    )
 
 
 @pytest.mark.parametrize("pause_source", PauseSource)
@@ -378,10 +551,16 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -398,10 +577,16 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -415,10 +600,16 @@ def test_command_store_handles_play_according_to_door_state() -> None:
         is_hardware_stopped=False,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
     door_close_event = DoorStateNotification(new_state=DoorState.CLOSED, blocking=False)
@@ -431,10 +622,16 @@ def test_command_store_handles_play_according_to_door_state() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -451,10 +648,16 @@ def test_command_store_handles_finish_action() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -471,10 +674,16 @@ def test_command_store_handles_stop_action() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -490,10 +699,16 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -514,10 +729,16 @@ def test_command_store_ignores_known_finish_error() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -538,17 +759,25 @@ def test_command_store_saves_unknown_finish_error() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={
-            "error-id": errors.ErrorOccurrence(
-                id="error-id",
-                createdAt=datetime(year=2021, month=1, day=1),
-                errorType="RuntimeError",
-                detail="oh no",
-            )
-        },
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(
+            {
+                "error-id": errors.ErrorOccurrence(
+                    id="error-id",
+                    createdAt=datetime(year=2021, month=1, day=1),
+                    errorType="RuntimeError",
+                    detail="oh no",
+                )
+            }
+        ),
     )
 
 
@@ -566,10 +795,16 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -587,10 +822,16 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -620,19 +861,29 @@ def test_command_store_handles_command_failed() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=["command-id"],
-        queued_command_ids=OrderedDict(),
-        commands_by_id={
-            "command-id": CommandEntry(index=0, command=expected_failed_command),
-        },
-        errors_by_id={
-            "error-id": errors.ErrorOccurrence(
-                id="error-id",
-                errorType="ProtocolEngineError",
-                createdAt=datetime(year=2022, month=2, day=2),
-                detail="oh no",
-            )
-        },
+        all_command_ids=pvector(["command-id"]),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=1,
+        last_completed_index=0,
+        update_count=2,
+        update_cursor_by_command_id=pmap({"command-id": 1}),
+        command_ids_by_update_cursor=pmap({1: "command-id"}),
+        commands_by_id=pmap(
+            {
+                "command-id": CommandEntry(index=0, command=expected_failed_command),
+            }
+        ),
+        errors_by_id=pmap(
+            {
+                "error-id": errors.ErrorOccurrence(
+                    id="error-id",
+                    errorType="ProtocolEngineError",
+                    createdAt=datetime(year=2022, month=2, day=2),
+                    detail="oh no",
+                )
+            }
+        ),
     )
 
 
@@ -647,10 +898,16 @@ def test_handles_hardware_stopped() -> None:
         is_hardware_stopped=True,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -670,10 +927,16 @@ def test_handles_door_open_and_close_event() -> None:
         is_hardware_stopped=False,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
     subject.handle_action(HardwareEventAction(event=door_close_event))
@@ -685,10 +948,16 @@ def test_handles_door_open_and_close_event() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
 
@@ -706,10 +975,16 @@ def test_handles_door_event_during_idle_run() -> None:
         is_hardware_stopped=False,
         is_door_blocking=True,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
 
     subject.handle_action(HardwareEventAction(event=door_close_event))
@@ -720,8 +995,14 @@ def test_handles_door_event_during_idle_run() -> None:
         is_hardware_stopped=False,
         is_door_blocking=False,
         running_command_id=None,
-        all_command_ids=[],
-        queued_command_ids=OrderedDict(),
-        commands_by_id=OrderedDict(),
-        errors_by_id={},
+        all_command_ids=pvector(),
+        queued_command_ids=pset(),
+        next_queued_index=None,
+        completed_command_count=0,
+        last_completed_index=None,
+        update_count=0,
+        update_cursor_by_command_id=pmap(),
+        command_ids_by_update_cursor=pmap(),
+        commands_by_id=pmap(),
+        errors_by_id=pmap(),
     )
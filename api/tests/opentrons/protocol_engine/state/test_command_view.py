@@ -1,9 +1,9 @@
 """Labware state store tests."""
 import pytest
-from collections import OrderedDict
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime
 from typing import Dict, List, NamedTuple, Optional, Sequence, Type
+from pyrsistent import pmap, pset, pvector
 
 from opentrons.protocol_engine import EngineStatus, commands as cmd, errors
 
@@ -11,6 +11,7 @@ from opentrons.protocol_engine.state.commands import (
     CommandState,
     CommandView,
     CommandSlice,
+    CommandUpdates,
     CommandEntry,
     CurrentCommand,
     RunResult,
@@ -34,13 +35,35 @@ def get_command_view(
     queued_command_ids: Sequence[str] = (),
     errors_by_id: Optional[Dict[str, errors.ErrorOccurrence]] = None,
     commands: Sequence[cmd.Command] = (),
+    updated_command_ids: Optional[Sequence[str]] = None,
 ) -> CommandView:
     """Get a command view test subject."""
+    # queued commands not otherwise specified go at the end of the command list
+    commands = [
+        *commands,
+        *[
+            create_queued_command(command_id=i)
+            for i in queued_command_ids
+            if i not in [c.id for c in commands]
+        ],
+    ]
     all_command_ids = [command.id for command in commands]
     commands_by_id = {
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
     }
+    updated_command_ids = (
+        updated_command_ids if updated_command_ids is not None else all_command_ids
+    )
+    update_cursor_by_command_id = {
+        command_id: update_cursor
+        for update_cursor, command_id in enumerate(updated_command_ids)
+    }
+    completed_indices = [
+        index
+        for index, command in enumerate(commands)
+        if command.status in [cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED]
+    ]
 
     state = CommandState(
         queue_status=queue_status,
@@ -48,10 +71,25 @@ def get_command_view(
         is_door_blocking=is_door_blocking,
         run_result=run_result,
         running_command_id=running_command_id,
-        queued_command_ids=OrderedDict((i, True) for i in queued_command_ids),
-        errors_by_id=errors_by_id or {},
-        all_command_ids=all_command_ids,
-        commands_by_id=commands_by_id,
+        queued_command_ids=pset(queued_command_ids),
+        next_queued_index=(
+            all_command_ids.index(queued_command_ids[0])
+            if len(queued_command_ids) > 0
+            else None
+        ),
+        completed_command_count=len(completed_indices),
+        last_completed_index=completed_indices[-1] if completed_indices else None,
+        update_count=len(updated_command_ids),
+        update_cursor_by_command_id=pmap(update_cursor_by_command_id),
+        command_ids_by_update_cursor=pmap(
+            {
+                update_cursor: command_id
+                for command_id, update_cursor in update_cursor_by_command_id.items()
+            }
+        ),
+        errors_by_id=pmap(errors_by_id or {}),
+        all_command_ids=pvector(all_command_ids),
+        commands_by_id=pmap(commands_by_id),
     )
 
     return CommandView(state=state)
@@ -157,7 +195,6 @@ def test_get_is_complete() -> None:
     assert subject.get_is_complete("command-id-4") is False
 
 
-@pytest.mark.xfail(strict=True, raises=NotImplementedError)
 def test_get_all_complete() -> None:
     """It should return true if all commands completed or any failed."""
     running_command = create_running_command(command_id="command-id-2")
@@ -182,6 +219,20 @@ def test_get_all_complete() -> None:
     assert subject.get_all_complete() is True
 
 
+def test_get_completed_count() -> None:
+    """It should return the number of succeeded or failed commands."""
+    subject = get_command_view(
+        commands=[
+            create_succeeded_command(command_id="command-id-1"),
+            create_failed_command(command_id="command-id-2"),
+            create_running_command(command_id="command-id-3"),
+            create_queued_command(command_id="command-id-4"),
+        ]
+    )
+
+    assert subject.get_completed_count() == 2
+
+
 def test_get_should_stop() -> None:
     """It should return true if the run_result status is set."""
     subject = get_command_view(run_result=RunResult.SUCCEEDED)
@@ -535,6 +586,78 @@ def test_get_current() -> None:
     )
 
 
+def test_get_updates() -> None:
+    """It should return commands changed since a cursor, without duplicates."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_queued_command(command_id="command-id-3")
+
+    subject = get_command_view(
+        commands=[command_1, command_2, command_3],
+        updated_command_ids=[
+            "command-id-1",
+            "command-id-2",
+            "command-id-3",
+            "command-id-1",
+            "command-id-1",
+            "command-id-2",
+        ],
+    )
+
+    assert subject.get_updates(cursor=0) == CommandUpdates(
+        commands=[command_3, command_1, command_2],
+        cursors=[3, 5, 6],
+        cursor=6,
+    )
+    assert subject.get_updates(cursor=3) == CommandUpdates(
+        commands=[command_1, command_2],
+        cursors=[5, 6],
+        cursor=6,
+    )
+    assert subject.get_updates(cursor=6) == CommandUpdates(
+        commands=[], cursors=[], cursor=6
+    )
+
+
+def test_get_count() -> None:
+    """It should return the number of commands."""
+    subject = get_command_view(
+        commands=[
+            create_succeeded_command(command_id="command-id-1"),
+            create_running_command(command_id="command-id-2"),
+        ],
+        updated_command_ids=["command-id-1", "command-id-2", "command-id-2"],
+    )
+
+    assert subject.get_count() == 2
+
+
+def test_get_has_updates() -> None:
+    """It should return whether any commands changed since a cursor."""
+    subject = get_command_view(
+        commands=[
+            create_succeeded_command(command_id="command-id-1"),
+            create_running_command(command_id="command-id-2"),
+        ],
+    )
+
+    assert subject.get_has_updates(cursor=0) is True
+    assert subject.get_has_updates(cursor=1) is True
+    assert subject.get_has_updates(cursor=2) is False
+
+
+def test_get_has_updates_or_stopped() -> None:
+    """It should return whether to stop waiting for command updates."""
+    command = create_succeeded_command(command_id="command-id-1")
+
+    subject = get_command_view(commands=[command])
+    assert subject.get_has_updates_or_stopped(cursor=0) is True
+    assert subject.get_has_updates_or_stopped(cursor=1) is False
+
+    subject = get_command_view(commands=[command], is_hardware_stopped=True)
+    assert subject.get_has_updates_or_stopped(cursor=1) is True
+
+
 def test_get_slice_empty() -> None:
     """It should return a slice from the tail if no current command."""
     subject = get_command_view(commands=[])
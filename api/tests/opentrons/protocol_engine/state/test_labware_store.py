@@ -2,6 +2,7 @@
 import pytest
 
 from datetime import datetime
+from pyrsistent import pmap, pvector
 
 from opentrons.calibration_storage.helpers import uri_from_details
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
@@ -59,17 +60,22 @@ def test_initial_state(
 
     assert subject.state == LabwareState(
         deck_definition=standard_deck_def,
-        labware_by_id={
-            "fixedTrash": LoadedLabware(
-                id="fixedTrash",
-                loadName=fixed_trash_def.parameters.loadName,
-                definitionUri=expected_trash_uri,
-                location=DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH),
-                offsetId=None,
-            )
-        },
-        labware_offsets_by_id={},
-        definitions_by_uri={expected_trash_uri: fixed_trash_def},
+        labware_by_id=pmap(
+            {
+                "fixedTrash": LoadedLabware(
+                    id="fixedTrash",
+                    loadName=fixed_trash_def.parameters.loadName,
+                    definitionUri=expected_trash_uri,
+                    location=DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH),
+                    offsetId=None,
+                )
+            }
+        ),
+        all_labware_ids=pvector(["fixedTrash"]),
+        labware_offsets_by_id=pmap(),
+        all_labware_offset_ids=pvector(),
+        labware_offset_ids_by_key=pmap(),
+        definitions_by_uri=pmap({str(expected_trash_uri): fixed_trash_def}),
     )
 
 
@@ -99,7 +105,37 @@ def test_handles_add_labware_offset(
         )
     )
 
-    assert subject.state.labware_offsets_by_id == {"offset-id": resolved_offset}
+    assert subject.state.labware_offsets_by_id == pmap({"offset-id": resolved_offset})
+    assert subject.state.labware_offset_ids_by_key == pmap(
+        {("offset-definition-uri", DeckSlotName.SLOT_1, None): "offset-id"}
+    )
+
+
+def test_handles_add_labware_offset_replaces_index(
+    subject: LabwareStore,
+) -> None:
+    """It should index the latest labware offset for each URI and location."""
+    request = LabwareOffsetCreate(
+        definitionUri="offset-definition-uri",
+        location=LabwareOffsetLocation(slotName=DeckSlotName.SLOT_1),
+        vector=LabwareOffsetVector(x=1, y=2, z=3),
+    )
+
+    for offset_id in ["offset-id-1", "offset-id-2"]:
+        subject.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=offset_id,
+                created_at=datetime(year=2021, month=1, day=2),
+                request=request,
+            )
+        )
+
+    assert subject.state.all_labware_offset_ids == pvector(
+        ["offset-id-1", "offset-id-2"]
+    )
+    assert subject.state.labware_offset_ids_by_key == pmap(
+        {("offset-definition-uri", DeckSlotName.SLOT_1, None): "offset-id-2"}
+    )
 
 
 def test_handles_load_labware(
@@ -2,6 +2,7 @@
 import pytest
 from datetime import datetime
 from typing import Dict, Optional, cast
+from pyrsistent import pmap, pvector
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 from opentrons_shared_data.pipette.dev_types import LabwareUri
@@ -62,10 +63,21 @@ def get_labware_view(
     deck_definition: Optional[DeckDefinitionV2] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    labware_by_id = labware_by_id or {}
+    labware_offsets_by_id = labware_offsets_by_id or {}
+    labware_offset_ids_by_key = {
+        (offset.definitionUri, offset.location.slotName, offset.location.moduleModel): (
+            offset_id
+        )
+        for offset_id, offset in labware_offsets_by_id.items()
+    }
     state = LabwareState(
-        labware_by_id=labware_by_id or {},
-        labware_offsets_by_id=labware_offsets_by_id or {},
-        definitions_by_uri=definitions_by_uri or {},
+        labware_by_id=pmap(labware_by_id),
+        all_labware_ids=pvector(labware_by_id),
+        labware_offsets_by_id=pmap(labware_offsets_by_id),
+        all_labware_offset_ids=pvector(labware_offsets_by_id),
+        labware_offset_ids_by_key=pmap(labware_offset_ids_by_key),
+        definitions_by_uri=pmap(definitions_by_uri or {}),
         deck_definition=deck_definition or cast(DeckDefinitionV2, {"fake": True}),
     )
 
@@ -1,4 +1,6 @@
 """Module state store tests."""
+from pyrsistent import pmap, pvector
+
 from opentrons.types import DeckSlotName
 from opentrons.protocol_engine import commands, actions
 
@@ -20,8 +22,9 @@ def test_initial_state() -> None:
     subject = ModuleStore()
 
     assert subject.state == ModuleState(
-        slot_by_module_id={},
-        hardware_module_by_slot={},
+        all_module_ids=pvector(),
+        slot_by_module_id=pmap(),
+        hardware_module_by_slot=pmap(),
     )
 
 
@@ -46,11 +49,14 @@ def test_load_module(tempdeck_v2_def: ModuleDefinition) -> None:
     subject.handle_action(action)
 
     assert subject.state == ModuleState(
-        slot_by_module_id={"module-id": DeckSlotName.SLOT_1},
-        hardware_module_by_slot={
-            DeckSlotName.SLOT_1: HardwareModule(
-                serial_number="serial-number",
-                definition=tempdeck_v2_def,
-            )
-        },
+        all_module_ids=pvector(["module-id"]),
+        slot_by_module_id=pmap({"module-id": DeckSlotName.SLOT_1}),
+        hardware_module_by_slot=pmap(
+            {
+                DeckSlotName.SLOT_1: HardwareModule(
+                    serial_number="serial-number",
+                    definition=tempdeck_v2_def,
+                )
+            }
+        ),
     )
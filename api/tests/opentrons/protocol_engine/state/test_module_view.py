@@ -2,6 +2,7 @@
 import pytest
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 from decoy import Decoy
+from pyrsistent import pmap, pvector
 
 from contextlib import nullcontext
 from typing import ContextManager, Dict, NamedTuple, Optional, Type, TypeVar, Union
@@ -28,9 +29,11 @@ def make_module_view(
     virtualize_modules: bool = False,
 ) -> ModuleView:
     """Get a module view test subject with the specified state."""
+    slot_by_module_id = slot_by_module_id or {}
     state = ModuleState(
-        slot_by_module_id=slot_by_module_id or {},
-        hardware_module_by_slot=hardware_module_by_slot or {},
+        all_module_ids=pvector(slot_by_module_id),
+        slot_by_module_id=pmap(slot_by_module_id),
+        hardware_module_by_slot=pmap(hardware_module_by_slot or {}),
     )
 
     return ModuleView(state=state, virtualize_modules=virtualize_modules)
@@ -1,6 +1,7 @@
 """Tests for pipette state changes in the protocol_engine state store."""
 import pytest
 from datetime import datetime
+from pyrsistent import pmap, pvector
 
 from opentrons.types import MountType
 from opentrons.protocol_engine import commands as cmd
@@ -33,10 +34,11 @@ def test_sets_initial_state(subject: PipetteStore) -> None:
     result = subject.state
 
     assert result == PipetteState(
-        pipettes_by_id={},
-        aspirated_volume_by_id={},
+        all_pipette_ids=pvector(),
+        pipettes_by_id=pmap(),
+        aspirated_volume_by_id=pmap(),
         current_well=None,
-        attached_tip_labware_by_id={},
+        attached_tip_labware_by_id=pmap(),
     )
 
 
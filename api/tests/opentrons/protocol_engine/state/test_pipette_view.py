@@ -1,6 +1,7 @@
 """Tests for pipette state accessors in the protocol_engine state store."""
 import pytest
 from typing import cast, Dict, List, Optional
+from pyrsistent import pmap, pvector
 
 from opentrons.types import MountType, Mount as HwMount
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -21,11 +22,13 @@ def get_pipette_view(
     attached_tip_labware_by_id: Optional[Dict[str, str]] = None,
 ) -> PipetteView:
     """Get a pipette view test subject with the specified state."""
+    pipettes_by_id = pipettes_by_id or {}
     state = PipetteState(
-        pipettes_by_id=pipettes_by_id or {},
-        aspirated_volume_by_id=aspirated_volume_by_id or {},
+        all_pipette_ids=pvector(pipettes_by_id),
+        pipettes_by_id=pmap(pipettes_by_id),
+        aspirated_volume_by_id=pmap(aspirated_volume_by_id or {}),
         current_well=current_well,
-        attached_tip_labware_by_id=attached_tip_labware_by_id or {},
+        attached_tip_labware_by_id=pmap(attached_tip_labware_by_id or {}),
     )
 
     return PipetteView(state=state)
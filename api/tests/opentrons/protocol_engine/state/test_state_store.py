@@ -6,8 +6,9 @@ from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 from opentrons.protocol_engine.state import State, StateStore
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import PlayAction, StopAction
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
+from opentrons.protocol_engine.state.commands import QueueStatus
 
 
 @pytest.fixture
@@ -45,6 +46,17 @@ def test_state_is_immutable(subject: StateStore) -> None:
     assert result_1 is not result_2
 
 
+def test_state_snapshots_are_unchanged(subject: StateStore) -> None:
+    """It should leave previous state snapshots untouched by later actions."""
+    result_1 = subject.state
+    subject.handle_action(PlayAction())
+    result_2 = subject.state
+
+    assert result_1.commands.queue_status == QueueStatus.IMPLICITLY_ACTIVE
+    assert result_2.commands.queue_status == QueueStatus.ACTIVE
+    assert result_1.labware is result_2.labware
+
+
 def test_notify_on_state_change(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
@@ -56,6 +68,21 @@ def test_notify_on_state_change(
     decoy.verify(change_notifier.notify(), times=1)
 
 
+def test_skips_unchanged_state(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should keep the state and not notify if no substore changed."""
+    subject.handle_action(StopAction())
+    result_1 = subject.state
+    subject.handle_action(StopAction())
+    result_2 = subject.state
+
+    assert result_1 is result_2
+    decoy.verify(change_notifier.notify(), times=1)
+
+
 async def test_wait_for_state(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
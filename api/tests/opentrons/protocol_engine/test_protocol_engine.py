@@ -349,6 +349,21 @@ async def test_finish_stops_hardware_if_queue_worker_join_fails(
     )
 
 
+async def test_wait_for_command_updates(
+    decoy: Decoy,
+    state_store: StateStore,
+    subject: ProtocolEngine,
+) -> None:
+    """It should wait for commands to change after a given update cursor."""
+    await subject.wait_for_command_updates(cursor=42)
+
+    decoy.verify(
+        await state_store.wait_for(
+            state_store.commands.get_has_updates_or_stopped, cursor=42
+        )
+    )
+
+
 async def test_wait_until_complete(
     decoy: Decoy,
     state_store: StateStore,
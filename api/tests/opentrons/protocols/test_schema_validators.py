@@ -0,0 +1,75 @@
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons.protocols import schema_validators
+
+
+def test_validators_are_cached():
+    assert (
+        schema_validators.labware_validator() is schema_validators.labware_validator()
+    )
+    assert schema_validators.protocol_validator(
+        4
+    ) is schema_validators.protocol_validator(4)
+
+
+def test_missing_protocol_schema():
+    with pytest.raises(FileNotFoundError):
+        schema_validators.protocol_validator(1000)
+
+
+def test_warm():
+    validators = schema_validators.warm()
+    assert validators[0] is schema_validators.labware_validator()
+    assert schema_validators.protocol_validator(3) in validators
+
+
+def test_could_be_labware(get_json_protocol_fixture, get_labware_fixture):
+    labware = get_labware_fixture("fixture_12_trough_v2")
+    assert schema_validators.could_be_labware(labware)
+    protocol = get_json_protocol_fixture("4", "testModulesProtocol")
+    assert not schema_validators.could_be_labware(protocol)
+    assert not schema_validators.could_be_labware([])
+
+
+def test_validate(get_json_protocol_fixture, get_labware_fixture):
+    labware = get_labware_fixture("fixture_12_trough_v2")
+    protocol = get_json_protocol_fixture("4", "testModulesProtocol")
+
+    schema_validators.labware_validator().validate(labware)
+    schema_validators.protocol_validator(4).validate(protocol)
+    assert not schema_validators.protocol_validator(4).is_valid(labware)
+
+    del labware["wells"]
+    with pytest.raises(jsonschema.ValidationError):
+        schema_validators.labware_validator().validate(labware)
+
+
+def test_protocol_validator_errors_match_schema(get_json_protocol_fixture):
+    """Commands checked by name fail with the error the whole schema gives"""
+    validator = schema_validators.protocol_validator(5)
+    protocol = get_json_protocol_fixture("5", "multipleTipracksWithTC")
+    assert validator.is_valid(protocol)
+
+    protocol["commands"][0]["params"]["well"] = 5
+    with pytest.raises(jsonschema.ValidationError) as raised:
+        validator.validate(protocol)
+    expected = jsonschema.exceptions.best_match(
+        jsonschema.Draft7Validator(
+            validator.schema,
+            resolver=jsonschema.RefResolver(
+                validator.schema["$id"],
+                validator.schema,
+                store={
+                    schema_validators.LABWARE_SCHEMA_ID: (
+                        schema_validators.labware_validator().schema
+                    )
+                },
+            ),
+        ).iter_errors(protocol)
+    )
+    assert raised.value.message == expected.message
+    assert list(raised.value.path) == list(expected.path)
+
+    protocol["commands"][0] = {"command": "notACommand", "params": {}}
+    assert not validator.is_valid(protocol)
@@ -0,0 +1,115 @@
+"""Tests for opentrons.simulate_batch."""
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from opentrons import simulate_batch
+
+DATA = Path(__file__).parent / "data"
+
+
+def test_find_protocols(tmp_path: Path) -> None:
+    """It should find protocols in directories, paths and a manifest."""
+    (tmp_path / "b.py").write_text("")
+    (tmp_path / "a.json").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# protocols\n\nsub/c.py\n")
+
+    assert simulate_batch.find_protocols([str(tmp_path), "d.py"], str(manifest)) == [
+        tmp_path / "a.json",
+        tmp_path / "b.py",
+        Path("d.py"),
+        tmp_path / "sub/c.py",
+    ]
+
+
+def test_simulate_batch() -> None:
+    """It should report each protocol's commands, errors and labware."""
+    results = list(
+        simulate_batch.simulate_batch(
+            [DATA / "test_simulate.py", DATA / "bug_aspirate_tip.py"], workers=1
+        )
+    )
+
+    ok, failed = results
+    assert ok["protocol"] == str(DATA / "test_simulate.py")
+    assert ok["ok"] is True
+    assert ok["errors"] == []
+    assert [command["text"] for command in ok["commands"]][0] == "2.0"
+    assert ok["estimatedDuration"] > 0
+    assert [(lw["slot"], lw["uri"]) for lw in ok["labware"]] == [
+        ("1", "opentrons/opentrons_96_tiprack_300ul/1"),
+        ("2", "opentrons/corning_96_wellplate_360ul_flat/1"),
+    ]
+    json.dumps(ok)
+
+    assert failed["ok"] is False
+    assert [error["type"] for error in failed["errors"]] == ["ExceptionInProtocolError"]
+    assert failed["commands"]
+
+
+def test_simulate_batch_in_process_keeps_logging(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Simulating in this process should not change its logging."""
+    logger = logging.getLogger("opentrons")
+    monkeypatch.setattr(logger, "propagate", True)
+
+    list(simulate_batch.simulate_batch([DATA / "test_simulate.py"], workers=1))
+
+    assert logger.propagate is True
+
+
+def _write_protocol(path: Path, body: str) -> Path:
+    path.write_text(
+        "import os\nimport sys\n"
+        'metadata = {"apiLevel": "2.11"}\n'
+        f"def run(ctx):\n    {body}\n"
+    )
+    return path
+
+
+def test_simulate_batch_captures_output(tmp_path: Path) -> None:
+    """It should capture printed output and treat sys.exit() as a failure."""
+    printing = _write_protocol(tmp_path / "printing.py", 'print("hello")')
+    exiting = _write_protocol(tmp_path / "exiting.py", "sys.exit(3)")
+
+    printed, exited = simulate_batch.simulate_batch([printing, exiting], workers=1)
+
+    assert printed["ok"] is True
+    assert printed["output"] == "hello\n"
+    assert exited["ok"] is False
+    assert [error["type"] for error in exited["errors"]] == ["SystemExit"]
+
+
+def test_simulate_batch_worker_dies(tmp_path: Path) -> None:
+    """A protocol whose worker dies should fail without stopping the batch."""
+    dying = _write_protocol(tmp_path / "dying.py", "os._exit(1)")
+    printing = _write_protocol(tmp_path / "printing.py", 'print("hello")')
+
+    results = {
+        result["protocol"]: result
+        for result in simulate_batch.simulate_batch([dying, printing], workers=2)
+    }
+
+    assert set(results) == {str(dying), str(printing)}
+    assert [error["type"] for error in results[str(dying)]["errors"]] == [
+        "BrokenProcessPool"
+    ]
+
+
+def test_main_exit_code(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """It should exit with 1 if any protocol failed."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["opentrons_simulate_batch", "-j", "1", str(DATA / "bug_aspirate_tip.py")],
+    )
+
+    assert simulate_batch.main() == 1
+    (line,) = capsys.readouterr().out.splitlines()
+    assert json.loads(line)["protocol"] == str(DATA / "bug_aspirate_tip.py")
@@ -0,0 +1,69 @@
+"""Benchmark packing and unpacking every CAN message payload type.
+
+Builds a payload of each message type in message_definitions, then times
+serialize, build from bytes, and unpack_from a memoryview over a buffer
+holding many payloads back to back. Prints the average time per payload
+across all message types.
+
+Usage:
+    python benchmarks/bench_binary_serializable.py [--count 2000]
+"""
+import argparse
+from time import perf_counter
+from typing import List, Type
+
+from typing_extensions import get_args
+
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.utils import BinarySerializable
+
+
+def _payload_types() -> List[Type[BinarySerializable]]:
+    """Get the payload type of every message definition."""
+    return [m.payload_type for m in get_args(MessageDefinition)]
+
+
+def _data(payload_type: Type[BinarySerializable]) -> bytes:
+    # Count up so fields aren't all zero
+    return bytes(i % 0x7F for i in range(payload_type.get_size()))
+
+
+def _time_per_call(seconds: float, calls: int) -> str:
+    return f"{seconds / calls * 1e6:6.2f} us"
+
+
+def main(count: int) -> None:
+    """Run the benchmark and print the time per payload."""
+    payload_types = _payload_types()
+    data = [_data(t) for t in payload_types]
+    payloads = [t.build(d) for t, d in zip(payload_types, data)]
+    calls = count * len(payload_types)
+    print(f"{len(payload_types)} message types, {count} of each")
+
+    start = perf_counter()
+    for _ in range(count):
+        for p in payloads:
+            p.serialize()
+    print(f"  serialize          {_time_per_call(perf_counter() - start, calls)}")
+
+    start = perf_counter()
+    for _ in range(count):
+        for t, d in zip(payload_types, data):
+            t.build(d)
+    print(f"  build              {_time_per_call(perf_counter() - start, calls)}")
+
+    buffers = [memoryview(d * count) for d in data]
+    start = perf_counter()
+    for t, buffer in zip(payload_types, buffers):
+        size = t.get_size()
+        for i in range(count):
+            t.unpack_from(buffer, i * size)
+    seconds = perf_counter() - start
+    print(f"  unpack_from        {_time_per_call(seconds, calls)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+    main(count=args.count)
@@ -0,0 +1,192 @@
+"""Benchmark routing received CAN messages to their listeners.
+
+Records a CAN stream like the one seen while a move group runs with a
+sensor being polled (mostly sensor readings and heartbeats, with move
+completions mixed in) and replays it through a CanMessenger at 1 kHz.
+The messenger's listeners are a move scheduler, sensor readers, and a
+tool detector, either all listening to everything and filtering messages
+themselves, or each subscribed to the messages it wants. Prints the CPU
+time spent per received frame and the share of a core the replay used.
+
+Usage:
+    python benchmarks/bench_can_dispatch.py [--frames 5000] [--rate 1000]
+"""
+import argparse
+import asyncio
+from time import perf_counter, process_time
+from typing import Iterator, List, Optional, Tuple
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    CanMessenger,
+    MessageListenerCallback,
+)
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import (
+    MessageDefinition,
+    message_definitions,
+    payloads,
+)
+from opentrons_hardware.firmware_bindings.messages.fields import SensorTypeField
+from opentrons_hardware.firmware_bindings.utils import UInt8Field, UInt32Field
+
+_NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.pipette_left, NodeId.pipette_right]
+
+
+class _ReplayDriver(AbstractCanDriver):
+    """A driver that plays back recorded frames at a fixed rate."""
+
+    def __init__(self, frames: List[CanMessage], rate: Optional[float]) -> None:
+        self._frames = iter(frames)
+        self._period = 1 / rate if rate else 0.0
+        self._next = perf_counter()
+        self.done = asyncio.Event()
+
+    async def send(self, message: CanMessage) -> None:
+        pass
+
+    async def read(self) -> CanMessage:
+        try:
+            frame = next(self._frames)
+        except StopIteration:
+            self.done.set()
+            await asyncio.Event().wait()
+            raise
+        if self._period:
+            self._next += self._period
+            await asyncio.sleep(max(0.0, self._next - perf_counter()))
+        return frame
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _frame(message: MessageDefinition, node_id: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+        data=message.payload.serialize(),
+    )
+
+
+def _record(count: int) -> List[CanMessage]:
+    """Build a recorded stream of `count` frames."""
+    reading = message_definitions.ReadFromSensorResponse(
+        payload=payloads.ReadFromSensorResponsePayload(
+            sensor=SensorTypeField(1), sensor_data=UInt32Field(1234)
+        )
+    )
+    completed = message_definitions.MoveCompleted(
+        payload=payloads.MoveCompletedPayload(
+            group_id=UInt8Field(0),
+            seq_id=UInt8Field(0),
+            current_position=UInt32Field(100),
+            ack_id=UInt8Field(1),
+        )
+    )
+    heartbeat = message_definitions.HeartbeatResponse()
+
+    def _stream() -> Iterator[CanMessage]:
+        i = 0
+        while True:
+            if i % 50 == 0:
+                yield _frame(completed, _NODES[(i // 50) % 2])
+            elif i % 4 == 0:
+                yield _frame(heartbeat, _NODES[(i // 4) % len(_NODES)])
+            else:
+                # Both pipettes report, but only the left one is being polled
+                yield _frame(reading, _NODES[2 + i % 2])
+            i += 1
+
+    stream = _stream()
+    return [next(stream) for _ in range(count)]
+
+
+def _add_listeners(messenger: CanMessenger, subscribed: bool) -> List[int]:
+    """Add listeners that do what the hardware control listeners do."""
+    received = [0]
+
+    def _count(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+        received[0] += 1
+
+    def _filtered(
+        message_id: MessageId, node_id: Optional[NodeId]
+    ) -> Tuple[MessageListenerCallback, List[MessageId], Optional[NodeId]]:
+        def _listener(
+            message: MessageDefinition, arbitration_id: ArbitrationId
+        ) -> None:
+            if message.message_id == message_id and (
+                node_id is None or arbitration_id.parts.originating_node_id == node_id
+            ):
+                _count(message, arbitration_id)
+
+        return _listener, [message_id], node_id
+
+    listeners = [
+        _filtered(MessageId.move_completed, None),
+        _filtered(MessageId.read_sensor_response, NodeId.pipette_left),
+        _filtered(MessageId.read_sensor_response, NodeId.head),
+        _filtered(MessageId.set_sensor_threshold_response, NodeId.pipette_left),
+        _filtered(MessageId.tools_detected_notification, None),
+        _filtered(MessageId.device_info_response, NodeId.head_bootloader),
+    ]
+    for listener, message_ids, node_id in listeners:
+        if subscribed:
+            messenger.add_listener(listener, message_ids=message_ids, node_id=node_id)
+        else:
+            messenger.add_listener(listener)
+    return received
+
+
+async def _bench(
+    frames: List[CanMessage], rate: Optional[float], subscribed: bool
+) -> Tuple[float, float, int]:
+    driver = _ReplayDriver(frames, rate)
+    messenger = CanMessenger(driver)
+    received = _add_listeners(messenger, subscribed)
+
+    start_wall = perf_counter()
+    start_cpu = process_time()
+    messenger.start()
+    await driver.done.wait()
+    cpu = process_time() - start_cpu
+    wall = perf_counter() - start_wall
+    await messenger.stop()
+    return cpu, wall, received[0]
+
+
+async def main(frame_count: int, rate: float) -> None:
+    """Run the benchmark and print dispatch overhead."""
+    frames = _record(frame_count)
+    print(f"{frame_count} frames")
+    for subscribed in (False, True):
+        name = "subscribed" if subscribed else "catch-all"
+        cpu, _, received = await _bench(frames, None, subscribed)
+        paced_cpu, wall, _ = await _bench(frames, rate, subscribed)
+        print(
+            f"  {name:<12} {cpu / frame_count * 1e6:7.1f} us/frame, "
+            f"{paced_cpu / wall * 100:5.1f}% of a core at {rate:g} Hz, "
+            f"{received} delivered"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=1000)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(frame_count=args.frames, rate=args.rate)
+    )
@@ -0,0 +1,172 @@
+"""Benchmark stop-and-wait and windowed firmware downloads.
+
+Runs the simulated socket CAN bus (opentrons_sim_can_bus) in process,
+with simulated bootloader nodes that ACK each data message after a fixed
+link latency. Downloads a firmware image to one node and to several
+nodes at once, with a range of download windows. Prints the time each
+download took.
+
+Usage:
+    python benchmarks/bench_firmware_download.py [--latency-ms 2] [--kib 32]
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Dict, List
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.constants import ErrorCode
+from opentrons_hardware.firmware_bindings.messages import (
+    MessageDefinition,
+    fields,
+    message_definitions,
+    payloads,
+)
+from opentrons_hardware.firmware_bindings.utils import UInt32Field
+from opentrons_hardware.firmware_update import (
+    FirmwareUpdateDownloader,
+    HexRecordProcessor,
+)
+from opentrons_hardware.firmware_update.hex_file import HexRecord, RecordType
+from opentrons_hardware.scripts import sim_socket_can
+
+_NODES = [
+    NodeId.gantry_x_bootloader,
+    NodeId.gantry_y_bootloader,
+    NodeId.head_bootloader,
+]
+
+
+async def _bootloader(port: int, node_id: NodeId, latency: float) -> None:
+    """ACK every data and complete message to node_id after latency."""
+    driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    loop = asyncio.get_event_loop()
+
+    def _reply(message: MessageDefinition) -> None:
+        frame = CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=message.message_id,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=node_id,
+                )
+            ),
+            data=message.payload.serialize(),
+        )
+        loop.call_later(latency, loop.create_task, driver.send(frame))
+
+    try:
+        async for frame in driver:
+            parts = frame.arbitration_id.parts
+            if parts.node_id != node_id:
+                continue
+            if parts.message_id == message_definitions.FirmwareUpdateData.message_id:
+                data = payloads.FirmwareUpdateData.build(frame.data)
+                assert isinstance(data, payloads.FirmwareUpdateData)
+                _reply(
+                    message_definitions.FirmwareUpdateDataAcknowledge(
+                        payload=payloads.FirmwareUpdateDataAcknowledge(
+                            address=UInt32Field(data.address.value),
+                            error_code=fields.ErrorCodeField(ErrorCode.ok),
+                        )
+                    )
+                )
+            elif (
+                parts.message_id
+                == message_definitions.FirmwareUpdateComplete.message_id
+            ):
+                _reply(
+                    message_definitions.FirmwareUpdateCompleteAcknowledge(
+                        payload=payloads.FirmwareUpdateAcknowledge(
+                            error_code=fields.ErrorCodeField(ErrorCode.ok)
+                        )
+                    )
+                )
+    finally:
+        driver.shutdown()
+
+
+def _image(kib: int) -> List[HexRecord]:
+    """Build the hex records of a firmware image."""
+    records = []
+    for address in range(0, kib * 1024, 16):
+        data = bytes((address + i) % 256 for i in range(16))
+        records.append(
+            HexRecord(
+                byte_count=len(data),
+                address=address,
+                record_type=RecordType.Data,
+                data=data,
+                checksum=0,
+            )
+        )
+    records.append(
+        HexRecord(
+            byte_count=0, address=0, record_type=RecordType.EOF, data=b"", checksum=0
+        )
+    )
+    return records
+
+
+async def _bench(
+    messenger: CanMessenger, image: List[HexRecord], node_count: int, window: int
+) -> float:
+    downloader = FirmwareUpdateDownloader(messenger)
+    processors: Dict[NodeId, HexRecordProcessor] = {
+        node_id: HexRecordProcessor(image) for node_id in _NODES[:node_count]
+    }
+    start = perf_counter()
+    async for _ in downloader.download_many(
+        processors, ack_wait_seconds=5, window=window
+    ):
+        pass
+    return perf_counter() - start
+
+
+async def main(latency_ms: float, kib: int, windows: List[int]) -> None:
+    """Run the benchmark and print download times."""
+    server = await asyncio.start_server(
+        sim_socket_can.ConnectionHandler(), host="127.0.0.1", port=0
+    )
+    assert server.sockets, "Simulated CAN bus is not listening."
+    port = server.sockets[0].getsockname()[1]
+    nodes = [
+        asyncio.ensure_future(_bootloader(port, node_id, latency_ms / 1000))
+        for node_id in _NODES
+    ]
+    driver = await SocketDriver.build(host="127.0.0.1", port=port)
+    messenger = CanMessenger(driver)
+    messenger.start()
+    image = _image(kib)
+
+    print(f"{kib} KiB image, link latency {latency_ms} ms")
+    for node_count in (1, len(_NODES)):
+        for window in windows:
+            name = "stop-and-wait" if window == 1 else f"window {window}"
+            seconds = await _bench(messenger, image, node_count, window)
+            print(f"  {node_count} node(s), {name:<14} {seconds * 1000:8.1f} ms")
+
+    await messenger.stop()
+    driver.shutdown()
+    for node in nodes:
+        node.cancel()
+    server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--kib", type=int, default=32)
+    parser.add_argument("--windows", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(latency_ms=args.latency_ms, kib=args.kib, windows=args.windows)
+    )
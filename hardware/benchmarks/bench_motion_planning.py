@@ -0,0 +1,119 @@
+"""Benchmark the per-move and batched motion planners.
+
+Plans paths of 10, 100, and 1000 targets with MoveManager.plan_motion and
+with the batched planner, and prints how long each took and how many
+blending passes it needed. Pipetting paths are gantry hops each followed
+by a dip; random paths are random points in all four axes, which take
+more passes to blend.
+
+Usage:
+    python benchmarks/bench_motion_planning.py [--sizes 10 100 1000]
+"""
+import argparse
+from time import perf_counter
+from typing import Dict, List
+
+import numpy as np  # type: ignore[import]
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+from opentrons_hardware.hardware_control.motion_planning.batched_move_utils import (
+    plan_moves,
+)
+
+AXES = ["X", "Y", "Z", "A"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=500,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=5,
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=500,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=5,
+    ),
+}
+
+ITERATION_LIMIT = 50
+
+
+def _build_random_path(size: int) -> List[MoveTarget[str]]:
+    """Build a path of random points in every axis."""
+    random = np.random.RandomState(seed=size)
+    return [
+        MoveTarget.build(dict(zip(AXES, point)), 200)
+        for point in random.uniform(0, 300, size=(size, len(AXES)))
+    ]
+
+
+def _build_pipetting_path(size: int) -> List[MoveTarget[str]]:
+    """Build a path of gantry hops, each followed by a short dip and rise."""
+    random = np.random.RandomState(seed=size)
+    targets: List[MoveTarget[str]] = []
+    while len(targets) < size:
+        x, y = random.uniform(0, 400, size=2)
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 100, "A": 0}, 400))
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 20, "A": 0}, 50))
+        targets.append(MoveTarget.build({"X": x, "Y": y, "Z": 100, "A": 0}, 50))
+    return targets[:size]
+
+
+def _bench(
+    manager: MoveManager[str],
+    origin: Dict[str, float],
+    targets: List[MoveTarget[str]],
+) -> None:
+    size = len(targets)
+
+    start = perf_counter()
+    converged, blend_log = manager.plan_motion(origin, targets, ITERATION_LIMIT)
+    seconds = perf_counter() - start
+    print(
+        f"  {size:>5} targets  per-move {seconds * 1e3:9.2f} ms "
+        f"({len(blend_log)} passes, converged: {converged})"
+    )
+
+    start = perf_counter()
+    converged, _, passes = plan_moves(CONSTRAINTS, origin, targets, ITERATION_LIMIT)
+    seconds = perf_counter() - start
+    print(
+        f"  {size:>5} targets  batched  {seconds * 1e3:9.2f} ms "
+        f"({passes} passes, converged: {converged})"
+    )
+
+
+def main(sizes: List[int]) -> None:
+    """Run the benchmark and print timings for each path size."""
+    origin: Dict[str, float] = {"X": 0, "Y": 0, "Z": 100, "A": 0}
+    manager = MoveManager(constraints=CONSTRAINTS)
+
+    for name, build_path in (
+        ("pipetting", _build_pipetting_path),
+        ("random", _build_random_path),
+    ):
+        print(f"{name} paths")
+        for size in sizes:
+            _bench(manager, origin, build_path(size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+    main(sizes=args.sizes)
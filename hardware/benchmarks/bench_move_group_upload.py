@@ -0,0 +1,165 @@
+"""Benchmark setting up and starting move groups over CAN.
+
+Runs move group plans through a CanDriver on a python-can virtual bus,
+with a thread on the other end of the bus standing in for the motor
+nodes: it completes each move group as soon as it is told to execute.
+Plans are set up one message at a time (as before the move group encoder),
+in a single burst, and in per-group bursts with the first group started
+while the rest are still being set up. Prints the time from the start of
+the run to the first execute message, and the total run time.
+
+Usage:
+    python benchmarks/bench_move_group_upload.py [--groups 20] [--sequences 10]
+"""
+import argparse
+import asyncio
+import threading
+from time import perf_counter
+from typing import List, Optional, Type
+
+from can import Bus, Message
+
+from opentrons_hardware.drivers.can_bus import CanDriver, CanMessenger
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import UInt8Field, UInt32Field
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+from opentrons_hardware.hardware_control.move_group_runner import (
+    MoveGroupRunner,
+    encode_move_groups,
+)
+
+_CHANNEL = "bench_move_group_upload"
+_NODES = [NodeId.gantry_x, NodeId.gantry_y, NodeId.head, NodeId.pipette_left]
+
+
+class _OneAtATimeRunner(MoveGroupRunner):
+    """Set up move groups one awaited message at a time."""
+
+    async def _send_groups(self, can_messenger: CanMessenger) -> None:
+        for group in encode_move_groups(self._move_groups):
+            for node_id, message in group:
+                await can_messenger.send(node_id=node_id, message=message)
+
+
+class _Nodes(threading.Thread):
+    """Complete each move group as soon as it is executed."""
+
+    def __init__(self, move_groups: MoveGroups) -> None:
+        super().__init__(daemon=True)
+        self._move_groups = move_groups
+        self._bus = Bus(_CHANNEL, interface="virtual")
+        self._done = threading.Event()
+        self.first_execute: Optional[float] = None
+
+    def run(self) -> None:
+        while not self._done.is_set():
+            m = self._bus.recv(timeout=0.1)
+            if m is None:
+                continue
+            parts = ArbitrationId(id=m.arbitration_id).parts
+            if parts.message_id != MessageId.execute_move_group_request:
+                continue
+            if self.first_execute is None:
+                self.first_execute = perf_counter()
+            group_id = m.data[0]
+            for seq_id, sequence in enumerate(self._move_groups[group_id]):
+                for node in sequence:
+                    self._complete(node, group_id, seq_id)
+
+    def _complete(self, node: NodeId, group_id: int, seq_id: int) -> None:
+        payload = payloads.MoveCompletedPayload(
+            group_id=UInt8Field(group_id),
+            seq_id=UInt8Field(seq_id),
+            current_position=UInt32Field(0),
+            ack_id=UInt8Field(0),
+        )
+        arbitration_id = ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.move_completed,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node,
+            )
+        )
+        self._bus.send(
+            Message(
+                arbitration_id=arbitration_id.id,
+                is_extended_id=True,
+                is_fd=True,
+                data=payload.serialize(),
+            )
+        )
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+        self._bus.shutdown()
+
+
+def _plan(groups: int, sequences: int) -> MoveGroups:
+    step = MoveGroupSingleAxisStep(
+        distance_mm=1,
+        velocity_mm_sec=10,
+        duration_sec=0.1,
+        acceleration_mm_sec_sq=100,
+    )
+    return [[{node: step for node in _NODES} for _ in range(sequences)]] * groups
+
+
+async def _bench(
+    runner_type: Type[MoveGroupRunner],
+    move_groups: MoveGroups,
+    start_during_upload: bool,
+) -> List[float]:
+    nodes = _Nodes(move_groups)
+    nodes.start()
+    driver = await CanDriver.build(channel=_CHANNEL, interface="virtual", bitrate=0)
+    messenger = CanMessenger(driver)
+    messenger.start()
+
+    runner = runner_type(move_groups, start_during_upload=start_during_upload)
+    start = perf_counter()
+    await runner.run(messenger)
+    total = perf_counter() - start
+
+    await messenger.stop()
+    driver.shutdown()
+    nodes.stop()
+    assert nodes.first_execute is not None, "No move group was executed."
+    return [nodes.first_execute - start, total]
+
+
+async def main(groups: int, sequences: int) -> None:
+    """Run the benchmark and print set up and run times."""
+    move_groups = _plan(groups, sequences)
+    frames = groups * sequences * len(_NODES)
+    print(f"{groups} groups of {sequences} sequences, {frames} set up messages")
+    for name, runner_type, start_during_upload in (
+        ("one at a time", _OneAtATimeRunner, False),
+        ("burst", MoveGroupRunner, False),
+        ("burst, start early", MoveGroupRunner, True),
+    ):
+        first, total = await _bench(runner_type, move_groups, start_during_upload)
+        print(
+            f"  {name:<20} {first * 1000:7.1f} ms to first motion, "
+            f"{total * 1000:7.1f} ms total"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--sequences", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(groups=args.groups, sequences=args.sequences)
+    )
@@ -0,0 +1,112 @@
+"""Benchmark capturing sensor readings into a SensorStream.
+
+Feeds read responses straight to a SensorStream listener, as the CAN
+messenger would, and times the capture of each reading with and without
+a host-side threshold waiting on a windowed mean. For comparison, times
+building a SensorDataType per reading into a list and averaging the
+window with python's statistics module, as a caller of the single-shot
+SensorScheduler reads would.
+
+Usage:
+    python benchmarks/bench_sensor_stream.py [--readings 20000] [--window 64]
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+from typing import List, cast
+
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
+from opentrons_hardware.firmware_bindings.constants import NodeId, SensorType
+from opentrons_hardware.firmware_bindings.messages.fields import SensorTypeField
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import UInt32Field
+from opentrons_hardware.sensors.stream import SensorStream
+from opentrons_hardware.sensors.utils import SensorDataType
+
+_ARBITRATION_ID = ArbitrationId(
+    parts=ArbitrationIdParts(
+        message_id=ReadFromSensorResponse.message_id,
+        node_id=NodeId.host,
+        function_code=0,
+        originating_node_id=NodeId.pipette_left,
+    )
+)
+
+
+def _messages(count: int) -> List[ReadFromSensorResponse]:
+    return [
+        ReadFromSensorResponse(
+            payload=ReadFromSensorResponsePayload(
+                sensor=SensorTypeField(SensorType.capacitive),
+                sensor_data=UInt32Field(i % 1000),
+            )
+        )
+        for i in range(count)
+    ]
+
+
+def _time_per_reading(seconds: float, readings: int) -> str:
+    return f"{seconds / readings * 1e6:6.2f} us"
+
+
+def _list_baseline(messages: List[ReadFromSensorResponse], window: int) -> float:
+    readings: List[float] = []
+    start = perf_counter()
+    for message in messages:
+        data = SensorDataType.build(message.payload.sensor_data)
+        readings.append(data.as_int / 2**15)
+        statistics.mean(readings[-window:])
+    return perf_counter() - start
+
+
+async def _stream(
+    messages: List[ReadFromSensorResponse], window: int, threshold: bool
+) -> float:
+    # The listener is fed directly, so the stream never uses the messenger.
+    stream = SensorStream(
+        cast(CanMessenger, None),
+        NodeId.pipette_left,
+        SensorType.capacitive,
+        capacity=4 * window,
+    )
+    if threshold:
+        waiter = asyncio.get_event_loop().create_task(
+            stream.wait_for_threshold(1e9, window=window)
+        )
+        await asyncio.sleep(0)
+    start = perf_counter()
+    for message in messages:
+        stream(message, _ARBITRATION_ID)
+    seconds = perf_counter() - start
+    if threshold:
+        waiter.cancel()
+    return seconds
+
+
+async def main(readings: int, window: int) -> None:
+    """Run the benchmark and print the time per reading."""
+    messages = _messages(readings)
+    print(f"{readings} readings, window of {window}")
+    seconds = _list_baseline(messages, window)
+    print(f"  list + statistics.mean     {_time_per_reading(seconds, readings)}")
+    seconds = await _stream(messages, window, threshold=False)
+    print(f"  stream capture             {_time_per_reading(seconds, readings)}")
+    seconds = await _stream(messages, window, threshold=True)
+    print(f"  stream capture + threshold {_time_per_reading(seconds, readings)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--readings", type=int, default=20000)
+    parser.add_argument("--window", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        main(readings=args.readings, window=args.window)
+    )
@@ -1,6 +1,8 @@
 """The can bus transport."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Sequence
+
 from opentrons_hardware.firmware_bindings import CanMessage
 
 
@@ -19,6 +21,21 @@ class AbstractCanDriver(ABC):
         """
         ...
 
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send several can messages, in order.
+
+        Drivers that can hand a burst of messages to the bus at once should
+        override this.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+        """
+        for message in messages:
+            await self.send(message)
+
     @abstractmethod
     async def read(self) -> CanMessage:
         """Read a message.
@@ -1,8 +1,11 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+import heapq
 from inspect import Traceback
-from typing import List, Optional, Callable, Tuple
+from itertools import count
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 import logging
 
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -25,13 +28,26 @@ log = logging.getLogger(__name__)
 MessageListenerCallback = Callable[[MessageDefinition, ArbitrationId], None]
 """Incoming message listener."""
 
+_SubscriptionKey = Tuple[Optional[int], Optional[int]]
+"""Originating node id and message id of a subscription. None matches any."""
+
+_Subscriber = Tuple[int, MessageListenerCallback]
+"""Registration order and callback of a listener."""
+
+_NO_SUBSCRIBERS: List[_Subscriber] = []
+
 
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+    Listeners may subscribe to specific message ids and/or a specific
+    originating node. Received frames are routed to their subscribers with a
+    dictionary lookup, and a frame's payload is only decoded if at least one
+    listener is subscribed to it. Listeners are called in the order they were
+    added.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -41,11 +57,32 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: List[MessageListenerCallback] = []
+        self._listeners: Dict[_SubscriptionKey, List[_Subscriber]] = {}
+        self._subscriptions: List[Tuple[_Subscriber, List[_SubscriptionKey]]] = []
+        self._next_order = count()
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
         """Send a message."""
+        await self._drive.send(message=self._build_frame(node_id, message))
+
+    async def send_many(
+        self, messages: Iterable[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Send several messages in one burst.
+
+        All the messages are encoded before any is sent, and the whole burst is
+        handed to the driver at once.
+
+        Args:
+            messages: Pairs of destination node id and message, in send order.
+        """
+        frames = [self._build_frame(node_id, message) for node_id, message in messages]
+        await self._drive.send_many(frames)
+
+    @staticmethod
+    def _build_frame(node_id: NodeId, message: MessageDefinition) -> CanMessage:
+        """Encode a message to a node as a can frame."""
         # TODO (amit, 2021-11-05): Use function code when it is better defined.
         arbitration_id = ArbitrationId(
             parts=ArbitrationIdParts(
@@ -56,13 +93,12 @@ class CanMessenger:
             )
         )
         data = message.payload.serialize()
-        log.info(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
-        await self._drive.send(
-            message=CanMessage(arbitration_id=arbitration_id, data=data)
+        log.debug(
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
+        return CanMessage(arbitration_id=arbitration_id, data=data)
 
     def start(self) -> None:
         """Start the reader task."""
@@ -82,13 +118,69 @@ class CanMessenger:
         else:
             log.warning("task not running.")
 
-    def add_listener(self, listener: MessageListenerCallback) -> None:
-        """Add a message listener."""
-        self._listeners.append(listener)
+    def add_listener(
+        self,
+        listener: MessageListenerCallback,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_id: Optional[NodeId] = None,
+    ) -> None:
+        """Add a message listener.
+
+        Args:
+            listener: The callback to notify of received messages.
+            message_ids: Only notify of messages with these ids. None for all.
+            node_id: Only notify of messages from this node. None for all.
+        """
+        node_key = None if node_id is None else int(node_id)
+        if message_ids is None:
+            keys: List[_SubscriptionKey] = [(node_key, None)]
+        else:
+            keys = [(node_key, int(m)) for m in set(message_ids)]
+        subscriber = (next(self._next_order), listener)
+        for key in keys:
+            self._listeners.setdefault(key, []).append(subscriber)
+        self._subscriptions.append((subscriber, keys))
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
-        """Remove a message listener."""
-        self._listeners.remove(listener)
+        """Remove a message listener.
+
+        If the listener was added more than once, the earliest is removed.
+
+        Raises:
+            ValueError: The listener was never added, or already removed.
+        """
+        for index, (subscriber, keys) in enumerate(self._subscriptions):
+            if subscriber[1] == listener:
+                break
+        else:
+            raise ValueError(f"{listener} is not a listener.")
+
+        del self._subscriptions[index]
+        for key in keys:
+            subscribers = self._listeners[key]
+            subscribers.remove(subscriber)
+            if not subscribers:
+                del self._listeners[key]
+
+    def _get_listeners(
+        self, node_id: int, message_id: int
+    ) -> List[MessageListenerCallback]:
+        """Get the listeners subscribed to a message from a node, in order."""
+        get = self._listeners.get
+        matches = [
+            subscribers
+            for subscribers in (
+                get((node_id, message_id), _NO_SUBSCRIBERS),
+                get((None, message_id), _NO_SUBSCRIBERS),
+                get((node_id, None), _NO_SUBSCRIBERS),
+                get((None, None), _NO_SUBSCRIBERS),
+            )
+            if subscribers
+        ]
+        if len(matches) == 1:
+            return [listener for _, listener in matches[0]]
+        # Each key's subscribers are already in order, so just merge them
+        return [listener for _, listener in heapq.merge(*matches, key=itemgetter(0))]
 
     async def _read_task_shield(self) -> None:
         try:
@@ -102,20 +194,29 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
+            parts = message.arbitration_id.parts
+            listeners = self._get_listeners(parts.originating_node_id, parts.message_id)
+            if not listeners:
+                # Nobody is interested, so don't bother decoding it.
+                continue
+            try:
+                message_definition = get_definition(MessageId(parts.message_id))
+            except ValueError:
+                message_definition = None
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
-                    log.info(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener in self._listeners:
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]  # noqa: E501
                 except BinarySerializableException:
                     log.exception(f"Failed to build from {message}")
+                    continue
+                log.debug(
+                    "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                    message.arbitration_id,
+                    build,
+                )
+                received = message_definition(payload=build)  # type: ignore[arg-type]
+                for listener in listeners:
+                    listener(received, message.arbitration_id)
             else:
                 log.error(f"Message {message} is not recognized.")
 
@@ -123,13 +224,22 @@ class CanMessenger:
 class WaitableCallback:
     """MessageListenerCallback that can be awaited or iterated."""
 
-    def __init__(self, messenger: CanMessenger) -> None:
+    def __init__(
+        self,
+        messenger: CanMessenger,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_id: Optional[NodeId] = None,
+    ) -> None:
         """Constructor.
 
         Args:
             messenger: Messenger to listen on.
+            message_ids: Only queue messages with these ids. None for all.
+            node_id: Only queue messages from this node. None for all.
         """
         self._messenger = messenger
+        self._message_ids = message_ids
+        self._node_id = node_id
         self._queue: asyncio.Queue[
             Tuple[MessageDefinition, ArbitrationId]
         ] = asyncio.Queue()
@@ -142,7 +252,9 @@ class WaitableCallback:
 
     def __enter__(self) -> WaitableCallback:
         """Enter context manager."""
-        self._messenger.add_listener(self)
+        self._messenger.add_listener(
+            self, message_ids=self._message_ids, node_id=self._node_id
+        )
         return self
 
     def __exit__(
@@ -162,3 +274,10 @@ class WaitableCallback:
     async def read(self) -> Tuple[MessageDefinition, ArbitrationId]:
         """Read next message."""
         return await self._queue.get()
+
+    def read_nowait(self) -> Optional[Tuple[MessageDefinition, ArbitrationId]]:
+        """Read the next message if one is already queued, else None."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import asyncio
 import platform
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from can import Notifier, Bus, AsyncBufferedReader, Message
 
@@ -102,13 +102,32 @@ class CanDriver(AbstractCanDriver):
         Returns:
             None
         """
-        m = Message(
+        await self._loop.run_in_executor(None, self._bus.send, self._to_bus(message))
+
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send several can messages in one trip to the executor.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+        """
+        bus_messages = [self._to_bus(message) for message in messages]
+        await self._loop.run_in_executor(None, self._send_all, bus_messages)
+
+    def _send_all(self, messages: List[Message]) -> None:
+        for m in messages:
+            self._bus.send(m)
+
+    @staticmethod
+    def _to_bus(message: CanMessage) -> Message:
+        return Message(
             arbitration_id=message.arbitration_id.id,
             is_extended_id=True,
             is_fd=True,
             data=message.data,
         )
-        await self._loop.run_in_executor(None, self._bus.send, m)
 
     async def read(self) -> CanMessage:
         """Read a message.
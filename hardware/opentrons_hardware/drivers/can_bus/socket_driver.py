@@ -1,5 +1,6 @@
 """A driver that emulates CAN over socket."""
 from __future__ import annotations
+from typing import Sequence
 from typing_extensions import Final
 import logging
 import struct
@@ -48,13 +49,20 @@ class SocketDriver(AbstractCanDriver):
 
     async def send(self, message: CanMessage) -> None:
         """Send a message."""
-        data = struct.pack(
+        self._writer.write(self._pack(message))
+
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send several messages in a single write."""
+        self._writer.write(b"".join(self._pack(message) for message in messages))
+
+    @staticmethod
+    def _pack(message: CanMessage) -> bytes:
+        return struct.pack(
             f">LL{len(message.data)}s",
             message.arbitration_id.id,
             len(message.data),
             message.data,
         )
-        self._writer.write(data)
 
     async def read(self) -> CanMessage:
         """Read a message."""
@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic
+from dataclasses import dataclass, fields
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    NamedTuple,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 
 class BinarySerializableException(BaseException):
@@ -116,6 +126,21 @@ class Int8Field(BinaryFieldBase[int]):
     FORMAT = "b"
 
 
+class _Codec(NamedTuple):
+    """A BinarySerializable class's compiled packing information."""
+
+    struct: struct.Struct
+    """The compiled struct for all the fields."""
+    names: Tuple[str, ...]
+    """The field names in packing order."""
+    builders: Tuple[Callable[[Any], BinaryFieldBase[Any]], ...]
+    """The callables to build each field from its unpacked value."""
+
+
+_codecs: Dict[Type[BinarySerializable], _Codec] = {}
+"""Compiled codecs by BinarySerializable class."""
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -124,6 +149,9 @@ class BinarySerializable:
     used by `struct` package to pack/unpack the field.
 
     Data will be packed big endian.
+
+    A class's struct format is compiled the first time it is packed or unpacked
+    and reused from then on.
     """
 
     ENDIAN = ">"
@@ -135,10 +163,10 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
+        vals = [getattr(self, name).value for name in codec.names]
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*vals)
         except struct.error as e:
             raise SerializationException(str(e))
 
@@ -159,16 +187,47 @@ class BinarySerializable:
         Returns:
             cls
         """
+        return cls.unpack_from(data)
+
+    @classmethod
+    def unpack_from(
+        cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0
+    ) -> BinarySerializable:
+        """Create a BinarySerializable from a buffer, starting at offset.
+
+        The buffer is not copied, so a memoryview of a frame holding several
+        payloads can be unpacked one payload at a time by advancing offset by
+        get_size().
+
+        Args:
+            buffer: An object supporting the buffer protocol.
+            offset: Byte offset of the start of the payload.
+
+        Returns:
+            cls
+        """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            args = {v.name: v.type.build(b[i]) for i, v in enumerate(fields(cls))}
-            # Mypy is not liking constructing the derived types.
-            return cls(**args)  # type: ignore[call-arg]
+            b = codec.struct.unpack_from(buffer, offset)
         except struct.error as e:
             raise InvalidFieldException(str(e))
+        return cls(*[build(v) for build, v in zip(codec.builders, b)])
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the compiled codec for this class."""
+        try:
+            return _codecs[cls]
+        except KeyError:
+            dataclass_fields = fields(cls)
+            codec = _Codec(
+                struct=struct.Struct(cls._get_format_string()),
+                names=tuple(v.name for v in dataclass_fields),
+                builders=tuple(_get_field_builder(v.type) for v in dataclass_fields),
+            )
+            _codecs[cls] = codec
+            return codec
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -190,7 +249,17 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
+
+
+def _get_field_builder(
+    field_type: Type[BinaryFieldBase[Any]],
+) -> Callable[[Any], BinaryFieldBase[Any]]:
+    """Get the fastest callable that builds a field from a value."""
+    if field_type.build.__func__ is BinaryFieldBase.build.__func__:  # type: ignore[attr-defined]  # noqa: E501
+        # build is the default factory; skip the extra classmethod call.
+        return field_type
+    return field_type.build
 
 
 class LittleEndianMixIn:
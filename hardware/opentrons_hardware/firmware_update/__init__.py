@@ -9,12 +9,13 @@ from .initiator import (
     pipette_right,
     Target,
 )
-from .downloader import FirmwareUpdateDownloader
+from .downloader import FirmwareUpdateDownloader, DownloadProgress
 from .hex_file import from_hex_file_path, from_hex_contents, HexRecordProcessor
 from .eraser import FirmwareUpdateEraser
 
 __all__ = [
     "FirmwareUpdateDownloader",
+    "DownloadProgress",
     "FirmwareUpdateInitiator",
     "FirmwareUpdateEraser",
     "head",
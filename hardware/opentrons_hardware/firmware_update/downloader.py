@@ -2,6 +2,8 @@
 import asyncio
 import binascii
 import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Union
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -22,6 +24,26 @@ from opentrons_hardware.firmware_bindings.messages import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class DownloadProgress:
+    """Progress of a firmware download to a node."""
+
+    node_id: NodeId
+    chunks_acked: int
+    """The number of data chunks the node has acknowledged."""
+    chunks_total: int
+    """The number of data chunks in the firmware."""
+
+
+@dataclass
+class _Outstanding:
+    """A data message that has been sent but not acknowledged."""
+
+    message: message_definitions.FirmwareUpdateData
+    deadline: float
+    attempts: int = 1
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -34,6 +56,8 @@ class FirmwareUpdateDownloader:
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
+        window: int = 1,
+        retries: int = 0,
     ) -> None:
         """Download hex record chunks to node.
 
@@ -41,42 +65,104 @@ class FirmwareUpdateDownloader:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK
+            window: Number of data chunks that may be awaiting an ACK at once.
+            retries: Number of times to resend a data chunk that wasn't ACKed.
 
         Returns:
             None
         """
-        with WaitableCallback(self._messenger) as reader:
-            num_messages = 0
-            crc32 = 0
-            for chunk in hex_processor.process(
-                fields.FirmwareUpdateDataField.NUM_BYTES
-            ):
-                logger.debug(
-                    f"Sending chunk {num_messages} to address {chunk.address:x}."
-                )
-                # Create and send message from this chunk
-                data = bytes(chunk.data)
-                data_message = message_definitions.FirmwareUpdateData(
+        async for _ in self.download(
+            node_id, hex_processor, ack_wait_seconds, window, retries
+        ):
+            pass
+
+    async def download(
+        self,
+        node_id: NodeId,
+        hex_processor: HexRecordProcessor,
+        ack_wait_seconds: float,
+        window: int = 1,
+        retries: int = 0,
+    ) -> AsyncIterator[DownloadProgress]:
+        """Download hex record chunks to node, reporting progress.
+
+        Up to `window` data chunks are sent ahead of their ACKs. ACKs are
+        matched to chunks by address, so they may arrive in any order. A chunk
+        whose ACK doesn't arrive in time is resent on its own.
+
+        Args:
+            node_id: The target node id.
+            hex_processor: The producer of hex chunks.
+            ack_wait_seconds: Number of seconds to wait for an ACK
+            window: Number of data chunks that may be awaiting an ACK at once.
+            retries: Number of times to resend a data chunk that wasn't ACKed.
+
+        Returns:
+            Progress after each ACKed data chunk.
+        """
+        if window < 1:
+            raise ValueError("The download window must be at least 1.")
+
+        data_messages: List[message_definitions.FirmwareUpdateData] = []
+        crc32 = 0
+        for chunk in hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES):
+            data = bytes(chunk.data)
+            data_messages.append(
+                message_definitions.FirmwareUpdateData(
                     payload=payloads.FirmwareUpdateData.create(
                         address=chunk.address, data=data
                     )
                 )
-                await self._messenger.send(node_id=node_id, message=data_message)
-                try:
-                    # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
+            )
+            crc32 = binascii.crc32(data, crc32)
+
+        with WaitableCallback(
+            self._messenger,
+            message_ids=[
+                message_definitions.FirmwareUpdateDataAcknowledge.message_id,
+                message_definitions.FirmwareUpdateCompleteAcknowledge.message_id,
+            ],
+            node_id=node_id,
+        ) as reader:
+            loop = asyncio.get_event_loop()
+            outstanding: Dict[int, _Outstanding] = {}
+            num_sent = 0
+            num_acked = 0
+            while num_acked < len(data_messages):
+                while num_sent < len(data_messages) and len(outstanding) < window:
+                    data_message = data_messages[num_sent]
+                    address = data_message.payload.address.value
+                    logger.debug("Sending chunk %d to address %x.", num_sent, address)
+                    outstanding[address] = _Outstanding(
+                        message=data_message,
+                        deadline=loop.time() + ack_wait_seconds,
                     )
-                except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
+                    await self._messenger.send(node_id=node_id, message=data_message)
+                    num_sent += 1
 
-                crc32 = binascii.crc32(data, crc32)
-                num_messages += 1
+                ack = await self._wait_data_message_ack(reader, outstanding)
+                if ack is None:
+                    await self._resend_expired(
+                        node_id, outstanding, ack_wait_seconds, retries
+                    )
+                elif outstanding.pop(ack.payload.address.value, None) is None:
+                    logger.warning(
+                        "Ignoring ACK for address %x, which is not awaiting one.",
+                        ack.payload.address.value,
+                    )
+                else:
+                    num_acked += 1
+                    yield DownloadProgress(
+                        node_id=node_id,
+                        chunks_acked=num_acked,
+                        chunks_total=len(data_messages),
+                    )
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
                 payload=payloads.FirmwareUpdateComplete(
-                    num_messages=UInt32Field(num_messages), crc32=UInt32Field(crc32)
+                    num_messages=UInt32Field(len(data_messages)),
+                    crc32=UInt32Field(crc32),
                 )
             )
             await self._messenger.send(node_id=node_id, message=complete_message)
@@ -88,17 +174,109 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message)
 
-    @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
-        """Wait for response to data."""
-        async for response, arbitration_id in reader:
-            if arbitration_id.parts.originating_node_id == node_id:
-                if isinstance(
-                    response, message_definitions.FirmwareUpdateDataAcknowledge
+    async def download_many(
+        self,
+        hex_processors: Mapping[NodeId, HexRecordProcessor],
+        ack_wait_seconds: float,
+        window: int = 1,
+        retries: int = 0,
+    ) -> AsyncIterator[DownloadProgress]:
+        """Download firmware to several nodes at once.
+
+        If any node's download fails, the others are cancelled and the error
+        is raised.
+
+        Args:
+            hex_processors: The producer of hex chunks for each target node id.
+            ack_wait_seconds: Number of seconds to wait for an ACK
+            window: Number of data chunks per node that may be awaiting an ACK
+                at once.
+            retries: Number of times to resend a data chunk that wasn't ACKed.
+
+        Returns:
+            Each node's progress, as it happens.
+        """
+        queue: "asyncio.Queue[Union[DownloadProgress, Exception, None]]" = (
+            asyncio.Queue()
+        )
+
+        async def _download(node_id: NodeId, hex_processor: HexRecordProcessor) -> None:
+            try:
+                async for progress in self.download(
+                    node_id, hex_processor, ack_wait_seconds, window, retries
                 ):
-                    if response.payload.error_code.value != ErrorCode.ok:
-                        raise ErrorResponse(response)
-                    break
+                    queue.put_nowait(progress)
+            except Exception as e:
+                queue.put_nowait(e)
+            else:
+                queue.put_nowait(None)
+
+        loop = asyncio.get_event_loop()
+        tasks = [
+            loop.create_task(_download(node_id, hex_processor))
+            for node_id, hex_processor in hex_processors.items()
+        ]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _wait_data_message_ack(
+        reader: WaitableCallback, outstanding: Dict[int, _Outstanding]
+    ) -> Optional[message_definitions.FirmwareUpdateDataAcknowledge]:
+        """Wait for the next data ACK, or None once the first deadline passes.
+
+        ACKs that were received before the deadline passed are still read.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = min(o.deadline for o in outstanding.values())
+        while True:
+            timeout = deadline - loop.time()
+            if timeout > 0:
+                try:
+                    response, _ = await asyncio.wait_for(reader.read(), timeout)
+                except asyncio.TimeoutError:
+                    return None
+            else:
+                # wait_for with no time left gives up without reading, even
+                # if an ACK is already queued
+                queued = reader.read_nowait()
+                if queued is None:
+                    return None
+                response, _ = queued
+            if isinstance(response, message_definitions.FirmwareUpdateDataAcknowledge):
+                if response.payload.error_code.value != ErrorCode.ok:
+                    raise ErrorResponse(response)
+                return response
+
+    async def _resend_expired(
+        self,
+        node_id: NodeId,
+        outstanding: Dict[int, _Outstanding],
+        ack_wait_seconds: float,
+        retries: int,
+    ) -> None:
+        """Resend the data messages whose ACKs are overdue."""
+        now = asyncio.get_event_loop().time()
+        for address, entry in outstanding.items():
+            if entry.deadline > now:
+                continue
+            if entry.attempts > retries:
+                raise TimeoutResponse(entry.message)
+            logger.warning("Resending chunk at address %x.", address)
+            entry.attempts += 1
+            entry.deadline = now + ack_wait_seconds
+            await self._messenger.send(node_id=node_id, message=entry.message)
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -32,7 +32,11 @@ class FirmwareUpdateEraser:
         Returns:
             None.
         """
-        with WaitableCallback(self._can_messenger) as reader:
+        with WaitableCallback(
+            self._can_messenger,
+            message_ids=[FirmwareUpdateEraseAppResponse.message_id],
+            node_id=node_id,
+        ) as reader:
             request = FirmwareUpdateEraseAppRequest()
             await self._can_messenger.send(node_id=node_id, message=request)
             try:
@@ -0,0 +1,455 @@
+"""Array versions of the motion planning utils.
+
+Each function here does the work of one of the per-move helpers in
+move_utils for every move in a path at once. Moves are rows and axes are
+columns, so a planning pass costs a fixed number of numpy operations
+however long the path is. Loops over axes are kept where the per-move
+helpers update a speed one axis at a time, so both give the same limits.
+"""
+import logging
+from typing import List, NamedTuple, Tuple
+
+import numpy as np  # type: ignore[import]
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+    get_target_axes,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+log = logging.getLogger(__name__)
+
+
+class ConstraintArrays(NamedTuple):
+    """Per-axis constraints, in the same axis order as the move arrays."""
+
+    max_acceleration: np.ndarray
+    max_speed_discont: np.ndarray
+    max_direction_change_speed_discont: np.ndarray
+
+
+class MoveArrays(NamedTuple):
+    """The fixed parts of a list of moves: one row per move."""
+
+    unit_vectors: np.ndarray
+    distances: np.ndarray
+    max_speeds: np.ndarray
+
+
+class BlockArrays(NamedTuple):
+    """The three blocks of each of a list of moves: one row per move."""
+
+    distances: np.ndarray
+    initial_speeds: np.ndarray
+    accelerations: np.ndarray
+    final_speeds: np.ndarray
+
+    @property
+    def move_initial_speeds(self) -> np.ndarray:
+        """Each move's initial speed, as `Move.initial_speed` computes it."""
+        moving = self.distances != 0
+        index = np.argmax(moving, axis=1)
+        speeds = self.initial_speeds[np.arange(len(index)), index]
+        return np.where(moving.any(axis=1), speeds, 0.0)
+
+    @property
+    def move_final_speeds(self) -> np.ndarray:
+        """Each move's final speed, as `Move.final_speed` computes it."""
+        moving = self.distances != 0
+        index = 2 - np.argmax(moving[:, ::-1], axis=1)
+        speeds = self.final_speeds[np.arange(len(index)), index]
+        return np.where(moving.any(axis=1), speeds, 0.0)
+
+
+def build_constraint_arrays(
+    constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+) -> ConstraintArrays:
+    """Arrange system constraints as arrays in axis order."""
+    return ConstraintArrays(
+        max_acceleration=np.array(
+            [constraints[axis].max_acceleration for axis in axes], dtype=np.float64
+        ),
+        max_speed_discont=np.array(
+            [constraints[axis].max_speed_discont for axis in axes], dtype=np.float64
+        ),
+        max_direction_change_speed_discont=np.array(
+            [constraints[axis].max_direction_change_speed_discont for axis in axes],
+            dtype=np.float64,
+        ),
+    )
+
+
+def targets_to_move_arrays(
+    initial: Coordinates[AxisKey, CoordinateValue],
+    targets: List[MoveTarget[AxisKey]],
+    axes: List[AxisKey],
+) -> MoveArrays:
+    """Transform a list of MoveTargets into the arrays of a list of moves."""
+    positions = np.array(
+        [[initial.get(axis, 0) for axis in axes]]
+        + [[target.position.get(axis, 0) for axis in axes] for target in targets],
+        dtype=np.float64,
+    )
+    displacements = np.diff(positions, axis=0)
+    distances = np.linalg.norm(displacements, axis=1)
+
+    zero_length = distances == 0
+    if zero_length.any():
+        index = int(np.argmax(zero_length))
+        raise ZeroLengthMoveError(
+            dict(zip(axes, positions[index])), dict(zip(axes, positions[index + 1]))
+        )
+
+    return MoveArrays(
+        unit_vectors=displacements / distances[:, np.newaxis],
+        distances=distances,
+        max_speeds=np.array([target.max_speed for target in targets], dtype=np.float64),
+    )
+
+
+def _neighbor_components(moves: MoveArrays, offset: int) -> np.ndarray:
+    """Each move's neighbor's unit vector, or zero if the neighbor is not moving.
+
+    An offset of -1 gets previous moves and 1 gets next moves. Moves at either
+    end of the path have stationary neighbors.
+    """
+    components = np.zeros_like(moves.unit_vectors)
+    moving = moves.distances > FLOAT_THRESHOLD
+    if offset < 0:
+        components[1:] = np.where(moving[:-1, np.newaxis], moves.unit_vectors[:-1], 0)
+    else:
+        components[:-1] = np.where(moving[1:, np.newaxis], moves.unit_vectors[1:], 0)
+    return components
+
+
+def _neighbor_speeds(speeds: np.ndarray, offset: int) -> np.ndarray:
+    """Each move's neighbor's speed, or zero at either end of the path."""
+    shifted = np.zeros_like(speeds)
+    if offset < 0:
+        shifted[1:] = speeds[:-1]
+    else:
+        shifted[:-1] = speeds[1:]
+    return shifted
+
+
+def _junction_speed_limits(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+    speeds: np.ndarray,
+    neighbor_components: np.ndarray,
+    neighbor_speeds: np.ndarray,
+) -> np.ndarray:
+    """Limit each move's speed at a junction with its neighbor, axis by axis.
+
+    This is `find_initial_speed` and `find_final_speed` for a whole path:
+    the rules at a move's start and end are the same, looking at the
+    previous or the next move respectively.
+    """
+    speeds = speeds.copy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis_index in range(moves.unit_vectors.shape[1]):
+            component = moves.unit_vectors[:, axis_index]
+            neighbor_component = neighbor_components[:, axis_index]
+            discont = constraints.max_speed_discont[axis_index]
+            direction_change_discont = constraints.max_direction_change_speed_discont[
+                axis_index
+            ]
+
+            moving = np.abs(component * speeds) >= FLOAT_THRESHOLD
+            stopped_limit = np.abs(discont / component)
+            same_direction_limit = np.abs(
+                np.maximum(np.abs(neighbor_speeds * neighbor_component), discont)
+                / component
+            )
+            direction_change_limit = np.abs(direction_change_discont / component)
+
+            limit = np.where(
+                (neighbor_component == 0) | (neighbor_speeds == 0),
+                stopped_limit,
+                np.where(
+                    neighbor_component * component > 0,
+                    same_direction_limit,
+                    direction_change_limit,
+                ),
+            )
+            speeds = np.where(moving, np.minimum(limit, speeds), speeds)
+
+    return speeds
+
+
+def find_initial_speeds(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+    initial_speeds: np.ndarray,
+    final_speeds: np.ndarray,
+) -> np.ndarray:
+    """Get each move's initial speed, given the current move speeds."""
+    return _junction_speed_limits(
+        constraints,
+        moves,
+        initial_speeds,
+        _neighbor_components(moves, -1),
+        _neighbor_speeds(final_speeds, -1),
+    )
+
+
+def find_final_speeds(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+    final_speeds: np.ndarray,
+    initial_speeds: np.ndarray,
+) -> np.ndarray:
+    """Get each move's final speed, given the current move speeds."""
+    return _junction_speed_limits(
+        constraints,
+        moves,
+        final_speeds,
+        _neighbor_components(moves, 1),
+        _neighbor_speeds(initial_speeds, 1),
+    )
+
+
+def achievable_finals(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+    initial_speeds: np.ndarray,
+    final_speeds: np.ndarray,
+) -> np.ndarray:
+    """Make sure each move's final speed is achievable from its initial speed."""
+    final_speeds = final_speeds.copy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis_index in range(moves.unit_vectors.shape[1]):
+            component = moves.unit_vectors[:, axis_index]
+            # using the equation v_f^2  = v_i^2 + 2as
+            max_final_velocity_sq = (
+                initial_speeds * component
+            ) ** 2 + 2 * constraints.max_acceleration[axis_index] * moves.distances
+            max_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_final_velocity_sq) / component,
+                    final_speeds - initial_speeds,
+                )
+                + initial_speeds
+            )
+            # take the smaller of the absolute values
+            constrained = np.copysign(
+                np.minimum(np.abs(max_final_velocity), np.abs(final_speeds)),
+                final_speeds,
+            )
+            final_speeds = np.where(component != 0, constrained, final_speeds)
+
+    return final_speeds
+
+
+def build_blocks(
+    constraints: ConstraintArrays,
+    moves: MoveArrays,
+    initial_speeds: np.ndarray,
+    final_speeds: np.ndarray,
+) -> BlockArrays:
+    """Build the accelerate, coast, and decelerate blocks of every move.
+
+    See `move_utils.build_blocks` for the shape of each move's blocks.
+    """
+    assert np.all(
+        (np.abs(initial_speeds) <= moves.max_speeds)
+        | np.isclose(np.abs(initial_speeds), moves.max_speeds)
+    ), "initial speed exceeds max speed"
+    assert np.all(
+        (np.abs(final_speeds) <= moves.max_speeds)
+        | np.isclose(np.abs(final_speeds), moves.max_speeds)
+    ), "final speed exceeds max speed"
+
+    unit_vectors = moves.unit_vectors
+    max_acc = np.where(unit_vectors != 0, constraints.max_acceleration, 0.0)
+    acc_v = np.linalg.norm(max_acc, axis=1)[:, np.newaxis] * unit_vectors
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis_index in range(unit_vectors.shape[1]):
+            axis_acc = acc_v[:, axis_index]
+            axis_max_acc = max_acc[:, axis_index]
+            scale = np.where(
+                np.abs(axis_acc) > axis_max_acc, axis_max_acc / axis_acc, 1.0
+            )
+            acc_v = acc_v * scale[:, np.newaxis]
+    max_acceleration = np.linalg.norm(acc_v, axis=1)
+
+    initial_speed_sq = initial_speeds**2
+    final_speed_sq = final_speeds**2
+
+    max_achievable_speed = np.sqrt(
+        0.5
+        * (2 * max_acceleration * moves.distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speed, moves.max_speeds) ** 2
+
+    first_distance = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    final_distance = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+
+    # Triangle moves that would overshoot fall back to a top speed of the
+    # larger of the initial and final speeds, as in `move_utils.build_blocks`
+    overshoot = first_distance + final_distance > moves.distances
+    trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distance = np.where(
+        overshoot,
+        np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distance,
+    )
+    final_distance = np.where(
+        overshoot,
+        np.abs(trimmed_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        final_distance,
+    )
+
+    top_speed = np.sqrt(initial_speed_sq + 2 * max_acceleration * first_distance)
+    coast = first_distance + final_distance < moves.distances
+    coast_distance = np.where(
+        coast, moves.distances - first_distance - final_distance, 0.0
+    )
+    coast_speed = np.where(coast, top_speed, 0.0)
+    end_speed = np.sqrt(
+        np.maximum(top_speed**2 - 2 * max_acceleration * final_distance, 0)
+    )
+
+    return BlockArrays(
+        distances=np.stack([first_distance, coast_distance, final_distance], axis=1),
+        initial_speeds=np.stack([initial_speeds, coast_speed, top_speed], axis=1),
+        accelerations=np.stack(
+            [max_acceleration, np.zeros_like(max_acceleration), -max_acceleration],
+            axis=1,
+        ),
+        final_speeds=np.stack([top_speed, coast_speed, end_speed], axis=1),
+    )
+
+
+def all_blended(
+    constraints: ConstraintArrays, moves: MoveArrays, blocks: BlockArrays
+) -> bool:
+    """Check if every move's blocks are complete and every junction is blended.
+
+    This is `move_utils.all_blended` for a whole path.
+    """
+    block_distance_sums = blocks.distances.sum(axis=1)
+    if np.any(
+        (np.abs(block_distance_sums - moves.distances) > FLOAT_THRESHOLD)
+        | ~np.isclose(block_distance_sums, moves.distances)
+    ):
+        return False
+
+    if len(moves.distances) < 2:
+        return True
+
+    first_components = moves.unit_vectors[:-1]
+    second_components = moves.unit_vectors[1:]
+    final_speeds = blocks.final_speeds[:-1, -1, np.newaxis] * first_components
+    initial_speeds = blocks.initial_speeds[1:, 0, np.newaxis] * second_components
+
+    def _under(limit: np.ndarray, speed: np.ndarray) -> np.ndarray:
+        return (np.abs(speed) <= limit) | np.isclose(speed, limit)
+
+    discont = constraints.max_speed_discont
+    direction_change_discont = constraints.max_direction_change_speed_discont
+    same_direction_blended = (
+        (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+        | _under(discont, final_speeds)
+        | _under(discont, initial_speeds)
+    )
+    direction_change_blended = _under(direction_change_discont, final_speeds) | _under(
+        direction_change_discont, initial_speeds
+    )
+
+    return bool(
+        np.all(
+            np.where(
+                first_components * second_components > 0,
+                same_direction_blended,
+                direction_change_blended,
+            )
+        )
+    )
+
+
+def move_arrays_to_moves(
+    axes: List[AxisKey], moves: MoveArrays, blocks: BlockArrays
+) -> List[Move[AxisKey]]:
+    """Build Move objects from move and block arrays."""
+    return [
+        Move(
+            unit_vector=dict(zip(axes, moves.unit_vectors[index])),
+            distance=moves.distances[index],
+            max_speed=moves.max_speeds[index],
+            blocks=(
+                Block(
+                    distance=blocks.distances[index, 0],
+                    initial_speed=blocks.initial_speeds[index, 0],
+                    acceleration=blocks.accelerations[index, 0],
+                ),
+                Block(
+                    distance=blocks.distances[index, 1],
+                    initial_speed=blocks.initial_speeds[index, 1],
+                    acceleration=blocks.accelerations[index, 1],
+                ),
+                Block(
+                    distance=blocks.distances[index, 2],
+                    initial_speed=blocks.initial_speeds[index, 2],
+                    acceleration=blocks.accelerations[index, 2],
+                ),
+            ),
+        )
+        for index in range(len(moves.distances))
+    ]
+
+
+def plan_moves(
+    constraints: SystemConstraints[AxisKey],
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    iteration_limit: int,
+) -> Tuple[bool, List[Move[AxisKey]], int]:
+    """Create and blend the moves of a whole path.
+
+    Each pass limits every move's initial speed from its previous move's
+    final speed, then limits every move's final speed from its next
+    move's new initial speed, so a slowdown travels two moves per pass.
+
+    Returns:
+        Whether the moves blended, the moves, and the number of passes.
+    """
+    axes = list(get_target_axes(target_list))
+    constraint_arrays = build_constraint_arrays(constraints, axes)
+    moves = targets_to_move_arrays(origin, target_list, axes)
+    initial_speeds = moves.max_speeds
+    final_speeds = moves.max_speeds
+    blocks = build_blocks(constraint_arrays, moves, initial_speeds, final_speeds)
+
+    for iteration in range(iteration_limit):
+        log.debug(f"Batched motion blending iteration: {iteration}")
+        initial_speeds = find_initial_speeds(
+            constraint_arrays, moves, initial_speeds, final_speeds
+        )
+        final_speeds = find_final_speeds(
+            constraint_arrays, moves, final_speeds, initial_speeds
+        )
+        final_speeds = achievable_finals(
+            constraint_arrays, moves, initial_speeds, final_speeds
+        )
+        blocks = build_blocks(constraint_arrays, moves, initial_speeds, final_speeds)
+
+        if all_blended(constraint_arrays, moves, blocks):
+            return True, move_arrays_to_moves(axes, moves, blocks), iteration + 1
+
+        initial_speeds = blocks.move_initial_speeds
+        final_speeds = blocks.move_final_speeds
+
+    return False, move_arrays_to_moves(axes, moves, blocks), iteration_limit
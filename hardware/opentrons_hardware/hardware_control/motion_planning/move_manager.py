@@ -1,7 +1,10 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import (
+    batched_move_utils,
+    move_utils,
+)
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -93,3 +96,33 @@ class MoveManager(Generic[AxisKey]):
                 to_blend = self._blend_log[-1]
         log.error("Could not converge!")
         return False, self._blend_log
+
+    def plan_motion_batched(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int = 10,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+        """Create and blend moves from targets, planning the whole path at once.
+
+        Each blending pass works on arrays of every move's speeds rather than
+        on one move at a time, which is much faster for long paths, and lets
+        a slowdown travel further per pass, so fewer passes are needed.
+
+        Unlike plan_motion, only the final moves are kept, so the blend log
+        has a single entry.
+        """
+        self._clear_blend_log()
+        converged, moves, passes = batched_move_utils.plan_moves(
+            self._constraints, origin, target_list, iteration_limit
+        )
+        self._blend_log = [moves]
+        if converged:
+            log.info(
+                f"built {len(moves)} moves with "
+                f"{sum(m.nonzero_blocks for m in moves)} "
+                f"non-zero blocks after {passes} iteration(s)"
+            )
+        else:
+            log.error("Could not converge!")
+        return converged, self._blend_log
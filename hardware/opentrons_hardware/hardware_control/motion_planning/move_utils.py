@@ -48,14 +48,19 @@ def get_unit_vector(
     return unit_vector, distance
 
 
-def targets_to_moves(
-    initial: Coordinates[AxisKey, CoordinateValue], targets: List[MoveTarget[AxisKey]]
-) -> Iterator[Move[AxisKey]]:
-    """Transform a list of MoveTargets into a list of Moves."""
+def get_target_axes(targets: List[MoveTarget[AxisKey]]) -> Set[AxisKey]:
+    """Get every axis that appears in a list of MoveTargets."""
     all_axes: Set[AxisKey] = set()
     for target in targets:
         all_axes.update(set(target.position.keys()))
+    return all_axes
+
 
+def targets_to_moves(
+    initial: Coordinates[AxisKey, CoordinateValue], targets: List[MoveTarget[AxisKey]]
+) -> Iterator[Move[AxisKey]]:
+    """Transform a list of MoveTargets into a list of Moves."""
+    all_axes = get_target_axes(targets)
     initial_checked = {k: initial.get(k, 0) for k in all_axes}
     for target in targets:
         position = {k: target.position.get(k, 0) for k in all_axes}
@@ -1,7 +1,8 @@
 """Class that schedules motion on can bus."""
 import asyncio
 import logging
-from typing import List, Set, Tuple
+from itertools import chain
+from typing import List, Optional, Sequence, Set, Tuple
 
 from opentrons_hardware.firmware_bindings import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import NodeId
@@ -18,7 +19,10 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
     ExecuteMoveGroupRequestPayload,
 )
 from .constants import interrupts_per_sec
-from opentrons_hardware.hardware_control.motion import MoveGroups
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
 from opentrons_hardware.firmware_bindings.utils import (
     UInt8Field,
     UInt32Field,
@@ -28,17 +32,71 @@ from opentrons_hardware.firmware_bindings.utils import (
 
 log = logging.getLogger(__name__)
 
+EncodedMoveGroup = List[Tuple[NodeId, AddLinearMoveRequest]]
+"""The messages that set up a move group, with their destination nodes."""
+
+
+def encode_move_groups(move_groups: MoveGroups) -> List[EncodedMoveGroup]:
+    """Build the set up messages for each move group of a plan.
+
+    Args:
+        move_groups: The move groups to encode.
+
+    Returns:
+        For each move group, its add move messages in send order.
+    """
+    return [
+        [
+            (node, _encode_step(group_i, seq_i, step))
+            for seq_i, sequence in enumerate(group)
+            for node, step in sequence.items()
+        ]
+        for group_i, group in enumerate(move_groups)
+    ]
+
+
+def _encode_step(
+    group_id: int, seq_id: int, step: MoveGroupSingleAxisStep
+) -> AddLinearMoveRequest:
+    """Build the add move message for one step, in firmware fixed point units."""
+    return AddLinearMoveRequest(
+        payload=AddLinearMoveRequestPayload(
+            request_stop_condition=UInt8Field(0),
+            group_id=UInt8Field(group_id),
+            seq_id=UInt8Field(seq_id),
+            duration=UInt32Field(int(step.duration_sec * interrupts_per_sec)),
+            acceleration=Int32Field(
+                int(
+                    (
+                        step.acceleration_mm_sec_sq
+                        / interrupts_per_sec
+                        / interrupts_per_sec
+                    )
+                    * (2**31)
+                )
+            ),
+            velocity=Int32Field(
+                int((step.velocity_mm_sec / interrupts_per_sec) * (2**31))
+            ),
+        )
+    )
+
 
 class MoveGroupRunner:
     """A move command scheduler."""
 
-    def __init__(self, move_groups: MoveGroups) -> None:
+    def __init__(
+        self, move_groups: MoveGroups, start_during_upload: bool = False
+    ) -> None:
         """Constructor.
 
         Args:
             move_groups: The move groups to run.
+            start_during_upload: Start executing the first move group as soon
+                as it is set up, while later groups are still being set up.
         """
         self._move_groups = move_groups
+        self._start_during_upload = start_during_upload
 
     async def run(self, can_messenger: CanMessenger) -> None:
         """Run the move group.
@@ -51,8 +109,11 @@ class MoveGroupRunner:
             return
 
         await self._clear_groups(can_messenger)
-        await self._send_groups(can_messenger)
-        await self._move(can_messenger)
+        if self._start_during_upload:
+            await self._move_during_upload(can_messenger)
+        else:
+            await self._send_groups(can_messenger)
+            await self._move(can_messenger)
 
     async def _clear_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to clear the message groups."""
@@ -63,45 +124,49 @@ class MoveGroupRunner:
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=AddLinearMoveRequest(
-                            payload=AddLinearMoveRequestPayload(
-                                request_stop_condition=UInt8Field(0),
-                                group_id=UInt8Field(group_i),
-                                seq_id=UInt8Field(seq_i),
-                                duration=UInt32Field(
-                                    int(step.duration_sec * interrupts_per_sec)
-                                ),
-                                acceleration=Int32Field(
-                                    int(
-                                        (
-                                            step.acceleration_mm_sec_sq
-                                            / interrupts_per_sec
-                                            / interrupts_per_sec
-                                        )
-                                        * (2**31)
-                                    )
-                                ),
-                                velocity=Int32Field(
-                                    int(
-                                        (step.velocity_mm_sec / interrupts_per_sec)
-                                        * (2**31)
-                                    )
-                                ),
-                            )
-                        ),
-                    )
+        groups = encode_move_groups(self._move_groups)
+        await can_messenger.send_many(list(chain.from_iterable(groups)))
+
+    async def _move_during_upload(self, can_messenger: CanMessenger) -> None:
+        """Set up the move groups one at a time, running each once it is set up."""
+        groups = encode_move_groups(self._move_groups)
+        loop = asyncio.get_event_loop()
+        uploads: List["asyncio.Future[None]"] = [loop.create_future() for _ in groups]
+        upload_task = loop.create_task(self._upload(can_messenger, groups, uploads))
+        try:
+            await self._move(can_messenger, uploads)
+        finally:
+            upload_task.cancel()
 
-    async def _move(self, can_messenger: CanMessenger) -> None:
+    @staticmethod
+    async def _upload(
+        can_messenger: CanMessenger,
+        groups: List[EncodedMoveGroup],
+        uploads: List["asyncio.Future[None]"],
+    ) -> None:
+        """Send each move group's set up messages, resolving its future when sent."""
+        try:
+            for group, upload in zip(groups, uploads):
+                await can_messenger.send_many(group)
+                upload.set_result(None)
+        except Exception as e:
+            pending = [upload for upload in uploads if not upload.done()]
+            pending[0].set_exception(e)
+            for upload in pending[1:]:
+                upload.cancel()
+
+    async def _move(
+        self,
+        can_messenger: CanMessenger,
+        uploads: Optional[Sequence["asyncio.Future[None]"]] = None,
+    ) -> None:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups)
         try:
-            can_messenger.add_listener(scheduler)
-            await scheduler.run(can_messenger)
+            can_messenger.add_listener(
+                scheduler, message_ids=[MoveCompleted.message_id]
+            )
+            await scheduler.run(can_messenger, uploads)
         finally:
             can_messenger.remove_listener(scheduler)
 
@@ -145,9 +210,21 @@ class MoveScheduler:
                 log.info(f"Move group {group_id} has completed.")
                 self._event.set()
 
-    async def run(self, can_messenger: CanMessenger) -> None:
-        """Start each move group after the prior has completed."""
+    async def run(
+        self,
+        can_messenger: CanMessenger,
+        uploads: Optional[Sequence["asyncio.Future[None]"]] = None,
+    ) -> None:
+        """Start each move group after the prior has completed.
+
+        Args:
+            can_messenger: a can messenger
+            uploads: If the move groups are still being set up, a future for
+                each group that is resolved once the group is set up.
+        """
         for group_id in range(len(self._moves)):
+            if uploads:
+                await uploads[group_id]
             self._event.clear()
 
             log.info(f"Executing move group {group_id}.")
@@ -29,7 +29,10 @@ class ToolDetector:
         self,
     ) -> AsyncIterator[ToolDetectionResult]:
         """Detect tool changes."""
-        with WaitableCallback(self._messenger) as wc:
+        with WaitableCallback(
+            self._messenger,
+            message_ids=[message_definitions.PushToolsDetectedNotification.message_id],
+        ) as wc:
             # send request message once, to establish initial state
             attached_tool_request_message = message_definitions.AttachedToolsRequest()
             await self._messenger.send(
@@ -59,9 +59,14 @@ TARGETS: Final = {
 
 async def run(args: argparse.Namespace) -> None:
     """Entry point for script."""
-    target = TARGETS[args.target]
+    targets = [TARGETS[name] for name in args.target]
+    # One file may be given for all of the targets
+    files = args.file if len(args.file) == len(targets) else args.file * len(targets)
 
-    hex_processor = HexRecordProcessor.from_file(Path(args.file))
+    hex_processors = {
+        target.bootloader_node: HexRecordProcessor.from_file(Path(file))
+        for target, file in zip(targets, files)
+    }
 
     driver = await build_driver(build_settings(args))
 
@@ -71,35 +76,41 @@ async def run(args: argparse.Namespace) -> None:
     initiator = FirmwareUpdateInitiator(messenger)
     downloader = FirmwareUpdateDownloader(messenger)
 
-    logger.info(f"Initiating FW Update on {target}.")
-    await initiator.run(
-        target=target,
-        retry_count=args.retry_count,
-        ready_wait_time_sec=args.timeout_seconds,
-    )
+    for target in targets:
+        logger.info(f"Initiating FW Update on {target}.")
+        await initiator.run(
+            target=target,
+            retry_count=args.retry_count,
+            ready_wait_time_sec=args.timeout_seconds,
+        )
 
     if not args.no_erase:
         eraser = FirmwareUpdateEraser(messenger)
-        logger.info(f"Erasing existing FW Update on {target}.")
-        await eraser.run(
-            node_id=target.bootloader_node,
-            timeout_sec=args.timeout_seconds,
-        )
+        for target in targets:
+            logger.info(f"Erasing existing FW Update on {target}.")
+            await eraser.run(
+                node_id=target.bootloader_node,
+                timeout_sec=args.timeout_seconds,
+            )
     else:
         logger.info("Skipping erase step.")
 
-    logger.info(f"Downloading FW to {target.bootloader_node}.")
-    await downloader.run(
-        node_id=target.bootloader_node,
-        hex_processor=hex_processor,
+    logger.info(f"Downloading FW to {', '.join(str(n) for n in hex_processors)}.")
+    async for progress in downloader.download_many(
+        hex_processors=hex_processors,
         ack_wait_seconds=args.timeout_seconds,
-    )
-
-    logger.info(f"Restarting FW on {target.system_node}.")
-    await messenger.send(
-        node_id=target.bootloader_node,
-        message=FirmwareUpdateStartApp(),
-    )
+        window=args.window,
+        retries=args.retries,
+    ):
+        if progress.chunks_acked == progress.chunks_total:
+            logger.info(f"Downloaded FW to {progress.node_id}.")
+
+    for target in targets:
+        logger.info(f"Restarting FW on {target.system_node}.")
+        await messenger.send(
+            node_id=target.bootloader_node,
+            message=FirmwareUpdateStartApp(),
+        )
 
     await messenger.stop()
 
@@ -115,16 +126,20 @@ def main() -> None:
 
     parser.add_argument(
         "--target",
-        help="The FW subsystem to be updated.",
+        help="The FW subsystem to be updated. Repeat to update several "
+        "subsystems at once.",
         type=str,
         required=True,
+        action="append",
         choices=TARGETS.keys(),
     )
     parser.add_argument(
         "--file",
-        help="Path to hex file containing the FW executable.",
+        help="Path to hex file containing the FW executable. Repeat to give "
+        "each --target its own file, in the same order.",
         type=str,
         required=True,
+        action="append",
     )
     parser.add_argument(
         "--retry-count",
@@ -135,6 +150,18 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window",
+        help="Number of data messages that may be awaiting a response at once.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--retries",
+        help="Number of times to resend a data message that got no response.",
+        type=int,
+        default=0,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -143,6 +170,8 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if len(args.file) not in (1, len(args.target)):
+        parser.error("specify one --file, or one --file per --target")
 
     asyncio.run(run(args))
 
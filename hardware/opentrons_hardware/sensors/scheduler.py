@@ -41,6 +41,8 @@ from opentrons_hardware.firmware_bindings.utils import (
 
 log = logging.getLogger(__name__)
 
+_RESPONSE_IDS = [ReadFromSensorResponse.message_id, SensorThresholdResponse.message_id]
+
 
 class SensorScheduler:
     """Sensor message scheduler."""
@@ -49,7 +51,9 @@ class SensorScheduler:
         self, sensor: PollSensorInformation, can_messenger: CanMessenger, timeout: int
     ) -> Optional[SensorDataType]:
         """Send poll message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger, message_ids=_RESPONSE_IDS, node_id=sensor.node_id
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -88,7 +92,9 @@ class SensorScheduler:
         self, sensor: ReadSensorInformation, can_messenger: CanMessenger, timeout: int
     ) -> Optional[SensorDataType]:
         """Send read message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger, message_ids=_RESPONSE_IDS, node_id=sensor.node_id
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -112,7 +118,9 @@ class SensorScheduler:
         self, sensor: WriteSensorInformation, can_messenger: CanMessenger, timeout: int
     ) -> Optional[SensorDataType]:
         """Send threshold message."""
-        with WaitableCallback(can_messenger) as reader:
+        with WaitableCallback(
+            can_messenger, message_ids=_RESPONSE_IDS, node_id=sensor.node_id
+        ) as reader:
             data: Optional[SensorDataType] = None
             await can_messenger.send(
                 node_id=sensor.node_id,
@@ -5,6 +5,7 @@ from typing import Optional
 
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.constants import NodeId, SensorType
+from opentrons_hardware.sensors.stream import SensorStream
 from opentrons_hardware.sensors.utils import SensorDataType
 
 
@@ -76,6 +77,12 @@ class AbstractAdvancedSensor(AbstractBasicSensor):
         """Set base offset of the sensor."""
         self._offset = offset
 
+    def stream(
+        self, can_messenger: CanMessenger, node_id: NodeId, capacity: int = 1024
+    ) -> SensorStream:
+        """Capture the readings the sensor sends, for use as a context manager."""
+        return SensorStream(can_messenger, node_id, self._sensor_type, capacity)
+
     @abstractmethod
     async def poll(
         self,
@@ -0,0 +1,270 @@
+"""Continuous capture of sensor readings."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from types import TracebackType
+from typing import AsyncIterator, List, Optional, Tuple, Type
+
+import numpy as np  # type: ignore[import]
+
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings import ArbitrationId
+from opentrons_hardware.firmware_bindings.constants import NodeId, SensorType
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+
+log = logging.getLogger(__name__)
+
+# Same scaling as SensorDataType.to_float.
+_TO_FLOAT = 1.0 / 2**15
+
+
+class SensorRingBuffer:
+    """The most recent readings of a sensor, in a fixed-size buffer.
+
+    Appending a reading overwrites the oldest one once the buffer is full.
+    Statistics are computed over the last `window` readings in place, without
+    copying them out of the buffer.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Constructor.
+
+        Args:
+            capacity: The number of readings to keep.
+        """
+        if capacity < 1:
+            raise ValueError("The buffer capacity must be at least 1.")
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._capacity = capacity
+        self._total = 0
+
+    @property
+    def capacity(self) -> int:
+        """The number of readings the buffer can hold."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """The number of readings ever appended."""
+        return self._total
+
+    def __len__(self) -> int:
+        """The number of readings in the buffer."""
+        return min(self._total, self._capacity)
+
+    def append(self, value: float) -> None:
+        """Add a reading, overwriting the oldest if the buffer is full."""
+        self._data[self._total % self._capacity] = value
+        self._total += 1
+
+    def sample(self, index: int) -> float:
+        """Get a reading by its position in the whole stream.
+
+        Args:
+            index: A number from total - len(self) up to total - 1.
+        """
+        if not self._total - len(self) <= index < self._total:
+            raise IndexError(f"Reading {index} is not in the buffer.")
+        return float(self._data[index % self._capacity])
+
+    def latest(self) -> float:
+        """Get the most recent reading."""
+        return self.sample(self._total - 1)
+
+    def mean(self, window: Optional[int] = None) -> float:
+        """Mean of the last `window` readings, or of the whole buffer."""
+        head, tail = self._segments(window)
+        return float((head.sum() + tail.sum()) / (head.size + tail.size))
+
+    def std(self, window: Optional[int] = None) -> float:
+        """Population standard deviation of the last `window` readings."""
+        head, tail = self._segments(window)
+        n = head.size + tail.size
+        mean = (head.sum() + tail.sum()) / n
+        variance = (np.dot(head, head) + np.dot(tail, tail)) / n - mean * mean
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def min(self, window: Optional[int] = None) -> float:
+        """Smallest of the last `window` readings."""
+        head, tail = self._segments(window)
+        return float(min(head.min(), tail.min()) if tail.size else head.min())
+
+    def max(self, window: Optional[int] = None) -> float:
+        """Largest of the last `window` readings."""
+        head, tail = self._segments(window)
+        return float(max(head.max(), tail.max()) if tail.size else head.max())
+
+    def to_array(self, window: Optional[int] = None) -> np.ndarray:
+        """Copy the last `window` readings out, oldest first."""
+        if not self._total:
+            return np.zeros(0, dtype=np.float64)
+        return np.concatenate(self._segments(window))
+
+    def _segments(self, window: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Views of the last `window` readings, split where the buffer wraps."""
+        count = len(self) if window is None else min(window, len(self))
+        if count < 1:
+            raise ValueError("There are no readings to summarize.")
+        end = self._total % self._capacity or self._capacity
+        start = end - count
+        if start >= 0:
+            return self._data[start:end], self._data[0:0]
+        return self._data[start:], self._data[:end]
+
+
+@dataclass
+class _ThresholdWaiter:
+    """A caller of SensorStream.wait_for_threshold."""
+
+    threshold: float
+    window: int
+    rising: bool
+    future: "asyncio.Future[float]"
+
+
+class SensorStream:
+    """Capture every reading a sensor sends into a SensorRingBuffer.
+
+    Readings are converted like SensorDataType.to_float. While the context
+    manager is open, each read response from the sensor is appended to the
+    buffer as it arrives, whatever requested it.
+
+    Iterating the stream yields readings in order. A consumer that falls
+    more than a buffer's worth of readings behind skips ahead to the oldest
+    reading still in the buffer.
+    """
+
+    def __init__(
+        self,
+        messenger: CanMessenger,
+        node_id: NodeId,
+        sensor_type: SensorType,
+        capacity: int = 1024,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            messenger: Messenger to listen on.
+            node_id: The node the sensor is on.
+            sensor_type: The sensor to capture.
+            capacity: The number of readings to keep.
+        """
+        self._messenger = messenger
+        self._node_id = node_id
+        self._sensor_type = sensor_type
+        self._buffer = SensorRingBuffer(capacity)
+        self._new_reading: Optional["asyncio.Future[None]"] = None
+        self._threshold_waiters: List[_ThresholdWaiter] = []
+
+    @property
+    def buffer(self) -> SensorRingBuffer:
+        """The captured readings."""
+        return self._buffer
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Listener for sensor readings."""
+        if not isinstance(message, ReadFromSensorResponse):
+            return
+        if message.payload.sensor.value != self._sensor_type:
+            return
+        self._buffer.append(message.payload.sensor_data.value * _TO_FLOAT)
+        if self._new_reading is not None:
+            if not self._new_reading.done():
+                self._new_reading.set_result(None)
+            self._new_reading = None
+        if self._threshold_waiters:
+            self._check_thresholds()
+
+    def __enter__(self) -> SensorStream:
+        """Start capturing readings."""
+        self._messenger.add_listener(
+            self,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_id=self._node_id,
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Stop capturing readings."""
+        self._messenger.remove_listener(self)
+
+    async def __aiter__(self) -> AsyncIterator[float]:
+        """Yield each reading captured from now on."""
+        index = self._buffer.total
+        while True:
+            while index >= self._buffer.total:
+                await self._wait_for_reading()
+            oldest = self._buffer.total - len(self._buffer)
+            if index < oldest:
+                log.warning(
+                    "Sensor stream consumer fell behind, skipping %d readings.",
+                    oldest - index,
+                )
+                index = oldest
+            yield self._buffer.sample(index)
+            index += 1
+
+    async def wait_for_threshold(
+        self, threshold: float, window: int = 1, rising: bool = True
+    ) -> float:
+        """Wait for the mean of the last `window` readings to cross a threshold.
+
+        Each reading is checked as it arrives, so a crossing between two reads
+        of the buffer is not missed.
+
+        Args:
+            threshold: The value to wait for.
+            window: The number of readings to average.
+            rising: Wait for the mean to reach at least the threshold if True,
+                or at most the threshold if False.
+
+        Returns:
+            The mean that crossed the threshold.
+        """
+        if window < 1:
+            raise ValueError("The threshold window must be at least 1.")
+        waiter = _ThresholdWaiter(
+            threshold=threshold,
+            window=window,
+            rising=rising,
+            future=asyncio.get_event_loop().create_future(),
+        )
+        self._threshold_waiters.append(waiter)
+        try:
+            return await waiter.future
+        finally:
+            if waiter in self._threshold_waiters:
+                self._threshold_waiters.remove(waiter)
+
+    async def _wait_for_reading(self) -> None:
+        """Wait for the next reading."""
+        if self._new_reading is None:
+            self._new_reading = asyncio.get_event_loop().create_future()
+        # Shield the future shared by all waiters from each one's cancellation.
+        await asyncio.shield(self._new_reading)
+
+    def _check_thresholds(self) -> None:
+        """Resolve the threshold waiters whose windows crossed."""
+        for waiter in list(self._threshold_waiters):
+            if len(self._buffer) < waiter.window:
+                continue
+            mean = self._buffer.mean(waiter.window)
+            crossed = (
+                mean >= waiter.threshold if waiter.rising else mean <= waiter.threshold
+            )
+            if crossed:
+                self._threshold_waiters.remove(waiter)
+                if not waiter.future.done():
+                    waiter.future.set_result(mean)
@@ -1,9 +1,9 @@
 """Pytest shared fixtures."""
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 import pytest
 from mock.mock import AsyncMock
-from opentrons_hardware.firmware_bindings import ArbitrationId
+from opentrons_hardware.firmware_bindings import ArbitrationId, MessageId, NodeId
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
@@ -15,15 +15,35 @@ class MockCanMessageNotifier:
 
     def __init__(self) -> None:
         """Constructor."""
-        self._listeners: List[MessageListenerCallback] = []
-
-    def add_listener(self, listener: MessageListenerCallback) -> None:
+        self._listeners: List[
+            Tuple[
+                MessageListenerCallback,
+                Optional[Iterable[MessageId]],
+                Optional[NodeId],
+            ]
+        ] = []
+
+    def add_listener(
+        self,
+        listener: MessageListenerCallback,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_id: Optional[NodeId] = None,
+    ) -> None:
         """Add listener."""
-        self._listeners.append(listener)
+        self._listeners.append(
+            (listener, None if message_ids is None else list(message_ids), node_id)
+        )
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
-        for listener in self._listeners:
+        for listener, message_ids, node_id in self._listeners:
+            if message_ids is not None and message.message_id not in message_ids:
+                continue
+            if (
+                node_id is not None
+                and arbitration_id.parts.originating_node_id != node_id
+            ):
+                continue
             listener(message, arbitration_id)
 
 
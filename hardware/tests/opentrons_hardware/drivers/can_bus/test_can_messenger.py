@@ -2,6 +2,7 @@
 from __future__ import annotations
 import asyncio
 from asyncio import Queue
+from typing import List, Tuple
 
 import pytest
 from mock import AsyncMock, Mock
@@ -95,6 +96,37 @@ async def test_send(
     )
 
 
+async def test_send_many(subject: CanMessenger, mock_driver: AsyncMock) -> None:
+    """It should encode all the messages and hand them to the driver at once."""
+    messages: List[Tuple[NodeId, MessageDefinition]] = [
+        (NodeId.head, HeartbeatRequest()),
+        (
+            NodeId.gantry_x,
+            GetMoveGroupRequest(
+                payload=MoveGroupRequestPayload(group_id=UInt8Field(1))
+            ),
+        ),
+    ]
+    await subject.send_many(messages)
+    mock_driver.send_many.assert_called_once_with(
+        [
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id,
+                        node_id=node_id,
+                        function_code=0,
+                        originating_node_id=NodeId.host,
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+            for node_id, message in messages
+        ]
+    )
+    mock_driver.send.assert_not_called()
+
+
 async def test_listen_messages(
     subject: CanMessenger, incoming_messages: Queue[CanMessage]
 ) -> None:
@@ -147,5 +179,162 @@ async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
     with WaitableCallback(mock_messenger) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, message_ids=None, node_id=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+async def test_waitable_callback_context_filtered() -> None:
+    """It should subscribe with its message id and node filters."""
+    mock_messenger = Mock(spec=CanMessenger)
+    with WaitableCallback(
+        mock_messenger, message_ids=[MessageId.move_completed], node_id=NodeId.head
+    ) as callback:
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, message_ids=[MessageId.move_completed], node_id=NodeId.head
+        )
+
+
+def _incoming(message_id: MessageId, node_id: NodeId, data: bytes) -> CanMessage:
+    """Build a received can message."""
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+        data=data,
+    )
+
+
+async def _read_all(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """Run the messenger until all the incoming messages are read."""
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+
+async def test_listen_subscribed_messages(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners with the messages they subscribed to."""
+    for node_id in (NodeId.gantry_x, NodeId.gantry_y):
+        for message_id in (
+            MessageId.get_move_group_request,
+            MessageId.heartbeat_request,
+        ):
+            incoming_messages.put_nowait(_incoming(message_id, node_id, b"\1"))
+
+    by_message = Mock(spec=MessageListenerCallback)
+    by_node = Mock(spec=MessageListenerCallback)
+    by_both = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(by_node, node_id=NodeId.gantry_y)
+    subject.add_listener(
+        by_both,
+        message_ids=[MessageId.get_move_group_request, MessageId.heartbeat_request],
+        node_id=NodeId.gantry_x,
+    )
+
+    await _read_all(subject, incoming_messages)
+
+    def _received(mock: Mock) -> List[Tuple[int, int]]:
+        return [
+            (args[0].message_id, args[1].parts.originating_node_id)
+            for args, _ in mock.call_args_list
+        ]
+
+    assert _received(by_message) == [
+        (MessageId.get_move_group_request, NodeId.gantry_x),
+        (MessageId.get_move_group_request, NodeId.gantry_y),
+    ]
+    assert _received(by_node) == [
+        (MessageId.get_move_group_request, NodeId.gantry_y),
+        (MessageId.heartbeat_request, NodeId.gantry_y),
+    ]
+    assert _received(by_both) == [
+        (MessageId.get_move_group_request, NodeId.gantry_x),
+        (MessageId.heartbeat_request, NodeId.gantry_x),
+    ]
+
+
+async def test_remove_subscribed_listener(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should stop calling a listener from all of its subscriptions."""
+    incoming_messages.put_nowait(
+        _incoming(MessageId.heartbeat_request, NodeId.head, b"")
+    )
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        message_ids=[MessageId.get_move_group_request, MessageId.heartbeat_request],
+    )
+    subject.remove_listener(listener)
+
+    await _read_all(subject, incoming_messages)
+
+    listener.assert_not_called()
+
+
+async def test_listeners_called_in_order(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should call listeners in the order they were added."""
+    incoming_messages.put_nowait(
+        _incoming(MessageId.heartbeat_request, NodeId.head, b"")
+    )
+    called: List[str] = []
+    subject.add_listener(lambda m, a: called.append("all"))
+    subject.add_listener(
+        lambda m, a: called.append("both"),
+        message_ids=[MessageId.heartbeat_request],
+        node_id=NodeId.head,
+    )
+    subject.add_listener(lambda m, a: called.append("node"), node_id=NodeId.head)
+    subject.add_listener(
+        lambda m, a: called.append("message"),
+        message_ids=[MessageId.heartbeat_request],
+    )
+
+    await _read_all(subject, incoming_messages)
+
+    assert called == ["all", "both", "node", "message"]
+
+
+def test_remove_unknown_listener(subject: CanMessenger) -> None:
+    """It should raise if asked to remove a listener that was never added."""
+    listener = Mock(spec=MessageListenerCallback)
+
+    with pytest.raises(ValueError):
+        subject.remove_listener(listener)
+
+    subject.add_listener(listener)
+    subject.remove_listener(listener)
+
+    with pytest.raises(ValueError):
+        subject.remove_listener(listener)
+
+
+async def test_unsubscribed_message_not_decoded(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """It should not decode messages that nobody is listening for."""
+    # Too short to decode as a MoveCompleted payload
+    incoming_messages.put_nowait(_incoming(MessageId.move_completed, NodeId.head, b""))
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.heartbeat_request])
+
+    await _read_all(subject, incoming_messages)
+
+    listener.assert_not_called()
+    assert "Failed to build" not in caplog.text
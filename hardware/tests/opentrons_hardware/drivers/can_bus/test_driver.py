@@ -45,6 +45,20 @@ async def test_send(subject: CanDriver, can_bus: Bus) -> None:
     assert recv.arbitration_id == 0x1FFFFFFF
 
 
+async def test_send_many(subject: CanDriver, can_bus: Bus) -> None:
+    """It should send several messages in order."""
+    messages = [
+        CanMessage(arbitration_id=ArbitrationId(id=i), data=bytearray([i]))
+        for i in range(3)
+    ]
+    await subject.send_many(messages)
+
+    for i in range(3):
+        recv = can_bus.recv()
+        assert recv.data == bytearray([i])
+        assert recv.arbitration_id == i
+
+
 async def test_receive(subject: CanDriver, can_bus: Bus) -> None:
     """It should receive a message."""
     m = Message(
@@ -0,0 +1,105 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    SerializationException,
+)
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    """A test payload."""
+
+    a: utils.UInt8Field
+    b: utils.Int16Field
+    c: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    """A little endian test payload."""
+
+    a: utils.UInt16Field
+
+
+class _DoublingField(utils.UInt8Field):
+    """A field with its own factory."""
+
+    @classmethod
+    def build(cls, t: int) -> "_DoublingField":
+        """Build with double the value."""
+        return cls(t * 2)
+
+
+@dataclass
+class _CustomFieldPayload(utils.BinarySerializable):
+    """A payload with a field with its own factory."""
+
+    a: _DoublingField
+
+
+def test_serialize() -> None:
+    """It should pack the fields in order, big endian."""
+    subject = _Payload(
+        a=utils.UInt8Field(1), b=utils.Int16Field(-2), c=utils.UInt32Field(3)
+    )
+    assert subject.serialize() == b"\x01\xff\xfe\x00\x00\x00\x03"
+    assert _Payload.get_size() == 7
+
+
+def test_serialize_little_endian() -> None:
+    """It should pack little endian fields."""
+    subject = _LittleEndianPayload(a=utils.UInt16Field(1))
+    assert subject.serialize() == b"\x01\x00"
+    assert _LittleEndianPayload.build(b"\x01\x00") == subject
+
+
+def test_serialize_error() -> None:
+    """It should raise if a value does not fit its field."""
+    subject = _Payload(
+        a=utils.UInt8Field(256), b=utils.Int16Field(0), c=utils.UInt32Field(0)
+    )
+    with pytest.raises(SerializationException):
+        subject.serialize()
+
+
+def test_build() -> None:
+    """It should build from a buffer, ignoring extra bytes."""
+    assert _Payload.build(b"\x01\xff\xfe\x00\x00\x00\x03\x00") == _Payload(
+        a=utils.UInt8Field(1), b=utils.Int16Field(-2), c=utils.UInt32Field(3)
+    )
+
+
+def test_build_too_short() -> None:
+    """It should raise if the buffer is too short."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.build(b"\x01\x02")
+
+
+def test_build_custom_field() -> None:
+    """It should use a field's own factory."""
+    assert _CustomFieldPayload.build(b"\x02") == _CustomFieldPayload(
+        a=_DoublingField(4)
+    )
+
+
+def test_unpack_from() -> None:
+    """It should unpack several payloads from one buffer by offset."""
+    payloads = [
+        _Payload(
+            a=utils.UInt8Field(i), b=utils.Int16Field(-i), c=utils.UInt32Field(i * 10)
+        )
+        for i in range(3)
+    ]
+    buffer = memoryview(b"".join(p.serialize() for p in payloads))
+    size = _Payload.get_size()
+
+    assert [
+        _Payload.unpack_from(buffer, offset) for offset in range(0, len(buffer), size)
+    ] == payloads
+
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.unpack_from(buffer, len(buffer) - 1)
@@ -1,10 +1,14 @@
 """Tests for the firmware downloader."""
+import asyncio
 import binascii
-from typing import List
+from typing import AsyncIterator, List, Optional, Set
 
 import pytest
 from mock import AsyncMock, MagicMock, call
+from opentrons_hardware.drivers.can_bus import CanMessenger, WaitableCallback
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
 from opentrons_hardware.firmware_bindings import (
+    CanMessage,
     NodeId,
     utils,
     ArbitrationId,
@@ -24,6 +28,7 @@ from opentrons_hardware.firmware_bindings.messages.fields import ErrorCodeField
 from opentrons_hardware.firmware_update import downloader
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
 from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor, Chunk
+from opentrons_hardware.scripts import sim_socket_can
 from tests.conftest import MockCanMessageNotifier
 
 
@@ -275,3 +280,255 @@ async def test_messaging_complete_no_response(
 
     with pytest.raises(TimeoutResponse):
         await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.5)
+
+
+async def test_window_sends_ahead(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+) -> None:
+    """It should send up to a window of chunks before waiting for ACKs."""
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    with pytest.raises(TimeoutResponse):
+        await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.1, window=2)
+
+    assert [
+        c.kwargs["message"].payload.address.value
+        for c in mock_messenger.send.call_args_list
+    ] == [0x000, 0x100]
+
+
+async def test_queued_ack_read_after_deadline(mock_messenger: AsyncMock) -> None:
+    """It should read an ACK that arrived even if its deadline has passed."""
+    ack = FirmwareUpdateDataAcknowledge(
+        payload=payloads.FirmwareUpdateDataAcknowledge(
+            address=utils.UInt32Field(0x100),
+            error_code=ErrorCodeField(ErrorCode.ok),
+        )
+    )
+    outstanding = {
+        0x100: downloader._Outstanding(
+            message=FirmwareUpdateData(
+                payload=payloads.FirmwareUpdateData.create(address=0x100, data=b"")
+            ),
+            deadline=asyncio.get_event_loop().time() - 1,
+        )
+    }
+
+    with WaitableCallback(mock_messenger) as reader:
+        reader(
+            ack,
+            ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=ack.message_id,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x_bootloader,
+                )
+            ),
+        )
+
+        wait_ack = downloader.FirmwareUpdateDownloader._wait_data_message_ack
+        assert await wait_ack(reader, outstanding) == ack
+        assert await wait_ack(reader, outstanding) is None
+
+
+class SimulatedBootloader:
+    """A bootloader node on a simulated socket CAN bus."""
+
+    def __init__(self, driver: SocketDriver, node_id: NodeId) -> None:
+        """Constructor."""
+        self._driver = driver
+        self._node_id = node_id
+        self._drop_first_ack: Set[int] = set()
+        self.received: List[int] = []
+        self.complete: Optional[payloads.FirmwareUpdateComplete] = None
+        self._task = asyncio.get_event_loop().create_task(self._run())
+
+    def drop_first_ack(self, address: int) -> None:
+        """Don't ACK the first data message to address."""
+        self._drop_first_ack.add(address)
+
+    async def stop(self) -> None:
+        """Stop the bootloader."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._driver.shutdown()
+
+    async def _run(self) -> None:
+        """Answer data and complete messages sent to this node."""
+        async for frame in self._driver:
+            parts = frame.arbitration_id.parts
+            if parts.node_id != self._node_id:
+                continue
+            if parts.message_id == FirmwareUpdateData.message_id:
+                data = payloads.FirmwareUpdateData.build(frame.data)
+                address = data.address.value  # type: ignore[attr-defined]
+                self.received.append(address)
+                if address in self._drop_first_ack:
+                    self._drop_first_ack.remove(address)
+                    continue
+                await self._send(
+                    FirmwareUpdateDataAcknowledge(
+                        payload=payloads.FirmwareUpdateDataAcknowledge(
+                            address=utils.UInt32Field(address),
+                            error_code=ErrorCodeField(ErrorCode.ok),
+                        )
+                    )
+                )
+            elif parts.message_id == FirmwareUpdateComplete.message_id:
+                complete = payloads.FirmwareUpdateComplete.build(frame.data)
+                assert isinstance(complete, payloads.FirmwareUpdateComplete)
+                self.complete = complete
+                await self._send(
+                    FirmwareUpdateCompleteAcknowledge(
+                        payload=payloads.FirmwareUpdateAcknowledge(
+                            error_code=ErrorCodeField(ErrorCode.ok)
+                        )
+                    )
+                )
+
+    async def _send(self, message: MessageDefinition) -> None:
+        """Send a message from this node to the host."""
+        await self._driver.send(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id,
+                        node_id=NodeId.host,
+                        function_code=0,
+                        originating_node_id=self._node_id,
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+        )
+
+
+@pytest.fixture
+async def sim_can_port(
+    loop: asyncio.AbstractEventLoop,
+) -> AsyncIterator[int]:
+    """Run a simulated socket CAN bus, returning its port."""
+    server = await asyncio.start_server(
+        sim_socket_can.ConnectionHandler(), host="127.0.0.1", port=0
+    )
+    assert server.sockets
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+async def sim_messenger(sim_can_port: int) -> AsyncIterator[CanMessenger]:
+    """A running messenger on the simulated socket CAN bus."""
+    driver = await SocketDriver.build(host="127.0.0.1", port=sim_can_port)
+    messenger = CanMessenger(driver)
+    messenger.start()
+    yield messenger
+    await messenger.stop()
+    driver.shutdown()
+
+
+@pytest.fixture
+async def bootloaders(sim_can_port: int) -> AsyncIterator[List[SimulatedBootloader]]:
+    """Simulated bootloader nodes on the simulated socket CAN bus."""
+    nodes = [
+        SimulatedBootloader(
+            await SocketDriver.build(host="127.0.0.1", port=sim_can_port), node_id
+        )
+        for node_id in (NodeId.gantry_x_bootloader, NodeId.gantry_y_bootloader)
+    ]
+    yield nodes
+    for node in nodes:
+        await node.stop()
+
+
+def _hex_processor(chunks: List[Chunk]) -> MagicMock:
+    """A hex processor that produces chunks."""
+    processor = MagicMock(spec=HexRecordProcessor)
+    processor.process.return_value = iter(chunks)
+    return processor
+
+
+async def test_windowed_download_with_retransmit(
+    sim_messenger: CanMessenger,
+    bootloaders: List[SimulatedBootloader],
+    chunks: List[Chunk],
+    crc32: int,
+) -> None:
+    """It should download with a window, resending only unACKed chunks."""
+    subject = downloader.FirmwareUpdateDownloader(sim_messenger)
+    bootloader = bootloaders[0]
+    bootloader.drop_first_ack(0x100)
+
+    progress = [
+        p
+        async for p in subject.download(
+            NodeId.gantry_x_bootloader,
+            _hex_processor(chunks),
+            ack_wait_seconds=0.2,
+            window=3,
+            retries=1,
+        )
+    ]
+
+    assert bootloader.received == [0x000, 0x100, 0x200, 0x100]
+    assert [(p.chunks_acked, p.chunks_total) for p in progress] == [
+        (1, 3),
+        (2, 3),
+        (3, 3),
+    ]
+    assert bootloader.complete == payloads.FirmwareUpdateComplete(
+        num_messages=utils.UInt32Field(3), crc32=utils.UInt32Field(crc32)
+    )
+
+
+async def test_windowed_download_retries_exhausted(
+    sim_messenger: CanMessenger,
+    bootloaders: List[SimulatedBootloader],
+    chunks: List[Chunk],
+) -> None:
+    """It should time out once a chunk's retries are used up."""
+    subject = downloader.FirmwareUpdateDownloader(sim_messenger)
+    bootloaders[0].drop_first_ack(0x100)
+
+    with pytest.raises(TimeoutResponse):
+        await subject.run(
+            NodeId.gantry_x_bootloader,
+            _hex_processor(chunks),
+            ack_wait_seconds=0.2,
+            window=3,
+        )
+
+
+async def test_download_many(
+    sim_messenger: CanMessenger,
+    bootloaders: List[SimulatedBootloader],
+    chunks: List[Chunk],
+) -> None:
+    """It should download to several nodes at once, reporting each's progress."""
+    subject = downloader.FirmwareUpdateDownloader(sim_messenger)
+
+    progress = [
+        p
+        async for p in subject.download_many(
+            {
+                b: _hex_processor(chunks)
+                for b in (NodeId.gantry_x_bootloader, NodeId.gantry_y_bootloader)
+            },
+            ack_wait_seconds=1,
+            window=2,
+        )
+    ]
+
+    for bootloader, node_id in zip(
+        bootloaders, (NodeId.gantry_x_bootloader, NodeId.gantry_y_bootloader)
+    ):
+        assert [p.chunks_acked for p in progress if p.node_id == node_id] == [1, 2, 3]
+        assert sorted(bootloader.received) == [0x000, 0x100, 0x200]
+        assert bootloader.complete is not None
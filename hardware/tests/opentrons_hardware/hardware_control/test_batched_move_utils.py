@@ -0,0 +1,173 @@
+"""Tests for batched move util functions."""
+import pytest
+import numpy as np  # type: ignore[import]
+from typing import List
+
+from opentrons_hardware.hardware_control.motion_planning import batched_move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    all_blended,
+    build_move,
+    targets_to_moves,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+AXES = ["X", "Y", "Z", "A"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=800,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=200,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=5,
+    ),
+    "A": AxisConstraints.build(
+        max_acceleration=200,
+        max_speed_discont=20,
+        max_direction_change_speed_discont=5,
+    ),
+}
+
+ORIGIN = {"X": 0, "Y": 0, "Z": 0, "A": 0}
+
+
+def build_targets(points: List[List[float]], max_speed: float) -> List[MoveTarget[str]]:
+    """Build a target list from a list of points."""
+    return [MoveTarget.build(dict(zip(AXES, point)), max_speed) for point in points]
+
+
+def assert_moves_close(actual: Move[str], expected: Move[str]) -> None:
+    """Assert two moves have the same shape, to floating point precision."""
+    assert actual.unit_vector.keys() == expected.unit_vector.keys()
+    for axis in expected.unit_vector:
+        assert np.isclose(actual.unit_vector[axis], expected.unit_vector[axis])
+    assert np.isclose(actual.distance, expected.distance)
+    for actual_block, expected_block in zip(actual.blocks, expected.blocks):
+        assert np.isclose(actual_block.distance, expected_block.distance)
+        assert np.isclose(actual_block.initial_speed, expected_block.initial_speed)
+        assert np.isclose(actual_block.acceleration, expected_block.acceleration)
+
+
+POINTS: List[List[float]] = [
+    [10, 0, 0, 0],
+    [10, 20, 0, 0],
+    [-5, 20, 15, 10],
+    [-5, 21, 15, 10],
+]
+
+
+@pytest.mark.parametrize("max_speed", [5, 30, 100])
+def test_first_pass_matches_build_move(max_speed: float) -> None:
+    """One pass should limit each move like build_move does with its neighbors."""
+    targets = build_targets(POINTS, max_speed)
+    moves = list(targets_to_moves(ORIGIN, targets))
+    dummy = Move.build_dummy(moves[0].unit_vector.keys())
+    neighbors = [dummy] + moves + [dummy]
+    expected_moves = [
+        build_move(move, prev_move, next_move, CONSTRAINTS)
+        for prev_move, move, next_move in zip(neighbors, moves, neighbors[2:])
+    ]
+
+    axes = list(moves[0].unit_vector.keys())
+    constraints = batched_move_utils.build_constraint_arrays(CONSTRAINTS, axes)
+    move_arrays = batched_move_utils.targets_to_move_arrays(ORIGIN, targets, axes)
+    initial_speeds = batched_move_utils.find_initial_speeds(
+        constraints, move_arrays, move_arrays.max_speeds, move_arrays.max_speeds
+    )
+    # Use the unchanged initial speeds of next moves, as build_move does
+    final_speeds = batched_move_utils.find_final_speeds(
+        constraints, move_arrays, move_arrays.max_speeds, move_arrays.max_speeds
+    )
+    final_speeds = batched_move_utils.achievable_finals(
+        constraints, move_arrays, initial_speeds, final_speeds
+    )
+    blocks = batched_move_utils.build_blocks(
+        constraints, move_arrays, initial_speeds, final_speeds
+    )
+    result = batched_move_utils.move_arrays_to_moves(axes, move_arrays, blocks)
+
+    assert len(result) == len(expected_moves)
+    for actual, expected in zip(result, expected_moves):
+        assert_moves_close(actual, expected)
+
+
+def test_blocks_are_continuous() -> None:
+    """Each block should start at the speed the block before it ends at.
+
+    This includes moves too short to reach their top speed, where the top
+    speed is trimmed after the blocks are first laid out.
+    """
+    targets = build_targets(POINTS, 500)
+    axes = AXES
+    constraints = batched_move_utils.build_constraint_arrays(CONSTRAINTS, axes)
+    move_arrays = batched_move_utils.targets_to_move_arrays(ORIGIN, targets, axes)
+    initial_speeds = batched_move_utils.find_initial_speeds(
+        constraints, move_arrays, move_arrays.max_speeds, move_arrays.max_speeds
+    )
+    final_speeds = batched_move_utils.find_final_speeds(
+        constraints, move_arrays, move_arrays.max_speeds, initial_speeds
+    )
+    final_speeds = batched_move_utils.achievable_finals(
+        constraints, move_arrays, initial_speeds, final_speeds
+    )
+    blocks = batched_move_utils.build_blocks(
+        constraints, move_arrays, initial_speeds, final_speeds
+    )
+
+    for move in batched_move_utils.move_arrays_to_moves(axes, move_arrays, blocks):
+        moving_blocks = [b for b in move.blocks if b.distance]
+        for block, next_block in zip(moving_blocks, moving_blocks[1:]):
+            assert np.isclose(block.final_speed, next_block.initial_speed)
+
+
+def test_plan_motion_batched() -> None:
+    """It should plan a path whose moves are all blended."""
+    targets = build_targets(
+        [[10 * i, 5 * (i % 3), 3 * (i % 2), 0] for i in range(1, 50)], 200
+    )
+    manager = MoveManager(CONSTRAINTS)
+
+    converged, blend_log = manager.plan_motion_batched(ORIGIN, targets)
+
+    assert converged
+    assert len(blend_log) == 1
+    assert len(blend_log[0]) == len(targets)
+    assert all_blended(CONSTRAINTS, blend_log[0])
+    for move in blend_log[0]:
+        assert np.isclose(sum(b.distance for b in move.blocks), move.distance)
+
+
+def test_plan_motion_batched_single_move() -> None:
+    """A single move should be planned exactly as plan_motion plans it."""
+    targets = build_targets([[100, 50, 20, 0]], 300)
+    manager = MoveManager(CONSTRAINTS)
+
+    _, expected_log = manager.plan_motion(ORIGIN, targets)
+    converged, blend_log = manager.plan_motion_batched(ORIGIN, targets)
+
+    assert converged
+    assert_moves_close(blend_log[0][0], expected_log[-1][0])
+
+
+def test_plan_motion_batched_zero_length() -> None:
+    """It should raise if a target is where the previous move ends."""
+    targets = build_targets([[10, 0, 0, 0], [10, 0, 0, 0]], 100)
+    manager = MoveManager(CONSTRAINTS)
+
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion_batched(ORIGIN, targets)
@@ -5,6 +5,7 @@ from hypothesis.extra import numpy as hynp
 from typing import Iterator, List
 
 from opentrons_hardware.hardware_control.motion_planning import move_manager
+from opentrons_hardware.hardware_control.motion_planning.move_utils import all_blended
 from opentrons_hardware.hardware_control.motion_planning.types import (
     AxisConstraints,
     Coordinates,
@@ -188,3 +189,44 @@ def test_close_move_plan(
     )
 
     assert converged
+
+
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    targets=generate_target_list(),
+)
+def test_batched_move_plan(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> None:
+    """Test batched motion plan using Hypothesis."""
+    assume(reject_close_coordinates(origin, targets[0].position))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    converged, blend_log = manager.plan_motion_batched(
+        origin=origin,
+        target_list=targets,
+        iteration_limit=20,
+    )
+
+    assert converged
+    assert all_blended(constraints, blend_log[-1])
@@ -1,6 +1,9 @@
 """Tests for the move scheduler."""
+import asyncio
+from typing import List, Tuple
+
 import pytest
-from mock import AsyncMock, call, MagicMock
+from mock import AsyncMock, call, MagicMock, patch
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
 
 from opentrons_hardware.firmware_bindings.constants import NodeId
@@ -23,6 +26,7 @@ from opentrons_hardware.hardware_control.motion import (
 from opentrons_hardware.hardware_control.move_group_runner import (
     MoveGroupRunner,
     MoveScheduler,
+    encode_move_groups,
 )
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions as md,
@@ -38,7 +42,15 @@ from opentrons_hardware.firmware_bindings.utils import (
 @pytest.fixture
 def mock_can_messenger() -> AsyncMock:
     """Mock communication."""
-    return AsyncMock()
+    mock = AsyncMock()
+
+    async def _send_many(messages: List[Tuple[NodeId, MessageDefinition]]) -> None:
+        for node_id, message in messages:
+            await mock.send(node_id=node_id, message=message)
+
+    # Record bursts as individual sends so tests can check either.
+    mock.send_many.side_effect = _send_many
+    return mock
 
 
 @pytest.fixture
@@ -470,3 +482,89 @@ async def test_multi_group_move(
             ),
         ]
     )
+
+
+async def test_send_groups_in_one_burst(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should set up all the move groups with a single burst."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple)
+    await subject._send_groups(can_messenger=mock_can_messenger)
+
+    encoded = encode_move_groups(move_group_multiple)
+    mock_can_messenger.send_many.assert_called_once_with(
+        encoded[0] + encoded[1] + encoded[2]
+    )
+
+
+def test_encode_move_groups(move_group_multiple: MoveGroups) -> None:
+    """It should encode each group's moves in order."""
+    encoded = encode_move_groups(move_group_multiple)
+    assert [
+        [(node, m.payload.group_id.value, m.payload.seq_id.value) for node, m in g]
+        for g in encoded
+    ] == [
+        [(NodeId.head, 0, 0)],
+        [(NodeId.gantry_x, 1, 0), (NodeId.gantry_y, 1, 0)],
+        [(NodeId.pipette_left, 2, 0), (NodeId.pipette_left, 2, 1)],
+    ]
+
+
+async def test_start_during_upload(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should start each group once it is set up, not once all are."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple, start_during_upload=True)
+    scheduler = MoveScheduler(move_groups=move_group_multiple)
+    mock_sender = MockSendMoveCompleter(move_group_multiple, scheduler)
+    sent: List[Tuple[str, int]] = []
+
+    async def _send(node_id: NodeId, message: MessageDefinition) -> None:
+        if isinstance(message, md.ExecuteMoveGroupRequest):
+            sent.append(("execute", message.payload.group_id.value))
+        await mock_sender.mock_send(node_id, message)
+
+    async def _send_many(messages: List[Tuple[NodeId, MessageDefinition]]) -> None:
+        # Take a while, as a long upload would
+        await asyncio.sleep(0.01)
+        message = messages[0][1]
+        assert isinstance(message, md.AddLinearMoveRequest)
+        sent.append(("upload", message.payload.group_id.value))
+
+    mock_can_messenger.send.side_effect = _send
+    mock_can_messenger.send_many.side_effect = _send_many
+    mock_can_messenger.add_listener = MagicMock()
+    mock_can_messenger.remove_listener = MagicMock()
+
+    with patch(
+        "opentrons_hardware.hardware_control.move_group_runner.MoveScheduler",
+        return_value=scheduler,
+    ):
+        await subject.run(can_messenger=mock_can_messenger)
+
+    assert sent == [
+        ("upload", 0),
+        ("execute", 0),
+        ("upload", 1),
+        ("execute", 1),
+        ("upload", 2),
+        ("execute", 2),
+    ]
+
+
+async def test_start_during_upload_error(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should raise an upload error instead of starting the group."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple, start_during_upload=True)
+    mock_can_messenger.send_many.side_effect = RuntimeError("oh no")
+    mock_can_messenger.add_listener = MagicMock()
+    mock_can_messenger.remove_listener = MagicMock()
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await subject.run(can_messenger=mock_can_messenger)
+
+    assert not any(
+        isinstance(c.kwargs["message"], md.ExecuteMoveGroupRequest)
+        for c in mock_can_messenger.send.call_args_list
+    )
@@ -0,0 +1,157 @@
+"""Tests for sensor streams."""
+import asyncio
+from typing import List
+
+import mock
+import numpy as np  # type: ignore[import]
+import pytest
+
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
+from opentrons_hardware.firmware_bindings.constants import NodeId, SensorType
+from opentrons_hardware.firmware_bindings.messages.fields import SensorTypeField
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ReadFromSensorResponse,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import UInt32Field
+from opentrons_hardware.sensors import fdc1004
+from opentrons_hardware.sensors.stream import SensorRingBuffer, SensorStream
+
+_ARBITRATION_ID = ArbitrationId(
+    parts=ArbitrationIdParts(
+        message_id=ReadFromSensorResponse.message_id,
+        node_id=NodeId.host,
+        function_code=0,
+        originating_node_id=NodeId.pipette_left,
+    )
+)
+
+
+@pytest.fixture
+def messenger() -> mock.MagicMock:
+    """A messenger whose listener methods are not awaited."""
+    return mock.MagicMock(spec=CanMessenger)
+
+
+@pytest.fixture
+def subject(messenger: mock.MagicMock) -> SensorStream:
+    """A capacitive sensor stream with a small buffer."""
+    return SensorStream(messenger, NodeId.pipette_left, SensorType.capacitive, 4)
+
+
+def _send(
+    stream: SensorStream,
+    values: List[float],
+    sensor: SensorType = SensorType.capacitive,
+) -> None:
+    """Deliver readings to the stream, scaled like the firmware."""
+    for value in values:
+        stream(
+            ReadFromSensorResponse(
+                payload=ReadFromSensorResponsePayload(
+                    sensor=SensorTypeField(sensor),
+                    sensor_data=UInt32Field(int(value * 2**15)),
+                )
+            ),
+            _ARBITRATION_ID,
+        )
+
+
+def test_ring_buffer_statistics() -> None:
+    """It should summarize the last readings across the wrap point."""
+    subject = SensorRingBuffer(4)
+    for value in [10.0, 1.0, 2.0, 3.0, 4.0, 6.0]:
+        subject.append(value)
+
+    assert len(subject) == 4
+    assert subject.total == 6
+    assert subject.latest() == 6.0
+    assert subject.to_array().tolist() == [2.0, 3.0, 4.0, 6.0]
+    assert subject.to_array(3).tolist() == [3.0, 4.0, 6.0]
+    assert subject.mean() == 3.75
+    assert subject.mean(2) == 5.0
+    assert subject.min(3) == 3.0
+    assert subject.max() == 6.0
+    assert subject.std() == pytest.approx(np.std([2.0, 3.0, 4.0, 6.0]))
+    assert subject.sample(2) == 2.0
+    with pytest.raises(IndexError):
+        subject.sample(1)
+
+
+def test_ring_buffer_empty() -> None:
+    """It should refuse to summarize no readings."""
+    subject = SensorRingBuffer(4)
+    assert subject.to_array().size == 0
+    with pytest.raises(ValueError):
+        subject.mean()
+    with pytest.raises(ValueError):
+        SensorRingBuffer(0)
+
+
+def test_stream_subscribes(messenger: mock.MagicMock) -> None:
+    """It should listen for the sensor's node's read responses while open."""
+    sensor = fdc1004.CapacitiveSensor()
+    with sensor.stream(messenger, NodeId.pipette_left) as subject:
+        messenger.add_listener.assert_called_once_with(
+            subject,
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_id=NodeId.pipette_left,
+        )
+    messenger.remove_listener.assert_called_once_with(subject)
+
+
+def test_stream_captures_sensor(subject: SensorStream) -> None:
+    """It should keep readings of its own sensor only."""
+    _send(subject, [1.0, 2.0])
+    _send(subject, [9.0], sensor=SensorType.pressure)
+    assert subject.buffer.to_array().tolist() == [1.0, 2.0]
+
+
+async def test_stream_iterate(subject: SensorStream) -> None:
+    """It should yield readings as they arrive."""
+
+    async def _collect() -> List[float]:
+        """Collect three readings."""
+        readings = []
+        async for reading in subject:
+            readings.append(reading)
+            if len(readings) == 3:
+                break
+        return readings
+
+    task = asyncio.get_event_loop().create_task(_collect())
+    await asyncio.sleep(0)
+    _send(subject, [1.0])
+    await asyncio.sleep(0)
+    _send(subject, [2.0, 3.0])
+    assert await asyncio.wait_for(task, 1) == [1.0, 2.0, 3.0]
+
+
+async def test_stream_iterate_overrun(subject: SensorStream) -> None:
+    """It should skip ahead when readings were overwritten."""
+    iterator = subject.__aiter__()
+    next_reading = asyncio.get_event_loop().create_task(iterator.__anext__())
+    await asyncio.sleep(0)
+    _send(subject, [1.0])
+    assert await next_reading == 1.0
+    _send(subject, [2.0, 3.0, 4.0, 5.0, 6.0])
+    assert await iterator.__anext__() == 3.0
+
+
+async def test_wait_for_threshold(subject: SensorStream) -> None:
+    """It should resolve on the reading whose window crosses the threshold."""
+    rising = asyncio.get_event_loop().create_task(
+        subject.wait_for_threshold(2.0, window=2)
+    )
+    falling = asyncio.get_event_loop().create_task(
+        subject.wait_for_threshold(0.5, rising=False)
+    )
+    await asyncio.sleep(0)
+    _send(subject, [1.0, 3.0, 1.0])
+    assert await asyncio.wait_for(rising, 1) == 2.0
+    assert not falling.done()
+    _send(subject, [0.25])
+    assert await asyncio.wait_for(falling, 1) == 0.25
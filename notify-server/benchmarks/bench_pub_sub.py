@@ -0,0 +1,138 @@
+"""Benchmark event throughput from publisher, through server, to subscriber.
+
+Runs the notify server in process on local tcp ports, with one publisher
+and one subscriber, and times how long the subscriber takes to receive a
+run of events. Compares json and msgpack frames (when msgpack is
+installed), with and without publisher batching, and a json subscriber
+receiving msgpack batches through the server. Prints events per second.
+
+Usage:
+    python benchmarks/bench_pub_sub.py [--events 2000] [--port 5575]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from notify_server.clients import publisher, subscriber
+from notify_server.clients.serdes import FrameFormat, available_formats
+from notify_server.models.event import Event
+from notify_server.models.payload_type import UserData
+from notify_server.server import server
+from notify_server.settings import ServerBindAddress, Settings
+
+_TOPIC = "hardware_events"
+
+
+def _event(i: int) -> Event:
+    return Event(
+        createdOn=datetime.now(),
+        publisher="bench",
+        data=UserData(data={"x": i * 0.1, "y": i * 0.2, "z": i * 0.3, "seq": i}),
+    )
+
+
+async def _connect(pub: publisher.Publisher, sub: subscriber.Subscriber) -> None:
+    # Subscriptions take a moment to reach the server, so publish until one
+    # arrives, then drain any stragglers.
+    for _ in range(50):
+        await pub.send(_TOPIC, _event(-1))
+        pub.flush()
+        try:
+            await asyncio.wait_for(sub.next_event(), 0.1)
+            break
+        except asyncio.TimeoutError:
+            pass
+    else:
+        raise RuntimeError("The subscriber did not connect to the server.")
+    while True:
+        try:
+            await asyncio.wait_for(sub.next_event(), 0.05)
+        except asyncio.TimeoutError:
+            return
+
+
+async def _bench(
+    settings: Settings,
+    events: List[Event],
+    pub_format: FrameFormat,
+    batch_interval: Optional[float],
+    sub_format: FrameFormat,
+) -> Tuple[float, int]:
+    pub = publisher.create(
+        settings.publisher_address.connection_string(),
+        frame_format=pub_format,
+        batch_interval=batch_interval,
+    )
+    sub = subscriber.create(
+        settings.subscriber_address.connection_string(),
+        [_TOPIC],
+        frame_format=sub_format,
+    )
+    await _connect(pub, sub)
+
+    async def _receive() -> int:
+        received = 0
+        try:
+            while received < len(events):
+                await asyncio.wait_for(sub.next_event(), 1)
+                received += 1
+        except asyncio.TimeoutError:
+            pass
+        return received
+
+    start = perf_counter()
+    receiver = asyncio.get_event_loop().create_task(_receive())
+    for e in events:
+        pub.send_nowait(_TOPIC, e)
+        # Let the server and subscriber run, as another process would.
+        await asyncio.sleep(0)
+    pub.flush()
+    received = await receiver
+    seconds = perf_counter() - start
+
+    pub.close()
+    sub.close()
+    return seconds, received
+
+
+async def main(count: int, port: int) -> None:
+    """Run the benchmark and print the throughput."""
+    settings = Settings(
+        publisher_address=ServerBindAddress(scheme="tcp", host="127.0.0.1", port=port),
+        subscriber_address=ServerBindAddress(
+            scheme="tcp", host="127.0.0.1", port=port + 1
+        ),
+    )
+    server_task = asyncio.get_event_loop().create_task(server.run(settings))
+    events = [_event(i) for i in range(count)]
+
+    cases: List[Tuple[FrameFormat, Optional[float], FrameFormat]] = [
+        (FrameFormat.JSON, None, FrameFormat.JSON)
+    ]
+    cases.append((FrameFormat.JSON, 0.005, FrameFormat.JSON))
+    if FrameFormat.MSGPACK in available_formats():
+        cases.append((FrameFormat.MSGPACK, None, FrameFormat.MSGPACK))
+        cases.append((FrameFormat.MSGPACK, 0.005, FrameFormat.MSGPACK))
+        cases.append((FrameFormat.MSGPACK, 0.005, FrameFormat.JSON))
+
+    print(f"{count} events")
+    for pub_format, batch_interval, sub_format in cases:
+        seconds, received = await _bench(
+            settings, events, pub_format, batch_interval, sub_format
+        )
+        batching = f"batched {batch_interval * 1000:.0f} ms" if batch_interval else ""
+        name = f"{pub_format.value} -> {sub_format.value} {batching}"
+        lost = f", {count - received} lost" if received < count else ""
+        print(f"  {name:<30} {received / seconds:9.0f} events/s{lost}")
+
+    server_task.cancel()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=5575)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(main(count=args.events, port=args.port))
@@ -1,32 +1,60 @@
 """A publisher client."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from asyncio import Future
-from typing import Any
+from typing import Any, Dict, List, Optional
 
-from notify_server.clients.serdes import to_frames
+from notify_server.clients.serdes import (
+    FrameFormat,
+    encode_event,
+    to_batch_frames,
+    to_frames,
+)
 from notify_server.models.event import Event
 from notify_server.network.connection import create_push, Connection
 
 log = logging.getLogger(__name__)
 
 
-def create(host_address: str) -> Publisher:
+def create(
+    host_address: str,
+    frame_format: FrameFormat = FrameFormat.JSON,
+    batch_interval: Optional[float] = None,
+) -> Publisher:
     """
     Construct a publisher.
 
     :param host_address: uri to connect to.
+    :param frame_format: encoding of events. Defaults to json; see
+        serdes.preferred_format for the most compact available.
+    :param batch_interval: if set, the seconds to collect events for before
+        sending each topic's events as one message.
     """
-    return Publisher(connection=create_push(host_address))
+    return Publisher(
+        connection=create_push(host_address),
+        frame_format=frame_format,
+        batch_interval=batch_interval,
+    )
 
 
 class Publisher:
     """Publisher class."""
 
-    def __init__(self, connection: Connection) -> None:
+    def __init__(
+        self,
+        connection: Connection,
+        frame_format: FrameFormat = FrameFormat.JSON,
+        batch_interval: Optional[float] = None,
+    ) -> None:
         """Construct a Publisher."""
         self._connection = connection
+        self._frame_format = frame_format
+        self._batch_interval = batch_interval
+        self._pending: Dict[str, List[bytes]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_sent: Optional[Future[Any]] = None
 
     async def send(self, topic: str, event: Event) -> None:
         """Publish an event to a topic."""
@@ -34,9 +62,70 @@ class Publisher:
 
     def send_nowait(self, topic: str, event: Event) -> Future[Any]:
         """Publish an event to a topic without waiting for completion."""
-        frames = to_frames(topic=topic, event=event)
+        if self._batch_interval is not None:
+            return self._add_to_batch(topic, event)
+        if self._frame_format is FrameFormat.JSON:
+            return self._connection.send_multipart(to_frames(topic=topic, event=event))
+        frames = to_batch_frames(
+            topic.encode("utf-8"),
+            [encode_event(event, self._frame_format)],
+            self._frame_format,
+        )
         return self._connection.send_multipart(frames)
 
+    def flush(self) -> Future[Any]:
+        """Send the batched events now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch_sent, self._batch_sent = self._batch_sent, None
+        pending, self._pending = self._pending, {}
+        if batch_sent is None:
+            done: Future[Any] = asyncio.get_event_loop().create_future()
+            done.set_result(None)
+            return done
+
+        sends = [
+            self._connection.send_multipart(
+                to_batch_frames(topic.encode("utf-8"), events, self._frame_format)
+            )
+            for topic, events in pending.items()
+        ]
+        _chain(asyncio.gather(*sends), batch_sent)
+        return batch_sent
+
     def close(self) -> None:
-        """Close the connection."""
+        """Send any batched events and close the connection."""
+        if self._pending:
+            self.flush()
         self._connection.close()
+
+    def _add_to_batch(self, topic: str, event: Event) -> Future[Any]:
+        """Queue an event for the next batch of its topic."""
+        # Encode now so the event is captured as it is when it is sent.
+        self._pending.setdefault(topic, []).append(
+            encode_event(event, self._frame_format)
+        )
+        if self._batch_sent is None:
+            loop = asyncio.get_event_loop()
+            self._batch_sent = loop.create_future()
+            self._flush_handle = loop.call_later(self._batch_interval or 0, self.flush)
+        return self._batch_sent
+
+
+def _chain(source: Future[Any], target: Future[Any]) -> None:
+    """Complete target the same way as source, once it is done."""
+
+    def _done(result: Future[Any]) -> None:
+        if target.done():
+            return
+        if result.cancelled():
+            target.cancel()
+            return
+        exc = result.exception()
+        if exc is not None:
+            target.set_exception(exc)
+        else:
+            target.set_result(None)
+
+    source.add_done_callback(_done)
@@ -1,12 +1,36 @@
-"""Methods and types for serializing and deserializing frames."""
+"""Methods and types for serializing and deserializing frames.
+
+An event is sent as two frames: a topic and the event serialized to json.
+
+Events can also be sent in batches, encoded in any FrameFormat: a topic, a
+format frame naming the encoding, and one frame per event. Batches sent to
+subscribers in a binary format have the topic prefixed with
+BINARY_TOPIC_PREFIX, so that a subscriber picks the format it receives by
+the topics it subscribes to.
+"""
 from __future__ import annotations
 
-from typing import List
+import enum
+import json
+from typing import List, NamedTuple, Sequence
 
 from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 
 from notify_server.models.event import Event
 
+try:
+    import msgpack  # type: ignore[import]
+except ImportError:
+    msgpack = None
+
+
+# One byte each. Neither can start a plain topic or a json event.
+BINARY_TOPIC_PREFIX = b"\x00"
+"""Prefix of the topics of events published in a binary format."""
+
+_FORMAT_MARKER = b"\x00"
+
 
 class MalformedFrames(Exception):
     """Exception raised on badly formed frames."""
@@ -20,25 +44,125 @@ class FrameEncodingError(Exception):
     pass
 
 
-def to_frames(topic: str, event: Event) -> List[bytes]:
+class FrameFormat(str, enum.Enum):
+    """The encoding of events in frames."""
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether subscribers to this format use binary topics."""
+        return self is not FrameFormat.JSON
+
+
+def available_formats() -> List[FrameFormat]:
+    """Get the frame formats that can be encoded and decoded here."""
+    return [f for f in FrameFormat if f is FrameFormat.JSON or msgpack is not None]
+
+
+def preferred_format() -> FrameFormat:
+    """Get the most compact frame format that is available."""
+    return FrameFormat.MSGPACK if msgpack is not None else FrameFormat.JSON
+
+
+def subscription_topic(topic: str, frame_format: FrameFormat) -> bytes:
+    """Get the topic to subscribe to for a topic's events in a format."""
+    encoded = topic.encode("utf-8")
+    return BINARY_TOPIC_PREFIX + encoded if frame_format.is_binary else encoded
+
+
+def encode_event(event: Event, frame_format: FrameFormat) -> bytes:
     """
-    Create zmq frames from members.
+    Serialize an event to a frame.
 
     :raises: FrameEncodingError
     """
     try:
-        event_json = event.json()
+        if frame_format is FrameFormat.JSON:
+            return event.json().encode("utf-8")
+        return _packb(event.dict(), default=pydantic_encoder)
     except (ValueError, TypeError) as e:
-        # Could not serialize event to json.
+        # Could not serialize event.
         raise FrameEncodingError() from e
 
-    return [
-        bytes(v, "utf-8")
-        for v in (
-            topic,
-            event_json,
+
+def decode_event(frame: bytes, frame_format: FrameFormat) -> Event:
+    """
+    Deserialize an event from a frame.
+
+    :raises: MalformedFrames
+    """
+    try:
+        if frame_format is FrameFormat.JSON:
+            return Event.parse_raw(frame)
+        return Event.parse_obj(_unpackb(frame))
+    except (ValueError, TypeError) as e:
+        raise MalformedFrames() from e
+
+
+def transcode(frame: bytes, source: FrameFormat, target: FrameFormat) -> bytes:
+    """
+    Re-encode a serialized event without validating it against the model.
+
+    :raises: MalformedFrames
+    """
+    if source is target:
+        return frame
+    try:
+        obj = json.loads(frame) if source is FrameFormat.JSON else _unpackb(frame)
+        if target is FrameFormat.JSON:
+            return json.dumps(obj).encode("utf-8")
+        return _packb(obj)
+    except (ValueError, TypeError) as e:
+        raise MalformedFrames() from e
+
+
+def to_frames(topic: str, event: Event) -> List[bytes]:
+    """
+    Create zmq frames from members.
+
+    :raises: FrameEncodingError
+    """
+    return [topic.encode("utf-8"), encode_event(event, FrameFormat.JSON)]
+
+
+def to_batch_frames(
+    topic: bytes, events: Sequence[bytes], frame_format: FrameFormat
+) -> List[bytes]:
+    """Create zmq frames from a topic and events serialized in frame_format."""
+    return [topic, _FORMAT_MARKER + frame_format.value.encode("utf-8"), *events]
+
+
+class Batch(NamedTuple):
+    """The parts of a message, without decoding the events."""
+
+    topic: str
+    frame_format: FrameFormat
+    events: List[bytes]
+
+
+def split_frames(frames: List[bytes]) -> Batch:
+    """
+    Split a message, in any of the layouts, into its parts.
+
+    :raises: MalformedFrames
+    """
+    try:
+        topic = frames[0]
+        if topic.startswith(BINARY_TOPIC_PREFIX):
+            topic = topic[1:]
+        if frames[1].startswith(_FORMAT_MARKER):
+            frame_format = FrameFormat(frames[1][1:].decode("utf-8"))
+            events = frames[2:]
+        else:
+            frame_format = FrameFormat.JSON
+            events = frames[1:2]
+        return Batch(
+            topic=topic.decode("utf-8"), frame_format=frame_format, events=events
         )
-    ]
+    except (ValueError, IndexError, AttributeError) as e:
+        raise MalformedFrames() from e
 
 
 class TopicEvent(BaseModel):
@@ -63,3 +187,30 @@ def from_frames(frames: List[bytes]) -> TopicEvent:
         )
     except (ValueError, IndexError, AttributeError) as e:
         raise MalformedFrames() from e
+
+
+def from_batch_frames(frames: List[bytes]) -> List[TopicEvent]:
+    """
+    Create objects from a zmq message in any of the layouts.
+
+    :raises: MalformedFrame
+    """
+    batch = split_frames(frames)
+    return [
+        TopicEvent(topic=batch.topic, event=decode_event(e, batch.frame_format))
+        for e in batch.events
+    ]
+
+
+def _packb(obj: object, **kwargs: object) -> bytes:
+    """Pack an object with msgpack."""
+    if msgpack is None:
+        raise ValueError("msgpack is not installed.")
+    return msgpack.packb(obj, **kwargs)  # type: ignore[no-any-return]
+
+
+def _unpackb(frame: bytes) -> object:
+    """Unpack an object with msgpack."""
+    if msgpack is None:
+        raise ValueError("msgpack is not installed.")
+    return msgpack.unpackb(frame)
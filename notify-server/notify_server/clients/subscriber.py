@@ -3,30 +3,52 @@ from __future__ import annotations
 
 import logging
 import typing
+from collections import deque
 
-from notify_server.clients.serdes import TopicEvent, from_frames
+from notify_server.clients.serdes import (
+    BINARY_TOPIC_PREFIX,
+    FrameFormat,
+    TopicEvent,
+    from_batch_frames,
+    subscription_topic,
+)
 from notify_server.network.connection import create_subscriber, Connection
 
 log = logging.getLogger(__name__)
 
 
-def create(host_address: str, topics: typing.Sequence[str]) -> Subscriber:
+def create(
+    host_address: str,
+    topics: typing.Sequence[str],
+    frame_format: FrameFormat = FrameFormat.JSON,
+) -> Subscriber:
     """
     Create a subscriber.
 
     :param host_address: The server notify_server address
     :param topics: The topics to subscribe to.
+    :param frame_format: The encoding to receive events in. Defaults to
+        json; see serdes.preferred_format for the most compact available.
     :return: A Subscriber instance.
     """
-    return Subscriber(create_subscriber(host_address, topics))
+    return Subscriber(
+        create_subscriber(
+            host_address, [subscription_topic(t, frame_format) for t in topics]
+        ),
+        frame_format=frame_format,
+    )
 
 
 class Subscriber:
     """Async Subscriber class."""
 
-    def __init__(self, connection: Connection) -> None:
+    def __init__(
+        self, connection: Connection, frame_format: FrameFormat = FrameFormat.JSON
+    ) -> None:
         """Construct."""
         self._connection = connection
+        self._binary = frame_format.is_binary
+        self._received: typing.Deque[TopicEvent] = deque()
 
     def close(self) -> None:
         """Stop the subscriber task."""
@@ -34,8 +56,14 @@ class Subscriber:
 
     async def next_event(self) -> TopicEvent:
         """Get next event."""
-        s = await self._connection.recv_multipart()
-        return from_frames(s)
+        while not self._received:
+            s = await self._connection.recv_multipart()
+            # A json subscription's prefix can also match binary topics
+            # that others subscribed to, as the empty prefix does
+            if s[0].startswith(BINARY_TOPIC_PREFIX) != self._binary:
+                continue
+            self._received.extend(from_batch_frames(s))
+        return self._received.popleft()
 
     def __aiter__(self) -> "Subscriber":
         """Create an async iterator."""
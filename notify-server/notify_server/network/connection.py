@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from asyncio import Future
-from typing import List, Any, Sequence
+from typing import List, Any, Sequence, Union
 
 import zmq  # type: ignore
 from zmq.asyncio import Context  # type: ignore
@@ -46,7 +46,18 @@ def create_publisher(address: str) -> Connection:
     return Connection(sock)
 
 
-def create_subscriber(address: str, topics: Sequence[str]) -> Connection:
+def create_xpublisher(address: str) -> Connection:
+    """Create an XPUB server connection, which also receives subscriptions."""
+    ctx = Context.instance()
+    sock = ctx.socket(zmq.XPUB)
+
+    log.info("Publisher binding to %s", address)
+    sock.bind(address)
+
+    return Connection(sock)
+
+
+def create_subscriber(address: str, topics: Sequence[Union[str, bytes]]) -> Connection:
     """Create a SUB client connection."""
     ctx = Context.instance()
     sock = ctx.socket(zmq.SUB)
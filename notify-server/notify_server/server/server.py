@@ -3,12 +3,99 @@
 import logging
 import asyncio
 from asyncio import Queue
+from typing import List, Set
 
-from notify_server.network.connection import create_publisher, create_pull, Connection
+from notify_server.clients.serdes import (
+    BINARY_TOPIC_PREFIX,
+    FrameFormat,
+    MalformedFrames,
+    available_formats,
+    split_frames,
+    to_batch_frames,
+    transcode,
+)
+from notify_server.network.connection import (
+    create_pull,
+    create_xpublisher,
+    Connection,
+)
 from notify_server.settings import Settings
 
 log = logging.getLogger(__name__)
 
+_SUBSCRIBE = 1
+
+
+class _Subscriptions:
+    """The topic prefixes that subscribers are subscribed to."""
+
+    def __init__(self) -> None:
+        self._prefixes: Set[bytes] = set()
+
+    def update(self, message: bytes) -> None:
+        """Apply an XPUB (un)subscribe message: a flag byte, then the prefix."""
+        if not message:
+            return
+        if message[0] == _SUBSCRIBE:
+            self._prefixes.add(message[1:])
+        else:
+            self._prefixes.discard(message[1:])
+
+    def wants(self, topic: bytes) -> bool:
+        """
+        Whether any subscriber would receive messages on a topic.
+
+        Binary topics are only wanted by subscriptions to binary topics, not
+        by json subscriptions whose prefix also matches them, like b"".
+        """
+        binary = topic.startswith(BINARY_TOPIC_PREFIX)
+        return any(
+            topic.startswith(p) and (p.startswith(BINARY_TOPIC_PREFIX) or not binary)
+            for p in self._prefixes
+        )
+
+
+def _route(frames: List[bytes], subscriptions: _Subscriptions) -> List[List[bytes]]:
+    """
+    Build the messages to publish for a message from a publisher.
+
+    Subscribers to a plain topic get one json event per message. Subscribers
+    to a binary topic get the whole batch in that format. Events are only
+    re-encoded for formats that someone is subscribed to.
+
+    :param frames: A message in any of the serdes layouts.
+    :param subscriptions: The current subscriptions.
+    :return: The messages to publish.
+    """
+    try:
+        batch = split_frames(frames)
+    except MalformedFrames:
+        log.warning("Dropping malformed message: %s", frames)
+        return []
+
+    topic = batch.topic.encode("utf-8")
+    messages: List[List[bytes]] = []
+    for frame_format in available_formats():
+        target = BINARY_TOPIC_PREFIX + topic if frame_format.is_binary else topic
+        if not subscriptions.wants(target):
+            continue
+        try:
+            events = [
+                transcode(e, batch.frame_format, frame_format) for e in batch.events
+            ]
+        except MalformedFrames:
+            log.warning(
+                "Could not re-encode %s events as %s.",
+                batch.frame_format.value,
+                frame_format.value,
+            )
+            continue
+        if frame_format is FrameFormat.JSON:
+            messages.extend([target, e] for e in events)
+        else:
+            messages.append(to_batch_frames(target, events, frame_format))
+    return messages
+
 
 async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
     """
@@ -32,22 +119,44 @@ async def _publisher_server_task(connection: Connection, queue: Queue) -> None:
         connection.close()
 
 
+async def _subscription_task(
+    connection: Connection, subscriptions: _Subscriptions
+) -> None:
+    """
+    Run a task that tracks the topics subscribers are subscribed to.
+
+    :param connection: The XPUB network connection.
+    :param subscriptions: The subscriptions to update.
+    :return: None
+    """
+    while True:
+        m = await connection.recv_multipart()
+        log.debug("Subscription: %s", m)
+        subscriptions.update(m[0])
+
+
 async def _subscriber_server_task(connection: Connection, queue: Queue) -> None:
     """
     Run a task that publishes messages to subscribers.
 
-    :param connection: The network connection.
+    :param connection: The XPUB network connection.
     :param queue: The queue of multipart messages to send
     :return: None
     """
+    subscriptions = _Subscriptions()
+    subscription_task = asyncio.create_task(
+        _subscription_task(connection, subscriptions)
+    )
     try:
         while True:
             s = await queue.get()
             log.debug("Publishing: %s", s)
-            await connection.send_multipart(s)
+            for m in _route(s, subscriptions):
+                await connection.send_multipart(m)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
+        subscription_task.cancel()
         connection.close()
 
 
@@ -57,7 +166,7 @@ async def run(settings: Settings) -> None:
 
     subtask = asyncio.create_task(
         _subscriber_server_task(
-            create_publisher(settings.subscriber_address.connection_string()), queue
+            create_xpublisher(settings.subscriber_address.connection_string()), queue
         )
     )
     pubtask = asyncio.create_task(
@@ -48,6 +48,7 @@ INSTALL_REQUIRES = [
     "pyzmq==19.0.2",
     "pydantic==1.8.2",
 ]
+EXTRAS_REQUIRE = {"msgpack": ["msgpack==1.0.2"]}
 
 
 def read(*parts):
@@ -77,5 +78,6 @@ if __name__ == "__main__":
         zip_safe=False,
         classifiers=CLASSIFIERS,
         install_requires=INSTALL_REQUIRES,
+        extras_require=EXTRAS_REQUIRE,
         include_package_data=True,
     )
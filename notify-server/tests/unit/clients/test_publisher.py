@@ -0,0 +1,71 @@
+"""Unit tests for the publisher client."""
+import asyncio
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from notify_server.clients.publisher import Publisher
+from notify_server.clients.serdes import (
+    FrameFormat,
+    encode_event,
+    from_batch_frames,
+    to_frames,
+)
+from notify_server.models.event import Event
+from notify_server.network.connection import Connection
+
+pytestmark = pytest.mark.asyncio
+
+
+def _connection() -> MagicMock:
+    """Create a connection whose sends complete immediately."""
+
+    def _send(frames: List[bytes]) -> "asyncio.Future[Any]":
+        sent: "asyncio.Future[Any]" = asyncio.get_event_loop().create_future()
+        sent.set_result(None)
+        return sent
+
+    connection = MagicMock(spec=Connection)
+    connection.send_multipart.side_effect = _send
+    return connection
+
+
+async def test_send(event: Event) -> None:
+    """Test that a json event is sent in two frames."""
+    connection = _connection()
+    await Publisher(connection).send("topic", event)
+    connection.send_multipart.assert_called_once_with(to_frames("topic", event))
+
+
+async def test_send_batched(event: Event) -> None:
+    """Test that events are sent in one message per topic after the interval."""
+    connection = _connection()
+    subject = Publisher(connection, FrameFormat.JSON, batch_interval=0.01)
+
+    sent = [
+        subject.send_nowait("topic1", event),
+        subject.send_nowait("topic2", event),
+        subject.send_nowait("topic1", event),
+    ]
+    connection.send_multipart.assert_not_called()
+    await asyncio.wait_for(asyncio.gather(*sent), 1)
+
+    messages = [c[0][0] for c in connection.send_multipart.call_args_list]
+    assert [[e.topic for e in from_batch_frames(m)] for m in messages] == [
+        ["topic1", "topic1"],
+        ["topic2"],
+    ]
+    assert messages[0][2] == encode_event(event, FrameFormat.JSON)
+
+
+async def test_flush(event: Event) -> None:
+    """Test that batched events can be sent before the interval."""
+    connection = _connection()
+    subject = Publisher(connection, FrameFormat.JSON, batch_interval=60)
+    sent = subject.send_nowait("topic", event)
+    await asyncio.wait_for(subject.flush(), 1)
+    assert sent.done()
+    assert connection.send_multipart.call_count == 1
+    await subject.flush()
+    assert connection.send_multipart.call_count == 1
@@ -3,13 +3,25 @@ from typing import List
 
 import pytest
 from notify_server.clients.serdes import (
+    FrameFormat,
     TopicEvent,
     MalformedFrames,
+    available_formats,
+    decode_event,
+    encode_event,
+    from_batch_frames,
+    subscription_topic,
+    to_batch_frames,
     to_frames,
     from_frames,
+    transcode,
 )
 from notify_server.models.event import Event
 
+requires_msgpack = pytest.mark.skipif(
+    FrameFormat.MSGPACK not in available_formats(), reason="msgpack is not installed"
+)
+
 
 def test_to_frames(event: Event) -> None:
     """Test that to_frames method creates a list of byte frames."""
@@ -32,3 +44,57 @@ def test_entry_from_frames(event: Event) -> None:
     """Test that an object is created from_frames."""
     entry = from_frames([b"topic", event.json().encode("utf-8")])
     assert entry == TopicEvent(topic="topic", event=event)
+
+
+@pytest.mark.parametrize(
+    argnames=["frame_format"], argvalues=[[f] for f in available_formats()]
+)
+def test_encode_decode(event: Event, frame_format: FrameFormat) -> None:
+    """Test that an event survives encoding in each available format."""
+    assert decode_event(encode_event(event, frame_format), frame_format) == event
+
+
+@pytest.mark.parametrize(
+    argnames=["frame_format"], argvalues=[[f] for f in available_formats()]
+)
+def test_batch_frames(event: Event, frame_format: FrameFormat) -> None:
+    """Test that a batch of events is created and read back."""
+    frames = to_batch_frames(
+        subscription_topic("topic", frame_format),
+        [encode_event(event, frame_format)] * 2,
+        frame_format,
+    )
+    assert from_batch_frames(frames) == [TopicEvent(topic="topic", event=event)] * 2
+
+
+def test_batch_frames_legacy(event: Event) -> None:
+    """Test that a two frame json message is read as a batch of one."""
+    assert from_batch_frames(to_frames("topic", event)) == [
+        TopicEvent(topic="topic", event=event)
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames=["frames"],
+    argvalues=[
+        [[]],
+        [[b"a"]],
+        [[b"a", b"\x00nope", b"{}"]],
+        [[b"a", b"\x00json", b"{"]],
+    ],
+)
+def test_batch_frames_fail(frames: List[bytes]) -> None:
+    """Test that an exception is raised on a bad batch."""
+    with pytest.raises(MalformedFrames):
+        from_batch_frames(frames)
+
+
+@requires_msgpack
+def test_transcode(event: Event) -> None:
+    """Test that an encoded event can change format without the model."""
+    packed = transcode(
+        encode_event(event, FrameFormat.JSON), FrameFormat.JSON, FrameFormat.MSGPACK
+    )
+    assert decode_event(packed, FrameFormat.MSGPACK) == event
+    unpacked = transcode(packed, FrameFormat.MSGPACK, FrameFormat.JSON)
+    assert decode_event(unpacked, FrameFormat.JSON) == event
@@ -0,0 +1,43 @@
+"""Unit tests for the subscriber client."""
+from typing import List
+
+import pytest
+from mock import AsyncMock, MagicMock
+
+from notify_server.clients.serdes import (
+    FrameFormat,
+    TopicEvent,
+    encode_event,
+    subscription_topic,
+    to_batch_frames,
+    to_frames,
+)
+from notify_server.clients.subscriber import Subscriber
+from notify_server.models.event import Event
+from notify_server.network.connection import Connection
+
+pytestmark = pytest.mark.asyncio
+
+
+def _connection(*messages: List[bytes]) -> MagicMock:
+    """Create a connection that receives messages in order."""
+    connection = MagicMock(spec=Connection)
+    connection.recv_multipart = AsyncMock(side_effect=messages)
+    return connection
+
+
+async def test_next_event(event: Event) -> None:
+    """Test that json events are received one per message."""
+    subject = Subscriber(_connection(to_frames("topic", event)))
+    assert await subject.next_event() == TopicEvent(topic="topic", event=event)
+
+
+async def test_next_event_skips_binary(event: Event) -> None:
+    """Test that a json subscriber skips batches meant for binary ones."""
+    binary = to_batch_frames(
+        subscription_topic("topic", FrameFormat.MSGPACK),
+        [encode_event(event, FrameFormat.JSON)],
+        FrameFormat.JSON,
+    )
+    subject = Subscriber(_connection(binary, to_frames("other", event)))
+    assert await subject.next_event() == TopicEvent(topic="other", event=event)
@@ -0,0 +1,92 @@
+"""Unit tests for the server module."""
+import pytest
+
+from notify_server.clients.serdes import (
+    BINARY_TOPIC_PREFIX,
+    FrameFormat,
+    available_formats,
+    encode_event,
+    from_batch_frames,
+    subscription_topic,
+    to_batch_frames,
+    to_frames,
+)
+from notify_server.models.event import Event
+from notify_server.server.server import _route, _Subscriptions
+
+
+def _subscriptions(*topics: bytes) -> _Subscriptions:
+    """Create subscriptions as XPUB would report them."""
+    subscriptions = _Subscriptions()
+    for t in topics:
+        subscriptions.update(b"\x01" + t)
+    return subscriptions
+
+
+def test_subscriptions() -> None:
+    """Test that subscriptions match topics by prefix until unsubscribed."""
+    subject = _subscriptions(b"hard")
+    assert subject.wants(b"hardware_events")
+    assert not subject.wants(b"other")
+    subject.update(b"\x00hard")
+    assert not subject.wants(b"hardware_events")
+
+
+def test_subscriptions_binary() -> None:
+    """Test that only binary subscriptions want binary topics."""
+    subject = _subscriptions(b"")
+    assert subject.wants(b"topic")
+    assert not subject.wants(subscription_topic("topic", FrameFormat.MSGPACK))
+    subject.update(b"\x01" + BINARY_TOPIC_PREFIX)
+    assert subject.wants(subscription_topic("topic", FrameFormat.MSGPACK))
+
+
+def test_route_no_subscribers(event: Event) -> None:
+    """Test that nothing is published without subscribers."""
+    assert _route(to_frames("topic", event), _subscriptions(b"other")) == []
+
+
+def test_route_malformed() -> None:
+    """Test that malformed messages are dropped."""
+    assert _route([b"topic"], _subscriptions(b"topic")) == []
+
+
+@pytest.mark.parametrize(
+    argnames=["frame_format"], argvalues=[[f] for f in available_formats()]
+)
+def test_route_json_batch(event: Event, frame_format: FrameFormat) -> None:
+    """Test that json subscribers get a batch one event per message."""
+    frames = to_batch_frames(
+        b"topic", [encode_event(event, frame_format)] * 2, frame_format
+    )
+    messages = _route(frames, _subscriptions(b"topic"))
+    assert messages == [to_frames("topic", event)] * 2
+
+
+@pytest.mark.parametrize(
+    argnames=["frame_format"], argvalues=[[f] for f in available_formats()]
+)
+def test_route_binary(event: Event, frame_format: FrameFormat) -> None:
+    """Test that binary subscribers get whole batches, and json ones too."""
+    if FrameFormat.MSGPACK not in available_formats():
+        pytest.skip("msgpack is not installed")
+    frames = to_batch_frames(
+        b"topic", [encode_event(event, frame_format)] * 2, frame_format
+    )
+    subscriptions = _subscriptions(
+        b"topic", subscription_topic("topic", FrameFormat.MSGPACK)
+    )
+    json_1, json_2, binary = _route(frames, subscriptions)
+    assert json_1 == json_2 == to_frames("topic", event)
+    assert binary[0] == subscription_topic("topic", FrameFormat.MSGPACK)
+    assert len(from_batch_frames(binary)) == 2
+
+
+def test_route_json_subscriber_to_everything(event: Event) -> None:
+    """Test that a json subscriber to every topic only gets json events."""
+    if FrameFormat.MSGPACK not in available_formats():
+        pytest.skip("msgpack is not installed")
+    frames = to_batch_frames(
+        b"topic", [encode_event(event, FrameFormat.JSON)], FrameFormat.JSON
+    )
+    assert _route(frames, _subscriptions(b"")) == [to_frames("topic", event)]
@@ -0,0 +1,109 @@
+"""Benchmark the in-memory and SQLite-backed run and analysis stores.
+
+Times inserting runs and completed analyses, then reading them all back,
+for each store implementation. The SQLite stores are opened in a
+temporary directory, so timings include real disk writes.
+
+Usage:
+    python benchmarks/bench_stores.py [--runs 1000] [--commands 1000]
+"""
+import argparse
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, List
+
+# protocol_api must be imported before protocol_engine to avoid a circular import
+from opentrons import protocol_api  # noqa: F401
+from opentrons.protocol_engine import commands
+
+from robot_server.persistence import open_database
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.sql_analysis_store import SqlAnalysisStore
+from robot_server.runs.run_store import RunResource, RunStore
+from robot_server.runs.sql_run_store import SqlRunStore
+
+_CREATED_AT = datetime(year=2022, month=1, day=1)
+
+
+def _time(name: str, count: int, func: Callable[[], object]) -> None:
+    start = perf_counter()
+    func()
+    seconds = perf_counter() - start
+    print(f"  {name:<28} {seconds * 1e3:9.2f} ms ({seconds / count * 1e6:.1f} us/item)")
+
+
+def _bench_run_store(run_store: RunStore, run_count: int) -> None:
+    runs = [
+        RunResource(
+            run_id=f"run-{i}",
+            protocol_id=None,
+            created_at=_CREATED_AT,
+            actions=[],
+            is_current=True,
+        )
+        for i in range(run_count)
+    ]
+
+    def insert() -> None:
+        for run in runs:
+            run_store.upsert(run)
+
+    _time("run upsert", run_count, insert)
+    _time("run get_all", run_count, run_store.get_all)
+
+
+def _bench_analysis_store(analysis_store: AnalysisStore, command_count: int) -> None:
+    command_list: List[commands.Command] = [
+        commands.Pause(
+            id=f"command-{i}",
+            key=f"command-{i}",
+            createdAt=_CREATED_AT,
+            status=commands.CommandStatus.SUCCEEDED,
+            params=commands.PauseParams(message="hello"),
+            result=commands.PauseResult(),
+        )
+        for i in range(command_count)
+    ]
+
+    def insert() -> None:
+        analysis_store.add_pending(protocol_id="protocol", analysis_id="analysis")
+        analysis_store.update(
+            analysis_id="analysis",
+            commands=command_list,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+
+    _time("analysis insert", command_count, insert)
+    _time(
+        "analysis get_by_protocol",
+        command_count,
+        lambda: analysis_store.get_by_protocol("protocol"),
+    )
+
+
+def main(run_count: int, command_count: int) -> None:
+    """Run the benchmark and print timings for each store implementation."""
+    print("in-memory")
+    _bench_run_store(RunStore(), run_count)
+    _bench_analysis_store(AnalysisStore(), command_count)
+
+    with TemporaryDirectory() as tmp_dir:
+        database = open_database(Path(tmp_dir))
+
+        print("sqlite")
+        _bench_run_store(SqlRunStore(database), run_count)
+        _bench_analysis_store(SqlAnalysisStore(database), command_count)
+
+        database.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=1000)
+    args = parser.parse_args()
+    main(run_count=args.runs, command_count=args.commands)
@@ -9,6 +9,7 @@ from opentrons import __version__
 from .router import router
 from .errors import exception_handlers
 from .hardware import initialize_hardware, cleanup_hardware
+from .persistence import close_sql_database
 from .service import initialize_logging
 
 log = logging.getLogger(__name__)
@@ -59,3 +60,5 @@ async def on_shutdown() -> None:
 
     for e in shutdown_errors:
         log.warning("Error during shutdown", exc_info=e)
+
+    close_sql_database(app.state)
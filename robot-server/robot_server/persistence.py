@@ -0,0 +1,111 @@
+"""SQLite database setup for disk-backed resource stores."""
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from fastapi import Depends
+
+from .app_state import AppState, AppStateValue, get_app_state
+from .settings import get_settings
+
+DATABASE_FILE_NAME = "robot_server.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS protocol (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    main_file TEXT NOT NULL,
+    files TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    protocol_type TEXT NOT NULL,
+    api_version TEXT,
+    schema_version INTEGER,
+    labware_definitions TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS run (
+    id TEXT PRIMARY KEY,
+    protocol_id TEXT,
+    created_at TEXT NOT NULL,
+    actions TEXT NOT NULL,
+    is_current INTEGER NOT NULL,
+    state_summary TEXT
+);
+
+CREATE TABLE IF NOT EXISTS analysis (
+    id TEXT PRIMARY KEY,
+    protocol_id TEXT NOT NULL,
+    result TEXT,
+    labware TEXT,
+    pipettes TEXT,
+    errors TEXT
+);
+
+CREATE INDEX IF NOT EXISTS analysis_protocol_id ON analysis (protocol_id);
+
+CREATE TABLE IF NOT EXISTS analysis_command (
+    analysis_id TEXT NOT NULL REFERENCES analysis (id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    command_type TEXT NOT NULL,
+    command TEXT NOT NULL,
+    PRIMARY KEY (analysis_id, idx)
+) WITHOUT ROWID;
+"""
+
+
+def open_database(directory: Path) -> sqlite3.Connection:
+    """Open the robot-server's SQLite database, creating it if necessary.
+
+    The database is opened in write-ahead-log mode, so readers never block
+    on the single writer, and a write only needs one fsync at checkpoint
+    rather than one per transaction.
+
+    The returned connection may be used from any thread, but callers
+    must not use it from more than one thread at a time. The stores
+    only touch it from the server's event loop thread.
+
+    Arguments:
+        directory: Directory to hold the database file.
+
+    Returns:
+        An open database connection with all store tables created.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(
+        str(directory / DATABASE_FILE_NAME),
+        check_same_thread=False,
+    )
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(_SCHEMA)
+
+    return connection
+
+
+_database = AppStateValue[sqlite3.Connection]("sql_database")
+
+
+def get_sql_database(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[sqlite3.Connection]:
+    """Get the server's database connection, if persistence is enabled."""
+    persistence_directory = get_settings().persistence_directory
+    database = _database.get_from(app_state)
+
+    if database is None and persistence_directory is not None:
+        database = open_database(persistence_directory)
+        _database.set_on(app_state, database)
+
+    return database
+
+
+def close_sql_database(app_state: AppState) -> None:
+    """Close the server's database connection, if one was opened."""
+    database = _database.get_from(app_state)
+
+    if database is not None:
+        database.close()
+        _database.set_on(app_state, None)
@@ -0,0 +1,134 @@
+"""On-disk cache of protocol analysis results."""
+import json
+import logging
+import os
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import parse_obj_as
+from pydantic.json import pydantic_encoder
+
+from opentrons import __version__ as api_version
+from opentrons.config import feature_flags
+from opentrons.protocol_engine import ErrorOccurrence, LoadedLabware, LoadedPipette
+from opentrons.protocol_engine.types import LoadedModule
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunData
+from opentrons_shared_data import __version__ as shared_data_version
+
+from .command_parsing import parse_command_obj
+
+log = logging.getLogger(__name__)
+
+# Bump to invalidate all existing entries if the entry format changes
+_CACHE_FORMAT_VERSION = "1"
+
+
+def _get_robot_config() -> Dict[str, bool]:
+    """Get the robot settings that may change the result of an analysis."""
+    return {
+        "shortFixedTrash": feature_flags.short_fixed_trash(),
+        "deckCalibrationDots": feature_flags.dots_deck_type(),
+        "useOldAspirationFunctions": feature_flags.use_old_aspiration_functions(),
+        "disableFastProtocolUpload": feature_flags.disable_fast_protocol_upload(),
+        "enableOT3HardwareController": (feature_flags.enable_ot3_hardware_controller()),
+    }
+
+
+class AnalysisCache:
+    """A bounded, least-recently-used cache of analysis results on disk.
+
+    Entries are keyed by a hash of everything that can affect an analysis:
+    the protocol's files and config, the robot settings that change how a
+    protocol is simulated, and the software and shared-data versions.
+    Uploading an identical protocol again can then reuse the earlier
+    result instead of simulating the protocol from scratch.
+    """
+
+    def __init__(self, directory: Path, max_entries: int) -> None:
+        """Initialize the cache.
+
+        Arguments:
+            directory: Directory to store cache entries in.
+            max_entries: Maximum number of analyses to keep. Once full, the
+                least recently used entries are removed to make room.
+        """
+        self._directory = directory
+        self._max_entries = max_entries
+
+    def get_key(self, source: ProtocolSource) -> str:
+        """Compute the cache key for a protocol."""
+        hasher = sha256()
+        header = {
+            "format": _CACHE_FORMAT_VERSION,
+            "api": api_version,
+            "sharedData": shared_data_version,
+            "robot": _get_robot_config(),
+            "config": repr(source.config),
+        }
+        hasher.update(json.dumps(header, sort_keys=True).encode())
+
+        for file in sorted(source.files, key=lambda f: f.name):
+            contents = (source.directory / file.name).read_bytes()
+            hasher.update(f"\n{file.name}:{file.role.value}:{len(contents)}\n".encode())
+            hasher.update(contents)
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[ProtocolRunData]:
+        """Get a cached analysis result, if present."""
+        entry_path = self._get_entry_path(key)
+
+        try:
+            entry = json.loads(entry_path.read_text())
+            result = ProtocolRunData(
+                commands=[parse_command_obj(c) for c in entry["commands"]],
+                errors=parse_obj_as(List[ErrorOccurrence], entry["errors"]),
+                labware=parse_obj_as(List[LoadedLabware], entry["labware"]),
+                pipettes=parse_obj_as(List[LoadedPipette], entry["pipettes"]),
+                modules=parse_obj_as(List[LoadedModule], entry["modules"]),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Discarding unreadable analysis cache entry {key}", exc_info=e)
+            entry_path.unlink()
+            return None
+
+        # Mark the entry as recently used for eviction purposes
+        os.utime(entry_path)
+
+        return result
+
+    def put(self, key: str, result: ProtocolRunData) -> None:
+        """Store an analysis result, evicting old entries if necessary."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        entry_path = self._get_entry_path(key)
+        temp_path = entry_path.with_suffix(".tmp")
+        entry = {
+            "commands": result.commands,
+            "errors": result.errors,
+            "labware": result.labware,
+            "pipettes": result.pipettes,
+            "modules": result.modules,
+        }
+
+        temp_path.write_text(json.dumps(entry, default=pydantic_encoder))
+        os.replace(temp_path, entry_path)
+
+        self._evict()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def _evict(self) -> None:
+        entries = sorted(
+            self._directory.glob("*.json"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+
+        for entry_path in entries[self._max_entries :]:
+            entry_path.unlink()
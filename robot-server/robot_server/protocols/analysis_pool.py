@@ -0,0 +1,171 @@
+"""Run protocol analyses in separate worker processes."""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Dict, Optional, Set, Tuple
+
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunData, create_simulating_runner
+
+log = logging.getLogger(__name__)
+
+# Worker processes are spawned rather than forked, because the server
+# process has hardware control threads and an event loop running that
+# must not be duplicated into the child
+_mp_context = multiprocessing.get_context("spawn")
+
+_WorkerResult = Tuple[Optional[ProtocolRunData], Optional[str]]
+
+
+class AnalysisError(RuntimeError):
+    """Base class for errors running an analysis in a worker process."""
+
+
+class AnalysisTimeoutError(AnalysisError):
+    """Error raised when an analysis takes longer than the allowed time."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the error message from the timeout."""
+        super().__init__(f"Analysis did not complete within {timeout} seconds.")
+
+
+class AnalysisProcessError(AnalysisError):
+    """Error raised when an analysis worker process fails unexpectedly."""
+
+
+class AnalysisCancelledError(AnalysisError):
+    """Error recorded when an analysis is cancelled before it completes."""
+
+    def __init__(self) -> None:
+        """Initialize the error message."""
+        super().__init__("Analysis was cancelled before it completed.")
+
+
+class AnalysisPool:
+    """A bounded pool of worker processes to run protocol simulations.
+
+    Each analysis runs in its own process, off of the server's event loop
+    and GIL, so a slow analysis cannot stall hardware control or HTTP
+    handling. At most `worker_count` analyses run at once; the rest wait
+    their turn. An analysis process is killed if it runs past its timeout
+    or if its protocol's analyses are cancelled.
+    """
+
+    def __init__(self, worker_count: int, timeout: float) -> None:
+        """Initialize the pool.
+
+        Arguments:
+            worker_count: Maximum number of analyses to run at once.
+            timeout: Maximum number of seconds an analysis may run for.
+        """
+        self._worker_count = worker_count
+        self._timeout = timeout
+        # Waiting on a worker's result blocks a thread for the whole analysis,
+        # so those waits get their own threads rather than tying up the
+        # event loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="analysis-pool",
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks_by_protocol_id: Dict[
+            str, Set["asyncio.Future[ProtocolRunData]"]
+        ] = {}
+
+    async def run(self, protocol_id: str, source: ProtocolSource) -> ProtocolRunData:
+        """Simulate a protocol in a worker process.
+
+        Arguments:
+            protocol_id: The protocol's ID, used to cancel its analyses.
+            source: The protocol to simulate.
+
+        Returns:
+            The simulation's result.
+
+        Raises:
+            AnalysisTimeoutError: The simulation took too long.
+            AnalysisProcessError: The worker process failed unexpectedly.
+            asyncio.CancelledError: The protocol's analyses were cancelled.
+        """
+        task = asyncio.ensure_future(self._run_in_process(source))
+        tasks = self._tasks_by_protocol_id.setdefault(protocol_id, set())
+        tasks.add(task)
+
+        try:
+            return await task
+        finally:
+            tasks.discard(task)
+            if not tasks:
+                self._tasks_by_protocol_id.pop(protocol_id, None)
+
+    def cancel(self, protocol_id: str) -> None:
+        """Cancel any waiting or running analyses of a protocol."""
+        for task in self._tasks_by_protocol_id.get(protocol_id, set()):
+            task.cancel()
+
+    async def _run_in_process(self, source: ProtocolSource) -> ProtocolRunData:
+        # Created here rather than in __init__ so it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._worker_count)
+
+        async with self._semaphore:
+            loop = asyncio.get_event_loop()
+            receiver, sender = _mp_context.Pipe(duplex=False)
+            process = _mp_context.Process(
+                target=_analyze_in_worker,
+                args=(source, sender),
+                daemon=True,
+            )
+
+            process.start()
+            # The worker holds its own copy of the sending end, so closing
+            # ours means `recv` will raise EOFError if the worker dies
+            sender.close()
+
+            try:
+                result, error = await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, _receive, receiver),
+                    timeout=self._timeout,
+                )
+            except asyncio.TimeoutError as e:
+                raise AnalysisTimeoutError(self._timeout) from e
+            finally:
+                if process.is_alive():
+                    process.terminate()
+
+                await loop.run_in_executor(self._executor, process.join)
+                receiver.close()
+
+        if result is None:
+            raise AnalysisProcessError(error or "Analysis worker exited unexpectedly.")
+
+        return result
+
+
+def _receive(receiver: Connection) -> _WorkerResult:
+    try:
+        result: _WorkerResult = receiver.recv()
+        return result
+    except (EOFError, OSError):
+        return None, None
+
+
+def _analyze_in_worker(source: ProtocolSource, sender: Connection) -> None:
+    """Entry point of an analysis worker process."""
+    message: _WorkerResult
+
+    try:
+        result = asyncio.get_event_loop().run_until_complete(_analyze(source))
+        message = (result, None)
+    except Exception as e:
+        message = (None, f"{type(e).__name__}: {e}")
+
+    sender.send(message)
+    sender.close()
+
+
+async def _analyze(source: ProtocolSource) -> ProtocolRunData:
+    protocol_runner = await create_simulating_runner()
+    return await protocol_runner.run(source)
@@ -1,5 +1,5 @@
 """Protocol analysis storage."""
-from typing import Dict, List, Set
+from typing import Dict, List, Sequence, Set, Union
 
 from opentrons.protocol_engine import (
     Command,
@@ -10,6 +10,7 @@ from opentrons.protocol_engine import (
 
 from .analysis_models import (
     ProtocolAnalysis,
+    AnalysisSummary,
     PendingAnalysis,
     CompletedAnalysis,
     AnalysisResult,
@@ -62,3 +63,12 @@ class AnalysisStore:
         ids_for_protocol = self._analysis_ids_by_protocol.get(protocol_id, set())
 
         return [self._analyses_by_id[analysis_id] for analysis_id in ids_for_protocol]
+
+    def get_listed_by_protocol(
+        self, protocol_id: str
+    ) -> Sequence[Union[ProtocolAnalysis, AnalysisSummary]]:
+        """Get a protocol's analyses as listed with all protocols.
+
+        Analyses in memory are cheap to list, so these are the full analyses.
+        """
+        return self.get_by_protocol(protocol_id)
@@ -0,0 +1,21 @@
+"""Parsing of protocol engine commands read back from storage."""
+from typing import Any, Dict, Type
+from typing_extensions import get_args
+
+from opentrons.protocol_engine import Command
+
+# Parsing into the Command union would try every member model in turn,
+# so stored commands are parsed by the model matching their commandType
+_COMMAND_MODELS_BY_TYPE: Dict[str, Type[Command]] = {
+    model.__fields__["commandType"].default: model for model in get_args(Command)
+}
+
+
+def parse_command_raw(command_type: str, command_json: str) -> Command:
+    """Parse a JSON-serialized command of a known command type."""
+    return _COMMAND_MODELS_BY_TYPE[command_type].parse_raw(command_json)
+
+
+def parse_command_obj(command: Dict[str, Any]) -> Command:
+    """Parse a command from a deserialized JSON object."""
+    return _COMMAND_MODELS_BY_TYPE[command["commandType"]].parse_obj(command)
@@ -1,22 +1,34 @@
 """Protocol router dependency wire-up."""
 import logging
 from pathlib import Path
+from sqlite3 import Connection
 from tempfile import gettempdir
+from typing import Optional
+
 from fastapi import Depends
 
+from opentrons.hardware_control.simulator_pool import SimulatorPool
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateValue, get_app_state
+from robot_server.persistence import get_sql_database
+from robot_server.settings import get_settings
 from .protocol_store import ProtocolStore
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_cache import AnalysisCache
+from .analysis_pool import AnalysisPool
+from .sql_protocol_store import SqlProtocolStore
+from .sql_analysis_store import SqlAnalysisStore
 
 log = logging.getLogger(__name__)
 
 _protocol_directory = AppStateValue[Path]("protocol_directory")
 _protocol_store = AppStateValue[ProtocolStore]("protocol_store")
 _analysis_store = AppStateValue[AnalysisStore]("analysis_store")
+_analysis_cache = AppStateValue[AnalysisCache]("analysis_cache")
+_analysis_pool = AppStateValue[AnalysisPool]("analysis_pool")
+_simulator_pool = AppStateValue[SimulatorPool]("simulator_pool")
 
 
 def get_protocol_reader(
@@ -26,42 +38,118 @@ def get_protocol_reader(
     protocol_dir = _protocol_directory.get_from(app_state)
 
     if protocol_dir is None:
-        protocol_dir = Path(gettempdir()) / "opentrons-protocols"
+        persistence_dir = get_settings().persistence_directory
+
+        if persistence_dir is not None:
+            protocol_dir = persistence_dir / "protocols"
+        else:
+            protocol_dir = Path(gettempdir()) / "opentrons-protocols"
+
         _protocol_directory.set_on(app_state, protocol_dir)
         log.info(f"Storing protocols in {protocol_dir}")
 
     return ProtocolReader(directory=protocol_dir)
 
 
-def get_protocol_store(app_state: AppState = Depends(get_app_state)) -> ProtocolStore:
+def get_protocol_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_database: Optional[Connection] = Depends(get_sql_database),
+) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     protocol_store = _protocol_store.get_from(app_state)
 
     if protocol_store is None:
-        protocol_store = ProtocolStore()
+        if sql_database is None:
+            protocol_store = ProtocolStore()
+        else:
+            protocol_store = SqlProtocolStore(sql_database)
+
         _protocol_store.set_on(app_state, protocol_store)
 
     return protocol_store
 
 
-def get_analysis_store(app_state: AppState = Depends(get_app_state)) -> AnalysisStore:
+def get_analysis_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_database: Optional[Connection] = Depends(get_sql_database),
+) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore()
+        if sql_database is None:
+            analysis_store = AnalysisStore()
+        else:
+            analysis_store = SqlAnalysisStore(sql_database)
+
         _analysis_store.set_on(app_state, analysis_store)
 
     return analysis_store
 
 
+def get_analysis_cache(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[AnalysisCache]:
+    """Get a singleton AnalysisCache to reuse results of identical analyses."""
+    analysis_cache = _analysis_cache.get_from(app_state)
+    settings = get_settings()
+
+    if analysis_cache is None and settings.analysis_cache_size > 0:
+        if settings.persistence_directory is not None:
+            cache_dir = settings.persistence_directory / "analysis-cache"
+        else:
+            cache_dir = Path(gettempdir()) / "opentrons-analysis-cache"
+
+        analysis_cache = AnalysisCache(
+            directory=cache_dir,
+            max_entries=settings.analysis_cache_size,
+        )
+        _analysis_cache.set_on(app_state, analysis_cache)
+
+    return analysis_cache
+
+
+def get_analysis_pool(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[AnalysisPool]:
+    """Get a singleton AnalysisPool to run analyses in, if enabled."""
+    analysis_pool = _analysis_pool.get_from(app_state)
+    settings = get_settings()
+
+    if analysis_pool is None and settings.analysis_worker_count > 0:
+        analysis_pool = AnalysisPool(
+            worker_count=settings.analysis_worker_count,
+            timeout=settings.analysis_timeout,
+        )
+        _analysis_pool.set_on(app_state, analysis_pool)
+
+    return analysis_pool
+
+
+def get_simulator_pool(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[SimulatorPool]:
+    """Get a singleton SimulatorPool for in-process analyses, if enabled."""
+    simulator_pool = _simulator_pool.get_from(app_state)
+    settings = get_settings()
+
+    if simulator_pool is None and settings.simulator_pool_size > 0:
+        simulator_pool = SimulatorPool(max_idle=settings.simulator_pool_size)
+        _simulator_pool.set_on(app_state, simulator_pool)
+
+    return simulator_pool
+
+
 async def get_protocol_analyzer(
     analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_cache: Optional[AnalysisCache] = Depends(get_analysis_cache),
+    analysis_pool: Optional[AnalysisPool] = Depends(get_analysis_pool),
+    simulator_pool: Optional[SimulatorPool] = Depends(get_simulator_pool),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
         analysis_store=analysis_store,
+        analysis_cache=analysis_cache,
+        analysis_pool=analysis_pool,
+        simulator_pool=simulator_pool,
     )
@@ -1,10 +1,25 @@
 """Protocol analysis module."""
+import asyncio
 import logging
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
 
-from opentrons.protocol_runner import ProtocolRunner
+from anyio import to_thread
+
+from opentrons.hardware_control.simulator_pool import SimulatorPool
+from opentrons.protocol_engine import ErrorOccurrence
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import (
+    ProtocolRunner,
+    ProtocolRunData,
+    create_simulating_runner,
+)
 
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_cache import AnalysisCache
+from .analysis_pool import AnalysisPool, AnalysisError, AnalysisCancelledError
 
 
 log = logging.getLogger(__name__)
@@ -15,12 +30,24 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
         analysis_store: AnalysisStore,
+        protocol_runner: Optional[ProtocolRunner] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+        analysis_pool: Optional[AnalysisPool] = None,
+        simulator_pool: Optional[SimulatorPool] = None,
     ) -> None:
-        """Initialize the analyzer and its dependencies."""
+        """Initialize the analyzer and its dependencies.
+
+        If an `analysis_pool` is given, protocols are simulated in its
+        worker processes. Otherwise, they are simulated in the server's own
+        process, by `protocol_runner` if given, or else by a new simulating
+        runner using a hardware simulator from `simulator_pool`, if given.
+        """
         self._protocol_runner = protocol_runner
         self._analysis_store = analysis_store
+        self._analysis_cache = analysis_cache
+        self._analysis_pool = analysis_pool
+        self._simulator_pool = simulator_pool
 
     async def analyze(
         self,
@@ -28,10 +55,40 @@ class ProtocolAnalyzer:
         analysis_id: str,
     ) -> None:
         """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        source = protocol_resource.source
+        result = None
+
+        # The cache hashes protocol files and reads and writes its entries on
+        # disk, so use it from a worker thread to keep the event loop free
+        if self._analysis_cache is not None:
+            cache_key = await to_thread.run_sync(self._analysis_cache.get_key, source)
+            result = await to_thread.run_sync(self._analysis_cache.get, cache_key)
 
-        log.info(f'Completed analysis "{analysis_id}".')
+        if result is not None:
+            log.info(f'Completed analysis "{analysis_id}" from cache.')
+        else:
+            try:
+                result = await self._simulate(protocol_resource.protocol_id, source)
+            except asyncio.CancelledError:
+                log.info(f'Cancelled analysis "{analysis_id}".')
+                self._store_result(
+                    analysis_id, _create_failed_result(AnalysisCancelledError())
+                )
+                raise
+            except AnalysisError as e:
+                log.warning(f'Analysis "{analysis_id}" failed.', exc_info=e)
+                result = _create_failed_result(e)
+            else:
+                log.info(f'Completed analysis "{analysis_id}".')
 
+                if self._analysis_cache is not None:
+                    await to_thread.run_sync(
+                        self._analysis_cache.put, cache_key, result
+                    )
+
+        self._store_result(analysis_id, result)
+
+    def _store_result(self, analysis_id: str, result: ProtocolRunData) -> None:
         self._analysis_store.update(
             analysis_id=analysis_id,
             commands=result.commands,
@@ -39,3 +96,39 @@ class ProtocolAnalyzer:
             pipettes=result.pipettes,
             errors=result.errors,
         )
+
+    async def _simulate(
+        self,
+        protocol_id: str,
+        source: ProtocolSource,
+    ) -> ProtocolRunData:
+        if self._analysis_pool is not None:
+            return await self._analysis_pool.run(protocol_id=protocol_id, source=source)
+
+        if self._protocol_runner is not None:
+            return await self._protocol_runner.run(source)
+
+        if self._simulator_pool is None:
+            protocol_runner = await create_simulating_runner()
+            return await protocol_runner.run(source)
+
+        async with self._simulator_pool.simulator() as hardware_api:
+            protocol_runner = await create_simulating_runner(hardware_api=hardware_api)
+            return await protocol_runner.run(source)
+
+
+def _create_failed_result(error: AnalysisError) -> ProtocolRunData:
+    return ProtocolRunData(
+        commands=[],
+        errors=[
+            ErrorOccurrence(
+                id=str(uuid4()),
+                createdAt=datetime.now(tz=timezone.utc),
+                errorType=type(error).__name__,
+                detail=str(error),
+            )
+        ],
+        labware=[],
+        pipettes=[],
+        modules=[],
+    )
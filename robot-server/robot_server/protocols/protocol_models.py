@@ -1,7 +1,7 @@
 """Protocol file models."""
 from datetime import datetime
 from pydantic import BaseModel, Extra, Field
-from typing import Sequence
+from typing import Sequence, Union
 
 from opentrons.protocol_reader import (
     ProtocolType as ProtocolType,
@@ -9,7 +9,7 @@ from opentrons.protocol_reader import (
 )
 
 from robot_server.service.json_api import ResourceModel
-from .analysis_models import ProtocolAnalysis
+from .analysis_models import AnalysisSummary, ProtocolAnalysis
 
 
 class ProtocolFile(BaseModel):
@@ -72,9 +72,12 @@ class Protocol(ResourceModel):
     # be a better way (e.g. produce better OpenAPI) to represent an arbitrary JSON obj.
     metadata: Metadata
 
-    # TODO(mc, 2021-09-01): consider reporting summary objects here, with the
-    # option to `GET /protocols/:pid/analysis/:aid` if needed
-    analyses: Sequence[ProtocolAnalysis] = Field(
+    analyses: Sequence[Union[ProtocolAnalysis, AnalysisSummary]] = Field(
         ...,
-        description="An analysis of how the protocol is expected to run.",
+        description=(
+            "Analyses of how the protocol is expected to run."
+            " When listing all protocols with persistent storage enabled, only"
+            " each analysis' `id` and `status` are included; get the protocol"
+            " by ID for its full analyses."
+        ),
     )
@@ -55,6 +55,11 @@ class ProtocolStore:
         except KeyError as e:
             raise ProtocolNotFoundError(protocol_id) from e
 
+        self._remove_files(entry)
+
+        return entry
+
+    def _remove_files(self, entry: ProtocolResource) -> None:
         try:
             protocol_dir = entry.source.directory
             for file_path in entry.source.files:
@@ -62,8 +67,6 @@ class ProtocolStore:
             protocol_dir.rmdir()
         except Exception as e:
             log.warning(
-                f"Unable to delete all files for protocol {protocol_id}",
+                f"Unable to delete all files for protocol {entry.protocol_id}",
                 exc_info=e,
             )
-
-        return entry
@@ -4,7 +4,7 @@ import textwrap
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, File, UploadFile, status
-from typing import List
+from typing import List, Optional
 from typing_extensions import Literal
 
 from opentrons.protocol_reader import ProtocolReader, ProtocolFilesInvalidError
@@ -22,6 +22,7 @@ from robot_server.service.json_api import (
 
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_pool import AnalysisPool
 from .analysis_store import AnalysisStore
 from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
 from .dependencies import (
@@ -29,6 +30,7 @@ from .dependencies import (
     get_protocol_store,
     get_analysis_store,
     get_protocol_analyzer,
+    get_analysis_pool,
 )
 
 
@@ -145,6 +147,11 @@ async def create_protocol(
 @protocols_router.get(
     path="/protocols",
     summary="Get uploaded protocols",
+    description=(
+        "Get all uploaded protocols. If protocols are stored persistently,"
+        " each protocol's analyses are summarized by their `id` and `status`;"
+        " use `GET /protocols/{protocolId}` to get a protocol's full analyses."
+    ),
     responses={status.HTTP_200_OK: {"model": SimpleMultiBody[Protocol]}},
 )
 async def get_protocols(
@@ -164,7 +171,7 @@ async def get_protocols(
             createdAt=r.created_at,
             protocolType=r.source.config.protocol_type,
             metadata=Metadata.parse_obj(r.source.metadata),
-            analyses=analysis_store.get_by_protocol(r.protocol_id),
+            analyses=analysis_store.get_listed_by_protocol(r.protocol_id),
             files=[ProtocolFile(name=f.name, role=f.role) for f in r.source.files],
         )
         for r in protocol_resources
@@ -230,12 +237,14 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_pool: Optional[AnalysisPool] = Depends(get_analysis_pool),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_pool: Worker processes running protocol analyses, if enabled.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
@@ -243,6 +252,9 @@ async def delete_protocol_by_id(
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
+    if analysis_pool is not None:
+        analysis_pool.cancel(protocol_id=protocolId)
+
     return await PydanticResponse.create(
         content=SimpleEmptyBody.construct(),
         status_code=status.HTTP_200_OK,
@@ -0,0 +1,183 @@
+"""Protocol analysis storage in a SQLite database."""
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+from pydantic import parse_raw_as
+from pydantic.json import pydantic_encoder
+
+from opentrons.protocol_engine import (
+    Command,
+    ErrorOccurrence,
+    LoadedPipette,
+    LoadedLabware,
+)
+
+from .analysis_models import (
+    ProtocolAnalysis,
+    AnalysisStatus,
+    AnalysisSummary,
+    PendingAnalysis,
+    CompletedAnalysis,
+    AnalysisResult,
+)
+from .analysis_store import AnalysisStore
+from .command_parsing import parse_command_raw
+
+_AnalysisRow = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]
+
+
+class SqlAnalysisStore(AnalysisStore):
+    """Storage interface for protocol analyses in a SQLite database.
+
+    An analysis' commands are written in one bulk insert when the analysis
+    completes, and are only read back from disk when the full analysis is
+    requested, so old analyses do not take up any memory.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize a SqlAnalysisStore.
+
+        Analyses still pending in the database were interrupted by the
+        server stopping, and nothing will ever complete them, so they
+        are marked as failed.
+
+        Arguments:
+            connection: Open database connection, from `open_database`.
+        """
+        self._connection = connection
+
+        interrupted_ids = [
+            analysis_id
+            for (analysis_id,) in self._connection.execute(
+                "SELECT id FROM analysis WHERE result IS NULL"
+            ).fetchall()
+        ]
+
+        for analysis_id in interrupted_ids:
+            self.update(
+                analysis_id=analysis_id,
+                commands=[],
+                labware=[],
+                pipettes=[],
+                errors=[
+                    ErrorOccurrence(
+                        id=str(uuid4()),
+                        errorType="AnalysisInterruptedError",
+                        createdAt=datetime.now(tz=timezone.utc),
+                        detail="The robot server stopped before analysis completed.",
+                    )
+                ],
+            )
+
+    def add_pending(self, protocol_id: str, analysis_id: str) -> List[ProtocolAnalysis]:
+        """Add a pending analysis to the store."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO analysis (id, protocol_id) VALUES (?, ?)",
+                (analysis_id, protocol_id),
+            )
+
+        return self.get_by_protocol(protocol_id)
+
+    def update(
+        self,
+        analysis_id: str,
+        commands: List[Command],
+        labware: List[LoadedLabware],
+        pipettes: List[LoadedPipette],
+        errors: List[ErrorOccurrence],
+    ) -> None:
+        """Update analysis results in the store."""
+        if len(errors) > 0:
+            result = AnalysisResult.NOT_OK
+        else:
+            result = AnalysisResult.OK
+
+        with self._connection:
+            self._connection.execute(
+                "UPDATE analysis SET result = ?, labware = ?, pipettes = ?, errors = ?"
+                " WHERE id = ?",
+                (
+                    result.value,
+                    json.dumps(labware, default=pydantic_encoder),
+                    json.dumps(pipettes, default=pydantic_encoder),
+                    json.dumps(errors, default=pydantic_encoder),
+                    analysis_id,
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM analysis_command WHERE analysis_id = ?", (analysis_id,)
+            )
+            self._connection.executemany(
+                "INSERT INTO analysis_command (analysis_id, idx, command_type, command)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    (analysis_id, i, c.commandType, c.json())
+                    for i, c in enumerate(commands)
+                ),
+            )
+
+    def get_by_protocol(self, protocol_id: str) -> List[ProtocolAnalysis]:
+        """Get an analysis for a given protocol ID from the store."""
+        rows = self._connection.execute(
+            "SELECT id, result, labware, pipettes, errors FROM analysis"
+            " WHERE protocol_id = ? ORDER BY rowid",
+            (protocol_id,),
+        ).fetchall()
+
+        return [self._analysis_from_row(row) for row in rows]
+
+    def get_listed_by_protocol(
+        self, protocol_id: str
+    ) -> Sequence[Union[ProtocolAnalysis, AnalysisSummary]]:
+        """Get a protocol's analyses as listed with all protocols.
+
+        Reading every analysis' commands back from the database to list all
+        protocols would be slow, so these are only summaries.
+        """
+        return self.get_summaries_by_protocol(protocol_id)
+
+    def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
+        """Get the IDs and statuses of a protocol's analyses, without commands."""
+        rows = self._connection.execute(
+            "SELECT id, result IS NULL FROM analysis"
+            " WHERE protocol_id = ? ORDER BY rowid",
+            (protocol_id,),
+        )
+
+        return [
+            AnalysisSummary.construct(
+                id=analysis_id,
+                status=AnalysisStatus.PENDING if pending else AnalysisStatus.COMPLETED,
+            )
+            for analysis_id, pending in rows
+        ]
+
+    def _analysis_from_row(self, row: _AnalysisRow) -> ProtocolAnalysis:
+        analysis_id, result, labware, pipettes, errors = row
+
+        if result is None:
+            return PendingAnalysis.construct(id=analysis_id)
+
+        return CompletedAnalysis.construct(
+            id=analysis_id,
+            result=AnalysisResult(result),
+            commands=self._get_commands(analysis_id),
+            labware=parse_raw_as(List[LoadedLabware], labware or "[]"),
+            pipettes=parse_raw_as(List[LoadedPipette], pipettes or "[]"),
+            errors=parse_raw_as(List[ErrorOccurrence], errors or "[]"),
+        )
+
+    def _get_commands(self, analysis_id: str) -> List[Command]:
+        rows = self._connection.execute(
+            "SELECT command_type, command FROM analysis_command"
+            " WHERE analysis_id = ? ORDER BY idx",
+            (analysis_id,),
+        )
+
+        return [
+            parse_command_raw(command_type, command) for command_type, command in rows
+        ]
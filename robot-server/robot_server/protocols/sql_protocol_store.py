@@ -0,0 +1,164 @@
+"""Methods for saving and retrieving protocol files with a SQLite index."""
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from pydantic import parse_obj_as
+from pydantic.json import pydantic_encoder
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocol_reader import (
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolType,
+    JsonProtocolConfig,
+    PythonProtocolConfig,
+)
+
+from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
+
+_ProtocolRow = Tuple[
+    str, str, str, str, str, str, str, Optional[str], Optional[int], str
+]
+
+_SELECT_PROTOCOL = (
+    "SELECT id, created_at, directory, main_file, files, metadata,"
+    " protocol_type, api_version, schema_version, labware_definitions"
+    " FROM protocol"
+)
+
+
+class SqlProtocolStore(ProtocolStore):
+    """Methods for storing and retrieving protocol files in a SQLite database.
+
+    Protocol files themselves stay on disk where the ProtocolReader put
+    them; the database records where they are along with what was read
+    from them, as plain JSON that stays readable across software updates.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize a SqlProtocolStore.
+
+        Arguments:
+            connection: Open database connection, from `open_database`.
+        """
+        self._connection = connection
+
+    def upsert(self, resource: ProtocolResource) -> None:
+        """Upsert a protocol resource into the store."""
+        source = resource.source
+        config = source.config
+        api_version = None
+        schema_version = None
+
+        if isinstance(config, PythonProtocolConfig):
+            api_version = str(config.api_version)
+        else:
+            schema_version = config.schema_version
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO protocol"
+                " (id, created_at, directory, main_file, files, metadata,"
+                " protocol_type, api_version, schema_version, labware_definitions)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET"
+                " created_at = excluded.created_at,"
+                " directory = excluded.directory,"
+                " main_file = excluded.main_file,"
+                " files = excluded.files,"
+                " metadata = excluded.metadata,"
+                " protocol_type = excluded.protocol_type,"
+                " api_version = excluded.api_version,"
+                " schema_version = excluded.schema_version,"
+                " labware_definitions = excluded.labware_definitions",
+                (
+                    resource.protocol_id,
+                    resource.created_at.isoformat(),
+                    str(source.directory),
+                    str(source.main_file),
+                    json.dumps(
+                        [{"name": f.name, "role": f.role.value} for f in source.files]
+                    ),
+                    json.dumps(source.metadata),
+                    config.protocol_type.value,
+                    api_version,
+                    schema_version,
+                    json.dumps(source.labware_definitions, default=pydantic_encoder),
+                ),
+            )
+
+    def get(self, protocol_id: str) -> ProtocolResource:
+        """Get a single protocol by ID."""
+        row = self._connection.execute(
+            f"{_SELECT_PROTOCOL} WHERE id = ?", (protocol_id,)
+        ).fetchone()
+
+        if row is None:
+            raise ProtocolNotFoundError(protocol_id)
+
+        return _protocol_from_row(row)
+
+    def get_all(self) -> List[ProtocolResource]:
+        """Get all protocols currently saved in this store."""
+        rows = self._connection.execute(f"{_SELECT_PROTOCOL} ORDER BY rowid")
+        return [_protocol_from_row(row) for row in rows]
+
+    def remove(self, protocol_id: str) -> ProtocolResource:
+        """Remove a protocol from the store."""
+        entry = self.get(protocol_id)
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM protocol WHERE id = ?", (protocol_id,)
+            )
+
+        self._remove_files(entry)
+
+        return entry
+
+
+def _protocol_from_row(row: _ProtocolRow) -> ProtocolResource:
+    (
+        protocol_id,
+        created_at,
+        directory,
+        main_file,
+        files,
+        metadata,
+        protocol_type,
+        api_version,
+        schema_version,
+        labware_definitions,
+    ) = row
+
+    config: Union[JsonProtocolConfig, PythonProtocolConfig]
+
+    if ProtocolType(protocol_type) == ProtocolType.PYTHON:
+        assert api_version is not None, "Python protocol saved without API version"
+        config = PythonProtocolConfig(api_version=APIVersion.from_string(api_version))
+    else:
+        assert schema_version is not None, "JSON protocol saved without schema"
+        config = JsonProtocolConfig(schema_version=schema_version)
+
+    return ProtocolResource(
+        protocol_id=protocol_id,
+        created_at=datetime.fromisoformat(created_at),
+        source=ProtocolSource(
+            directory=Path(directory),
+            main_file=Path(main_file),
+            files=[
+                ProtocolSourceFile(name=f["name"], role=ProtocolFileRole(f["role"]))
+                for f in json.loads(files)
+            ],
+            metadata=json.loads(metadata),
+            config=config,
+            labware_definitions=parse_obj_as(
+                List[LabwareDefinition], json.loads(labware_definitions)
+            ),
+        ),
+    )
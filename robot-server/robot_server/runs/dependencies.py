@@ -1,25 +1,33 @@
 """Run router dependency-injection wire-up."""
+from sqlite3 import Connection
+from typing import Optional
+
 from fastapi import Depends
 
 from opentrons.hardware_control import HardwareControlAPI
 
 from robot_server.app_state import AppState, AppStateValue, get_app_state
 from robot_server.hardware import get_hardware
+from robot_server.persistence import get_sql_database
 
 from .engine_store import EngineStore
 from .run_store import RunStore
+from .sql_run_store import SqlRunStore
 
 
 _run_store = AppStateValue[RunStore]("run_store")
 _engine_store = AppStateValue[EngineStore]("engine_store")
 
 
-def get_run_store(app_state: AppState = Depends(get_app_state)) -> RunStore:
+def get_run_store(
+    app_state: AppState = Depends(get_app_state),
+    sql_database: Optional[Connection] = Depends(get_sql_database),
+) -> RunStore:
     """Get a singleton RunStore to keep track of created runs."""
     run_store = _run_store.get_from(app_state)
 
     if run_store is None:
-        run_store = RunStore()
+        run_store = RunStore() if sql_database is None else SqlRunStore(sql_database)
         _run_store.set_on(app_state, run_store)
 
     return run_store
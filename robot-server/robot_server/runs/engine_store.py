@@ -24,6 +24,7 @@ class EngineConflictError(RuntimeError):
 class RunnerEnginePair(NamedTuple):
     """A stored ProtocolRunner/ProtocolEngine pair."""
 
+    run_id: str
     runner: ProtocolRunner
     engine: ProtocolEngine
 
@@ -55,6 +56,13 @@ class EngineStore:
 
         return self._runner_engine_pair.engine
 
+    def get_current_run_id(self) -> Optional[str]:
+        """Get the ID of the run the "current" engine belongs to, if any."""
+        if self._runner_engine_pair is None:
+            return None
+
+        return self._runner_engine_pair.run_id
+
     @property
     def runner(self) -> ProtocolRunner:
         """Get the "current" persisted ProtocolRunner.
@@ -85,7 +93,11 @@ class EngineStore:
 
         await self.clear()
 
-        self._runner_engine_pair = RunnerEnginePair(runner=runner, engine=engine)
+        self._runner_engine_pair = RunnerEnginePair(
+            run_id=run_id,
+            runner=runner,
+            engine=engine,
+        )
         self._engines_by_run_id[run_id] = engine
 
         return engine.state_view
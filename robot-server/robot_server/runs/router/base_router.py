@@ -10,6 +10,8 @@ from typing_extensions import Literal
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
+from opentrons.protocol_engine import EngineStatus, StateView
+
 from robot_server.errors import ErrorDetails, ErrorBody
 from robot_server.service.dependencies import get_current_time, get_unique_id
 from robot_server.service.task_runner import TaskRunner
@@ -25,15 +27,16 @@ from robot_server.service.json_api import (
 
 from robot_server.protocols import (
     ProtocolStore,
+    ProtocolResource,
     ProtocolNotFound,
     ProtocolNotFoundError,
     get_protocol_store,
 )
 
-from ..run_store import RunStore, RunResource, RunNotFoundError
+from ..run_store import RunStore, RunResource, RunNotFoundError, StateSummary
 from ..run_view import RunView
 from ..run_models import Run, RunSummary, RunCreate, RunUpdate
-from ..engine_store import EngineStore, EngineConflictError
+from ..engine_store import EngineStore, EngineConflictError, EngineMissingError
 from ..dependencies import get_run_store, get_engine_store
 
 
@@ -82,6 +85,53 @@ class AllRunsLinks(BaseModel):
     )
 
 
+def _summarize_state(engine_state: StateView) -> StateSummary:
+    return StateSummary.construct(
+        status=engine_state.commands.get_status(),
+        errors=engine_state.commands.get_all_errors(),
+        pipettes=engine_state.pipettes.get_all(),
+        labware=engine_state.labware.get_all(),
+        labwareOffsets=engine_state.labware.get_labware_offsets(),
+    )
+
+
+def _get_state_summary(
+    run_id: str,
+    run_store: RunStore,
+    engine_store: EngineStore,
+) -> StateSummary:
+    """Get a summary of a run's engine state, even if its engine is gone.
+
+    Engines are not kept across server restarts. Runs from before a restart
+    use the summary saved when they stopped being current, or, if the server
+    stopped while they were current, are reported as stopped.
+    """
+    try:
+        return _summarize_state(engine_store.get_state(run_id))
+    except EngineMissingError:
+        return run_store.get_state_summary(run_id) or StateSummary.construct(
+            status=EngineStatus.STOPPED,
+            errors=[],
+            pipettes=[],
+            labware=[],
+            labwareOffsets=[],
+        )
+
+
+def _get_protocol_resource(
+    protocol_id: Optional[str],
+    protocol_store: ProtocolStore,
+) -> Optional[ProtocolResource]:
+    """Get the protocol a new run is for, if any, or raise a 404."""
+    if protocol_id is None:
+        return None
+
+    try:
+        return protocol_store.get(protocol_id=protocol_id)
+    except ProtocolNotFoundError as e:
+        raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
+
+
 async def get_run_data_from_url(
     runId: str,
     run_store: RunStore = Depends(get_run_store),
@@ -99,7 +149,7 @@ async def get_run_data_from_url(
     except RunNotFoundError as e:
         raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
-    engine_state = engine_store.get_state(run.run_id)
+    state_summary = _get_state_summary(run.run_id, run_store, engine_store)
 
     return Run.construct(
         id=run.run_id,
@@ -107,11 +157,11 @@ async def get_run_data_from_url(
         createdAt=run.created_at,
         current=run.is_current,
         actions=run.actions,
-        errors=engine_state.commands.get_all_errors(),
-        pipettes=engine_state.pipettes.get_all(),
-        labware=engine_state.labware.get_all(),
-        labwareOffsets=engine_state.labware.get_labware_offsets(),
-        status=engine_state.commands.get_status(),
+        errors=state_summary.errors,
+        pipettes=state_summary.pipettes,
+        labware=state_summary.labware,
+        labwareOffsets=state_summary.labwareOffsets,
+        status=state_summary.status,
     )
 
 
@@ -147,19 +197,21 @@ async def create_run(
         task_runner: Background task runner.
     """
     protocol_id = request_body.data.protocolId if request_body is not None else None
-    protocol_resource = None
+    protocol_resource = _get_protocol_resource(protocol_id, protocol_store)
 
-    if protocol_id is not None:
-        try:
-            protocol_resource = protocol_store.get(protocol_id=protocol_id)
-        except ProtocolNotFoundError as e:
-            raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
+    prev_run_id = engine_store.get_current_run_id()
 
     try:
         engine_state = await engine_store.create(run_id=run_id)
     except EngineConflictError as e:
         raise RunAlreadyActive(detail=str(e)).as_error(status.HTTP_409_CONFLICT)
 
+    if prev_run_id is not None:
+        run_store.update_state_summary(
+            run_id=prev_run_id,
+            summary=_summarize_state(engine_store.get_state(prev_run_id)),
+        )
+
     if request_body is not None:
         for offset_request in request_body.data.labwareOffsets:
             engine_store.engine.add_labware_offset(offset_request)
@@ -220,13 +272,13 @@ async def get_runs(
 
     for run in run_store.get_all():
         run_id = run.run_id
-        engine_state = engine_store.get_state(run_id)
+        state_summary = _get_state_summary(run_id, run_store, engine_store)
         run_data = RunSummary.construct(
             id=run_id,
             protocolId=run.protocol_id,
             createdAt=run.created_at,
             current=run.is_current,
-            status=engine_state.commands.get_status(),
+            status=state_summary.status,
         )
 
         data.append(run_data)
@@ -348,9 +400,13 @@ async def update_run(
             raise RunNotIdle().as_error(status.HTTP_409_CONFLICT)
 
         run_store.upsert(run)
+        run_store.update_state_summary(
+            run_id=run.run_id,
+            summary=_summarize_state(engine_store.get_state(run.run_id)),
+        )
         log.info(f'Marked run "{runId}" as not current.')
 
-    engine_state = engine_store.get_state(run.run_id)
+    state_summary = _get_state_summary(run.run_id, run_store, engine_store)
 
     data = Run.construct(
         id=run.run_id,
@@ -358,11 +414,11 @@ async def update_run(
         createdAt=run.created_at,
         current=run.is_current,
         actions=run.actions,
-        errors=engine_state.commands.get_all_errors(),
-        pipettes=engine_state.pipettes.get_all(),
-        labware=engine_state.labware.get_all(),
-        labwareOffsets=engine_state.labware.get_labware_offsets(),
-        status=engine_state.commands.get_status(),
+        errors=state_summary.errors,
+        pipettes=state_summary.pipettes,
+        labware=state_summary.labware,
+        labwareOffsets=state_summary.labwareOffsets,
+        status=state_summary.status,
     )
 
     return await PydanticResponse.create(
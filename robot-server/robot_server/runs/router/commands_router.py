@@ -1,25 +1,28 @@
 """Router for /runs commands endpoints."""
 from asyncio import wait_for, TimeoutError as AsyncioTimeoutError
 from datetime import datetime
-from typing import Optional, Union
+from typing import AsyncIterator, Optional, Union
 from typing_extensions import Final, Literal
 
 from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel, Field
+from starlette.responses import StreamingResponse
 
 from opentrons.protocol_engine import commands as pe_commands, errors as pe_errors
+from opentrons.protocol_engine.state.commands import CommandStore, CommandView
 
 from robot_server.errors import ErrorDetails, ErrorBody
 from robot_server.service.json_api import (
     RequestModel,
     SimpleBody,
+    SimpleMultiBody,
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
 )
 
 from ..run_models import Run, RunCommandSummary
-from ..engine_store import EngineStore
+from ..engine_store import EngineStore, EngineMissingError
 from ..dependencies import get_engine_store
 from .base_router import RunNotFound, RunStopped, get_run_data_from_url
 
@@ -66,6 +69,16 @@ class CommandCollectionLinks(BaseModel):
     )
 
 
+class CommandUpdate(BaseModel):
+    """A single line of a streamed command updates response."""
+
+    cursor: int = Field(
+        ...,
+        description="The update cursor to resume from after this update.",
+    )
+    data: RunCommandSummary = Field(..., description="The added or changed command.")
+
+
 @commands_router.post(
     path="/runs/{runId}/commands",
     summary="Enqueue a protocol command",
@@ -192,24 +205,11 @@ async def get_run_commands(
         cursor: Cursor index for the collection response.
         pageLength: Maximum number of items to return.
     """
-    state = engine_store.get_state(run.id)
-    current_command = state.commands.get_current()
-    command_slice = state.commands.get_slice(cursor=cursor, length=pageLength)
-
-    data = [
-        RunCommandSummary.construct(
-            id=c.id,
-            key=c.key,
-            commandType=c.commandType,
-            status=c.status,
-            createdAt=c.createdAt,
-            startedAt=c.startedAt,
-            completedAt=c.completedAt,
-            params=c.params,
-            errorId=c.errorId,
-        )
-        for c in command_slice.commands
-    ]
+    commands = _get_command_view(engine_store, run.id)
+    current_command = commands.get_current()
+    command_slice = commands.get_slice(cursor=cursor, length=pageLength)
+
+    data = [_summarize_command(c) for c in command_slice.commands]
 
     meta = MultiBodyMeta(
         cursor=command_slice.cursor,
@@ -236,6 +236,92 @@ async def get_run_commands(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/command_updates",
+    summary="Get the commands that have been added or changed in the run",
+    description=(
+        "Get summaries of only the commands that have been added or changed"
+        " since a given update cursor. To follow a run as it progresses,"
+        " start with a `cursor` of `0`, and pass the returned `meta.cursor`"
+        " as the `cursor` of the next request."
+        "\n\n"
+        "If nothing has changed since `cursor` and the run is current,"
+        " the request waits until a command changes, the run stops,"
+        " or `timeout` is reached before returning."
+        "\n\n"
+        "If `stream` is `true`, the response is instead a newline-delimited"
+        " JSON (`application/x-ndjson`) stream of"
+        ' `{"cursor": ..., "data": ...}` objects, one per command update,'
+        " that stays open until the run stops or is no longer current."
+    ),
+    responses={
+        status.HTTP_200_OK: {"model": SimpleMultiBody[RunCommandSummary]},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+    },
+)
+async def get_run_command_updates(
+    engine_store: EngineStore = Depends(get_engine_store),
+    run: Run = Depends(get_run_data_from_url),
+    cursor: int = Query(
+        default=0,
+        ge=0,
+        description="The update cursor returned by a previous request.",
+    ),
+    stream: bool = Query(
+        default=False,
+        description=(
+            "If `true`, stream updates as newline-delimited JSON"
+            " instead of returning a single response."
+        ),
+    ),
+    timeout: int = Query(
+        default=30_000,
+        gt=0,
+        description=(
+            "If `stream` is `false`, the maximum number of milliseconds"
+            " to wait for updates before returning an empty response."
+        ),
+    ),
+) -> Union[PydanticResponse[SimpleMultiBody[RunCommandSummary]], StreamingResponse]:
+    """Get the commands added or changed in a run since an update cursor.
+
+    Arguments:
+        engine_store: Protocol engine and runner storage.
+        run: Run response model, provided by the route handler for `GET /runs/{runId}`
+        cursor: Update cursor to get changes after.
+        stream: Whether to stream updates as newline-delimited JSON.
+        timeout: Maximum time, in milliseconds, to wait for an update.
+    """
+    commands = _get_command_view(engine_store, run.id)
+
+    if stream:
+        return StreamingResponse(
+            _stream_command_updates(engine_store, run, cursor),
+            media_type="application/x-ndjson",
+        )
+
+    if run.current and not commands.get_has_updates_or_stopped(cursor):
+        try:
+            await wait_for(
+                engine_store.engine.wait_for_command_updates(cursor),
+                timeout=timeout / 1000,
+            )
+        except AsyncioTimeoutError:
+            pass
+
+    updates = commands.get_updates(cursor)
+    data = [_summarize_command(c) for c in updates.commands]
+    meta = MultiBodyMeta(
+        cursor=updates.cursor,
+        totalLength=commands.get_count(),
+    )
+
+    return await PydanticResponse.create(
+        content=SimpleMultiBody.construct(data=data, meta=meta),
+        status_code=status.HTTP_200_OK,
+    )
+
+
 @commands_router.get(
     path="/runs/{runId}/commands/{commandId}",
     summary="Get full details about a specific command in the run",
@@ -264,9 +350,8 @@ async def get_run_command(
             `GET /run/{runId}`. Present to ensure 404 if run
             not found.
     """
-    engine_state = engine_store.get_state(run.id)
     try:
-        command = engine_state.commands.get(commandId)
+        command = _get_command_view(engine_store, run.id).get(commandId)
     except pe_errors.CommandDoesNotExistError as e:
         raise CommandNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
@@ -274,3 +359,54 @@ async def get_run_command(
         content=SimpleBody.construct(data=command),
         status_code=status.HTTP_200_OK,
     )
+
+
+def _get_command_view(engine_store: EngineStore, run_id: str) -> CommandView:
+    """Get a run's commands, or no commands if its engine is gone.
+
+    Engines are not persisted, so runs from before a restart have none.
+    """
+    try:
+        return engine_store.get_state(run_id).commands
+    except EngineMissingError:
+        return CommandView(CommandStore().state)
+
+
+def _summarize_command(command: pe_commands.Command) -> RunCommandSummary:
+    return RunCommandSummary.construct(
+        id=command.id,
+        key=command.key,
+        commandType=command.commandType,
+        status=command.status,
+        createdAt=command.createdAt,
+        startedAt=command.startedAt,
+        completedAt=command.completedAt,
+        params=command.params,
+        errorId=command.errorId,
+    )
+
+
+async def _stream_command_updates(
+    engine_store: EngineStore,
+    run: Run,
+    cursor: int,
+) -> AsyncIterator[bytes]:
+    commands = _get_command_view(engine_store, run.id)
+    # hold onto this run's engine, in case another run becomes current mid-stream
+    engine = engine_store.engine if run.current else None
+
+    while True:
+        updates = commands.get_updates(cursor)
+        cursor = updates.cursor
+
+        for command, command_cursor in zip(updates.commands, updates.cursors):
+            line = CommandUpdate.construct(
+                cursor=command_cursor,
+                data=_summarize_command(command),
+            )
+            yield line.json().encode() + b"\n"
+
+        if engine is None or commands.get_is_stopped():
+            break
+
+        await engine.wait_for_command_updates(cursor)
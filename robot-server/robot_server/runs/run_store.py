@@ -3,6 +3,16 @@ from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from pydantic import BaseModel
+
+from opentrons.protocol_engine import (
+    EngineStatus,
+    ErrorOccurrence,
+    LabwareOffset,
+    LoadedLabware,
+    LoadedPipette,
+)
+
 from .action_models import RunAction
 
 
@@ -21,6 +31,21 @@ class RunResource:
     is_current: bool
 
 
+class StateSummary(BaseModel):
+    """A saved summary of a run's ProtocolEngine state.
+
+    Engines only live in memory, so a run that has been replaced as the
+    current run keeps this summary for when its engine is no longer around,
+    for example after the server restarts.
+    """
+
+    status: EngineStatus
+    errors: List[ErrorOccurrence]
+    pipettes: List[LoadedPipette]
+    labware: List[LoadedLabware]
+    labwareOffsets: List[LabwareOffset]
+
+
 class RunNotFoundError(ValueError):
     """Error raised when a given Run ID is not found in the store."""
 
@@ -35,6 +60,7 @@ class RunStore:
     def __init__(self) -> None:
         """Initialize a RunStore and its in-memory storage."""
         self._runs_by_id: Dict[str, RunResource] = {}
+        self._state_summaries_by_id: Dict[str, StateSummary] = {}
 
     def upsert(self, run: RunResource) -> RunResource:
         """Insert or update a run resource in the store.
@@ -89,7 +115,27 @@ class RunStore:
         Raises:
             RunNotFoundError: The specified run ID was not found.
         """
+        self._state_summaries_by_id.pop(run_id, None)
+
         try:
             return self._runs_by_id.pop(run_id)
         except KeyError as e:
             raise RunNotFoundError(run_id) from e
+
+    def update_state_summary(self, run_id: str, summary: StateSummary) -> None:
+        """Save a summary of a run's engine state.
+
+        Arguments:
+            run_id: The run's unique identifier. No-op if the run is not stored.
+            summary: The run's latest engine state.
+        """
+        if run_id in self._runs_by_id:
+            self._state_summaries_by_id[run_id] = summary
+
+    def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+        """Get the saved summary of a run's engine state, if any.
+
+        Arguments:
+            run_id: The run's unique identifier.
+        """
+        return self._state_summaries_by_id.get(run_id)
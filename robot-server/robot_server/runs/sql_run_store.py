@@ -0,0 +1,155 @@
+"""Runs' disk-backed store."""
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from pydantic import parse_raw_as
+from pydantic.json import pydantic_encoder
+
+from .action_models import RunAction
+from .run_store import RunStore, RunResource, RunNotFoundError, StateSummary
+
+_RunRow = Tuple[str, str, str, str, int]
+
+_SELECT_RUN = "SELECT id, protocol_id, created_at, actions, is_current FROM run"
+
+
+class SqlRunStore(RunStore):
+    """Methods for storing and retrieving run resources in a SQLite database."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize a SqlRunStore.
+
+        Engines do not outlive the server process, so any run that was
+        current when the database was last used is marked as not current.
+
+        Arguments:
+            connection: Open database connection, from `open_database`.
+        """
+        self._connection = connection
+
+        with self._connection:
+            self._connection.execute("UPDATE run SET is_current = 0 WHERE is_current")
+
+    def upsert(self, run: RunResource) -> RunResource:
+        """Insert or update a run resource in the store.
+
+        Arguments:
+            run: Run resource to store. Reads `run.id` to
+                determine identity in storage.
+
+        Returns:
+            The resource that was added to the store.
+        """
+        with self._connection:
+            if run.is_current is True:
+                self._connection.execute(
+                    "UPDATE run SET is_current = 0 WHERE is_current AND id != ?",
+                    (run.run_id,),
+                )
+
+            self._connection.execute(
+                "INSERT INTO run (id, protocol_id, created_at, actions, is_current)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET"
+                " protocol_id = excluded.protocol_id,"
+                " created_at = excluded.created_at,"
+                " actions = excluded.actions,"
+                " is_current = excluded.is_current",
+                (
+                    run.run_id,
+                    run.protocol_id,
+                    run.created_at.isoformat(),
+                    json.dumps(run.actions, default=pydantic_encoder),
+                    run.is_current,
+                ),
+            )
+
+        return run
+
+    def get(self, run_id: str) -> RunResource:
+        """Get a specific run entry by its identifier.
+
+        Arguments:
+            run_id: Unique identifier of run entry to retrieve.
+
+        Returns:
+            The retrieved run entry from the store.
+        """
+        row = self._connection.execute(
+            f"{_SELECT_RUN} WHERE id = ?", (run_id,)
+        ).fetchone()
+
+        if row is None:
+            raise RunNotFoundError(run_id)
+
+        return _run_from_row(row)
+
+    def get_all(self) -> List[RunResource]:
+        """Get all known run resources.
+
+        Returns:
+            All stored run entries, in the order they were first added.
+        """
+        rows = self._connection.execute(f"{_SELECT_RUN} ORDER BY rowid")
+        return [_run_from_row(row) for row in rows]
+
+    def remove(self, run_id: str) -> RunResource:
+        """Remove a run by its unique identifier.
+
+        Arguments:
+            run_id: The run's unique identifier.
+
+        Returns:
+            The run entry that was deleted.
+
+        Raises:
+            RunNotFoundError: The specified run ID was not found.
+        """
+        run = self.get(run_id)
+
+        with self._connection:
+            self._connection.execute("DELETE FROM run WHERE id = ?", (run_id,))
+
+        return run
+
+    def update_state_summary(self, run_id: str, summary: StateSummary) -> None:
+        """Save a summary of a run's engine state.
+
+        Arguments:
+            run_id: The run's unique identifier. No-op if the run is not stored.
+            summary: The run's latest engine state.
+        """
+        with self._connection:
+            self._connection.execute(
+                "UPDATE run SET state_summary = ? WHERE id = ?",
+                (summary.json(), run_id),
+            )
+
+    def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
+        """Get the saved summary of a run's engine state, if any.
+
+        Arguments:
+            run_id: The run's unique identifier.
+        """
+        row = self._connection.execute(
+            "SELECT state_summary FROM run WHERE id = ?", (run_id,)
+        ).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        return StateSummary.parse_raw(row[0])
+
+
+def _run_from_row(row: _RunRow) -> RunResource:
+    run_id, protocol_id, created_at, actions, is_current = row
+
+    return RunResource(
+        run_id=run_id,
+        protocol_id=protocol_id,
+        created_at=datetime.fromisoformat(created_at),
+        actions=parse_raw_as(List[RunAction], actions),
+        is_current=bool(is_current),
+    )
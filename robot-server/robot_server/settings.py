@@ -72,6 +72,50 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    persistence_directory: typing.Optional[Path] = Field(
+        None,
+        description=(
+            "A directory to store protocols, runs, and analyses in, so they"
+            " survive a server restart. If not set, they are only kept in memory."
+        ),
+    )
+
+    analysis_cache_size: int = Field(
+        0,
+        description=(
+            "The number of protocol analyses to cache on disk, so re-uploading"
+            " an identical protocol does not need a new simulation."
+            " 0, the default, disables the cache."
+        ),
+    )
+
+    analysis_worker_count: int = Field(
+        0,
+        description=(
+            "The number of worker processes to run protocol analyses in, at most"
+            " one analysis per worker at a time. If 0, analyses run inside the"
+            " server process instead."
+        ),
+    )
+
+    analysis_timeout: float = Field(
+        300.0,
+        description=(
+            "The maximum number of seconds an analysis may run for in a worker"
+            " process before it is stopped and marked as failed."
+        ),
+    )
+
+    simulator_pool_size: int = Field(
+        0,
+        description=(
+            "The number of built and homed hardware simulators to keep for"
+            " protocol analyses that run inside the server process, so each"
+            " analysis need not build its own. The pool is disabled by default;"
+            " set to a positive number to enable it."
+        ),
+    )
+
     notification_server_subscriber_address: str = Field(
         "tcp://localhost:5555",
         description="The endpoint to subscribe to notification server topics.",
@@ -1,4 +1,5 @@
 import signal
+import sqlite3
 import subprocess
 import time
 import sys
@@ -29,6 +30,7 @@ from opentrons.protocols.geometry.deck import Deck
 
 from robot_server import app
 from robot_server.hardware import get_hardware
+from robot_server.persistence import open_database
 from robot_server.versioning import API_VERSION_HEADER, LATEST_API_VERSION_HEADER_VALUE
 from robot_server.service.session.manager import SessionManager
 
@@ -378,3 +380,11 @@ def clear_custom_tiprack_def_dir() -> Iterator[None]:
         os.remove(tiprack_path)
     except FileNotFoundError:
         pass
+
+
+@pytest.fixture
+def sql_database(tmp_path: pathlib.Path) -> Iterator[sqlite3.Connection]:
+    """Get a fresh SQLite database in a temporary directory."""
+    connection = open_database(tmp_path)
+    yield connection
+    connection.close()
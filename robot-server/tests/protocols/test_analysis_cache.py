@@ -0,0 +1,106 @@
+"""Tests for the AnalysisCache."""
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+from opentrons.types import MountType
+from opentrons.protocol_engine import commands as pe_commands, types as pe_types
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+)
+from opentrons.protocol_runner import ProtocolRunData
+
+from robot_server.protocols.analysis_cache import AnalysisCache
+
+
+@pytest.fixture
+def subject(tmp_path: Path) -> AnalysisCache:
+    """Get an AnalysisCache test subject."""
+    return AnalysisCache(directory=tmp_path / "cache", max_entries=2)
+
+
+def _make_source(directory: Path, contents: str) -> ProtocolSource:
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "protocol.json").write_text(contents)
+
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / "protocol.json",
+        config=JsonProtocolConfig(schema_version=6),
+        files=[ProtocolSourceFile(name="protocol.json", role=ProtocolFileRole.MAIN)],
+        metadata={},
+        labware_definitions=[],
+    )
+
+
+def _make_result(message: str) -> ProtocolRunData:
+    return ProtocolRunData(
+        commands=[
+            pe_commands.Pause(
+                id="command-id",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2022, month=2, day=2),
+                params=pe_commands.PauseParams(message=message),
+                result=pe_commands.PauseResult(),
+            )
+        ],
+        errors=[],
+        labware=[],
+        pipettes=[
+            pe_types.LoadedPipette(
+                id="pipette-id",
+                pipetteName=pe_types.PipetteName.P300_SINGLE,
+                mount=MountType.LEFT,
+            )
+        ],
+        modules=[],
+    )
+
+
+def test_get_key_by_contents(tmp_path: Path, subject: AnalysisCache) -> None:
+    """It should key protocols by their contents, not their location."""
+    key_1 = subject.get_key(_make_source(tmp_path / "protocol-1", "{}"))
+    key_2 = subject.get_key(_make_source(tmp_path / "protocol-2", "{}"))
+    key_3 = subject.get_key(_make_source(tmp_path / "protocol-3", "{ }"))
+
+    assert key_1 == key_2
+    assert key_1 != key_3
+
+
+def test_get_missing(subject: AnalysisCache) -> None:
+    """It should return None for a key that has not been stored."""
+    assert subject.get("abc") is None
+
+
+def test_put_and_get(subject: AnalysisCache) -> None:
+    """It should store a result and read it back."""
+    result = _make_result("hello")
+
+    subject.put("abc", result)
+
+    assert subject.get("abc") == result
+
+
+def test_evicts_least_recently_used(subject: AnalysisCache) -> None:
+    """It should evict the least recently used entry when full."""
+    subject.put("a", _make_result("a"))
+    subject.put("b", _make_result("b"))
+    subject.get("a")
+    subject.put("c", _make_result("c"))
+
+    assert subject.get("a") == _make_result("a")
+    assert subject.get("b") is None
+    assert subject.get("c") == _make_result("c")
+
+
+def test_discards_bad_entry(tmp_path: Path, subject: AnalysisCache) -> None:
+    """It should discard an entry that cannot be read."""
+    subject.put("abc", _make_result("hello"))
+    (tmp_path / "cache" / "abc.json").write_text("oh no")
+
+    assert subject.get("abc") is None
+    assert not (tmp_path / "cache" / "abc.json").exists()
@@ -0,0 +1,82 @@
+"""Tests for the AnalysisPool."""
+import asyncio
+import pytest
+import textwrap
+from pathlib import Path
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    PythonProtocolConfig,
+)
+
+from robot_server.protocols.analysis_pool import (
+    AnalysisPool,
+    AnalysisTimeoutError,
+)
+
+
+@pytest.fixture
+def protocol_source(tmp_path: Path) -> ProtocolSource:
+    """Get a minimal Python protocol that pauses once."""
+    main_file = tmp_path / "protocol.py"
+    main_file.write_text(
+        textwrap.dedent(
+            """
+            metadata = {"apiLevel": "2.11"}
+
+            def run(ctx):
+                ctx.pause("hello world")
+            """
+        )
+    )
+
+    return ProtocolSource(
+        directory=tmp_path,
+        main_file=main_file,
+        config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+        files=[ProtocolSourceFile(name="protocol.py", role=ProtocolFileRole.MAIN)],
+        metadata={"apiLevel": "2.11"},
+        labware_definitions=[],
+    )
+
+
+async def test_run(protocol_source: ProtocolSource) -> None:
+    """It should simulate a protocol in a worker process."""
+    subject = AnalysisPool(worker_count=1, timeout=60)
+
+    result = await subject.run(protocol_id="protocol-id", source=protocol_source)
+
+    assert [c.commandType for c in result.commands] == ["pause"]
+    assert result.errors == []
+
+
+async def test_run_timeout(protocol_source: ProtocolSource) -> None:
+    """It should stop an analysis that runs past its timeout."""
+    subject = AnalysisPool(worker_count=1, timeout=0.001)
+
+    with pytest.raises(AnalysisTimeoutError):
+        await subject.run(protocol_id="protocol-id", source=protocol_source)
+
+
+async def test_cancel(protocol_source: ProtocolSource) -> None:
+    """It should cancel running and waiting analyses of a protocol."""
+    subject = AnalysisPool(worker_count=1, timeout=60)
+
+    running = asyncio.ensure_future(
+        subject.run(protocol_id="protocol-id", source=protocol_source)
+    )
+    waiting = asyncio.ensure_future(
+        subject.run(protocol_id="protocol-id", source=protocol_source)
+    )
+    await asyncio.sleep(0)
+
+    subject.cancel(protocol_id="protocol-id")
+
+    with pytest.raises(asyncio.CancelledError):
+        await running
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
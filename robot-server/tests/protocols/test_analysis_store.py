@@ -34,6 +34,30 @@ def test_add_pending() -> None:
     assert result == [PendingAnalysis(id="analysis-id")]
 
 
+def test_get_listed_full_analyses() -> None:
+    """It should list a protocol's full analyses."""
+    subject = AnalysisStore()
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    subject.update(
+        analysis_id="analysis-id",
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+    assert subject.get_listed_by_protocol("protocol-id") == [
+        CompletedAnalysis(
+            id="analysis-id",
+            result=AnalysisResult.OK,
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+    ]
+
+
 def test_add_analysis_equipment() -> None:
     """It should add labware and pipettes to the stored analysis."""
     labware = pe_types.LoadedLabware(
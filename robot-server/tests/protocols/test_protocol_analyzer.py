@@ -1,9 +1,12 @@
 """Tests for the ProtocolAnalyzer."""
+import asyncio
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
+from opentrons.hardware_control import HardwareControlAPI
+from opentrons.hardware_control.simulator_pool import SimulatorPool
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocol_engine import (
     commands as pe_commands,
@@ -13,8 +16,11 @@ from opentrons.protocol_engine import (
 from opentrons.protocol_runner import ProtocolRunner, ProtocolRunData
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
+from robot_server.protocols.analysis_cache import AnalysisCache
+from robot_server.protocols.analysis_pool import AnalysisPool, AnalysisTimeoutError
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_store import ProtocolResource
+from robot_server.protocols import protocol_analyzer
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
@@ -30,6 +36,18 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
     return decoy.mock(cls=AnalysisStore)
 
 
+@pytest.fixture
+def analysis_cache(decoy: Decoy) -> AnalysisCache:
+    """Get a mocked out AnalysisCache."""
+    return decoy.mock(cls=AnalysisCache)
+
+
+@pytest.fixture
+def analysis_pool(decoy: Decoy) -> AnalysisPool:
+    """Get a mocked out AnalysisPool."""
+    return decoy.mock(cls=AnalysisPool)
+
+
 @pytest.fixture
 def subject(
     protocol_runner: ProtocolRunner,
@@ -42,6 +60,43 @@ def subject(
     )
 
 
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a ProtocolResource to analyze."""
+    return ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            labware_definitions=[],
+        ),
+    )
+
+
+@pytest.fixture
+def run_data() -> ProtocolRunData:
+    """Get a ProtocolRunData result."""
+    return ProtocolRunData(
+        commands=[
+            pe_commands.Pause(
+                id="command-id",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2022, month=2, day=2),
+                params=pe_commands.PauseParams(message="hello world"),
+            )
+        ],
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+    )
+
+
 async def test_analyze(
     decoy: Decoy,
     protocol_runner: ProtocolRunner,
@@ -116,3 +171,245 @@ async def test_analyze(
             errors=[analysis_error],
         ),
     )
+
+
+async def test_analyze_with_simulator_pool(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    run_data: ProtocolRunData,
+) -> None:
+    """It should simulate with a simulator from the pool, then give it back."""
+    simulator_pool = SimulatorPool()
+    hardware_apis = []
+
+    async def create_simulating_runner(
+        hardware_api: HardwareControlAPI,
+    ) -> ProtocolRunner:
+        hardware_apis.append(hardware_api)
+        return protocol_runner
+
+    monkeypatch.setattr(
+        protocol_analyzer, "create_simulating_runner", create_simulating_runner
+    )
+    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+        run_data
+    )
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        simulator_pool=simulator_pool,
+    )
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=run_data.commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        ),
+    )
+    assert hardware_apis == [await simulator_pool.acquire()]
+
+
+async def test_analyze_cache_hit(
+    decoy: Decoy,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    protocol_resource: ProtocolResource,
+    run_data: ProtocolRunData,
+) -> None:
+    """It should use a cached result instead of running the protocol."""
+    subject = ProtocolAnalyzer(
+        protocol_runner=protocol_runner,
+        analysis_store=analysis_store,
+        analysis_cache=analysis_cache,
+    )
+
+    decoy.when(analysis_cache.get_key(protocol_resource.source)).then_return("key")
+    decoy.when(analysis_cache.get("key")).then_return(run_data)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=run_data.commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        ),
+    )
+    decoy.verify(await protocol_runner.run(protocol_resource.source), times=0)
+
+
+async def test_analyze_cache_miss(
+    decoy: Decoy,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    analysis_cache: AnalysisCache,
+    protocol_resource: ProtocolResource,
+    run_data: ProtocolRunData,
+) -> None:
+    """It should run the protocol and cache the result if not already cached."""
+    subject = ProtocolAnalyzer(
+        protocol_runner=protocol_runner,
+        analysis_store=analysis_store,
+        analysis_cache=analysis_cache,
+    )
+
+    decoy.when(analysis_cache.get_key(protocol_resource.source)).then_return("key")
+    decoy.when(analysis_cache.get("key")).then_return(None)
+    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+        run_data
+    )
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_cache.put("key", run_data),
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=run_data.commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        ),
+    )
+
+
+async def test_analyze_in_pool(
+    decoy: Decoy,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    analysis_pool: AnalysisPool,
+    protocol_resource: ProtocolResource,
+    run_data: ProtocolRunData,
+) -> None:
+    """It should simulate the protocol in the analysis pool, if given."""
+    subject = ProtocolAnalyzer(
+        protocol_runner=protocol_runner,
+        analysis_store=analysis_store,
+        analysis_pool=analysis_pool,
+    )
+
+    decoy.when(
+        await analysis_pool.run(
+            protocol_id="protocol-id",
+            source=protocol_resource.source,
+        )
+    ).then_return(run_data)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=run_data.commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        ),
+    )
+    decoy.verify(await protocol_runner.run(protocol_resource.source), times=0)
+
+
+async def test_analyze_in_pool_error(
+    decoy: Decoy,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    analysis_pool: AnalysisPool,
+    protocol_resource: ProtocolResource,
+) -> None:
+    """It should store a failed analysis if the analysis pool raises."""
+    subject = ProtocolAnalyzer(
+        protocol_runner=protocol_runner,
+        analysis_store=analysis_store,
+        analysis_pool=analysis_pool,
+    )
+
+    decoy.when(
+        await analysis_pool.run(
+            protocol_id="protocol-id",
+            source=protocol_resource.source,
+        )
+    ).then_raise(AnalysisTimeoutError(timeout=42))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    errors = matchers.Captor()
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors,
+        ),
+    )
+
+    assert len(errors.value) == 1
+    assert errors.value[0].errorType == "AnalysisTimeoutError"
+    assert "42 seconds" in errors.value[0].detail
+
+
+async def test_analyze_in_pool_cancelled(
+    decoy: Decoy,
+    protocol_runner: ProtocolRunner,
+    analysis_store: AnalysisStore,
+    analysis_pool: AnalysisPool,
+    protocol_resource: ProtocolResource,
+) -> None:
+    """It should store a failed analysis and re-raise if cancelled."""
+    subject = ProtocolAnalyzer(
+        protocol_runner=protocol_runner,
+        analysis_store=analysis_store,
+        analysis_pool=analysis_pool,
+    )
+
+    decoy.when(
+        await analysis_pool.run(
+            protocol_id="protocol-id",
+            source=protocol_resource.source,
+        )
+    ).then_raise(asyncio.CancelledError())
+
+    with pytest.raises(asyncio.CancelledError):
+        await subject.analyze(
+            protocol_resource=protocol_resource,
+            analysis_id="analysis-id",
+        )
+
+    errors = matchers.Captor()
+    decoy.verify(
+        analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors,
+        ),
+    )
+
+    assert len(errors.value) == 1
+    assert errors.value[0].errorType == "AnalysisCancelledError"
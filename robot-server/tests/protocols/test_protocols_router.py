@@ -20,6 +20,7 @@ from opentrons.protocol_reader import (
 from robot_server.errors import ApiError
 from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
 from robot_server.service.task_runner import TaskRunner
+from robot_server.protocols.analysis_pool import AnalysisPool
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 from robot_server.protocols.analysis_models import PendingAnalysis
@@ -143,8 +144,8 @@ async def test_get_protocols(
     )
 
     decoy.when(protocol_store.get_all()).then_return([resource_1, resource_2])
-    decoy.when(analysis_store.get_by_protocol("abc")).then_return([analysis_1])
-    decoy.when(analysis_store.get_by_protocol("123")).then_return([analysis_2])
+    decoy.when(analysis_store.get_listed_by_protocol("abc")).then_return([analysis_1])
+    decoy.when(analysis_store.get_listed_by_protocol("123")).then_return([analysis_2])
 
     result = await get_protocols(
         protocol_store=protocol_store,
@@ -317,7 +318,11 @@ async def test_delete_protocol_by_id(
     protocol_store: ProtocolStore,
 ) -> None:
     """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_pool=None,
+    )
 
     decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
 
@@ -325,6 +330,25 @@ async def test_delete_protocol_by_id(
     assert result.status_code == 200
 
 
+async def test_delete_protocol_cancels_analyses(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should cancel any running analyses of the removed protocol."""
+    analysis_pool = decoy.mock(cls=AnalysisPool)
+
+    await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_pool=analysis_pool,
+    )
+
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_pool.cancel(protocol_id="protocol-id"),
+    )
+
+
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
@@ -337,6 +361,10 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_pool=None,
+        )
 
     assert exc_info.value.status_code == 404
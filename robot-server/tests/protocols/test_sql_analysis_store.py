@@ -0,0 +1,205 @@
+"""Tests for robot_server.protocols.sql_analysis_store."""
+import pytest
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from opentrons.types import MountType, DeckSlotName
+from opentrons.protocol_engine import (
+    commands as pe_commands,
+    errors as pe_errors,
+    types as pe_types,
+)
+
+from robot_server.persistence import open_database
+from robot_server.protocols.sql_analysis_store import SqlAnalysisStore
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    AnalysisStatus,
+    AnalysisSummary,
+    PendingAnalysis,
+    CompletedAnalysis,
+)
+
+
+@pytest.fixture
+def subject(sql_database: sqlite3.Connection) -> SqlAnalysisStore:
+    """Get a SqlAnalysisStore test subject."""
+    return SqlAnalysisStore(sql_database)
+
+
+def test_get_empty(subject: SqlAnalysisStore) -> None:
+    """It should return an empty list if no analysis saved."""
+    assert subject.get_by_protocol("protocol-id") == []
+
+
+def test_add_pending(subject: SqlAnalysisStore) -> None:
+    """It should add pending analyses to the store, in order."""
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-2")
+    result = subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-1")
+    subject.add_pending(protocol_id="other-protocol-id", analysis_id="analysis-3")
+
+    assert result == [
+        PendingAnalysis(id="analysis-2"),
+        PendingAnalysis(id="analysis-1"),
+    ]
+
+
+def test_update_analysis(subject: SqlAnalysisStore) -> None:
+    """It should store and read back a completed analysis."""
+    labware = pe_types.LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="namespace/load-name/42",
+        location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        offsetId=None,
+    )
+    pipette = pe_types.LoadedPipette(
+        id="pipette-id",
+        pipetteName=pe_types.PipetteName.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    commands: List[pe_commands.Command] = [
+        pe_commands.Pause(
+            id=f"pause-{i}",
+            key="command-key",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            params=pe_commands.PauseParams(message="hello world"),
+            result=pe_commands.PauseResult(),
+        )
+        for i in range(3)
+    ]
+    error = pe_errors.ErrorOccurrence(
+        id="error-id",
+        createdAt=datetime(year=2021, month=1, day=1),
+        errorType="BadError",
+        detail="oh no",
+    )
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    subject.update(
+        analysis_id="analysis-id",
+        commands=commands,
+        labware=[labware],
+        pipettes=[pipette],
+        errors=[error],
+    )
+
+    assert subject.get_by_protocol("protocol-id") == [
+        CompletedAnalysis(
+            id="analysis-id",
+            result=AnalysisResult.NOT_OK,
+            commands=commands,
+            labware=[labware],
+            pipettes=[pipette],
+            errors=[error],
+        )
+    ]
+
+
+def test_update_analysis_replaces_commands(subject: SqlAnalysisStore) -> None:
+    """It should replace an analysis' commands if it is updated twice."""
+    command = pe_commands.Pause(
+        id="pause",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(),
+    )
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    command_lists: List[List[pe_commands.Command]] = [[command, command], [command]]
+
+    for commands in command_lists:
+        subject.update(
+            analysis_id="analysis-id",
+            commands=commands,
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+
+    assert subject.get_by_protocol("protocol-id") == [
+        CompletedAnalysis(
+            id="analysis-id",
+            result=AnalysisResult.OK,
+            commands=[command],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+    ]
+
+
+def test_get_summaries(subject: SqlAnalysisStore) -> None:
+    """It should summarize a protocol's analyses, in order."""
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-1")
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-2")
+    subject.add_pending(protocol_id="other-protocol-id", analysis_id="analysis-3")
+    subject.update(
+        analysis_id="analysis-1",
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(id="analysis-1", status=AnalysisStatus.COMPLETED),
+        AnalysisSummary(id="analysis-2", status=AnalysisStatus.PENDING),
+    ]
+    assert subject.get_listed_by_protocol(
+        "protocol-id"
+    ) == subject.get_summaries_by_protocol("protocol-id")
+
+
+def test_analyses_persist(tmp_path: Path) -> None:
+    """Analyses should survive closing and reopening the database."""
+    database = open_database(tmp_path)
+    store = SqlAnalysisStore(database)
+    store.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    store.update(
+        analysis_id="analysis-id",
+        commands=[],
+        labware=[],
+        pipettes=[],
+        errors=[],
+    )
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlAnalysisStore(database).get_by_protocol("protocol-id")
+    database.close()
+
+    assert result == [
+        CompletedAnalysis(
+            id="analysis-id",
+            result=AnalysisResult.OK,
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=[],
+        )
+    ]
+
+
+def test_pending_analyses_fail_after_reopen(tmp_path: Path) -> None:
+    """Analyses interrupted by a restart should be marked as failed."""
+    database = open_database(tmp_path)
+    SqlAnalysisStore(database).add_pending(
+        protocol_id="protocol-id", analysis_id="analysis-id"
+    )
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlAnalysisStore(database).get_by_protocol("protocol-id")
+    database.close()
+
+    assert len(result) == 1
+    assert isinstance(result[0], CompletedAnalysis)
+    assert result[0].result == AnalysisResult.NOT_OK
+    assert result[0].commands == []
+    assert [e.errorType for e in result[0].errors] == ["AnalysisInterruptedError"]
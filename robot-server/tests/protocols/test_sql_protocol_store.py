@@ -0,0 +1,187 @@
+"""Tests for robot_server.protocols.sql_protocol_store."""
+import pytest
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from opentrons_shared_data.labware.dev_types import LabwareDefinition as LabwareDefDict
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+    PythonProtocolConfig,
+)
+
+from robot_server.persistence import open_database
+from robot_server.protocols.protocol_store import (
+    ProtocolResource,
+    ProtocolNotFoundError,
+)
+from robot_server.protocols.sql_protocol_store import SqlProtocolStore
+
+
+@pytest.fixture
+def subject(sql_database: sqlite3.Connection) -> SqlProtocolStore:
+    """Get a SqlProtocolStore test subject."""
+    return SqlProtocolStore(sql_database)
+
+
+def test_upsert_and_get_protocol(tmp_path: Path, subject: SqlProtocolStore) -> None:
+    """It should store a single protocol."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=(tmp_path / "abc.py"),
+            config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+            files=[ProtocolSourceFile(name="abc.py", role=ProtocolFileRole.MAIN)],
+            metadata={"protocolName": "hello world"},
+            labware_definitions=[],
+        ),
+    )
+
+    subject.upsert(protocol_resource)
+
+    assert subject.get("protocol-id") == protocol_resource
+
+
+def test_get_missing_protocol_raises(subject: SqlProtocolStore) -> None:
+    """It should raise an error when protocol not found."""
+    with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
+        subject.get("protocol-id")
+
+
+def test_get_all_protocols(tmp_path: Path, subject: SqlProtocolStore) -> None:
+    """It should get all protocols existing in the store, in insertion order."""
+    resource_1 = ProtocolResource(
+        protocol_id="abc",
+        created_at=datetime.now(),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=(tmp_path / "abc.json"),
+            config=JsonProtocolConfig(schema_version=5),
+            files=[],
+            metadata={},
+            labware_definitions=[],
+        ),
+    )
+    resource_2 = ProtocolResource(
+        protocol_id="123",
+        created_at=datetime.now(),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=(tmp_path / "123.json"),
+            config=JsonProtocolConfig(schema_version=6),
+            files=[],
+            metadata={},
+            labware_definitions=[],
+        ),
+    )
+
+    subject.upsert(resource_1)
+    subject.upsert(resource_2)
+
+    assert subject.get_all() == [resource_1, resource_2]
+
+
+def test_remove_protocol(tmp_path: Path, subject: SqlProtocolStore) -> None:
+    """It should remove the specified protocol and its files."""
+    directory = tmp_path / "protocol-id"
+    main_file = directory / "protocol.json"
+
+    directory.mkdir()
+    main_file.touch()
+
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=directory,
+            main_file=main_file,
+            config=JsonProtocolConfig(schema_version=123),
+            files=[ProtocolSourceFile(name=main_file.name, role=ProtocolFileRole.MAIN)],
+            metadata={},
+            labware_definitions=[],
+        ),
+    )
+
+    subject.upsert(protocol_resource)
+    result = subject.remove("protocol-id")
+
+    assert result == protocol_resource
+    assert directory.exists() is False
+
+    with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
+        subject.get("protocol-id")
+
+
+def test_remove_missing_protocol_raises(subject: SqlProtocolStore) -> None:
+    """It should raise an error when trying to remove missing protocol."""
+    with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
+        subject.remove("protocol-id")
+
+
+def test_protocols_persist(tmp_path: Path) -> None:
+    """Protocols should survive closing and reopening the database."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=(tmp_path / "abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            labware_definitions=[],
+        ),
+    )
+
+    database = open_database(tmp_path)
+    SqlProtocolStore(database).upsert(protocol_resource)
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlProtocolStore(database).get_all()
+    database.close()
+
+    assert result == [protocol_resource]
+
+
+def test_protocol_with_labware_persists(
+    tmp_path: Path, minimal_labware_def: LabwareDefDict
+) -> None:
+    """It should save a protocol's files, metadata, and labware as plain data."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=tmp_path,
+            main_file=(tmp_path / "abc.py"),
+            config=PythonProtocolConfig(api_version=APIVersion(2, 11)),
+            files=[
+                ProtocolSourceFile(name="abc.py", role=ProtocolFileRole.MAIN),
+                ProtocolSourceFile(name="def.json", role=ProtocolFileRole.LABWARE),
+            ],
+            metadata={"protocolName": "hello world", "tags": ["a", "b"]},
+            labware_definitions=[LabwareDefinition.parse_obj(minimal_labware_def)],
+        ),
+    )
+
+    database = open_database(tmp_path)
+    SqlProtocolStore(database).upsert(protocol_resource)
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlProtocolStore(database).get("protocol-id")
+    metadata = database.execute(
+        "SELECT metadata FROM protocol WHERE id = ?", ("protocol-id",)
+    ).fetchone()
+    database.close()
+
+    assert result == protocol_resource
+    assert metadata == ('{"protocolName": "hello world", "tags": ["a", "b"]}',)
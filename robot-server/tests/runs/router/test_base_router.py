@@ -1,5 +1,6 @@
 """Tests for base /runs routes."""
 import pytest
+import sqlite3
 from datetime import datetime
 from decoy import Decoy, matchers
 from pathlib import Path
@@ -37,7 +38,9 @@ from robot_server.runs.run_store import (
     RunStore,
     RunNotFoundError,
     RunResource,
+    StateSummary,
 )
+from robot_server.runs.sql_run_store import SqlRunStore
 
 from robot_server.runs.router.base_router import (
     AllRunsLinks,
@@ -145,6 +148,57 @@ async def test_create_run(
     )
 
 
+async def test_create_run_saves_previous_state(
+    decoy: Decoy,
+    task_runner: TaskRunner,
+    run_store: RunStore,
+    engine_store: EngineStore,
+) -> None:
+    """It should save a summary of the replaced run's engine state."""
+    prev_engine_state = decoy.mock(cls=StateView)
+    engine_state = decoy.mock(cls=StateView)
+
+    decoy.when(engine_store.get_current_run_id()).then_return("prev-run-id")
+    decoy.when(engine_store.get_state("prev-run-id")).then_return(prev_engine_state)
+    decoy.when(await engine_store.create(run_id="run-id")).then_return(engine_state)
+
+    decoy.when(prev_engine_state.commands.get_status()).then_return(
+        pe_types.EngineStatus.SUCCEEDED
+    )
+    decoy.when(prev_engine_state.commands.get_all_errors()).then_return([])
+    decoy.when(prev_engine_state.pipettes.get_all()).then_return([])
+    decoy.when(prev_engine_state.labware.get_all()).then_return([])
+    decoy.when(prev_engine_state.labware.get_labware_offsets()).then_return([])
+    decoy.when(engine_state.pipettes.get_all()).then_return([])
+    decoy.when(engine_state.labware.get_all()).then_return([])
+    decoy.when(engine_state.labware.get_labware_offsets()).then_return([])
+    decoy.when(engine_state.commands.get_status()).then_return(
+        pe_types.EngineStatus.IDLE
+    )
+
+    await create_run(
+        request_body=None,
+        run_store=run_store,
+        engine_store=engine_store,
+        task_runner=task_runner,
+        run_id="run-id",
+        created_at=datetime(year=2021, month=1, day=1),
+    )
+
+    decoy.verify(
+        run_store.update_state_summary(
+            run_id="prev-run-id",
+            summary=StateSummary(
+                status=pe_types.EngineStatus.SUCCEEDED,
+                errors=[],
+                pipettes=[],
+                labware=[],
+                labwareOffsets=[],
+            ),
+        )
+    )
+
+
 async def test_create_protocol_run(
     decoy: Decoy,
     run_view: RunView,
@@ -330,6 +384,54 @@ async def test_get_run_data_from_url(
     assert result == expected_response
 
 
+async def test_get_run_data_from_url_no_engine(
+    decoy: Decoy,
+    run_store: RunStore,
+    engine_store: EngineStore,
+) -> None:
+    """It should use the run's saved state summary if its engine is gone."""
+    created_at = datetime(year=2021, month=1, day=1)
+
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=created_at,
+        actions=[],
+        is_current=False,
+    )
+
+    decoy.when(run_store.get(run_id="run-id")).then_return(run)
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError("oh no"))
+    decoy.when(run_store.get_state_summary("run-id")).then_return(
+        StateSummary(
+            status=pe_types.EngineStatus.SUCCEEDED,
+            errors=[],
+            pipettes=[],
+            labware=[],
+            labwareOffsets=RESOLVED_LABWARE_OFFSETS,
+        )
+    )
+
+    result = await get_run_data_from_url(
+        runId="run-id",
+        run_store=run_store,
+        engine_store=engine_store,
+    )
+
+    assert result == Run(
+        id="run-id",
+        protocolId=None,
+        createdAt=created_at,
+        status=pe_types.EngineStatus.SUCCEEDED,
+        current=False,
+        actions=[],
+        errors=[],
+        pipettes=[],
+        labware=[],
+        labwareOffsets=RESOLVED_LABWARE_OFFSETS,
+    )
+
+
 async def test_get_run_with_errors(
     decoy: Decoy,
     run_store: RunStore,
@@ -506,6 +608,73 @@ async def test_get_runs_not_empty(
     assert result.status_code == 200
 
 
+async def test_get_runs_after_restart(
+    decoy: Decoy,
+    sql_database: sqlite3.Connection,
+    engine_store: EngineStore,
+) -> None:
+    """It should summarize persisted runs whose engines did not survive a restart."""
+    created_at_1 = datetime(year=2021, month=1, day=1)
+    created_at_2 = datetime(year=2022, month=2, day=2)
+
+    run_store_before_restart = SqlRunStore(sql_database)
+    run_store_before_restart.upsert(
+        RunResource(
+            run_id="unique-id-1",
+            protocol_id=None,
+            created_at=created_at_1,
+            actions=[],
+            is_current=False,
+        )
+    )
+    run_store_before_restart.update_state_summary(
+        run_id="unique-id-1",
+        summary=StateSummary(
+            status=pe_types.EngineStatus.SUCCEEDED,
+            errors=[],
+            pipettes=[],
+            labware=[],
+            labwareOffsets=[],
+        ),
+    )
+    run_store_before_restart.upsert(
+        RunResource(
+            run_id="unique-id-2",
+            protocol_id=None,
+            created_at=created_at_2,
+            actions=[],
+            is_current=True,
+        )
+    )
+
+    run_store = SqlRunStore(sql_database)
+
+    decoy.when(engine_store.get_state(matchers.Anything())).then_raise(
+        EngineMissingError("oh no")
+    )
+
+    result = await get_runs(run_store=run_store, engine_store=engine_store)
+
+    assert result.content.data == [
+        RunSummary(
+            id="unique-id-1",
+            protocolId=None,
+            createdAt=created_at_1,
+            status=pe_types.EngineStatus.SUCCEEDED,
+            current=False,
+        ),
+        RunSummary(
+            id="unique-id-2",
+            protocolId=None,
+            createdAt=created_at_2,
+            status=pe_types.EngineStatus.STOPPED,
+            current=False,
+        ),
+    ]
+    assert result.content.links == AllRunsLinks(current=None)
+    assert result.status_code == 200
+
+
 async def test_delete_run_by_id(
     decoy: Decoy,
     run_store: RunStore,
@@ -651,6 +820,16 @@ async def test_update_run_to_not_current(
     decoy.verify(
         await engine_store.clear(),
         run_store.upsert(updated_resource),
+        run_store.update_state_summary(
+            run_id="run-id",
+            summary=StateSummary(
+                status=pe_types.EngineStatus.SUCCEEDED,
+                errors=[],
+                pipettes=[],
+                labware=[],
+                labwareOffsets=[],
+            ),
+        ),
     )
 
 
@@ -8,6 +8,7 @@ from opentrons.protocol_engine import (
     EngineStatus,
     StateView,
     CommandSlice,
+    CommandUpdates,
     CurrentCommand,
     commands as pe_commands,
     errors as pe_errors,
@@ -15,15 +16,18 @@ from opentrons.protocol_engine import (
 
 from robot_server.errors import ApiError
 from robot_server.service.json_api import RequestModel, MultiBodyMeta
+from starlette.responses import StreamingResponse
 from robot_server.runs.run_models import Run, RunCommandSummary
-from robot_server.runs.engine_store import EngineStore
+from robot_server.runs.engine_store import EngineStore, EngineMissingError
 from robot_server.runs.router.commands_router import (
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
+    CommandUpdate,
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_command_updates,
 )
 
 
@@ -277,6 +281,236 @@ async def test_get_run_commands_empty(decoy: Decoy, engine_store: EngineStore) -
     assert result.status_code == 200
 
 
+async def test_get_run_commands_no_engine(
+    decoy: Decoy, engine_store: EngineStore
+) -> None:
+    """It should return no commands for a run whose engine is gone."""
+    run = Run(
+        id="run-id",
+        protocolId=None,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=EngineStatus.STOPPED,
+        current=False,
+        actions=[],
+        errors=[],
+        pipettes=[],
+        labware=[],
+        labwareOffsets=[],
+    )
+
+    decoy.when(engine_store.get_state("run-id")).then_raise(EngineMissingError())
+
+    result = await get_run_commands(
+        run=run,
+        engine_store=engine_store,
+        cursor=None,
+        pageLength=42,
+    )
+
+    assert result.content.data == []
+    assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=0)
+    assert result.content.links == CommandCollectionLinks(current=None)
+    assert result.status_code == 200
+
+
+async def test_get_run_command_updates(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should return commands changed since the cursor without waiting."""
+    run = Run.construct(id="run-id", current=True)  # type: ignore[call-arg]
+    command = pe_commands.Pause(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(message="hello world"),
+    )
+
+    engine_state = decoy.mock(cls=StateView)
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.commands.get_has_updates_or_stopped(3)).then_return(True)
+    decoy.when(engine_state.commands.get_updates(3)).then_return(
+        CommandUpdates(commands=[command], cursors=[5], cursor=5)
+    )
+    decoy.when(engine_state.commands.get_count()).then_return(2)
+
+    result = await get_run_command_updates(
+        engine_store=engine_store,
+        run=run,
+        cursor=3,
+        stream=False,
+        timeout=999,
+    )
+
+    decoy.verify(
+        await engine_store.engine.wait_for_command_updates(3),
+        times=0,
+    )
+
+    assert not isinstance(result, StreamingResponse)
+    assert result.content.data == [
+        RunCommandSummary(
+            id="command-id",
+            key="command-key",
+            commandType="pause",
+            createdAt=datetime(year=2021, month=1, day=1),
+            status=pe_commands.CommandStatus.RUNNING,
+            params=pe_commands.PauseParams(message="hello world"),
+        )
+    ]
+    assert result.content.meta == MultiBodyMeta(cursor=5, totalLength=2)
+    assert result.status_code == 200
+
+
+async def test_get_run_command_updates_long_poll(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should wait for command updates if there are none yet."""
+    run = Run.construct(id="run-id", current=True)  # type: ignore[call-arg]
+
+    engine_state = decoy.mock(cls=StateView)
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.commands.get_has_updates_or_stopped(3)).then_return(False)
+    decoy.when(engine_state.commands.get_updates(3)).then_return(
+        CommandUpdates(commands=[], cursors=[], cursor=3)
+    )
+    decoy.when(engine_state.commands.get_count()).then_return(2)
+
+    result = await get_run_command_updates(
+        engine_store=engine_store,
+        run=run,
+        cursor=3,
+        stream=False,
+        timeout=999,
+    )
+
+    decoy.verify(await engine_store.engine.wait_for_command_updates(3))
+
+    assert not isinstance(result, StreamingResponse)
+    assert result.content.data == []
+    assert result.content.meta == MultiBodyMeta(cursor=3, totalLength=2)
+
+
+async def test_get_run_command_updates_stream(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should stream command updates as NDJSON until the engine stops."""
+    run = Run.construct(id="run-id", current=True)  # type: ignore[call-arg]
+    queued_command = pe_commands.Pause(
+        id="command-id-2",
+        key="command-key-2",
+        status=pe_commands.CommandStatus.QUEUED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(),
+    )
+    running_command = pe_commands.Pause(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(),
+    )
+    succeeded_command = pe_commands.Pause(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.PauseParams(),
+    )
+
+    engine_state = decoy.mock(cls=StateView)
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.commands.get_updates(0)).then_return(
+        CommandUpdates(
+            commands=[queued_command, running_command], cursors=[1, 2], cursor=2
+        )
+    )
+    decoy.when(engine_state.commands.get_updates(2)).then_return(
+        CommandUpdates(commands=[succeeded_command], cursors=[3], cursor=3)
+    )
+    decoy.when(engine_state.commands.get_is_stopped()).then_return(False, True)
+
+    result = await get_run_command_updates(
+        engine_store=engine_store,
+        run=run,
+        cursor=0,
+        stream=True,
+        timeout=999,
+    )
+
+    assert isinstance(result, StreamingResponse)
+    assert result.media_type == "application/x-ndjson"
+
+    lines = [line async for line in result.body_iterator]
+
+    decoy.verify(await engine_store.engine.wait_for_command_updates(2), times=1)
+
+    assert [CommandUpdate.parse_raw(line) for line in lines] == [
+        CommandUpdate(
+            cursor=1,
+            data=RunCommandSummary(
+                id="command-id-2",
+                key="command-key-2",
+                commandType="pause",
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=pe_commands.CommandStatus.QUEUED,
+                params=pe_commands.PauseParams(),
+            ),
+        ),
+        CommandUpdate(
+            cursor=2,
+            data=RunCommandSummary(
+                id="command-id",
+                key="command-key",
+                commandType="pause",
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=pe_commands.CommandStatus.RUNNING,
+                params=pe_commands.PauseParams(),
+            ),
+        ),
+        CommandUpdate(
+            cursor=3,
+            data=RunCommandSummary(
+                id="command-id",
+                key="command-key",
+                commandType="pause",
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                params=pe_commands.PauseParams(),
+            ),
+        ),
+    ]
+    assert all(line.endswith(b"\n") for line in lines)
+
+
+async def test_get_run_command_updates_stream_not_current(
+    decoy: Decoy,
+    engine_store: EngineStore,
+) -> None:
+    """It should end the stream immediately if the run is not current."""
+    run = Run.construct(id="run-id", current=False)  # type: ignore[call-arg]
+
+    engine_state = decoy.mock(cls=StateView)
+    decoy.when(engine_store.get_state("run-id")).then_return(engine_state)
+    decoy.when(engine_state.commands.get_updates(0)).then_return(
+        CommandUpdates(commands=[], cursors=[], cursor=0)
+    )
+
+    result = await get_run_command_updates(
+        engine_store=engine_store,
+        run=run,
+        cursor=0,
+        stream=True,
+        timeout=999,
+    )
+
+    assert isinstance(result, StreamingResponse)
+    assert [line async for line in result.body_iterator] == []
+
+
 async def test_get_run_command_by_id(
     decoy: Decoy,
     engine_store: EngineStore,
@@ -30,6 +30,7 @@ async def test_create_engine(subject: EngineStore) -> None:
     assert isinstance(subject.engine, ProtocolEngine)
     assert result is subject.engine.state_view
     assert result is subject.get_state("run-id")
+    assert subject.get_current_run_id() == "run-id"
 
 
 async def test_archives_state_if_engine_already_exists(subject: EngineStore) -> None:
@@ -71,6 +72,8 @@ async def test_clear_engine(subject: EngineStore) -> None:
     with pytest.raises(EngineMissingError):
         subject.runner
 
+    assert subject.get_current_run_id() is None
+
 
 async def test_clear_engine_noop(subject: EngineStore) -> None:
     """It should noop if clear called and no stored engine entry."""
@@ -2,7 +2,14 @@
 import pytest
 from datetime import datetime
 
-from robot_server.runs.run_store import RunStore, RunResource, RunNotFoundError
+from opentrons.protocol_engine import EngineStatus
+
+from robot_server.runs.run_store import (
+    RunStore,
+    RunResource,
+    RunNotFoundError,
+    StateSummary,
+)
 
 
 def test_add_run() -> None:
@@ -149,3 +156,33 @@ def test_add_run_current_run_deactivates() -> None:
 
     assert subject.get("run-id-1").is_current is False
     assert subject.get("run-id-2").is_current is True
+
+
+def test_state_summary() -> None:
+    """It should save a state summary for a stored run only."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=False,
+    )
+    summary = StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        pipettes=[],
+        labware=[],
+        labwareOffsets=[],
+    )
+
+    subject = RunStore()
+    subject.upsert(run)
+    subject.update_state_summary("run-id", summary)
+    subject.update_state_summary("other-run-id", summary)
+
+    assert subject.get_state_summary("run-id") == summary
+    assert subject.get_state_summary("other-run-id") is None
+
+    subject.remove("run-id")
+
+    assert subject.get_state_summary("run-id") is None
@@ -0,0 +1,208 @@
+"""Tests for robot_server.runs.sql_run_store."""
+import pytest
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from robot_server.persistence import open_database
+from robot_server.runs.action_models import RunAction, RunActionType
+from opentrons.protocol_engine import EngineStatus
+
+from robot_server.runs.run_store import RunResource, RunNotFoundError, StateSummary
+from robot_server.runs.sql_run_store import SqlRunStore
+
+
+@pytest.fixture
+def subject(sql_database: sqlite3.Connection) -> SqlRunStore:
+    """Get a SqlRunStore test subject."""
+    return SqlRunStore(sql_database)
+
+
+def test_upsert_and_get_run(subject: SqlRunStore) -> None:
+    """It should be able to add a run to the store and read it back."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        actions=[
+            RunAction(
+                id="action-id",
+                createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+                actionType=RunActionType.PLAY,
+            )
+        ],
+        is_current=True,
+    )
+
+    result = subject.upsert(run)
+
+    assert result == run
+    assert subject.get("run-id") == run
+
+
+def test_update_run(subject: SqlRunStore) -> None:
+    """It should be able to update a run in the store."""
+    run = RunResource(
+        run_id="identical-run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, hour=1, minute=1, second=1),
+        actions=[],
+        is_current=True,
+    )
+    updated_run = RunResource(
+        run_id="identical-run-id",
+        protocol_id=None,
+        created_at=datetime(year=2022, month=2, day=2, hour=2, minute=2, second=2),
+        actions=[],
+        is_current=False,
+    )
+
+    subject.upsert(run)
+    subject.upsert(updated_run)
+
+    assert subject.get_all() == [updated_run]
+
+
+def test_get_run_missing(subject: SqlRunStore) -> None:
+    """It raises if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-id"):
+        subject.get(run_id="run-id")
+
+
+def test_get_all_runs(subject: SqlRunStore) -> None:
+    """It can get all created runs, in insertion order."""
+    run_1 = RunResource(
+        run_id="run-id-2",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=False,
+    )
+    run_2 = RunResource(
+        run_id="run-id-1",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+
+    subject.upsert(run_1)
+    subject.upsert(run_2)
+
+    assert subject.get_all() == [run_1, run_2]
+
+
+def test_remove_run(subject: SqlRunStore) -> None:
+    """It can remove and return a previously stored run entry."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+
+    subject.upsert(run)
+    result = subject.remove(run_id="run-id")
+
+    assert result == run
+    assert subject.get_all() == []
+
+
+def test_remove_run_missing_id(subject: SqlRunStore) -> None:
+    """It raises if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-id"):
+        subject.remove(run_id="run-id")
+
+
+def test_add_run_current_run_deactivates(subject: SqlRunStore) -> None:
+    """Adding a current run should mark all others as not current."""
+    run_1 = RunResource(
+        run_id="run-id-1",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+    run_2 = RunResource(
+        run_id="run-id-2",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+
+    subject.upsert(run_1)
+    subject.upsert(run_2)
+
+    assert subject.get("run-id-1").is_current is False
+    assert subject.get("run-id-2").is_current is True
+
+
+def test_runs_persist(tmp_path: Path) -> None:
+    """Runs should survive closing and reopening the database."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=False,
+    )
+
+    database = open_database(tmp_path)
+    SqlRunStore(database).upsert(run)
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlRunStore(database).get_all()
+    database.close()
+
+    assert result == [run]
+
+
+def test_runs_not_current_after_reopen(tmp_path: Path) -> None:
+    """A run that was current should not be current after a restart."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=True,
+    )
+
+    database = open_database(tmp_path)
+    SqlRunStore(database).upsert(run)
+    database.close()
+
+    database = open_database(tmp_path)
+    result = SqlRunStore(database).get("run-id")
+    database.close()
+
+    assert result.is_current is False
+
+
+def test_state_summary(subject: SqlRunStore) -> None:
+    """It should save and read back a run's state summary."""
+    run = RunResource(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime.now(),
+        actions=[],
+        is_current=False,
+    )
+    summary = StateSummary(
+        status=EngineStatus.FAILED,
+        errors=[],
+        pipettes=[],
+        labware=[],
+        labwareOffsets=[],
+    )
+
+    subject.upsert(run)
+    assert subject.get_state_summary("run-id") is None
+
+    subject.update_state_summary("run-id", summary)
+    subject.upsert(run)
+
+    assert subject.get_state_summary("run-id") == summary
+    assert subject.get_state_summary("other-run-id") is None
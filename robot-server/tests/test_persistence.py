@@ -0,0 +1,36 @@
+"""Tests for robot_server.persistence."""
+from pathlib import Path
+
+from robot_server.persistence import DATABASE_FILE_NAME, open_database
+
+
+def test_open_database(tmp_path: Path) -> None:
+    """It should create the database file in WAL mode with all tables."""
+    subject = open_database(tmp_path / "nested")
+
+    journal_mode = subject.execute("PRAGMA journal_mode").fetchone()
+    tables = subject.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    ).fetchall()
+
+    subject.close()
+
+    assert (tmp_path / "nested" / DATABASE_FILE_NAME).exists()
+    assert journal_mode == ("wal",)
+    assert tables == [("analysis",), ("analysis_command",), ("protocol",), ("run",)]
+
+
+def test_open_database_twice(tmp_path: Path) -> None:
+    """It should open an existing database without losing data."""
+    subject = open_database(tmp_path)
+
+    with subject:
+        subject.execute("INSERT INTO analysis (id, protocol_id) VALUES ('abc', 'def')")
+
+    subject.close()
+    subject = open_database(tmp_path)
+
+    result = subject.execute("SELECT id, protocol_id FROM analysis").fetchall()
+    subject.close()
+
+    assert result == [("abc", "def")]
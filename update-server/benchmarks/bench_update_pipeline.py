@@ -0,0 +1,102 @@
+"""Benchmark writing a system update zip to a partition.
+
+Builds an update zip with a deflated rootfs, then writes it to a stand-in
+partition file two ways: extracting, hashing and copying the rootfs in
+three passes (unzip_update, hash_file and write_file), and decompressing,
+hashing and writing it in one pass (stream_zipped_file). Then rebuilds it
+from a delta against a base image, with --changed percent of its blocks
+different, onto a partition holding the base (apply_delta). Prints the time
+each took and the size of the zipped rootfs and delta.
+
+Usage:
+    python benchmarks/bench_update_pipeline.py [--mib 64] [--changed 2]
+"""
+import argparse
+import io
+import os
+import random
+import tempfile
+import zipfile
+from time import perf_counter
+
+from otupdate.buildroot.update_actions import write_file
+from otupdate.common.delta import apply_delta, make_delta
+from otupdate.common.file_actions import hash_file, stream_zipped_file, unzip_update
+
+
+def _build_zip(directory: str, mib: int) -> str:
+    # Half random, half zeros, so it compresses somewhat like a filesystem
+    block = os.urandom(32 * 1024) + bytes(32 * 1024)
+    path = os.path.join(directory, "ot2-system.zip")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zf.open("rootfs.ext4", "w") as rootfs:
+            for _ in range(mib * 16):
+                rootfs.write(block)
+        zf.writestr("rootfs.ext4.hash", b"")
+    return path
+
+
+def _three_pass(zip_path: str, partition: str) -> float:
+    start = perf_counter()
+    files, sizes = unzip_update(
+        zip_path, lambda p: None, ["rootfs.ext4"], ["rootfs.ext4"]
+    )
+    rootfs = files["rootfs.ext4"]
+    assert rootfs
+    hash_file(rootfs, lambda p: None, file_size=sizes["rootfs.ext4"])
+    write_file(rootfs, partition, lambda p: None)
+    seconds = perf_counter() - start
+    os.unlink(rootfs)
+    return seconds
+
+
+def _one_pass(zip_path: str, partition: str) -> float:
+    start = perf_counter()
+    stream_zipped_file(zip_path, "rootfs.ext4", partition, lambda p: None)
+    return perf_counter() - start
+
+
+def _delta(directory: str, zip_path: str, partition: str, changed: float) -> float:
+    with zipfile.ZipFile(zip_path) as zf:
+        rootfs = bytearray(zf.read("rootfs.ext4"))
+    base = os.path.join(directory, "base")
+    for path in (base, partition):
+        with open(path, "wb") as f:
+            f.write(rootfs)
+    blocks = len(rootfs) // 4096
+    for index in random.sample(range(blocks), int(blocks * changed / 100)):
+        rootfs[index * 4096 : (index + 1) * 4096] = os.urandom(4096)
+    target = os.path.join(directory, "target")
+    with open(target, "wb") as f:
+        f.write(rootfs)
+    delta = io.BytesIO()
+    make_delta(base, target, delta)
+    delta_zip = os.path.join(directory, "delta.zip")
+    with zipfile.ZipFile(delta_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("rootfs.ext4.delta", delta.getvalue())
+    start = perf_counter()
+    with zipfile.ZipFile(delta_zip) as zf, zf.open("rootfs.ext4.delta") as d:
+        apply_delta(d, base, partition, lambda p: None)
+    seconds = perf_counter() - start
+    print(f"  delta              {seconds:6.2f} s", end="")
+    print(f"  ({os.path.getsize(delta_zip) // 1024} KiB zipped)")
+    return seconds
+
+
+def main(mib: int, changed: float) -> None:
+    """Run the benchmark and print the write times."""
+    with tempfile.TemporaryDirectory() as directory:
+        zip_path = _build_zip(directory, mib)
+        partition = os.path.join(directory, "partition")
+        print(f"{mib} MiB rootfs, {os.path.getsize(zip_path) // 1024} KiB zipped")
+        print(f"  unzip, hash, copy  {_three_pass(zip_path, partition):6.2f} s")
+        print(f"  stream             {_one_pass(zip_path, partition):6.2f} s")
+        _delta(directory, zip_path, partition, changed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mib", type=int, default=64)
+    parser.add_argument("--changed", type=float, default=2)
+    args = parser.parse_args()
+    main(mib=args.mib, changed=args.changed)
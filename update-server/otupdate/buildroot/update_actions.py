@@ -12,19 +12,24 @@ import os
 import re
 import subprocess
 import tempfile
+import zipfile
 from typing import Callable, Optional
 
 from otupdate.common.file_actions import (
     unzip_update,
     hash_file,
+    stream_zipped_file,
     verify_signature,
+    FileMissing,
     HashMismatch,
 )
+from otupdate.common.delta import BaseMismatch, apply_delta
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 
 ROOTFS_SIG_NAME = "rootfs.ext4.hash.sig"
 ROOTFS_HASH_NAME = "rootfs.ext4.hash"
 ROOTFS_NAME = "rootfs.ext4"
+ROOTFS_DELTA_NAME = "rootfs.ext4.delta"
 UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
 LOG = logging.getLogger(__name__)
 
@@ -119,6 +124,117 @@ class OT2UpdateActions(UpdateActionsInterface):
         write_file(rootfs_filepath, part_path, progress_callback, chunk_size, file_size)
         return unused.value
 
+    def verify_update(
+        self,
+        filepath: str,
+        progress_callback: Callable[[float], None],
+        cert_path: Optional[str],
+    ) -> bytes:
+        """Worker for validation before a streamed write. Call in an executor.
+
+        - Checks that filepath contains a rootfs or a rootfs delta, without
+          extracting it
+        - Unzips the rootfs hash and, if requested, its signature
+        - If requested, checks the signature of the hash
+
+        The rootfs itself, whether packaged whole or rebuilt from a delta, is
+        checked against the hash while :py:meth:`stream_update` writes it.
+
+        :param filepath: The path to the update zip file
+        :param progress_callback: The function to call with progress between 0
+                                  and 1.0.
+        :param cert_path: Path to an x.509 certificate to check the signature
+                          against. If ``None``, signature checking is disabled
+        :returns bytes: The packaged hash of the rootfs, as ascii hex
+
+        Will also raise an exception if validation fails
+        """
+        with zipfile.ZipFile(filepath, "r") as zf:
+            names = zf.namelist()
+            if ROOTFS_NAME not in names and ROOTFS_DELTA_NAME not in names:
+                raise FileMissing(f"File {ROOTFS_NAME} missing from zip")
+
+        def zip_callback(progress):
+            progress_callback(progress / 2.0)
+
+        required = [ROOTFS_HASH_NAME]
+        if cert_path:
+            required.append(ROOTFS_SIG_NAME)
+        files, _ = unzip_update(
+            filepath, zip_callback, [ROOTFS_HASH_NAME, ROOTFS_SIG_NAME], required
+        )
+        hashfile = files.get(ROOTFS_HASH_NAME)
+        assert hashfile
+        if cert_path:
+            sigfile = files.get(ROOTFS_SIG_NAME)
+            assert sigfile
+            verify_signature(hashfile, sigfile, cert_path)
+        progress_callback(1.0)
+        return open(hashfile, "rb").read().strip()
+
+    def stream_update(
+        self,
+        filepath: str,
+        packaged_hash: bytes,
+        progress_callback: Callable[[float], None],
+    ) -> Partition:
+        """
+        Write the rootfs in an update zip to the next root partition in one pass
+
+        The rootfs is decompressed, hashed and written to the partition
+        together, rather than being extracted, hashed and copied in turn. The
+        partition is not switched to here, so a hash mismatch only leaves the
+        unused partition with a bad image.
+
+        If the zip has a rootfs delta (see :py:mod:`otupdate.common.delta`)
+        rather than a rootfs, the rootfs is rebuilt from the delta and the
+        running root partition, and only the blocks that differ from what is
+        already on the unused partition are written. The running partition
+        drifts from the image the delta was made against once it boots, so if
+        the delta's base blocks do not match and the zip also has the full
+        rootfs, the full rootfs is written instead.
+
+        :param filepath: The path to the update zip file, already checked by
+                         :py:meth:`verify_update`
+        :param packaged_hash: The hash returned by :py:meth:`verify_update`
+        :param progress_callback: A callback to call periodically with progress
+                                  between 0 and 1.0.
+        :returns: The root partition that the rootfs image was written to
+        :raises HashMismatch: If the rootfs does not match ``packaged_hash``
+        :raises MalformedDelta: If the delta is not valid, or does not apply
+                                to the running partition and there is no
+                                full rootfs to fall back to
+        """
+        unused = _find_unused_partition()
+        with zipfile.ZipFile(filepath, "r") as zf:
+            names = zf.namelist()
+            use_delta = ROOTFS_DELTA_NAME in names
+            if use_delta:
+                base = _find_base_partition()
+                LOG.info(f"stream_update: applying delta against {base.value.path}")
+                try:
+                    with zf.open(ROOTFS_DELTA_NAME) as delta:
+                        rootfs_hash = apply_delta(
+                            delta, base.value.path, unused.value.path, progress_callback
+                        )
+                except BaseMismatch as e:
+                    if ROOTFS_NAME not in names:
+                        raise
+                    LOG.warning(f"stream_update: {e}, writing the full rootfs")
+                    use_delta = False
+        if not use_delta:
+            rootfs_hash = stream_zipped_file(
+                filepath, ROOTFS_NAME, unused.value.path, progress_callback
+            )
+        if packaged_hash != rootfs_hash:
+            msg = (
+                f"Hash mismatch: calculated {rootfs_hash!r} != "
+                f"packaged {packaged_hash!r}"
+            )
+            LOG.error(msg)
+            raise HashMismatch(msg)
+        return unused.value
+
     @contextlib.contextmanager
     def mount_update(self):
         """Mount the freshly-written partition r/w (to update machine-id).
@@ -165,6 +281,12 @@ def _find_unused_partition() -> RootPartitions:
     return {b"2": RootPartitions.TWO, b"3": RootPartitions.THREE}[which]
 
 
+def _find_base_partition() -> RootPartitions:
+    """Find the running root partition that rootfs deltas apply to"""
+    unused = _find_unused_partition()
+    return RootPartitions.THREE if unused == RootPartitions.TWO else RootPartitions.TWO
+
+
 def write_file(
     infile: str,
     outfile: str,
@@ -0,0 +1,319 @@
+"""
+common.delta - block-level delta images for root filesystem updates
+
+A delta rebuilds a target image from a base image (the running root
+partition) by copying the blocks the two share and carrying only the blocks
+that changed. It is a sequence of records after a header:
+
+- header: ``MAGIC``, the block size (u32) and the target size in bytes (u64)
+- ``C`` record: copy a run of blocks from the base: the first source block
+  (u64), the number of blocks (u32) and the sha256 of the base data copied.
+  A run is at most ``_CHUNK_SIZE`` bytes.
+- ``L`` record: literal target data: its length in bytes (u32) and the data
+- ``E`` record: the end of the delta
+
+Records build the target in order. All integers are big endian.
+
+The running root partition is not byte for byte the image the delta was made
+from: its machine-id and ext4 metadata change once it is booted. Every run of
+base blocks is checked against its hash before it is copied, and
+:py:exc:`BaseMismatch` is raised if it differs, so that the caller can fall
+back to a full image.
+
+To make a delta on the build machine::
+
+    python -m otupdate.common.delta base/rootfs.ext4 rootfs.ext4 rootfs.ext4.delta
+"""
+
+import argparse
+import binascii
+import hashlib
+import logging
+import os
+import stat
+import struct
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+MAGIC = b"OTDELTA2"
+DEFAULT_BLOCK_SIZE = 4096
+
+_HEADER = struct.Struct(">8sIQ")
+_COPY = struct.Struct(">QI32s")
+_LITERAL = struct.Struct(">I")
+_COPY_OP = b"C"
+_LITERAL_OP = b"L"
+_END_OP = b"E"
+
+# Largest amount of target data to handle at once, in bytes
+_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class MalformedDelta(ValueError):
+    def __init__(self, message):
+        self.message = message
+        self.short = "Malformed Delta"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.message}>"
+
+    def __str__(self):
+        return self.message
+
+
+class BaseMismatch(MalformedDelta):
+    """The base image differs from the one the delta was made against"""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.short = "Base Mismatch"
+
+
+def _block_digests(path: str, block_size: int) -> List[bytes]:
+    """Hash each block of a file"""
+    digests = []
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            digests.append(hashlib.sha256(block).digest())
+    return digests
+
+
+def _block_sources(
+    target_path: str, base_digests: List[bytes], block_size: int
+) -> Iterator[Tuple[bytes, Optional[int]]]:
+    """Read each block of the target with the base block it can be copied from
+
+    The same block of the base is preferred, so that unchanged regions copy
+    as long runs.
+    """
+    base_index: Dict[bytes, int] = {}
+    for index, digest in enumerate(base_digests):
+        base_index.setdefault(digest, index)
+    with open(target_path, "rb") as target:
+        index = 0
+        while True:
+            block = target.read(block_size)
+            if not block:
+                return
+            digest = hashlib.sha256(block).digest()
+            if index < len(base_digests) and base_digests[index] == digest:
+                yield block, index
+            else:
+                yield block, base_index.get(digest)
+            index += 1
+
+
+def make_delta(
+    base_path: str,
+    target_path: str,
+    out: IO[bytes],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Tuple[int, int]:
+    """
+    Write a delta that rebuilds the target image from the base image
+
+    Each target block is copied from the same block of the base if they
+    match, otherwise from any base block with the same contents, otherwise
+    carried literally. Each run of copied blocks carries the hash of its base
+    data, so :py:func:`apply_delta` can check the base it is given.
+
+    :param base_path: The image the delta will be applied to
+    :param target_path: The image the delta rebuilds
+    :param out: Where to write the delta
+    :param block_size: The size of the blocks to compare. Should match the
+                       filesystem's block size.
+    :returns: The number of target blocks, and how many of them are literal
+    """
+    base_digests = _block_digests(base_path, block_size)
+    target_size = os.path.getsize(target_path)
+    out.write(_HEADER.pack(MAGIC, block_size, target_size))
+    chunk_blocks = max(1, _CHUNK_SIZE // block_size)
+    blocks = 0
+    literal_blocks = 0
+    copy_start: Optional[int] = None
+    copy_count = 0
+    copy_size = 0
+    literal = bytearray()
+
+    def flush_copy() -> None:
+        nonlocal copy_start, copy_count, copy_size
+        if copy_start is not None:
+            base.seek(copy_start * block_size)
+            digest = hashlib.sha256(base.read(copy_size)).digest()
+            out.write(_COPY_OP + _COPY.pack(copy_start, copy_count, digest))
+        copy_start, copy_count, copy_size = None, 0, 0
+
+    def flush_literal() -> None:
+        if literal:
+            out.write(_LITERAL_OP + _LITERAL.pack(len(literal)) + literal)
+            literal.clear()
+
+    with open(base_path, "rb") as base:
+        for block, source in _block_sources(target_path, base_digests, block_size):
+            if source is None:
+                flush_copy()
+                literal += block
+                literal_blocks += 1
+                if len(literal) >= _CHUNK_SIZE:
+                    flush_literal()
+            elif (
+                copy_start is not None
+                and source == copy_start + copy_count
+                and copy_count < chunk_blocks
+            ):
+                copy_count += 1
+                copy_size += len(block)
+            else:
+                flush_literal()
+                flush_copy()
+                copy_start, copy_count, copy_size = source, 1, len(block)
+            blocks += 1
+        flush_copy()
+        flush_literal()
+    out.write(_END_OP)
+    LOG.info(
+        f"make_delta: {literal_blocks} of {blocks} {block_size}B blocks "
+        f"of {target_path} differ from {base_path}"
+    )
+    return blocks, literal_blocks
+
+
+def _read_exactly(f: IO[bytes], size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise MalformedDelta("Delta ended early")
+    return data
+
+
+def _target_chunks(
+    delta: IO[bytes], base: IO[bytes], block_size: int, target_size: int
+) -> Iterator[bytes]:
+    """Read the records of a delta, yielding the target in chunks
+
+    Each run of base blocks is checked against its hash before it is yielded.
+    """
+    chunk_blocks = max(1, _CHUNK_SIZE // block_size)
+    position = 0
+    while True:
+        op = _read_exactly(delta, 1)
+        if op == _END_OP:
+            return
+        elif op == _COPY_OP:
+            source, count, digest = _COPY.unpack(_read_exactly(delta, _COPY.size))
+            if count > chunk_blocks:
+                raise MalformedDelta(f"Copy of {count} blocks is too long")
+            size = min(count * block_size, target_size - position)
+            base.seek(source * block_size)
+            data = base.read(size)
+            if len(data) != size:
+                raise BaseMismatch("Base image is too short")
+            if hashlib.sha256(data).digest() != digest:
+                raise BaseMismatch(
+                    f"Base blocks {source} to {source + count - 1} differ "
+                    "from the image the delta was made against"
+                )
+            position += size
+            yield data
+        elif op == _LITERAL_OP:
+            (length,) = _LITERAL.unpack(_read_exactly(delta, _LITERAL.size))
+            position += length
+            yield _read_exactly(delta, length)
+        else:
+            raise MalformedDelta(f"Unknown delta record {op!r}")
+
+
+def _write_changed(fd: int, offset: int, data: bytes, block_size: int) -> int:
+    """Write the blocks of data that differ from what is already at offset
+
+    :returns: The number of blocks written
+    """
+    current = os.pread(fd, len(data), offset)
+    if current == data:
+        return 0
+    written = 0
+    view = memoryview(data)
+    for start in range(0, len(data), block_size):
+        block = view[start : start + block_size]
+        if current[start : start + block_size] != block:
+            os.pwrite(fd, block, offset + start)
+            written += 1
+    return written
+
+
+def apply_delta(
+    delta: IO[bytes],
+    base_path: str,
+    outfile: str,
+    progress_callback: Callable[[float], None],
+    algo: str = "sha256",
+) -> bytes:
+    """
+    Rebuild a target image from a delta and a base image, hashing it
+
+    Only the blocks that differ from what is already in ``outfile`` are
+    written, so updating a partition that holds a similar image writes
+    little. If ``outfile`` is a regular file it is truncated to the target
+    size.
+
+    This function is blocking and takes a while. It calls ``progress_callback``
+    with the fraction of the target rebuilt so far.
+
+    :param delta: The delta, e.g. opened from the update zip
+    :param base_path: The image the delta was made against
+    :param outfile: The path to write the target to, e.g. a partition device
+    :param progress_callback: The callback to call with progress between 0 and
+                              1. May not ever be precisely 1.0.
+    :param algo: The algorithm to use. Can be anything used by
+                 :py:mod:`hashlib`
+    :returns: The hash of the target as ascii hex
+    :raises BaseMismatch: If the base differs from the image the delta was
+                          made against. Blocks before the first difference
+                          may already have been written to ``outfile``.
+    :raises MalformedDelta: If the delta is not valid
+    """
+    magic, block_size, target_size = _HEADER.unpack(_read_exactly(delta, _HEADER.size))
+    if magic != MAGIC:
+        raise MalformedDelta("Not a delta image")
+    hasher = hashlib.new(algo)
+    position = 0
+    blocks_written = 0
+    fd = os.open(outfile, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        with open(base_path, "rb") as base:
+            for data in _target_chunks(delta, base, block_size, target_size):
+                if position + len(data) > target_size:
+                    raise MalformedDelta("Delta is longer than its target")
+                hasher.update(data)
+                blocks_written += _write_changed(fd, position, data, block_size)
+                position += len(data)
+                progress_callback(position / (target_size or 1))
+        if position != target_size:
+            raise MalformedDelta("Delta is shorter than its target")
+        if stat.S_ISREG(os.fstat(fd).st_mode):
+            os.ftruncate(fd, target_size)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    LOG.info(
+        f"apply_delta: wrote {blocks_written} changed {block_size}B blocks "
+        f"of {target_size}B to {outfile}"
+    )
+    return binascii.hexlify(hasher.digest())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Make a delta that rebuilds target from base"
+    )
+    parser.add_argument("base", help="The image the delta will be applied to")
+    parser.add_argument("target", help="The image the delta rebuilds")
+    parser.add_argument("delta", help="The path to write the delta to")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with open(args.delta, "wb") as delta_file:
+        make_delta(args.base, args.target, delta_file, args.block_size)
@@ -5,15 +5,21 @@ handling hash and sig checking
 
 import binascii
 import hashlib
+import io
 import logging
 import os
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
 import tempfile
 import zipfile
 
 LOG = logging.getLogger(__name__)
 
+#: The size of the blocks :py:meth:`stream_zipped_file` writes. Large and
+#: aligned, so the SD card is written a whole erase block at a time.
+WRITE_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message):
@@ -180,6 +186,74 @@ def hash_file(
     return binascii.hexlify(hasher.digest())
 
 
+def stream_zipped_file(
+    filepath: str,
+    member: str,
+    outfile: str,
+    progress_callback: Callable[[float], None],
+    block_size: int = WRITE_BLOCK_SIZE,
+    algo: str = "sha256",
+) -> bytes:
+    """
+    Decompress a file from a zip straight to another file, hashing it on the way
+
+    The member is read, hashed, and written in one pass, without extracting it
+    to disk first. Writes go to ``outfile`` unbuffered in ``block_size``
+    blocks, each on a worker thread while the next block is decompressed and
+    hashed, and are flushed to the device before returning.
+
+    This function is blocking and takes a while. It calls ``progress_callback``
+    with the fraction of the member written so far.
+
+    :param filepath: The path to the zipfile
+    :param member: The name of the file in the zip to write
+    :param outfile: The path to write to, e.g. a partition device
+    :param progress_callback: The callback to call with progress between 0 and
+                              1. May not ever be precisely 1.0.
+    :param block_size: The size of the blocks to write. Should be a multiple of
+                       the device's block size.
+    :param algo: The algorithm to use. Can be anything used by
+                 :py:mod:`hashlib`
+    :returns: The hash of the member as ascii hex
+    :raises FileMissing: If the member is not in the zip
+    """
+    hasher = hashlib.new(algo)
+    written = 0
+    with zipfile.ZipFile(filepath, "r") as zf:
+        try:
+            info = zf.getinfo(member)
+        except KeyError:
+            raise FileMissing(f"File {member} missing from zip")
+        LOG.info(
+            f"stream_zipped_file: writing {member} ({info.file_size}B) from "
+            f"{filepath} to {outfile} in {block_size}B blocks"
+        )
+        with zf.open(info) as zipped, open(outfile, "wb", buffering=0) as out:
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending: Optional["Future[None]"] = None
+                while True:
+                    block = zipped.read(block_size)
+                    if not block:
+                        break
+                    hasher.update(block)
+                    if pending:
+                        pending.result()
+                    pending = writer.submit(_write_all, out, block)
+                    written += len(block)
+                    progress_callback(written / (info.file_size or 1))
+                if pending:
+                    pending.result()
+            os.fsync(out.fileno())
+    return binascii.hexlify(hasher.digest())
+
+
+def _write_all(out: io.RawIOBase, block: bytes) -> None:
+    """Write all of a block to an unbuffered file."""
+    view = memoryview(block)
+    while view:
+        view = view[out.write(view) or 0 :]
+
+
 def verify_signature(message_path: str, sigfile_path: str, cert_path: str) -> None:
     """
     Verify the signature (assumed, of the hash file)
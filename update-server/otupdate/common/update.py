@@ -21,6 +21,10 @@ from .session import UpdateSession, Stages
 SESSION_VARNAME = APP_VARIABLE_PREFIX + "session"
 LOG = logging.getLogger(__name__)
 
+# Read uploads in large chunks so writing the update zip to the SD card is
+# not a flood of small writes.
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def session_from_request(request: web.Request) -> Optional[UpdateSession]:
     return request.app.get(SESSION_VARNAME, None)
@@ -77,7 +81,7 @@ async def status(request: web.Request, session: UpdateSession) -> web.Response:
 async def _save_file(part: BodyPartReader, path: str):
     with open(os.path.join(path, part.name), "wb") as write:
         while not part.at_eof():
-            chunk = await part.read_chunk()
+            chunk = await part.read_chunk(_UPLOAD_CHUNK_SIZE)
             decoded = part.decode(chunk)
             write.write(decoded)
 
@@ -85,15 +89,25 @@ async def _save_file(part: BodyPartReader, path: str):
 def _begin_write(
     session: UpdateSession,
     loop: asyncio.AbstractEventLoop,
-    rootfs_file_path: str,
+    downloaded_update_path: str,
+    packaged_hash: bytes,
     actions: update_actions.UpdateActionsInterface,
 ):
-    """Start the write process."""
+    """Start the write process.
+
+    The image is decompressed, hashed and written to the unused partition in
+    one pass. A hash mismatch ends the session in error before it can be
+    committed.
+    """
     session.set_progress(0)
     session.set_stage(Stages.WRITING)
     write_future = asyncio.ensure_future(
         loop.run_in_executor(
-            None, actions.write_update, rootfs_file_path, session.set_progress
+            None,
+            actions.stream_update,
+            downloaded_update_path,
+            packaged_hash,
+            session.set_progress,
         )
     )
 
@@ -114,14 +128,18 @@ def _begin_validation(
     downloaded_update_path: str,
     actions: update_actions.UpdateActionsInterface,
 ) -> asyncio.futures.Future:
-    """Start the validation process."""
+    """Start the validation process.
+
+    This checks the update's files and the signature of its hash, but not the
+    image itself, which is hashed as it is written.
+    """
     session.set_stage(Stages.VALIDATING)
     cert_path = config.update_cert_path if config.signature_required else None
 
     validation_future = asyncio.ensure_future(
         loop.run_in_executor(
             None,
-            actions.validate_update,
+            actions.verify_update,
             downloaded_update_path,
             session.set_progress,
             cert_path,
@@ -133,8 +151,15 @@ def _begin_validation(
         if exc:
             session.set_error(getattr(exc, "short", str(type(exc))), str(exc))
         else:
-            rootfs_file = fut.result()
-            loop.call_soon_threadsafe(_begin_write, session, loop, rootfs_file, actions)
+            packaged_hash = fut.result()
+            loop.call_soon_threadsafe(
+                _begin_write,
+                session,
+                loop,
+                downloaded_update_path,
+                packaged_hash,
+                actions,
+            )
 
     validation_future.add_done_callback(validation_done)
     return validation_future
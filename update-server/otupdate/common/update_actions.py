@@ -54,6 +54,32 @@ class UpdateActionsInterface:
         """
         ...
 
+    @abc.abstractmethod
+    def verify_update(
+        self,
+        filepath: str,
+        progress_callback: Callable[[float], None],
+        cert_path: Optional[str],
+    ) -> bytes:
+        """
+        Check the update's files and signature without extracting its image,
+        and return the image's packaged hash
+        """
+        ...
+
+    @abc.abstractmethod
+    def stream_update(
+        self,
+        filepath: str,
+        packaged_hash: bytes,
+        progress_callback: Callable[[float], None],
+    ) -> Partition:
+        """
+        Decompress the image from the update straight to a specific rootfs
+        path in one pass, checking it against ``packaged_hash``
+        """
+        ...
+
     @abc.abstractmethod
     @contextlib.contextmanager
     def mount_update(self) -> Iterator:
@@ -12,7 +12,7 @@ import zipfile
 import pytest
 
 from otupdate.buildroot import update_actions
-from otupdate.common import file_actions
+from otupdate.common import delta, file_actions
 
 
 @pytest.mark.exclude_rootfs_ext4_hash_sig
@@ -118,6 +118,120 @@ def test_write_update(extracted_update_file, testing_partition):
     )
 
 
+def test_verify_update(downloaded_update_file, testing_cert):
+    updater = update_actions.OT2UpdateActions()
+    cb = mock.Mock()
+    packaged_hash = updater.verify_update(downloaded_update_file, cb, testing_cert)
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert packaged_hash == zf.read("rootfs.ext4.hash").strip()
+    # The rootfs is not extracted
+    assert not os.path.exists(
+        os.path.join(os.path.dirname(downloaded_update_file), "rootfs.ext4")
+    )
+    assert cb.call_args[0][0] == 1.0
+
+
+@pytest.mark.bad_sig
+def test_verify_update_catches_bad_sig(downloaded_update_file, testing_cert):
+    updater = update_actions.OT2UpdateActions()
+    with pytest.raises(file_actions.SignatureMismatch):
+        updater.verify_update(downloaded_update_file, mock.Mock(), testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_verify_update_catches_missing_image(downloaded_update_file, testing_cert):
+    updater = update_actions.OT2UpdateActions()
+    with pytest.raises(file_actions.FileMissing):
+        updater.verify_update(downloaded_update_file, mock.Mock(), testing_cert)
+
+
+def test_stream_update(downloaded_update_file, testing_partition):
+    updater = update_actions.OT2UpdateActions()
+    cb = mock.Mock()
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        packaged_hash = zf.read("rootfs.ext4.hash").strip()
+        rootfs = zf.read("rootfs.ext4")
+    partition = updater.stream_update(downloaded_update_file, packaged_hash, cb)
+    assert partition.path == testing_partition
+    assert open(testing_partition, "rb").read() == rootfs
+    assert cb.call_args[0][0] == 1.0
+
+
+def test_stream_update_delta(
+    downloaded_update_file, testing_partition, tmpdir, monkeypatch
+):
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        packaged_hash = zf.read("rootfs.ext4.hash").strip()
+        rootfs = zf.read("rootfs.ext4")
+    base = os.path.join(tmpdir, "running-partition")
+    open(base, "wb").write(rootfs[::-1])
+    monkeypatch.setattr(
+        update_actions,
+        "_find_base_partition",
+        mock.Mock(return_value=mock.Mock(value=mock.Mock(path=base))),
+    )
+    zf_path = _delta_update(tmpdir, rootfs, packaged_hash, base, False)
+
+    updater = update_actions.OT2UpdateActions()
+    assert updater.verify_update(zf_path, mock.Mock(), None) == packaged_hash
+    partition = updater.stream_update(zf_path, packaged_hash, mock.Mock())
+    assert partition.path == testing_partition
+    assert open(testing_partition, "rb").read() == rootfs
+
+
+def _delta_update(tmpdir, rootfs, packaged_hash, base, with_rootfs):
+    zf_path = os.path.join(tmpdir, "delta-update.zip")
+    rootfs_path = os.path.join(tmpdir, "rootfs.ext4")
+    open(rootfs_path, "wb").write(rootfs)
+    with zipfile.ZipFile(zf_path, "w") as zf:
+        zf.writestr("rootfs.ext4.hash", packaged_hash)
+        if with_rootfs:
+            zf.writestr("rootfs.ext4", rootfs)
+        with zf.open("rootfs.ext4.delta", "w") as d:
+            delta.make_delta(base, rootfs_path, d)
+    return zf_path
+
+
+@pytest.mark.parametrize("with_rootfs", [True, False])
+def test_stream_update_delta_base_differs(
+    downloaded_update_file, testing_partition, tmpdir, monkeypatch, with_rootfs
+):
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        packaged_hash = zf.read("rootfs.ext4.hash").strip()
+        rootfs = zf.read("rootfs.ext4")
+    # The delta is made against the released image, but the running
+    # partition's machine-id has changed since it booted
+    pristine = rootfs[: 4096 * 10] + os.urandom(4096) + rootfs[4096 * 11 :]
+    pristine_path = os.path.join(tmpdir, "pristine")
+    open(pristine_path, "wb").write(pristine)
+    running = os.path.join(tmpdir, "running-partition")
+    open(running, "wb").write(b"machine-id" + pristine[10:])
+    monkeypatch.setattr(
+        update_actions,
+        "_find_base_partition",
+        mock.Mock(return_value=mock.Mock(value=mock.Mock(path=running))),
+    )
+    zf_path = _delta_update(tmpdir, rootfs, packaged_hash, pristine_path, with_rootfs)
+
+    updater = update_actions.OT2UpdateActions()
+    if with_rootfs:
+        partition = updater.stream_update(zf_path, packaged_hash, mock.Mock())
+        assert partition.path == testing_partition
+        assert open(testing_partition, "rb").read() == rootfs
+    else:
+        with pytest.raises(delta.BaseMismatch):
+            updater.stream_update(zf_path, packaged_hash, mock.Mock())
+
+
+@pytest.mark.bad_hash
+def test_stream_update_catches_bad_hash(downloaded_update_file, testing_partition):
+    updater = update_actions.OT2UpdateActions()
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        packaged_hash = zf.read("rootfs.ext4.hash").strip()
+    with pytest.raises(file_actions.HashMismatch):
+        updater.stream_update(downloaded_update_file, packaged_hash, mock.Mock())
+
+
 def test_commit_update(monkeypatch):
     updater = update_actions.OT2UpdateActions()
     unused = update_actions.RootPartitions.TWO
@@ -0,0 +1,99 @@
+import binascii
+import hashlib
+import io
+import os
+from unittest import mock
+
+import pytest
+
+from otupdate.common import delta
+
+BLOCK = 512
+
+
+def _images(tmpdir):
+    base = bytearray(os.urandom(BLOCK * 64))
+    target = bytearray(base)
+    # A changed block, a block moved from elsewhere, and a ragged tail
+    target[BLOCK * 3 : BLOCK * 4] = os.urandom(BLOCK)
+    target[BLOCK * 10 : BLOCK * 11] = base[BLOCK * 40 : BLOCK * 41]
+    target += os.urandom(100)
+    base_path = os.path.join(tmpdir, "base")
+    target_path = os.path.join(tmpdir, "target")
+    open(base_path, "wb").write(base)
+    open(target_path, "wb").write(target)
+    return base_path, target_path, bytes(target)
+
+
+def _make(base_path, target_path):
+    out = io.BytesIO()
+    blocks, literal = delta.make_delta(base_path, target_path, out, BLOCK)
+    out.seek(0)
+    return out, blocks, literal
+
+
+def test_roundtrip(tmpdir):
+    base_path, target_path, target = _images(tmpdir)
+    out, blocks, literal = _make(base_path, target_path)
+    assert blocks == 65
+    # The changed block and the tail
+    assert literal == 2
+    assert len(out.getvalue()) < BLOCK * 3
+    outfile = os.path.join(tmpdir, "out")
+    cb = mock.Mock()
+    digest = delta.apply_delta(out, base_path, outfile, cb)
+    assert open(outfile, "rb").read() == target
+    assert digest == binascii.hexlify(hashlib.sha256(target).digest())
+    assert cb.call_args[0][0] == 1.0
+
+
+def test_writes_only_changed_blocks(tmpdir, monkeypatch):
+    base_path, target_path, target = _images(tmpdir)
+    out, _, _ = _make(base_path, target_path)
+    outfile = os.path.join(tmpdir, "out")
+    # The unused partition holds the base image, longer than the target
+    open(outfile, "wb").write(open(base_path, "rb").read() + bytes(BLOCK * 4))
+    pwrite = mock.Mock(wraps=os.pwrite)
+    monkeypatch.setattr(delta.os, "pwrite", pwrite)
+    delta.apply_delta(out, base_path, outfile, mock.Mock())
+    assert open(outfile, "rb").read() == target
+    # The changed block, the moved block, and the tail
+    assert [c[0][2] for c in pwrite.call_args_list] == [
+        BLOCK * 3,
+        BLOCK * 10,
+        BLOCK * 64,
+    ]
+
+
+def test_malformed(tmpdir):
+    base_path, target_path, _ = _images(tmpdir)
+    out, _, _ = _make(base_path, target_path)
+    outfile = os.path.join(tmpdir, "out")
+    with pytest.raises(delta.MalformedDelta):
+        delta.apply_delta(io.BytesIO(b"not a delta"), base_path, outfile, mock.Mock())
+    truncated = io.BytesIO(out.getvalue()[:-1])
+    with pytest.raises(delta.MalformedDelta):
+        delta.apply_delta(truncated, base_path, outfile, mock.Mock())
+    short_base = os.path.join(tmpdir, "short")
+    open(short_base, "wb").write(open(base_path, "rb").read()[: BLOCK * 8])
+    with pytest.raises(delta.MalformedDelta):
+        delta.apply_delta(out, short_base, outfile, mock.Mock())
+
+
+def test_base_differs(tmpdir, monkeypatch):
+    base_path, target_path, _ = _images(tmpdir)
+    out, _, _ = _make(base_path, target_path)
+    # The running partition has drifted from the image the delta was made
+    # against, as a booted rootfs does
+    running = bytearray(open(base_path, "rb").read())
+    running[BLOCK * 20 + 7] ^= 0xFF
+    running_path = os.path.join(tmpdir, "running")
+    open(running_path, "wb").write(running)
+    outfile = os.path.join(tmpdir, "out")
+    pwrite = mock.Mock(wraps=os.pwrite)
+    monkeypatch.setattr(delta.os, "pwrite", pwrite)
+    with pytest.raises(delta.BaseMismatch):
+        delta.apply_delta(out, running_path, outfile, mock.Mock())
+    # The run of blocks holding the difference was never written
+    written = [c[0][2] for c in pwrite.call_args_list]
+    assert all(offset < BLOCK * 11 for offset in written)
@@ -95,3 +95,32 @@ def test_verify_signature_catches_bad_sig(extracted_update_file, testing_cert):
             os.path.join(extracted_update_file, "rootfs.ext4.hash.sig"),
             testing_cert,
         )
+
+
+def test_stream_zipped_file(downloaded_update_file, tmpdir):
+    cb = mock.Mock()
+    out = os.path.join(tmpdir, "partition")
+    rootfs_hash = file_actions.stream_zipped_file(
+        downloaded_update_file, "rootfs.ext4", out, cb, block_size=4096
+    )
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert open(out, "rb").read() == zf.read("rootfs.ext4")
+        assert rootfs_hash == zf.read("rootfs.ext4.hash").strip()
+        size = zf.getinfo("rootfs.ext4").file_size
+    # One callback per block, including the fractional one at the end
+    calls = size // 4096
+    if calls * 4096 != size:
+        calls += 1
+    assert cb.call_count == calls
+    assert cb.call_args[0][0] == 1.0
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_stream_zipped_file_requires_member(downloaded_update_file, tmpdir):
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.stream_zipped_file(
+            downloaded_update_file,
+            "rootfs.ext4",
+            os.path.join(tmpdir, "partition"),
+            mock.Mock(),
+        )